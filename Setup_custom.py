@@ -46,6 +46,7 @@ def GetConfigurations() -> Union[
     d: dict[str, Configuration.Configuration] = {}
 
     common_python_packages: list[Configuration.VersionInfo] = [
+        Configuration.VersionInfo("aiohttp", SemVer("3.9.1")),
         Configuration.VersionInfo("typer-config", SemVer("1.2.1")),
     ]
 
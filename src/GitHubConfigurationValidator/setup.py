@@ -16,7 +16,6 @@
 """Setup for GitHubConfigurationValidator"""
 
 import datetime
-import os
 import sys
 import textwrap
 
@@ -43,6 +42,9 @@ with ExitStack(lambda: sys.path.pop(0)):
     # We have to import in this way to get the proper doc string from __main__.py
     import __main__ as GitHubConfigurationValidatorMain
 
+# __main__.py adds 'src' to the path
+from GitHubConfigurationValidatorLib.PluginBundle import PluginBundle  # pylint: disable=wrong-import-position
+
 
 # ----------------------------------------------------------------------
 def _GetVersion() -> str:
@@ -76,36 +78,28 @@ else:
 # ----------------------------------------------------------------------
 include_files: list[tuple[str, str]] = []
 
-for include_path, is_supported_file_func in [
-    (Path("src/Plugins"), lambda filename: filename.suffix == ".py" and filename.stem != "__init__"),
-    (Path("src/Configs"), lambda filename: True),
-]:
-    for child in include_path.iterdir():
-        if not (child.is_file() and is_supported_file_func(child)):
-            continue
-
-        include_files.append(
-            (
-                str(child),
-                str(Path(*child.parts[1:])),
-            ),
-        )
-
-for root_str, directories, filenames in os.walk(Path("src/GitHubConfigurationValidatorLib")):
-    root = Path(root_str)
-
-    if root.parts[-1] == "TestFiles":
+for child in Path("src/Configs").iterdir():
+    if not child.is_file():
         continue
 
-    for filename in filenames:
-        fullpath = root / filename
+    include_files.append(
+        (
+            str(child),
+            str(Path(*child.parts[1:])),
+        ),
+    )
+
+# The plugins and GitHubConfigurationValidatorLib are distributed as precompiled bytecode in a zip file
+# (rather than as source files, which would be compiled each time the executable is invoked in a
+# read-only directory).
+_plugin_bundle = PluginBundle.Create(
+    _this_dir / "build" / PluginBundle.FILENAME,
+    Path("src/Plugins"),
+    [Path("src/GitHubConfigurationValidatorLib")],
+    exclude_dir_names={"TestFiles", "UnitTests"},
+)
 
-        include_files.append(
-            (
-                str(fullpath),
-                str(Path(*fullpath.parts[1:])),
-            ),
-        )
+include_files.append((str(_plugin_bundle.filename), PluginBundle.FILENAME))
 
 
 # ----------------------------------------------------------------------
@@ -138,11 +132,17 @@ setup(
                 "tcl",
                 "tkinter",
             ],
+            "includes": [
+                # Used by plugins, but no longer imported by the EntryPoint
+                "Common_FoundationEx.InflectEx",
+            ],
             "no_compress": False,
             "optimize": 0,
             "packages": [
+                "aiohttp",
                 "dateutil",
                 "semantic_version",
+                "yarl",
             ],
             "include_files": include_files,
         },
@@ -0,0 +1,363 @@
+# ----------------------------------------------------------------------
+# |
+# |  EntryPoint_UnitTest.py
+# |
+# |  David Brownell <db@DavidBrownell.com>
+# |      2023-12-12 09:31:08
+# |
+# ----------------------------------------------------------------------
+# |
+# |  Copyright David Brownell 2023
+# |  Distributed under the Boost Software License, Version 1.0. See
+# |  accompanying file LICENSE_1_0.txt or copy at
+# |  http://www.boost.org/LICENSE_1_0.txt.
+# |
+# ----------------------------------------------------------------------
+"""Unit tests for EntryPoint/__main__.py"""
+
+import importlib.util
+import json
+import sqlite3
+import sys
+import time
+
+from pathlib import Path
+from unittest import mock
+
+import pytest
+
+from typer.testing import CliRunner
+
+from Common_Foundation.ContextlibEx import ExitStack
+from Common_Foundation import PathEx
+
+
+# ----------------------------------------------------------------------
+sys.path.insert(0, str(PathEx.EnsureDir(Path(__file__).parent.parent.parent)))
+with ExitStack(lambda: sys.path.pop(0)):
+    from GitHubConfigurationValidatorLib import GitHubSession
+    from GitHubConfigurationValidatorLib.Plugin import Plugin
+    from GitHubConfigurationValidatorLib.RateLimitScheduler import RateLimitScheduler
+    from GitHubConfigurationValidatorLib.ResultsDatabase import ResultsDatabase
+    from GitHubConfigurationValidatorLib.Snapshot import SnapshotWriter
+    from GitHubConfigurationValidatorLib.Timings import Timings
+
+    _spec = importlib.util.spec_from_file_location("_EntryPoint", Path(__file__).parent.parent / "__main__.py")
+    assert _spec is not None
+    assert _spec.loader is not None
+
+    _EntryPoint = importlib.util.module_from_spec(_spec)
+    _spec.loader.exec_module(_EntryPoint)
+
+
+# ----------------------------------------------------------------------
+def _GetRuns(
+    filename: Path,
+) -> list[tuple]:
+    connection = sqlite3.connect(filename)
+
+    try:
+        return connection.execute("SELECT completed_at IS NOT NULL, returncode FROM runs ORDER BY id").fetchall()
+    finally:
+        connection.close()
+
+
+# ----------------------------------------------------------------------
+def test_DefaultMaxConcurrentRequests():
+    # The value is duplicated so that RateLimitScheduler isn't imported when the command line is parsed
+    assert _EntryPoint._DEFAULT_MAX_CONCURRENT_REQUESTS == RateLimitScheduler.DEFAULT_MAX_CONCURRENT_REQUESTS
+
+
+# ----------------------------------------------------------------------
+class TestYieldResultsDatabase(object):
+    # ----------------------------------------------------------------------
+    def test_Disabled(self):
+        dm = mock.MagicMock(result=0)
+
+        with _EntryPoint._YieldResultsDatabase(dm, None, "https://github.com", "owner") as results_db:
+            assert results_db is None
+
+    # ----------------------------------------------------------------------
+    def test_Success(self, tmp_path):
+        filename = tmp_path / "Results.db"
+        dm = mock.MagicMock(result=0)
+
+        with _EntryPoint._YieldResultsDatabase(dm, filename, "https://github.com", "owner") as results_db:
+            assert results_db is not None
+            results_db.WriteRepository("Repo", 0, [])
+
+            # Errors reported during the run are recorded
+            dm.result = -1
+
+        assert _GetRuns(filename) == [(1, -1)]
+        assert ResultsDatabase.LoadRun(filename, "https://github.com", "owner") == {"Repo": []}
+
+        dm.WriteInfo.assert_called_once()
+
+    # ----------------------------------------------------------------------
+    def test_Exception(self, tmp_path):
+        filename = tmp_path / "Results.db"
+        dm = mock.MagicMock(result=0)
+
+        with pytest.raises(Exception, match="Interrupted"):
+            with _EntryPoint._YieldResultsDatabase(dm, filename, "https://github.com", "owner") as results_db:
+                assert results_db is not None
+                results_db.WriteRepository("Repo", 0, [])
+
+                raise Exception("Interrupted")
+
+        # The run is not complete, but the results written are available
+        assert _GetRuns(filename) == [(0, None)]
+        assert ResultsDatabase.LoadRun(filename, "https://github.com", "owner") is None
+
+        dm.WriteInfo.assert_called_once()
+
+    # ----------------------------------------------------------------------
+    def test_KeyboardInterrupt(self, tmp_path):
+        filename = tmp_path / "Results.db"
+        dm = mock.MagicMock(result=0)
+
+        with pytest.raises(KeyboardInterrupt):
+            with _EntryPoint._YieldResultsDatabase(dm, filename, "https://github.com", "owner"):
+                raise KeyboardInterrupt()
+
+        assert _GetRuns(filename) == [(0, None)]
+
+
+# ----------------------------------------------------------------------
+class TestYieldSuspendablePhaseTimer(object):
+    # ----------------------------------------------------------------------
+    def test_Standard(self):
+        timings = Timings()
+
+        # ----------------------------------------------------------------------
+        def Generator():
+            with _EntryPoint._YieldSuspendablePhaseTimer(timings, "Phase") as timer:
+                for index in range(3):
+                    time.sleep(0.01)
+
+                    with timer.Suspend():
+                        yield index
+
+        # ----------------------------------------------------------------------
+
+        for _ in Generator():
+            # The consumer is slow, but this time is not attributed to the generator
+            time.sleep(0.2)
+
+        durations = timings._durations[Timings.Category.Phase]["Phase"]  # pylint: disable=protected-access
+
+        assert len(durations) == 1
+        assert 0.03 <= durations[0] < 0.2
+
+    # ----------------------------------------------------------------------
+    def test_Closed(self):
+        timings = Timings()
+
+        # ----------------------------------------------------------------------
+        def Generator():
+            with _EntryPoint._YieldSuspendablePhaseTimer(timings, "Phase") as timer:
+                while True:
+                    with timer.Suspend():
+                        yield
+
+        # ----------------------------------------------------------------------
+
+        generator = Generator()
+
+        next(generator)
+        time.sleep(0.2)
+        generator.close()
+
+        durations = timings._durations[Timings.Category.Phase]["Phase"]  # pylint: disable=protected-access
+
+        assert len(durations) == 1
+        assert durations[0] < 0.2
+
+    # ----------------------------------------------------------------------
+    def test_Disabled(self):
+        with _EntryPoint._YieldSuspendablePhaseTimer(None, "Phase") as timer:
+            with timer.Suspend():
+                pass
+
+
+# ----------------------------------------------------------------------
+class TestValidateRepos(object):
+    # ----------------------------------------------------------------------
+    @staticmethod
+    def _Validate(
+        monkeypatch,
+        dm: mock.MagicMock,
+        num_repositories: int,
+        **kwargs,
+    ) -> list:
+        # ----------------------------------------------------------------------
+        def EnumRepos(*args, on_page_func, **kwargs):  # pylint: disable=unused-argument
+            on_page_func(num_repositories)
+
+            for index in range(num_repositories):
+                yield {"name": "Repo{}".format(index)}
+
+        # ----------------------------------------------------------------------
+
+        monkeypatch.setattr(_EntryPoint, "_EnumRepos", EnumRepos)
+
+        return _EntryPoint._ValidateRepos(
+            dm,
+            mock.MagicMock(),
+            [],
+            mock.MagicMock(),
+            [],
+            [],
+            lambda repository_info, fetch_context, configurations: repository_info["name"],
+            ignore_archived=False,
+            ignore_forks=False,
+            max_concurrency=1,
+            **kwargs,
+        )
+
+    # ----------------------------------------------------------------------
+    def test_Standard(self, monkeypatch):
+        assert self._Validate(monkeypatch, mock.MagicMock(), 10) == ["Repo{}".format(index) for index in range(10)]
+
+    # ----------------------------------------------------------------------
+    def test_ProgressVerb(self, monkeypatch):
+        dm = mock.MagicMock()
+
+        self._Validate(monkeypatch, dm, 3, header="Exporting repositories...", progress_verb="exported")
+
+        header, status_funcs = dm.Nested.call_args.args
+
+        assert header == "Exporting repositories..."
+        assert [status_func() for status_func in status_funcs] == [
+            "3 repositories found",
+            "3 repositories matched",
+            "3 repositories exported",
+        ]
+
+    # ----------------------------------------------------------------------
+    def test_CallbackErrors(self, monkeypatch):
+        dm = mock.MagicMock()
+        validate_dm = dm.Nested.return_value.__enter__.return_value
+
+        # ----------------------------------------------------------------------
+        def StreamFunc(dm, result):  # pylint: disable=unused-argument
+            raise Exception("Stream error")
+
+        # ----------------------------------------------------------------------
+        def OnError(repository_info):  # pylint: disable=unused-argument
+            raise Exception("Error function error")
+
+        # ----------------------------------------------------------------------
+
+        # Many more repositories than the work queue can hold, so a worker that exits early would
+        # block the producer.
+        results = self._Validate(monkeypatch, dm, 10, stream_func=StreamFunc, on_error_func=OnError)
+
+        assert results == [None] * 10
+
+        messages = [call.args[0] for call in validate_dm.WriteError.call_args_list]
+
+        assert len(messages) == 20
+        assert sum("Stream error" in message for message in messages) == 10
+        assert sum("Error function error" in message for message in messages) == 10
+
+    # ----------------------------------------------------------------------
+    def test_WorkerExit(self, monkeypatch):
+        dm = mock.MagicMock()
+        validate_dm = dm.Nested.return_value.__enter__.return_value
+
+        validate_dm.WriteError.side_effect = Exception("Unexpected")
+
+        # ----------------------------------------------------------------------
+        def StreamFunc(dm, result):  # pylint: disable=unused-argument
+            raise Exception("Stream error")
+
+        # ----------------------------------------------------------------------
+
+        # The producer does not block when the workers have exited and the worker's exception is raised
+        with pytest.raises(Exception, match="Unexpected"):
+            self._Validate(monkeypatch, dm, 10, stream_func=StreamFunc)
+
+
+# ----------------------------------------------------------------------
+class TestValidateSnapshot(object):
+    # ----------------------------------------------------------------------
+    def test_Standard(self, tmp_path, monkeypatch):
+        monkeypatch.setenv(_EntryPoint._PLUGIN_MANIFEST_ENVIRONMENT_VAR, "0")
+
+        snapshot_filename = tmp_path / "Snapshot.zip"
+
+        writer = SnapshotWriter(snapshot_filename, "https://github.com", "owner", True)
+
+        for name, allow_auto_merge, is_protected in [
+            ("Repo1", True, True),
+            ("Repo2", False, False),
+        ]:
+            writer.Add(
+                {
+                    "name": name,
+                    "default_branch": "main",
+                    "archived": False,
+                    "disabled": False,
+                    "fork": False,
+                },
+                {
+                    Plugin.ConfigurationType.Repository: {"name": name, "allow_auto_merge": allow_auto_merge},
+                    Plugin.ConfigurationType.Branch: {"name": "main", "protected": is_protected},
+                    Plugin.ConfigurationType.BranchProtection: None,
+                },
+            )
+
+        writer.AddFailure(
+            {
+                "name": "Repo3",
+                "default_branch": "main",
+                "archived": False,
+                "disabled": False,
+                "fork": False,
+            },
+        )
+
+        writer.Close()
+
+        output_filename = tmp_path / "Results.jsonl"
+
+        # Snapshots are validated without accessing GitHub
+        with mock.patch.object(GitHubSession.GitHubSession, "__init__", side_effect=Exception("GitHub was accessed")):
+            result = CliRunner().invoke(
+                _EntryPoint.app,
+                [
+                    "ValidateSnapshot",
+                    str(snapshot_filename),
+                    "--include-plugin", "AutoMerge",
+                    "--include-plugin", "ProtectedBranch",
+                    "--output-jsonl", str(output_filename),
+                ],
+            )
+
+        assert result.exception is None or isinstance(result.exception, SystemExit), result.output
+        assert result.exit_code == -1, result.output
+
+        # Repositories that could not be exported are reported as errors
+        assert "'Repo3' could not be exported when the snapshot was created." in result.output
+
+        records = [json.loads(line) for line in output_filename.read_text(encoding="utf-8").splitlines()]
+
+        assert sorted(
+            (record["repository"], record["plugin"])
+            for record in records
+            if record["record"] == "finding"
+        ) == [
+            ("Repo2", "AutoMerge"),
+            ("Repo2", "ProtectedBranch"),
+        ]
+
+        assert sorted(
+            (record["repository"], record["returncode"])
+            for record in records
+            if record["record"] == "repository"
+        ) == [
+            ("Repo1", 0),
+            ("Repo2", -1),
+        ]
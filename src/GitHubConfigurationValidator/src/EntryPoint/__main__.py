@@ -16,17 +16,23 @@
 """Tools that validates GitHub configuration settings."""
 
 import importlib
+import os
+import queue
 import re
 import sys
 import textwrap
+import threading
+import time
 import traceback
 
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
 from dataclasses import dataclass
 from io import StringIO
 from pathlib import Path
-from typing import Any, Callable, cast, Iterator, Optional, Pattern, Type as PythonType
+from typing import Any, AsyncIterator, Callable, cast, Iterator, Optional, Pattern, Type as PythonType, TypeVar, TYPE_CHECKING, Union
+from urllib.parse import parse_qs, urlparse
 
-import requests
 import typer
 
 from semantic_version import Version as SemVer
@@ -40,9 +46,7 @@ from Common_Foundation.Streams.Capabilities import Capabilities
 from Common_Foundation.Streams.DoneManager import DoneManager, DoneManagerException, DoneManagerFlags
 from Common_Foundation import TextwrapEx
 
-from Common_FoundationEx import ExecuteTasks
-from Common_FoundationEx.InflectEx import inflect
-from Common_FoundationEx.TyperEx import TypeDefinitionsType, ProcessDynamicArgs
+from Common_FoundationEx.TyperEx import TypeDefinitionItem, TypeDefinitionsType, ProcessDynamicArgs
 
 
 # ----------------------------------------------------------------------
@@ -71,8 +75,41 @@ _root_dir = PathEx.EnsureDir(_root_dir.resolve())
 # import other plugins), so we do not remove it.
 sys.path.insert(0, str(_root_dir))
 
-from GitHubConfigurationValidatorLib.GitHubSession import GitHubSession
+# When frozen, the plugins and GitHubConfigurationValidatorLib are distributed as a precompiled
+# PluginBundle (created by setup.py) rather than as source files. The bundle must be in the path before
+# anything in GitHubConfigurationValidatorLib is imported so that the bundled modules are used.
+_plugin_bundle_filename: Optional[Path] = None
+
+if getattr(sys, "frozen", False) and (_root_dir / "PluginBundle.zip").is_file():  # PluginBundle.FILENAME
+    _plugin_bundle_filename = _root_dir / "PluginBundle.zip"
+    sys.path.insert(0, str(_plugin_bundle_filename))
+
+from GitHubConfigurationValidatorLib.Finding import Finding
 from GitHubConfigurationValidatorLib.Plugin import Plugin
+from GitHubConfigurationValidatorLib.PluginBundle import PluginBundle
+from GitHubConfigurationValidatorLib.PluginManifest import PluginManifest
+
+# Modules that are only needed by some commands (most of which import 'requests') are imported where
+# they are used so that commands such as '--help' and 'ListPlugins' start quickly. Use `-X importtime`
+# to see the modules imported by a command and `TestFiles/StartupBenchmark.py` to measure startup
+# times.
+if TYPE_CHECKING:
+    import requests  # pragma: no cover
+
+    from GitHubConfigurationValidatorLib import GraphQLConfigurations  # pragma: no cover
+    from GitHubConfigurationValidatorLib.AsyncGitHubSession import AsyncGitHubSession  # pragma: no cover
+    from GitHubConfigurationValidatorLib.Cassette import Cassette  # pragma: no cover
+    from GitHubConfigurationValidatorLib.FetchContext import FetchContext  # pragma: no cover
+    from GitHubConfigurationValidatorLib.FetchPlan import FetchPlan  # pragma: no cover
+    from GitHubConfigurationValidatorLib.GitHubSession import GitHubSession  # pragma: no cover
+    from GitHubConfigurationValidatorLib.JsonLinesWriter import JsonLinesWriter  # pragma: no cover
+    from GitHubConfigurationValidatorLib.OutcomeMatrix import OutcomeMatrix  # pragma: no cover
+    from GitHubConfigurationValidatorLib.ResponseCache import ResponseCache  # pragma: no cover
+    from GitHubConfigurationValidatorLib.ResultsDatabase import ResultsDatabase  # pragma: no cover
+    from GitHubConfigurationValidatorLib.ResultsDiff import ResultsDiff  # pragma: no cover
+    from GitHubConfigurationValidatorLib.RuleEngine import ResultMatrix, RuleEngine  # pragma: no cover
+    from GitHubConfigurationValidatorLib.Timings import Timings  # pragma: no cover
+    from GitHubConfigurationValidatorLib.ValidationState import ValidationState  # pragma: no cover
 
 
 # ----------------------------------------------------------------------
@@ -85,6 +122,11 @@ class NaturalOrderGrouper(TyperGroup):
 
 # ----------------------------------------------------------------------
 _DEFAULT_GITHUB_URL                         = "https://api.github.com"
+_REPOS_PER_PAGE                             = 100  # The maximum value supported by GitHub
+_DEFAULT_MAX_CONCURRENT_REQUESTS            = 32  # RateLimitScheduler.DEFAULT_MAX_CONCURRENT_REQUESTS
+_WORK_QUEUE_POLL_SECONDS                    = 0.5  # How often a blocked producer checks that workers are still running
+
+_PLUGIN_MANIFEST_ENVIRONMENT_VAR            = "GITHUB_CONFIGURATION_VALIDATOR_PLUGIN_MANIFEST"  # Set to "0" to disable the plugin manifest
 
 # ----------------------------------------------------------------------
 app                                         = typer.Typer(
@@ -103,6 +145,11 @@ _max_plugin_version_option                  = typer.Option(None, "--max-plugin-v
 _additional_plugin_dirs_option              = typer.Option(None, "--plugin-dir", file_okay=False, exists=True, help="Additional directories to search for plugins.")
 _github_url_option                          = typer.Option(_DEFAULT_GITHUB_URL, "--github-url", help="GitHub url. ")
 _pat_option                                 = typer.Option(None, "--pat", help="GitHub Personal Access Token (PAT) or filename containing a PAT.")
+_cache_option                               = typer.Option(None, "--cache", dir_okay=False, help="Filename of an on-disk cache used to store GitHub responses; cached responses are revalidated via conditional requests, which do not count against the GitHub rate limit.")
+_record_option                              = typer.Option(None, "--record", dir_okay=False, help="Record all requests sent to GitHub (and the responses received) in a cassette file that can be replayed via '--replay'.")
+_replay_option                              = typer.Option(None, "--replay", dir_okay=False, exists=True, help="Replay the responses recorded in a cassette file (via '--record') rather than accessing GitHub.")
+_replay_latency_option                      = typer.Option(0.0, "--replay-latency", min=0.0, help="Number of seconds to wait before returning each response when using '--replay'.")
+_max_concurrent_requests_option             = typer.Option(_DEFAULT_MAX_CONCURRENT_REQUESTS, "--max-concurrent-requests", min=1, help="Maximum number of requests sent to GitHub concurrently; this value is reduced automatically as the GitHub rate limit budget is exhausted.")
 _ignore_archived_option                     = typer.Option(None, "--ignore-archived", help="Do not process archived repositories.")
 _ignore_forks_option                        = typer.Option(None, "--ignore-forks", help="Do not process forked repositories.")
 _include_repos_option                       = typer.Option(None, "--include-repo", help="Regular expression matching GitHub repository names that should be processed.")
@@ -110,6 +157,34 @@ _exclude_repos_option                       = typer.Option(None, "--exclude-repo
 _include_plugins_option                     = typer.Option(None, "--include-plugin", help="Regular expression matching plugin names that should be applied.")
 _exclude_plugins_option                     = typer.Option(None, "--exclude-plugin", help="Regular expression matching plugin names that should not be applied.")
 _with_rationale_option                      = typer.Option(None, "--rationale", help="Include plugin rationale in the output.")
+_output_jsonl_option                        = typer.Option(None, "--output-jsonl", dir_okay=False, help="Write the results to a JSON Lines file (one record for each message produced by a plugin and one summary record for each repository) as each repository's validation is complete.")
+_timings_option                             = typer.Option(False, "--timings", help="Display the call counts and durations of each GitHub endpoint, plugin, and phase once the command is complete.")
+
+
+# ----------------------------------------------------------------------
+@app.callback()
+def AppCallback(
+    ctx: typer.Context,
+    profile_filename: Optional[Path]=typer.Option(None, "--profile", dir_okay=False, help="Profile the command and write the profiling data (in pstats format) to this file; a summary of the functions with the highest cumulative times is written to '<filename>.txt'."),
+) -> None:
+    if profile_filename is None:
+        return
+
+    from GitHubConfigurationValidatorLib.Profiler import Profiler
+
+    profiler = Profiler()
+
+    # ----------------------------------------------------------------------
+    def OnClose() -> None:
+        profiler.Stop()
+        profiler.Save(profile_filename)
+
+    # ----------------------------------------------------------------------
+
+    # The callback is invoked when the command completes (even if it exits via an exception)
+    ctx.call_on_close(OnClose)
+
+    profiler.Start()
 
 
 # ----------------------------------------------------------------------
@@ -134,7 +209,7 @@ def ListPlugins(
     with DoneManager.CreateCommandLine(
         output_flags=DoneManagerFlags.Create(verbose=verbose, debug=debug),
     ) as dm:
-        plugins = _GetPlugins(ctx, dm, additional_plugin_dirs, [], [], max_plugin_version)
+        plugins = _GetPluginEntries(ctx, dm, additional_plugin_dirs, max_plugin_version)
         if dm.result != 0:
             return
 
@@ -164,11 +239,7 @@ def ListPlugins(
                 return
 
             for plugin in plugins:
-                stream.write(
-                    plugin.GenerateDisplayString(
-                        resolution_repository="<repo name here>",
-                    ),
-                )
+                stream.write(plugin.display_string)
 
 
 # ----------------------------------------------------------------------
@@ -193,7 +264,7 @@ def PluginInfo(
     with DoneManager.CreateCommandLine(
         output_flags=DoneManagerFlags.Create(verbose=verbose, debug=debug),
     ) as dm:
-        plugins = _GetPlugins(ctx, dm, additional_plugin_dirs, [], [], None)
+        plugins = _GetPluginEntries(ctx, dm, additional_plugin_dirs, None)
         if dm.result != 0:
             return
 
@@ -203,11 +274,7 @@ def PluginInfo(
             return
 
         with dm.YieldStream() as stream:
-            stream.write(
-                plugin.GenerateDisplayString(
-                    resolution_repository="<repo name here>",
-                ),
-            )
+            stream.write(plugin.display_string)
 
 
 # ----------------------------------------------------------------------
@@ -217,37 +284,59 @@ def ListRepos(
     username: str=_username_argument,
     github_url: str=_github_url_option,
     pat: str=_pat_option,
+    cache_filename: Optional[Path]=_cache_option,
+    record_filename: Optional[Path]=_record_option,
+    replay_filename: Optional[Path]=_replay_option,
+    replay_latency: float=_replay_latency_option,
+    max_concurrent_requests: int=_max_concurrent_requests_option,
     ignore_archived: bool=_ignore_archived_option,
     ignore_forks: bool=_ignore_forks_option,
     include_repos: list[str]=_include_repos_option,
     exclude_repos: list[str]=_exclude_repos_option,
+    show_timings: bool=_timings_option,
     verbose: bool=typer.Option(False, "--verbose", help="Write verbose information to the terminal."),
     debug: bool=typer.Option(False, "--debug", help="Write debug information to the terminal."),
 ) -> None:
     """Lists all repositories associated with a GitHub user/organization."""
 
-    with DoneManager.CreateCommandLine(
-        output_flags=DoneManagerFlags.Create(verbose=verbose, debug=debug),
-    ) as dm:
-        session = GitHubSession(github_url, username, pat)
-
-        repositories = _GetRepos(
+    with (
+        DoneManager.CreateCommandLine(
+            output_flags=DoneManagerFlags.Create(verbose=verbose, debug=debug),
+        ) as dm,
+        _YieldTimings(dm, show_timings) as timings,
+    ):
+        with _YieldSession(
             dm,
-            session,
-            include_repos,
-            exclude_repos,
-            ignore_archived=ignore_archived,
-            ignore_forks=ignore_forks,
-        )
-
-        with dm.YieldStream() as stream:
-            stream.write(
-                "\n".join(
-                    "{}) {}".format(index + 1, repository)
-                    for index, repository in enumerate(repositories)
-                ),
+            github_url,
+            username,
+            pat,
+            cache_filename,
+            max_concurrent_requests,
+            record_filename=record_filename,
+            replay_filename=replay_filename,
+            replay_latency=replay_latency,
+            timings=timings,
+        ) as session:
+            repositories = _GetRepos(
+                dm,
+                session,
+                include_repos,
+                exclude_repos,
+                ignore_archived=ignore_archived,
+                ignore_forks=ignore_forks,
             )
-            stream.write("\n")
+
+            with (
+                _YieldPhaseTimer(timings, "Writing output"),
+                dm.YieldStream() as stream,
+            ):
+                stream.write(
+                    "\n".join(
+                        "{}) {}".format(index + 1, repository_info["name"])
+                        for index, repository_info in enumerate(repositories)
+                    ),
+                )
+                stream.write("\n")
 
 
 # ----------------------------------------------------------------------
@@ -266,11 +355,18 @@ def ValidateRepo(
     repository: str=typer.Argument(None, help="Name of the GitHub repository to validate."),
     github_url: str=_github_url_option,
     pat: str=_pat_option,
+    cache_filename: Optional[Path]=_cache_option,
+    record_filename: Optional[Path]=_record_option,
+    replay_filename: Optional[Path]=_replay_option,
+    replay_latency: float=_replay_latency_option,
+    max_concurrent_requests: int=_max_concurrent_requests_option,
     include_plugins: list[str]=_include_plugins_option,
     exclude_plugins: list[str]=_exclude_plugins_option,
     max_plugin_version=_max_plugin_version_option,
     additional_plugin_dirs: list[Path]=_additional_plugin_dirs_option,
     with_rationale: bool=_with_rationale_option,
+    output_jsonl_filename: Optional[Path]=_output_jsonl_option,
+    show_timings: bool=_timings_option,
     verbose: bool=typer.Option(False, "--verbose", help="Write verbose information to the terminal."),
     debug: bool=typer.Option(False, "--debug", help="Write debug information to the terminal."),
 ) -> None:
@@ -279,29 +375,52 @@ def ValidateRepo(
     if with_rationale and not verbose:
         verbose = True
 
-    with DoneManager.CreateCommandLine(
-        output_flags=DoneManagerFlags.Create(verbose=verbose, debug=debug),
-    ) as dm:
+    with (
+        DoneManager.CreateCommandLine(
+            output_flags=DoneManagerFlags.Create(verbose=verbose, debug=debug),
+        ) as dm,
+        _YieldTimings(dm, show_timings) as timings,
+    ):
         with dm.Nested("Validating '{}'...".format(repository)) as validate_dm:
-            plugins = _GetPlugins(
-                ctx,
-                validate_dm,
-                additional_plugin_dirs,
-                include_plugins,
-                exclude_plugins,
-                max_plugin_version,
-            )
+            with _YieldPhaseTimer(timings, "Loading plugins"):
+                plugins = _GetPlugins(
+                    ctx,
+                    validate_dm,
+                    additional_plugin_dirs,
+                    include_plugins,
+                    exclude_plugins,
+                    max_plugin_version,
+                )
 
             if validate_dm.result != 0:
                 return
 
-            _ValidateRepo(
-                validate_dm,
-                GitHubSession(github_url, username, pat),
-                repository,
-                plugins,
-                with_rationale=with_rationale,
-            )
+            with (
+                _YieldJsonLinesWriter(validate_dm, output_jsonl_filename) as jsonl_writer,
+                _YieldSession(
+                    validate_dm,
+                    github_url,
+                    username,
+                    pat,
+                    cache_filename,
+                    max_concurrent_requests,
+                    record_filename=record_filename,
+                    replay_filename=replay_filename,
+                    replay_latency=replay_latency,
+                    timings=timings,
+                ) as session,
+            ):
+                with _YieldPhaseTimer(timings, "Validating repository"):
+                    findings, _ = _ValidateRepo(
+                        validate_dm,
+                        session,
+                        repository,
+                        plugins,
+                        with_rationale=with_rationale,
+                    )
+
+                if jsonl_writer is not None:
+                    jsonl_writer.WriteRepository(repository, validate_dm.result, findings)
 
 
 # ----------------------------------------------------------------------
@@ -319,6 +438,11 @@ def ValidateRepos(
     username: str=_username_argument,
     github_url: str=_github_url_option,
     pat: str=_pat_option,
+    cache_filename: Optional[Path]=_cache_option,
+    record_filename: Optional[Path]=_record_option,
+    replay_filename: Optional[Path]=_replay_option,
+    replay_latency: float=_replay_latency_option,
+    max_concurrent_requests: int=_max_concurrent_requests_option,
     ignore_archived: bool=_ignore_archived_option,
     ignore_forks: bool=_ignore_forks_option,
     include_repos: list[str]=_include_repos_option,
@@ -329,6 +453,17 @@ def ValidateRepos(
     additional_plugin_dirs: list[Path]=_additional_plugin_dirs_option,
     with_rationale: bool=_with_rationale_option,
     ignore_warnings_in_repo_param: list[str]=typer.Option(None, "--ignore-warnings-in-repo", help="Ignore warnings in the specified repository."),
+    use_async: bool=typer.Option(False, "--async", help="Validate repositories with the asyncio engine, which is able to keep many more requests in flight than the default (thread-based) engine; the value of '--max-concurrent-requests' limits the number of concurrent requests."),
+    state_filename: Optional[Path]=typer.Option(None, "--state", dir_okay=False, help="Filename of an on-disk store of validation results; the results for repositories that haven't changed since the previous validation (and were validated with the same plugins and arguments) are displayed without accessing GitHub."),
+    full: bool=typer.Option(False, "--full", help="Validate all repositories, even if the results stored via '--state' are current."),
+    use_graphql: bool=typer.Option(False, "--graphql", help="Retrieve repository settings, default branch settings, and branch protection settings for many repositories per request via the GitHub GraphQL API rather than retrieving them individually via the REST API."),
+    output_jsonl_filename: Optional[Path]=_output_jsonl_option,
+    results_db_filename: Optional[Path]=typer.Option(None, "--results-db", dir_okay=False, help="Filename of a SQLite database that accumulates the results of each run (indexed by run, repository, and plugin) so that historical results can be queried without accessing GitHub."),
+    diff_against_filename: Optional[Path]=typer.Option(None, "--diff-against", dir_okay=False, exists=True, help="Display only the findings that are new, resolved, or changed since a previous run (as written via '--output-jsonl' or as stored via '--results-db'); the result reflects only new and changed findings."),
+    show_summary: bool=typer.Option(False, "--summary", help="Display the number of repositories with errors and warnings for each plugin once all repositories have been validated; outcomes are stored compactly (2 bits per repository and plugin), so this is suitable for very large organizations."),
+    stream: bool=typer.Option(False, "--stream", help="Write the results of each repository as soon as its validation is complete (in the order in which validations complete) rather than once all repositories have been validated; results are not retained, so memory usage does not grow with the number of repositories."),
+    columnar: bool=typer.Option(False, "--columnar", help="Retrieve the settings of all repositories before validating them so that rules can be evaluated for all repositories at once (one column of values per setting) rather than repository by repository; this is more efficient for large organizations but requires more memory."),
+    show_timings: bool=_timings_option,
     verbose: bool=typer.Option(False, "--verbose", help="Write verbose information to the terminal."),
     debug: bool=typer.Option(False, "--debug", help="Write debug information to the terminal."),
 ) -> None:
@@ -339,111 +474,665 @@ def ValidateRepos(
 
     ignore_warnings_in_repo = set(ignore_warnings_in_repo_param)
 
-    with DoneManager.CreateCommandLine(
-        output_flags=DoneManagerFlags.Create(verbose=verbose, debug=debug),
-    ) as dm:
-        plugins = _GetPlugins(
-            ctx,
-            dm,
-            additional_plugin_dirs,
-            include_plugins,
-            exclude_plugins,
-            max_plugin_version,
-        )
+    with (
+        DoneManager.CreateCommandLine(
+            output_flags=DoneManagerFlags.Create(verbose=verbose, debug=debug),
+        ) as dm,
+        _YieldTimings(dm, show_timings) as timings,
+    ):
+        with _YieldPhaseTimer(timings, "Loading plugins"):
+            plugins = _GetPlugins(
+                ctx,
+                dm,
+                additional_plugin_dirs,
+                include_plugins,
+                exclude_plugins,
+                max_plugin_version,
+            )
 
         if dm.result != 0:
             return
 
-        session = GitHubSession(github_url, username, pat)
+        with _YieldPhaseTimer(timings, "Preparing plugins"):
+            # Modules used by plugins during validation are imported once here rather than by each
+            # validation thread (which would serialize the threads on the import lock).
+            for plugin in plugins:
+                plugin.Prepare()
+
+        from GitHubConfigurationValidatorLib.FetchContext import FetchContext
+        from GitHubConfigurationValidatorLib.FetchPlan import FetchPlan
+        from GitHubConfigurationValidatorLib.ResultsDiff import ResultsDiff
+        from GitHubConfigurationValidatorLib.RuleEngine import RuleEngine
+        from GitHubConfigurationValidatorLib.ValidationState import ValidationState
+
+        # The previous results must be loaded before anything is written, as they may be stored in
+        # the same database as the current results.
+        results_diff: Optional[ResultsDiff] = None
+
+        if diff_against_filename is not None:
+            with dm.Nested(
+                "Loading previous results from '{}'...".format(diff_against_filename),
+                lambda: "{} found".format(_CountNoun("repository", 0 if results_diff is None else results_diff.num_previous_repositories)),
+                suffix="\n",
+            ) as load_dm:
+                try:
+                    results_diff = ResultsDiff.Load(diff_against_filename, github_url, username)
+                except Exception as ex:  # pylint: disable=broad-exception-caught
+                    load_dm.WriteError("{}\n".format(ex))
+                    return
+
+        diff_counts = {change_type: 0 for change_type in ResultsDiff.ChangeType}
+        diff_counts_lock = threading.Lock()
+
+        outcome_matrix: Optional[OutcomeMatrix] = None
+
+        if show_summary:
+            from GitHubConfigurationValidatorLib.OutcomeMatrix import OutcomeMatrix
+
+            outcome_matrix = OutcomeMatrix([plugin.name for plugin in plugins])
+
+        # The rules and the requests required by the plugins are compiled once and shared by all
+        # repositories
+        rule_engine = RuleEngine(plugins)
+        fetch_plan = FetchPlan(plugins)
+
+        with (
+            _YieldValidationState(
+                dm,
+                state_filename,
+                github_url,
+                username,
+                lambda: ValidationState.CreatePolicy(
+                    plugins,
+                    github_url=github_url,
+                    username=username,
+                    with_rationale=with_rationale,
+                    verbose=dm.is_verbose,
+                    debug=dm.is_debug,
+                    ignore_warnings_in_repo=sorted(ignore_warnings_in_repo),
+                ),
+            ) as validation_state,
+            _YieldJsonLinesWriter(dm, output_jsonl_filename) as jsonl_writer,
+            _YieldResultsDatabase(dm, results_db_filename, github_url, username) as results_db,
+            _YieldSession(
+                dm,
+                github_url,
+                username,
+                pat,
+                cache_filename,
+                max_concurrent_requests,
+                record_filename=record_filename,
+                replay_filename=replay_filename,
+                replay_latency=replay_latency,
+                timings=timings,
+            ) as session,
+        ):
+            # ----------------------------------------------------------------------
+            @dataclass
+            class ExecuteResult(object):
+                returncode: int
+                output: str
 
-        repositories = _GetRepos(
-            dm,
-            session,
-            include_repos,
-            exclude_repos,
-            ignore_archived=ignore_archived,
-            ignore_forks=ignore_forks,
-        )
-        if not repositories:
-            return
+            # ----------------------------------------------------------------------
+            def ValidateRepository(
+                repository_info: dict[str, Any],
+                fetch_context: Optional["FetchContext"]=None,
+                configurations: Optional["GraphQLConfigurations.ConfigurationsType"]=None,
+                rule_results: Optional["ResultMatrix.RowType"]=None,
+            ) -> Optional[ExecuteResult]:
+                if validation_state is not None and not full:
+                    entry = validation_state.Get(repository_info)
+                    if entry is not None:
+                        WriteResults(
+                            repository_info["name"],
+                            entry.returncode,
+                            entry.findings,
+                            entry.skipped_plugin_names,
+                            is_replayed=True,
+                        )
+
+                        if results_diff is not None:
+                            return CreateDiffResult(repository_info["name"], entry.findings)
+
+                        if entry.output is None:
+                            return None
+
+                        return ExecuteResult(entry.returncode, entry.output)
+
+                returncode, output, findings, skipped_plugin_names = ValidateRepositoryImpl(
+                    repository_info,
+                    fetch_context,
+                    configurations,
+                    rule_results,
+                )
 
-        # ----------------------------------------------------------------------
-        @dataclass
-        class ExecuteResult(object):
-            returncode: int
-            output: str
+                if validation_state is not None:
+                    validation_state.Set(repository_info, returncode, output, findings, skipped_plugin_names)
 
-        # ----------------------------------------------------------------------
-        def Execute(
-            context: str,
-            on_simple_status_func: Callable[[str], None],  # pylint: disable=unused-argument
-        ) -> ExecuteTasks.TransformTypes.FuncType[Optional[ExecuteResult]]:
-            repository = context
-            del context
+                WriteResults(repository_info["name"], returncode, findings, skipped_plugin_names)
+
+                if results_diff is not None:
+                    return CreateDiffResult(repository_info["name"], findings)
+
+                if output is None:
+                    return None
+
+                return ExecuteResult(returncode, output)
+
+            # ----------------------------------------------------------------------
+            def WriteResults(
+                repository: str,
+                returncode: int,
+                findings: list[Finding],
+                skipped_plugin_names: list[str],
+                *,
+                is_replayed: bool=False,
+            ) -> None:
+                if jsonl_writer is not None:
+                    jsonl_writer.WriteRepository(repository, returncode, findings, is_replayed=is_replayed)
+
+                if results_db is not None:
+                    results_db.WriteRepository(repository, returncode, findings, is_replayed=is_replayed)
+
+                if outcome_matrix is not None:
+                    outcome_matrix.AddRepository(repository, findings, skipped_plugin_names)
 
             # ----------------------------------------------------------------------
-            def Impl(
-                status: ExecuteTasks.Status,  # pylint: disable=unused-argument
+            def OnError(
+                repository_info: dict[str, Any],
+            ) -> None:
+                # Errors have been displayed; every plugin was skipped for the repository
+                if outcome_matrix is not None:
+                    outcome_matrix.AddRepository(repository_info["name"], None)
+
+            # ----------------------------------------------------------------------
+            def CreateDiffResult(
+                repository: str,
+                findings: list[Finding],
             ) -> Optional[ExecuteResult]:
+                assert results_diff is not None
+
+                changes = results_diff.Compare(repository, findings)
+                if not changes:
+                    return None
+
+                with diff_counts_lock:
+                    for change in changes:
+                        diff_counts[change.change_type] += 1
+
                 sink = StringIO()
 
                 Capabilities.Set(sink, dm.capabilities)
 
                 with DoneManager.Create(
                     sink,
-                    "Checking '{}'...".format(repository),
+                    "Changes in '{}'...".format(repository),
                     output_flags=DoneManagerFlags.Create(verbose=dm.is_verbose, debug=dm.is_debug),
                 ) as this_dm:
-                    _ValidateRepo(
-                        this_dm,
-                        session,
-                        repository,
-                        plugins,
-                        with_rationale=with_rationale,
-                    )
+                    for change in changes:
+                        finding = change.finding
+
+                        if change.change_type == ResultsDiff.ChangeType.Resolved:
+                            this_dm.WriteInfo("[{}] (resolved) {}\n".format(finding.plugin, finding.message))
+                            continue
 
-                    original_result = this_dm.result
+                        if change.change_type == ResultsDiff.ChangeType.New:
+                            message = "[{}] (new) {}\n".format(finding.plugin, finding.message)
+                        elif change.change_type == ResultsDiff.ChangeType.Changed:
+                            assert change.previous_message_type is not None
+                            message = "[{}] (previously {}) {}\n".format(
+                                finding.plugin,
+                                change.previous_message_type.name.lower(),
+                                finding.message,
+                            )
+                        else:
+                            assert False, change.change_type  # pragma: no cover
+
+                        if finding.message_type == Plugin.MessageType.Error:
+                            this_dm.WriteError(message)
+                        elif finding.message_type == Plugin.MessageType.Warning:
+                            this_dm.WriteWarning(message)
+                        elif finding.message_type == Plugin.MessageType.Info:
+                            this_dm.WriteInfo(message)
+                        else:
+                            assert False, finding.message_type  # pragma: no cover
 
                     if this_dm.result > 0 and repository in ignore_warnings_in_repo:
                         this_dm.result = 0
 
-                if original_result != 0:
-                    return ExecuteResult(this_dm.result, sink.getvalue())
+                return ExecuteResult(this_dm.result, sink.getvalue())
 
-                return None
+            # ----------------------------------------------------------------------
+            def ValidateRepositoryImpl(
+                repository_info: dict[str, Any],
+                fetch_context: Optional["FetchContext"],
+                configurations: Optional["GraphQLConfigurations.ConfigurationsType"],
+                rule_results: Optional["ResultMatrix.RowType"],
+            ) -> tuple[int, Optional[str], list[Finding], list[str]]:
+                return _ValidateRepoCaptured(
+                    dm,
+                    session,
+                    repository_info["name"],
+                    plugins,
+                    ignore_warnings_in_repo,
+                    with_rationale=with_rationale,
+                    rule_engine=rule_engine,
+                    rule_results=rule_results,
+                    fetch_plan=fetch_plan,
+                    repository_info=repository_info,
+                    fetch_context=fetch_context,
+                    configurations=configurations,
+                )
 
             # ----------------------------------------------------------------------
+            def CollectRepository(
+                repository_info: dict[str, Any],
+                fetch_context: Optional["FetchContext"],
+                configurations: Optional["GraphQLConfigurations.ConfigurationsType"],
+            ) -> _CollectedRepository:
+                if validation_state is not None and not full and validation_state.Get(repository_info) is not None:
+                    # The previous results will be replayed
+                    return _CollectedRepository(repository_info, None, None)
 
-            return Impl
+                if fetch_context is None:
+                    fetch_context = FetchContext(session)
 
-        # ----------------------------------------------------------------------
+                if configurations is None:
+                    configurations = fetch_plan.Execute(fetch_context, repository_info["name"], repository_info)
+
+                return _CollectedRepository(repository_info, fetch_context, configurations)
+
+            # ----------------------------------------------------------------------
+            streamed_returncode = 0
+
+            def StreamResult(
+                validate_dm: DoneManager,
+                result: ExecuteResult,
+            ) -> None:
+                nonlocal streamed_returncode
+
+                validate_dm.WriteLine("")
+                validate_dm.WriteLine(result.output)
+
+                streamed_returncode = _MergeReturnCodes(streamed_returncode, result.returncode)
+
+            # ----------------------------------------------------------------------
+
+            stream_func = StreamResult if stream else None
+
+            validate_repos_func = _ValidateReposAsync if use_async else _ValidateRepos
+
+            with _YieldPhaseTimer(timings, "Validating repositories"):
+                if columnar:
+                    with _YieldPhaseTimer(timings, "Retrieving configurations"):
+                        collected_repositories = validate_repos_func(
+                            dm,
+                            session,
+                            plugins,
+                            fetch_plan,
+                            include_repos,
+                            exclude_repos,
+                            CollectRepository,
+                            ignore_archived=ignore_archived,
+                            ignore_forks=ignore_forks,
+                            max_concurrency=max_concurrent_requests,
+                            use_graphql=use_graphql,
+                            is_current_func=None if validation_state is None or full else validation_state.IsCurrent,
+                            header="Retrieving configurations...",
+                            progress_verb="retrieved",
+                            on_error_func=OnError,
+                        )
+
+                    results = _ValidateReposColumnar(
+                        dm,
+                        rule_engine,
+                        collected_repositories,
+                        ValidateRepository,
+                        max_concurrency=max_concurrent_requests,
+                        timings=timings,
+                        stream_func=stream_func,
+                        on_error_func=OnError,
+                    )
+                else:
+                    results = validate_repos_func(
+                        dm,
+                        session,
+                        plugins,
+                        fetch_plan,
+                        include_repos,
+                        exclude_repos,
+                        ValidateRepository,
+                        ignore_archived=ignore_archived,
+                        ignore_forks=ignore_forks,
+                        max_concurrency=max_concurrent_requests,
+                        use_graphql=use_graphql,
+                        is_current_func=None if validation_state is None or full else validation_state.IsCurrent,
+                        stream_func=stream_func,
+                        on_error_func=OnError,
+                    )
+
+            if results_diff is not None:
+                dm.WriteInfo(
+                    "Changes since '{}': {} new, {} changed, {} resolved.\n".format(
+                        results_diff.filename,
+                        diff_counts[ResultsDiff.ChangeType.New],
+                        diff_counts[ResultsDiff.ChangeType.Changed],
+                        diff_counts[ResultsDiff.ChangeType.Resolved],
+                    ),
+                )
+
+            if stream:
+                dm.result = _MergeReturnCodes(dm.result, streamed_returncode)
+
+            elif results:
+                dm.WriteLine("")
 
-        results = ExecuteTasks.Transform(
+                with _YieldPhaseTimer(timings, "Writing output"):
+                    for result in results:
+                        if result is None:
+                            continue
+
+                        dm.WriteLine(result.output)
+                        dm.WriteLine("")
+
+                        dm.result = _MergeReturnCodes(dm.result, result.returncode)
+
+            if outcome_matrix is not None:
+                with _YieldPhaseTimer(timings, "Summarizing"):
+                    dm.WriteLine("\n{}\n".format(outcome_matrix.GenerateReport()))
+
+
+# ----------------------------------------------------------------------
+@app.command("ExportSnapshot", no_args_is_help=True)
+@use_yaml_config()
+def ExportSnapshot(
+    username: str=_username_argument,
+    snapshot_filename: Path=typer.Argument(..., dir_okay=False, help="Name of the snapshot file to create."),
+    github_url: str=_github_url_option,
+    pat: str=_pat_option,
+    cache_filename: Optional[Path]=_cache_option,
+    record_filename: Optional[Path]=_record_option,
+    replay_filename: Optional[Path]=_replay_option,
+    replay_latency: float=_replay_latency_option,
+    max_concurrent_requests: int=_max_concurrent_requests_option,
+    ignore_archived: bool=_ignore_archived_option,
+    ignore_forks: bool=_ignore_forks_option,
+    include_repos: list[str]=_include_repos_option,
+    exclude_repos: list[str]=_exclude_repos_option,
+    use_async: bool=typer.Option(False, "--async", help="Retrieve configuration information with the asyncio engine, which is able to keep many more requests in flight than the default (thread-based) engine; the value of '--max-concurrent-requests' limits the number of concurrent requests."),
+    use_graphql: bool=typer.Option(False, "--graphql", help="Retrieve repository settings, default branch settings, and branch protection settings for many repositories per request via the GitHub GraphQL API rather than retrieving them individually via the REST API."),
+    show_timings: bool=_timings_option,
+    verbose: bool=typer.Option(False, "--verbose", help="Write verbose information to the terminal."),
+    debug: bool=typer.Option(False, "--debug", help="Write debug information to the terminal."),
+) -> None:
+    """Exports the repository, branch, and branch protection settings of repositories associated with a GitHub user/organization to a snapshot that can be validated offline via 'ValidateSnapshot'."""
+
+    with (
+        DoneManager.CreateCommandLine(
+            output_flags=DoneManagerFlags.Create(verbose=verbose, debug=debug),
+        ) as dm,
+        _YieldTimings(dm, show_timings) as timings,
+    ):
+        from GitHubConfigurationValidatorLib.FetchContext import FetchContext
+        from GitHubConfigurationValidatorLib.FetchPlan import FetchPlan
+        from GitHubConfigurationValidatorLib.Snapshot import Snapshot, SnapshotWriter
+
+        # All of the configuration information available to (non-custom) plugins is retrieved, so
+        # that any plugin can be applied to the snapshot.
+        fetch_plan = FetchPlan([], Snapshot.CONFIGURATION_TYPES)
+
+        with _YieldSession(
             dm,
-            "Validating repositories...",
-            [
-                ExecuteTasks.TaskData(repository, repository)
-                for repository in repositories
-            ],
-            Execute,
-        )
+            github_url,
+            username,
+            pat,
+            cache_filename,
+            max_concurrent_requests,
+            record_filename=record_filename,
+            replay_filename=replay_filename,
+            replay_latency=replay_latency,
+            timings=timings,
+        ) as session:
+            snapshot_writer = SnapshotWriter(snapshot_filename, session.github_url, username, session.has_pat)
+
+            try:
+                # ----------------------------------------------------------------------
+                def ExportRepository(
+                    repository_info: dict[str, Any],
+                    fetch_context: Optional["FetchContext"],
+                    configurations: Optional["GraphQLConfigurations.ConfigurationsType"],
+                ) -> None:
+                    if fetch_context is None:
+                        fetch_context = FetchContext(session)
 
-        dm.WriteLine("")
+                    if configurations is None:
+                        configurations = fetch_plan.Execute(fetch_context, repository_info["name"], repository_info)
 
-        for result in results:
-            if result is None:
-                continue
+                    snapshot_writer.Add(repository_info, configurations)
+
+                # ----------------------------------------------------------------------
+
+                validate_repos_func = _ValidateReposAsync if use_async else _ValidateRepos
+
+                with _YieldPhaseTimer(timings, "Exporting repositories"):
+                    validate_repos_func(
+                        dm,
+                        session,
+                        [],
+                        fetch_plan,
+                        include_repos,
+                        exclude_repos,
+                        ExportRepository,
+                        ignore_archived=ignore_archived,
+                        ignore_forks=ignore_forks,
+                        max_concurrency=max_concurrent_requests,
+                        use_graphql=use_graphql,
+                        header="Exporting repositories...",
+                        progress_verb="exported",
+                        on_error_func=snapshot_writer.AddFailure,
+                    )
+
+            except:
+                snapshot_writer.Close(commit=False)
+                raise
+
+            # Repositories that couldn't be exported have been reported as errors; they are recorded
+            # in the snapshot so that they are reported as errors when it is validated as well.
+            snapshot_writer.Close()
+
+            dm.WriteInfo(
+                "{} written to '{}'{}.\n".format(
+                    _CountNoun("repository", snapshot_writer.num_repositories),
+                    snapshot_filename,
+                    "" if not snapshot_writer.num_failed_repositories else " ({} could not be exported)".format(
+                        _CountNoun("repository", snapshot_writer.num_failed_repositories),
+                    ),
+                ),
+            )
+
+
+# ----------------------------------------------------------------------
+@app.command(
+    "ValidateSnapshot",
+    context_settings={
+        "allow_extra_args": True,
+        "ignore_unknown_options": True,
+    },
+    no_args_is_help=True,
+)
+@use_yaml_config()
+def ValidateSnapshot(
+    ctx: typer.Context,
+    snapshot_filename: Path=typer.Argument(..., dir_okay=False, exists=True, help="Name of a snapshot file created via 'ExportSnapshot'."),
+    ignore_archived: bool=_ignore_archived_option,
+    ignore_forks: bool=_ignore_forks_option,
+    include_repos: list[str]=_include_repos_option,
+    exclude_repos: list[str]=_exclude_repos_option,
+    include_plugins: list[str]=_include_plugins_option,
+    exclude_plugins: list[str]=_exclude_plugins_option,
+    max_plugin_version=_max_plugin_version_option,
+    additional_plugin_dirs: list[Path]=_additional_plugin_dirs_option,
+    with_rationale: bool=_with_rationale_option,
+    ignore_warnings_in_repo_param: list[str]=typer.Option(None, "--ignore-warnings-in-repo", help="Ignore warnings in the specified repository."),
+    output_jsonl_filename: Optional[Path]=_output_jsonl_option,
+    show_timings: bool=_timings_option,
+    verbose: bool=typer.Option(False, "--verbose", help="Write verbose information to the terminal."),
+    debug: bool=typer.Option(False, "--debug", help="Write debug information to the terminal."),
+) -> None:
+    """Validates the repositories in a snapshot (created via 'ExportSnapshot') without accessing GitHub; custom plugins are not applied."""
+
+    if with_rationale and not verbose:
+        verbose = True
+
+    ignore_warnings_in_repo = set(ignore_warnings_in_repo_param)
+
+    with (
+        DoneManager.CreateCommandLine(
+            output_flags=DoneManagerFlags.Create(verbose=verbose, debug=debug),
+        ) as dm,
+        _YieldTimings(dm, show_timings) as timings,
+    ):
+        with _YieldPhaseTimer(timings, "Loading plugins"):
+            plugins = _GetPlugins(
+                ctx,
+                dm,
+                additional_plugin_dirs,
+                include_plugins,
+                exclude_plugins,
+                max_plugin_version,
+            )
+
+        if dm.result != 0:
+            return
+
+        # Custom plugins access GitHub directly, so they can't be applied to a snapshot
+        custom_plugin_names = [
+            plugin.name
+            for plugin in plugins
+            if plugin.configuration_type == Plugin.ConfigurationType.Custom
+        ]
+
+        if custom_plugin_names:
+            dm.WriteInfo("Custom plugins are not applied to snapshots: {}.\n".format(", ".join(custom_plugin_names)))
+
+            plugins = [plugin for plugin in plugins if plugin.configuration_type != Plugin.ConfigurationType.Custom]
+
+        from GitHubConfigurationValidatorLib.FetchPlan import FetchPlan
+        from GitHubConfigurationValidatorLib.RuleEngine import RuleEngine
+        from GitHubConfigurationValidatorLib.Snapshot import Snapshot
+
+        include_exprs = _CreateRegexes(include_repos)
+        exclude_exprs = _CreateRegexes(exclude_repos)
+
+        repositories: list[Snapshot.Repository] = []
+
+        with _YieldPhaseTimer(timings, "Loading snapshot"):
+            with dm.Nested(
+                "Loading '{}'...".format(snapshot_filename),
+                lambda: "{} matched".format(_CountNoun("repository", len(repositories))),
+                suffix="\n",
+            ) as load_dm:
+                try:
+                    snapshot = Snapshot.Load(snapshot_filename)
+                except Exception as ex:  # pylint: disable=broad-exception-caught
+                    load_dm.WriteError("{}\n".format(ex))
+                    return
+
+                try:
+                    load_dm.WriteVerbose(
+                        "'{}' ({}) was exported on {} UTC.\n".format(
+                            snapshot.username,
+                            snapshot.github_url,
+                            snapshot.created_at,
+                        ),
+                    )
+
+                    for repository in snapshot.EnumRepositories():
+                        if _IsRepoIncluded(
+                            load_dm,
+                            repository.repository_info,
+                            include_exprs,
+                            exclude_exprs,
+                            ignore_archived=ignore_archived,
+                            ignore_forks=ignore_forks,
+                        ):
+                            repositories.append(repository)
+
+                    for repository_info in snapshot.failed_repositories:
+                        if _IsRepoIncluded(
+                            load_dm,
+                            repository_info,
+                            include_exprs,
+                            exclude_exprs,
+                            ignore_archived=ignore_archived,
+                            ignore_forks=ignore_forks,
+                        ):
+                            load_dm.WriteError("'{}' could not be exported when the snapshot was created.\n".format(repository_info["name"]))
+
+                finally:
+                    snapshot.Close()
+
+        # The rules of all repositories are evaluated at once
+        rule_engine = RuleEngine(plugins)
+        fetch_plan = FetchPlan(plugins)
+
+        with _YieldPhaseTimer(timings, "Evaluating rules"):
+            matrix = rule_engine.EvaluateMatrix([repository.configurations for repository in repositories])
+
+        # Errors are displayed as they would have been when the snapshot was exported
+        session_info = _SessionInfo(
+            snapshot.github_url,
+            snapshot.username,
+            snapshot.has_pat,
+            timings,
+        )
 
-            result = cast(ExecuteResult, result)
+        outputs: list[tuple[int, str]] = []
+
+        with (
+            _YieldJsonLinesWriter(dm, output_jsonl_filename) as jsonl_writer,
+            _YieldPhaseTimer(timings, "Validating repositories"),
+        ):
+            with dm.Nested(
+                "Validating repositories...",
+                lambda: "{} validated".format(_CountNoun("repository", len(repositories))),
+            ) as validate_dm:
+                for index, repository in enumerate(repositories):
+                    try:
+                        returncode, output, findings, _ = _ValidateRepoCaptured(
+                            dm,
+                            session_info,
+                            repository.repository_info["name"],
+                            plugins,
+                            ignore_warnings_in_repo,
+                            with_rationale=with_rationale,
+                            rule_engine=rule_engine,
+                            rule_results=matrix.GetRow(index),
+                            fetch_plan=fetch_plan,
+                            repository_info=repository.repository_info,
+                            configurations=repository.configurations,
+                        )
+                    except Exception as ex:  # pylint: disable=broad-exception-caught
+                        validate_dm.WriteError("An error was encountered while validating '{}': {}\n".format(repository.repository_info["name"], ex))
+                        continue
+
+                    if jsonl_writer is not None:
+                        jsonl_writer.WriteRepository(repository.repository_info["name"], returncode, findings)
+
+                    if output is not None:
+                        outputs.append((returncode, output))
+
+            if not outputs:
+                return
 
-            dm.WriteLine(result.output)
             dm.WriteLine("")
 
-            if (
-                result.returncode < 0
-                or (result.returncode > 0 and dm.result >= 0)
-            ):
-                dm.result = result.returncode
+            with _YieldPhaseTimer(timings, "Writing output"):
+                for returncode, output in outputs:
+                    dm.WriteLine(output)
+                    dm.WriteLine("")
+
+                    dm.result = _MergeReturnCodes(dm.result, returncode)
 
 
 # ----------------------------------------------------------------------
@@ -473,135 +1162,465 @@ def _CreateRegexes(
 
 
 # ----------------------------------------------------------------------
-def _GetPlugins(
-    ctx: typer.Context,
-    dm: DoneManager,
-    additional_plugin_dirs: list[Path],
-    include_plugins: list[str],
-    exclude_plugins: list[str],
-    max_plugin_version: Optional[str],
-) -> list[Plugin]:
-    include_plugin_regexes = _CreateRegexes(include_plugins)
-    exclude_plugin_regexes = _CreateRegexes(exclude_plugins)
+def _CountNoun(
+    noun: str,
+    count: int,
+) -> str:
+    """\
+    Equivalent to `inflect.no` for the regular nouns used in status messages; inflect is slow to import
+    and isn't needed for anything else here.
+    """
 
-    del include_plugins
-    del exclude_plugins
+    if count != 1:
+        noun = "{}ies".format(noun[:-1]) if re.search(r"[^aeiou]y$", noun) else "{}s".format(noun)
 
-    if max_plugin_version:
-        try:
-            semver = SemVer.coerce(max_plugin_version)
-        except:
-            raise DoneManagerException("'{}' is not a valid semantic version.".format(max_plugin_version))
+    return "{} {}".format(count or "no", noun)
 
-        is_valid_plugin_version_func = lambda version: version <= semver
-    else:
-        is_valid_plugin_version_func = lambda version: True
 
-    plugin_dirs: list[Path] = [
-        PathEx.EnsureDir(_root_dir / "Plugins"),
-    ]
+# ----------------------------------------------------------------------
+def _MergeReturnCodes(
+    returncode: int,
+    other_returncode: int,
+) -> int:
+    """Returns the most significant return code, where errors (< 0) take precedence over warnings (> 0)"""
 
-    plugin_dirs += additional_plugin_dirs
+    if (
+        other_returncode < 0
+        or (other_returncode > 0 and returncode >= 0)
+    ):
+        return other_returncode
 
-    # There is a bit of the chicken-and-egg problem here. We need to know all of the
-    # custom parameters across all plugins before we can parse the command line arguments
-    # that correspond to the arguments, but then also need to instantiate the plugin using these
-    # values. Here is what we do...
-    #
-    # 1) Walk all of the plugins and put together a dictionary of all the parameters.
-    # 2) For each plugin with custom parameters, create a callback that instantiates the plugin with the command line values.
-    # 3) Parse the arguments provided on the command line.
-    # 4) Invoke each callback with the command line parameters to instantiate the Plugins that were deferred.
+    return returncode
 
-    # Get the plugins
-    custom_parameter_types: TypeDefinitionsType = {}
-    create_plugin_callback_funcs: list[Callable[[dict[str, Any]], Plugin]] = []
 
-    plugins: list[Plugin] = []
+# ----------------------------------------------------------------------
+@contextmanager
+def _YieldSession(
+    dm: DoneManager,
+    github_url: str,
+    username: str,
+    pat: Optional[str],
+    cache_filename: Optional[Path],
+    max_concurrent_requests: int,
+    *,
+    record_filename: Optional[Path]=None,
+    replay_filename: Optional[Path]=None,
+    replay_latency: float=0.0,
+    timings: Optional["Timings"]=None,
+) -> Iterator["GitHubSession"]:
+    from GitHubConfigurationValidatorLib.Cassette import Cassette
+    from GitHubConfigurationValidatorLib.GitHubSession import GitHubSession
+    from GitHubConfigurationValidatorLib.RateLimitScheduler import RateLimitScheduler
+    from GitHubConfigurationValidatorLib.ResponseCache import ResponseCache
+
+    cassette: Optional[Cassette] = None
+
+    if record_filename is not None and replay_filename is not None:
+        raise DoneManagerException("'--record' and '--replay' cannot be used together.")
+
+    if record_filename is not None:
+        cassette = Cassette.CreateRecorder(record_filename)
+    elif replay_filename is not None:
+        cassette = Cassette.Load(replay_filename, replay_latency)
+
+    response_cache: Optional[ResponseCache] = None
+
+    if cache_filename is not None:
+        if cassette is not None:
+            # The cassette must contain complete responses rather than those that rely on the
+            # contents of the cache.
+            dm.WriteInfo("The response cache is not used when recording or replaying requests.\n")
+        else:
+            response_cache = ResponseCache(cache_filename)
 
-    with dm.Nested(
-        "Loading plugins from {}...".format(inflect.no("directory", len(plugin_dirs))),
-        lambda: "{} found".format(inflect.no("plugin", len(plugins))),
-        suffix="\n",
-    ) as load_dm:
-        for index, plugin_dir in enumerate(plugin_dirs):
-            with load_dm.VerboseNested("Processing '{}' ({} of {})...".format(plugin_dir, index + 1, len(plugin_dirs))) as dir_dm:
-                sys.path.insert(0, str(plugin_dir))
-                with ExitStack(lambda: sys.path.pop(0)):
-                    for filename in plugin_dir.iterdir():
-                        if filename.suffix != ".py":
-                            continue
+    rate_limit_scheduler = RateLimitScheduler(
+        max_concurrent_requests=max_concurrent_requests,
+    )
 
-                        if not filename.stem.endswith("Plugin"):
-                            continue
+    try:
+        yield GitHubSession(
+            github_url,
+            username,
+            pat,
+            response_cache=response_cache,
+            rate_limit_scheduler=rate_limit_scheduler,
+            cassette=cassette,
+            timings=timings,
+        )
+    finally:
+        dm.WriteVerbose(rate_limit_scheduler.GetStatisticsString())
 
-                        if filename.stem == "Plugin":
-                            continue
+        if cassette is not None:
+            if cassette.mode == Cassette.Mode.Record:
+                cassette.Save()
 
-                        try:
-                            mod = importlib.import_module(filename.stem)
-                        except:  # pylint: disable=bare-except
-                            dir_dm.WriteWarning(
-                                textwrap.dedent(
-                                    """\
-                                    An error was encountered when importing '{}'.
-
-                                        {}
-
-                                    """,
-                                ).format(
-                                    filename,
-                                    TextwrapEx.Indent(
-                                        traceback.format_exc().rstrip(),
-                                        4,
-                                        skip_first_line=True,
-                                    ),
-                                ),
-                            )
+            dm.WriteInfo(cassette.GetStatisticsString())
 
-                            continue
+        if response_cache is not None:
+            dm.WriteInfo(response_cache.GetStatisticsString())
+            response_cache.Close()
 
-                        found_plugin = False
 
-                        for potential_name in [
-                            "Plugin",
-                        ]:
-                            potential_plugin = getattr(mod, potential_name, None)
-                            if potential_plugin is None:
-                                continue
+# ----------------------------------------------------------------------
+@contextmanager
+def _YieldValidationState(
+    dm: DoneManager,
+    filename: Optional[Path],
+    github_url: str,
+    username: str,
+    create_policy_func: Callable[[], str],
+) -> Iterator[Optional["ValidationState"]]:
+    if filename is None:
+        yield None
+        return
 
-                            found_plugin = True
+    from GitHubConfigurationValidatorLib.ValidationState import ValidationState
 
-                            parameters = potential_plugin.GetInstantiationParameters()
+    validation_state = ValidationState(filename, github_url, username, create_policy_func())
 
-                            if not parameters:
-                                create_plugin_callback_funcs.append(lambda arguments, plugin=potential_plugin: plugin())
-                            else:
-                                for k, v in parameters.items():
-                                    assert k not in custom_parameter_types, k
-                                    custom_parameter_types[k] = v
+    try:
+        yield validation_state
+    finally:
+        dm.WriteInfo(validation_state.GetStatisticsString())
+        validation_state.Close()
 
-                                # ----------------------------------------------------------------------
-                                def CreatePlugin(
-                                    arguments: dict[str, Any],
-                                    plugin: PythonType=potential_plugin,  # type: ignore
-                                    parameters: TypeDefinitionsType=parameters,
-                                ) -> Plugin:
-                                    kwargs: dict[str, Any] = {}
 
-                                    for k in parameters.keys():
-                                        kwargs[k] = arguments[k]
+# ----------------------------------------------------------------------
+@contextmanager
+def _YieldJsonLinesWriter(
+    dm: DoneManager,
+    filename: Optional[Path],
+) -> Iterator[Optional["JsonLinesWriter"]]:
+    if filename is None:
+        yield None
+        return
 
-                                    return plugin(**kwargs)
+    from GitHubConfigurationValidatorLib.JsonLinesWriter import JsonLinesWriter
 
-                                # ----------------------------------------------------------------------
+    jsonl_writer = JsonLinesWriter(filename)
 
-                                create_plugin_callback_funcs.append(CreatePlugin)
+    try:
+        yield jsonl_writer
+    finally:
+        dm.WriteInfo(jsonl_writer.GetStatisticsString())
+        jsonl_writer.Close()
 
-                            break
 
-                        if not found_plugin:
+# ----------------------------------------------------------------------
+@contextmanager
+def _YieldResultsDatabase(
+    dm: DoneManager,
+    filename: Optional[Path],
+    github_url: str,
+    username: str,
+) -> Iterator[Optional["ResultsDatabase"]]:
+    if filename is None:
+        yield None
+        return
+
+    from GitHubConfigurationValidatorLib.ResultsDatabase import ResultsDatabase
+
+    results_db = ResultsDatabase(filename, github_url, username)
+
+    try:
+        yield results_db
+
+        # Runs that raise an exception are not recorded as complete
+        results_db.Complete(dm.result)
+
+    finally:
+        dm.WriteInfo(results_db.GetStatisticsString())
+        results_db.Close()
+
+
+# ----------------------------------------------------------------------
+@contextmanager
+def _YieldTimings(
+    dm: DoneManager,
+    enabled: bool,
+) -> Iterator[Optional["Timings"]]:
+    if not enabled:
+        yield None
+        return
+
+    from GitHubConfigurationValidatorLib.Timings import Timings
+
+    timings = Timings()
+
+    try:
+        yield timings
+    finally:
+        dm.WriteLine("\n{}\n".format(timings.GenerateReport()))
+
+
+# ----------------------------------------------------------------------
+# The timer functions access the categories via the Timings instance so that the Timings module is only
+# imported when '--timings' is provided.
+@contextmanager
+def _YieldPhaseTimer(
+    timings: Optional["Timings"],
+    name: str,
+) -> Iterator[None]:
+    if timings is None:
+        yield
+        return
+
+    with timings.YieldTimer(timings.Category.Phase, name):
+        yield
+
+
+# ----------------------------------------------------------------------
+@contextmanager
+def _YieldPluginTimer(
+    timings: Optional["Timings"],
+    name: str,
+) -> Iterator[None]:
+    if timings is None:
+        yield
+        return
+
+    with timings.YieldTimer(timings.Category.Plugin, name):
+        yield
+
+
+# ----------------------------------------------------------------------
+class _SuspendableTimer(object):
+    """Measures the time spent running, excluding the time spent within `Suspend`"""
+
+    # ----------------------------------------------------------------------
+    def __init__(self):
+        self._seconds                       = 0.0
+        self._start_time                    = time.perf_counter()
+
+    # ----------------------------------------------------------------------
+    @contextmanager
+    def Suspend(self) -> Iterator[None]:
+        self._seconds += time.perf_counter() - self._start_time
+
+        try:
+            yield
+        finally:
+            self._start_time = time.perf_counter()
+
+    # ----------------------------------------------------------------------
+    def GetSeconds(self) -> float:
+        return self._seconds + time.perf_counter() - self._start_time
+
+
+# ----------------------------------------------------------------------
+@contextmanager
+def _YieldSuspendablePhaseTimer(
+    timings: Optional["Timings"],
+    name: str,
+) -> Iterator[_SuspendableTimer]:
+    """\
+    Times a generator without the time that it is suspended at a yield (for example, while the
+    consumer is blocked on a full work queue).
+    """
+
+    timer = _SuspendableTimer()
+
+    try:
+        yield timer
+    finally:
+        if timings is not None:
+            timings.Add(timings.Category.Phase, name, timer.GetSeconds())
+
+
+# ----------------------------------------------------------------------
+@dataclass
+class _PluginSource(object):
+    """A plugin file that has been discovered, but not necessarily imported"""
+
+    filename: Path
+    plugin_dir: Path
+    parameters: TypeDefinitionsType
+    entry: Optional[PluginManifest.Entry]   # None if the plugin was not found in the manifest
+    plugin_class: Optional[PythonType]      # None if the plugin's module has not been imported
+    source_filename: Optional[Path]         # The PluginBundle that contains the plugin (if any)
+
+    # ----------------------------------------------------------------------
+    def Create(
+        self,
+        dm: DoneManager,
+        arguments: dict[str, Any],
+    ) -> Optional[Plugin]:
+        if self.plugin_class is None:
+            mod = _ImportPluginModule(dm, self.plugin_dir, self.filename)
+            if mod is None:
+                return None
+
+            self.plugin_class = getattr(mod, "Plugin", None)
+            if self.plugin_class is None:
+                dm.WriteInfo("A plugin class was not found in '{}'.\n".format(self.filename))
+                return None
+
+        kwargs: dict[str, Any] = {}
+
+        for k in self.parameters.keys():
+            kwargs[k] = arguments[k]
+
+        return self.plugin_class(**kwargs)
+
+
+# ----------------------------------------------------------------------
+def _GetPlugins(
+    ctx: typer.Context,
+    dm: DoneManager,
+    additional_plugin_dirs: list[Path],
+    include_plugins: list[str],
+    exclude_plugins: list[str],
+    max_plugin_version: Optional[str],
+) -> list[Plugin]:
+    plugins: list[Plugin] = []
+
+    for _, plugin in _LoadPlugins(
+        ctx,
+        dm,
+        additional_plugin_dirs,
+        include_plugins,
+        exclude_plugins,
+        max_plugin_version,
+        entries_only=False,
+    ):
+        assert plugin is not None
+        plugins.append(plugin)
+
+    return plugins
+
+
+# ----------------------------------------------------------------------
+def _GetPluginEntries(
+    ctx: typer.Context,
+    dm: DoneManager,
+    additional_plugin_dirs: list[Path],
+    max_plugin_version: Optional[str],
+) -> list[PluginManifest.Entry]:
+    """Returns information about the plugins without importing those that are in the plugin manifest"""
+
+    return [
+        entry
+        for entry, _ in _LoadPlugins(
+            ctx,
+            dm,
+            additional_plugin_dirs,
+            [],
+            [],
+            max_plugin_version,
+            entries_only=True,
+        )
+    ]
+
+
+# ----------------------------------------------------------------------
+def _LoadPlugins(
+    ctx: typer.Context,
+    dm: DoneManager,
+    additional_plugin_dirs: list[Path],
+    include_plugins: list[str],
+    exclude_plugins: list[str],
+    max_plugin_version: Optional[str],
+    *,
+    entries_only: bool,                     # Plugins are only imported and instantiated when necessary if True
+) -> list[tuple[PluginManifest.Entry, Optional[Plugin]]]:
+    include_plugin_regexes = _CreateRegexes(include_plugins)
+    exclude_plugin_regexes = _CreateRegexes(exclude_plugins)
+
+    del include_plugins
+    del exclude_plugins
+
+    if max_plugin_version:
+        try:
+            semver = SemVer.coerce(max_plugin_version)
+        except:
+            raise DoneManagerException("'{}' is not a valid semantic version.".format(max_plugin_version))
+
+        is_valid_plugin_version_func = lambda version: version <= semver
+    else:
+        is_valid_plugin_version_func = lambda version: True
+
+    plugin_dirs: list[Path] = [
+        _plugin_bundle_filename or PathEx.EnsureDir(_root_dir / "Plugins"),
+    ]
+
+    plugin_dirs += additional_plugin_dirs
+
+    manifest = _LoadPluginManifest()
+
+    # There is a bit of the chicken-and-egg problem here. We need to know all of the
+    # custom parameters across all plugins before we can parse the command line arguments
+    # that correspond to the arguments, but then also need to instantiate the plugin using these
+    # values. Here is what we do...
+    #
+    # 1) Walk all of the plugins and put together a dictionary of all the parameters (the
+    #    parameters of plugins in the manifest are available without importing the plugin).
+    # 2) Parse the arguments provided on the command line.
+    # 3) Filter the plugins by version and name (using the manifest when possible).
+    # 4) Import and instantiate the plugins that remain with the command line values.
+
+    # Get the plugins
+    custom_parameter_types: TypeDefinitionsType = {}
+    plugin_sources: list[_PluginSource] = []
+
+    results: list[tuple[PluginManifest.Entry, Optional[Plugin]]] = []
+
+    with dm.Nested(
+        "Loading plugins from {}...".format(_CountNoun("directory", len(plugin_dirs))),
+        lambda: "{} found".format(_CountNoun("plugin", len(results))),
+        suffix="\n",
+    ) as load_dm:
+        for index, plugin_dir in enumerate(plugin_dirs):
+            with load_dm.VerboseNested("Processing '{}' ({} of {})...".format(plugin_dir, index + 1, len(plugin_dirs))) as dir_dm:
+                source_filename: Optional[Path] = None
+
+                if plugin_dir == _plugin_bundle_filename:
+                    try:
+                        plugin_bundle = PluginBundle.Load(plugin_dir)
+                    except Exception as ex:  # pylint: disable=broad-exception-caught
+                        dir_dm.WriteError("{}\n".format(ex))
+                        continue
+
+                    # All of the plugins are contained within the bundle (which is in the path)
+                    source_filename = plugin_dir
+                    plugin_dir = plugin_bundle.plugin_dir
+
+                    filenames = plugin_bundle.GetPluginFilenames()
+                else:
+                    filenames = [
+                        filename
+                        for filename in plugin_dir.iterdir()
+                        if PluginBundle.IsPluginFilename(filename)
+                    ]
+
+                for filename in filenames:
+                    entry = None if manifest is None else manifest.Get(filename, source_filename)
+
+                    if entry is not None:
+                        plugin_source = _PluginSource(filename, plugin_dir, entry.instantiation_parameters, entry, None, source_filename)
+                    else:
+                        mod = _ImportPluginModule(dir_dm, plugin_dir, filename)
+                        if mod is None:
+                            continue
+
+                        potential_plugin = getattr(mod, "Plugin", None)
+                        if potential_plugin is None:
                             dir_dm.WriteInfo("A plugin class was not found in '{}'.\n".format(filename))
+                            continue
+
+                        plugin_source = _PluginSource(
+                            filename,
+                            plugin_dir,
+                            potential_plugin.GetInstantiationParameters(),
+                            None,
+                            potential_plugin,
+                            source_filename,
+                        )
+
+                    for k, v in plugin_source.parameters.items():
+                        assert k not in custom_parameter_types, k
+                        custom_parameter_types[k] = v
+
+                    plugin_sources.append(plugin_source)
 
         if load_dm.result != 0:
             load_dm.WriteError("Errors were encountered while loading plugins.\n")
@@ -612,138 +1631,518 @@ def _GetPlugins(
         else:
             arguments = {}
 
-        for create_plugin_func in create_plugin_callback_funcs:
-            plugin = create_plugin_func(arguments)
+        for plugin_source in plugin_sources:
+            # The manifest describes plugins instantiated with default values
+            is_default_instantiation = all(
+                arguments[k] == _GetParameterDefaultValue(v)
+                for k, v in plugin_source.parameters.items()
+            )
+
+            entry = plugin_source.entry if is_default_instantiation else None
+            plugin: Optional[Plugin] = None
+
+            if entry is None:
+                plugin = plugin_source.Create(load_dm, arguments)
+                if plugin is None:
+                    continue
 
-            if not is_valid_plugin_version_func(plugin.version_introduced):
+                entry = PluginManifest.Entry(
+                    plugin.name,
+                    plugin.configuration_type,
+                    plugin.version_introduced,
+                    plugin.description,
+                    plugin.GenerateDisplayString(
+                        resolution_repository="<repo name here>",
+                    ),
+                    plugin_source.parameters,
+                )
+
+                if manifest is not None and is_default_instantiation:
+                    manifest.Set(plugin_source.filename, entry, plugin_source.source_filename)
+
+            if not is_valid_plugin_version_func(entry.version_introduced):
                 load_dm.WriteInfo(
                     "'{}' was excluded due to its version ({} > {}).\n".format(
-                        plugin.name,
-                        plugin.version_introduced,
+                        entry.name,
+                        entry.version_introduced,
                         max_plugin_version,
                     ),
                 )
                 continue
 
-            if exclude_plugin_regexes and any(expr.match(plugin.name) for expr in exclude_plugin_regexes):
-                load_dm.WriteInfo("'{}' was excluded.\n".format(plugin.name))
+            if exclude_plugin_regexes and any(expr.match(entry.name) for expr in exclude_plugin_regexes):
+                load_dm.WriteInfo("'{}' was excluded.\n".format(entry.name))
                 continue
 
-            if include_plugin_regexes and not any(expr.match(plugin.name) for expr in include_plugin_regexes):
-                load_dm.WriteInfo("'{}' was not included.\n".format(plugin.name))
+            if include_plugin_regexes and not any(expr.match(entry.name) for expr in include_plugin_regexes):
+                load_dm.WriteInfo("'{}' was not included.\n".format(entry.name))
                 continue
 
-            plugins.append(plugin)
+            if plugin is None and not entries_only:
+                plugin = plugin_source.Create(load_dm, arguments)
+                if plugin is None:
+                    continue
+
+            results.append((entry, plugin))
+
+        if manifest is not None:
+            try:
+                manifest.Save()
+            except OSError as ex:
+                load_dm.WriteVerbose("The plugin manifest could not be saved ({}).\n".format(ex))
+
+        results.sort(key=lambda result: result[0].name)
+
+        return results
+
+
+# ----------------------------------------------------------------------
+def _LoadPluginManifest() -> Optional[PluginManifest]:
+    """Returns the plugin manifest, or None if it shouldn't be used"""
+
+    if os.environ.get(_PLUGIN_MANIFEST_ENVIRONMENT_VAR, None) == "0":
+        return None
+
+    if getattr(sys, "frozen", False):
+        installation_dir = Path(sys.executable)
+        dependencies = [installation_dir]
+    else:
+        installation_dir = _root_dir
+        lib_dir = _root_dir / "GitHubConfigurationValidatorLib"
+
+        dependencies = [
+            lib_dir / "Plugin.py",
+            lib_dir / "PluginManifest.py",
+            lib_dir / "Impl" / "PluginImpl.py",
+        ]
+
+    if sys.platform == "win32":
+        cache_dir = Path(os.environ.get("LOCALAPPDATA", Path.home()))
+    else:
+        cache_dir = Path(os.environ.get("XDG_CACHE_HOME", Path.home() / ".cache"))
+
+    return PluginManifest.Load(
+        PluginManifest.GetFilename(cache_dir / "GitHubConfigurationValidator", installation_dir),
+        dependencies,
+    )
+
+
+# ----------------------------------------------------------------------
+def _ImportPluginModule(
+    dm: DoneManager,
+    plugin_dir: Path,
+    filename: Path,
+) -> Optional[Any]:
+    """Imports the plugin's module; errors are written to the DoneManager as warnings"""
+
+    sys.path.insert(0, str(plugin_dir))
+    with ExitStack(lambda: sys.path.pop(0)):
+        try:
+            return importlib.import_module(filename.stem)
+        except:  # pylint: disable=bare-except
+            dm.WriteWarning(
+                textwrap.dedent(
+                    """\
+                    An error was encountered when importing '{}'.
+
+                        {}
+
+                    """,
+                ).format(
+                    filename,
+                    TextwrapEx.Indent(
+                        traceback.format_exc().rstrip(),
+                        4,
+                        skip_first_line=True,
+                    ),
+                ),
+            )
+
+            return None
+
+
+# ----------------------------------------------------------------------
+def _GetParameterDefaultValue(
+    parameter: Any,
+) -> Any:
+    if isinstance(parameter, TypeDefinitionItem):
+        return parameter.option_info.default
 
-        plugins.sort(key=lambda plugin: plugin.name)
+    if isinstance(parameter, tuple) and len(parameter) == 2 and isinstance(parameter[1], typer.models.OptionInfo):
+        return parameter[1].default
 
-        return plugins
+    # The default value can't be determined, so the plugin will always be instantiated
+    return _NO_DEFAULT_VALUE
+
+
+_NO_DEFAULT_VALUE                           = object()
 
 
 # ----------------------------------------------------------------------
 def _GetRepos(
     dm: DoneManager,
-    session: GitHubSession,
+    session: "GitHubSession",
     includes: list[str],
     excludes: list[str],
     *,
     ignore_archived: bool,
     ignore_forks: bool,
-) -> list[str]:
-    repositories: list[str] = []
+) -> list[dict[str, Any]]:
+    """Returns information about each repository, as provided by GitHub when listing repositories"""
+
+    repositories: list[dict[str, Any]] = []
     found = 0
 
     with dm.Nested(
         "Getting repositories...",
         [
-            lambda: "{} found".format(inflect.no("repository", found)),
-            lambda: "{} matched".format(inflect.no("repository", len(repositories))),
+            lambda: "{} found".format(_CountNoun("repository", found)),
+            lambda: "{} matched".format(_CountNoun("repository", len(repositories))),
         ],
         suffix="\n",
     ) as repos_dm:
-        include_exprs = _CreateRegexes(includes)
-        exclude_exprs = _CreateRegexes(excludes)
+        # ----------------------------------------------------------------------
+        def OnPage(
+            num_repositories: int,
+        ) -> None:
+            nonlocal found
+            found += num_repositories
 
-        del includes
-        del excludes
+        # ----------------------------------------------------------------------
 
-        page = 1
-        per_page = 25
+        repositories += _EnumRepos(
+            repos_dm,
+            session,
+            _CreateRegexes(includes),
+            _CreateRegexes(excludes),
+            ignore_archived=ignore_archived,
+            ignore_forks=ignore_forks,
+            on_page_func=OnPage,
+        )
 
-        while True:
-            response = session.get(
-                "{}/{}/repos".format(
-                    "orgs" if session.is_enterprise else "users",
-                    session.github_username,
-                ),
-                params={
-                    "page": page,
-                    "per_page": per_page,
-                },
-            )
+        if repos_dm.result != 0:
+            return []
+
+        return repositories
+
+
+# ----------------------------------------------------------------------
+def _EnumRepos(
+    dm: DoneManager,
+    session: "GitHubSession",
+    include_exprs: list[Pattern],
+    exclude_exprs: list[Pattern],
+    *,
+    ignore_archived: bool,
+    ignore_forks: bool,
+    on_page_func: Optional[Callable[[int], None]]=None,  # Called with the number of repositories in each page
+) -> Iterator[dict[str, Any]]:
+    """\
+    Yields information about each matching repository (as provided by GitHub when listing repositories)
+    as soon as the page that contains it has been received; errors are written to the DoneManager.
+    """
+
+    url = _GetReposUrl(session)
+
+    # ----------------------------------------------------------------------
+    def GetPage(
+        page: int,
+    ) -> "requests.Response":
+        return session.get(url, params=_CreateReposParams(page))
+
+    # ----------------------------------------------------------------------
+    def EnumResponses() -> Iterator["requests.Response"]:
+        response = GetPage(1)
+        yield response
+
+        last_page = _GetReposLastPage(response)
+        if last_page is not None:
+            # All of the remaining pages are known, so retrieve them concurrently
+            remaining_pages = list(range(2, last_page + 1))
 
-            page += 1
+            if remaining_pages:
+                max_workers = len(remaining_pages)
 
-            response.raise_for_status()
+                if session.rate_limit_scheduler is not None:
+                    max_workers = min(max_workers, session.rate_limit_scheduler.GetRecommendedConcurrency())
+
+                with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                    # Results are yielded in page order as they become available
+                    yield from executor.map(GetPage, remaining_pages)
+
+        else:
+            # The server didn't indicate the number of pages, so follow the 'next' links
+            page = 1
+
+            while "next" in response.links:
+                page += 1
+
+                response = GetPage(page)
+                yield response
+
+    # ----------------------------------------------------------------------
+
+    with _YieldSuspendablePhaseTimer(session.timings, "Enumerating repositories") as timer:
+        for response in EnumResponses():
+            content = _DecodeReposResponse(dm, response)
+            if content is None:
+                return
+
+            if on_page_func is not None:
+                on_page_func(len(content))
+
+            for response_item in content:
+                if _IsRepoIncluded(
+                    dm,
+                    response_item,
+                    include_exprs,
+                    exclude_exprs,
+                    ignore_archived=ignore_archived,
+                    ignore_forks=ignore_forks,
+                ):
+                    # Time spent waiting for the consumer is not part of the enumeration
+                    with timer.Suspend():
+                        yield response_item
+
+
+# ----------------------------------------------------------------------
+async def _EnumReposAsync(
+    dm: DoneManager,
+    async_session: "AsyncGitHubSession",
+    include_exprs: list[Pattern],
+    exclude_exprs: list[Pattern],
+    *,
+    ignore_archived: bool,
+    ignore_forks: bool,
+    on_page_func: Optional[Callable[[int], None]]=None,  # Called with the number of repositories in each page
+) -> AsyncIterator[dict[str, Any]]:
+    """\
+    Yields information about each matching repository (as provided by GitHub when listing repositories)
+    as soon as the page that contains it has been received; errors are written to the DoneManager.
+    """
+
+    import asyncio
+
+    url = _GetReposUrl(async_session.session)
+
+    # ----------------------------------------------------------------------
+    async def EnumResponses() -> AsyncIterator["requests.Response"]:
+        response = await async_session.Get(url, params=_CreateReposParams(1))
+        yield response
+
+        last_page = _GetReposLastPage(response)
+        if last_page is not None:
+            # All of the remaining pages are known, so retrieve them concurrently
+            tasks = [
+                asyncio.create_task(async_session.Get(url, params=_CreateReposParams(page)))
+                for page in range(2, last_page + 1)
+            ]
 
             try:
-                response = response.json()
-            except requests.exceptions.JSONDecodeError as ex:
-                temp_filename = CurrentShell.CreateTempFilename(".html")
+                # Results are yielded in page order as they become available
+                for task in tasks:
+                    yield await task
 
-                with temp_filename.open("w") as f:
-                    f.write(response.text)
+            finally:
+                for task in tasks:
+                    task.cancel()
 
-                repos_dm.WriteError("The response content was not valid JSON; it has been saved at '{}' (Error: {}).\n".format(temp_filename, ex))
-                return []
+        else:
+            # The server didn't indicate the number of pages, so follow the 'next' links
+            page = 1
 
-            if not response:
-                break
+            while "next" in response.links:
+                page += 1
 
-            found += len(response)
+                response = await async_session.Get(url, params=_CreateReposParams(page))
+                yield response
 
-            for response_item in response:
-                repository = response_item["name"]
+    # ----------------------------------------------------------------------
 
-                if response_item["disabled"]:
-                    repos_dm.WriteVerbose("'{}' is disabled.\n".format(repository))
-                    continue
+    with _YieldSuspendablePhaseTimer(async_session.session.timings, "Enumerating repositories") as timer:
+        async for response in EnumResponses():
+            content = _DecodeReposResponse(dm, response)
+            if content is None:
+                return
 
-                if ignore_archived and response_item["archived"]:
-                    repos_dm.WriteVerbose("'{}' is archived.\n".format(repository))
-                    continue
+            if on_page_func is not None:
+                on_page_func(len(content))
 
-                if ignore_forks and response_item["fork"]:
-                    repos_dm.WriteVerbose("'{}' is a fork.\n".format(repository))
-                    continue
+            for response_item in content:
+                if _IsRepoIncluded(
+                    dm,
+                    response_item,
+                    include_exprs,
+                    exclude_exprs,
+                    ignore_archived=ignore_archived,
+                    ignore_forks=ignore_forks,
+                ):
+                    # Time spent waiting for the consumer is not part of the enumeration
+                    with timer.Suspend():
+                        yield response_item
 
-                if exclude_exprs and any(expr.match(repository) for expr in exclude_exprs):
-                    repos_dm.WriteVerbose("'{}' was excluded.\n".format(repository))
-                    continue
 
-                if include_exprs and not any(expr.match(repository) for expr in include_exprs):
-                    repos_dm.WriteVerbose("'{}' was not included.\n".format(repository))
-                    continue
+# ----------------------------------------------------------------------
+def _GetReposUrl(
+    session: "GitHubSession",
+) -> str:
+    return "{}/{}/repos".format(
+        "orgs" if session.is_enterprise else "users",
+        session.github_username,
+    )
 
-                repositories.append(repository)
 
-        return repositories
+# ----------------------------------------------------------------------
+def _CreateReposParams(
+    page: int,
+) -> dict[str, int]:
+    return {
+        "page": page,
+        "per_page": _REPOS_PER_PAGE,
+    }
+
+
+# ----------------------------------------------------------------------
+def _GetReposLastPage(
+    response: "requests.Response",
+) -> Optional[int]:
+    """Returns the last page number provided in the 'Link' header, or None if the header doesn't contain that information"""
+
+    if "next" not in response.links:
+        # This is the only page
+        return 1
+
+    last_url = response.links.get("last", {}).get("url", None)
+    if last_url is None:
+        return None
+
+    pages = parse_qs(urlparse(last_url).query).get("page", None)
+    if not pages:
+        return None
+
+    try:
+        return int(pages[0])
+    except ValueError:
+        return None
+
+
+# ----------------------------------------------------------------------
+def _DecodeReposResponse(
+    dm: DoneManager,
+    response: "requests.Response",
+) -> Optional[list[dict[str, Any]]]:
+    import requests
+
+    response.raise_for_status()
+
+    try:
+        return response.json()
+    except requests.exceptions.JSONDecodeError as ex:
+        temp_filename = CurrentShell.CreateTempFilename(".html")
+
+        with temp_filename.open("w") as f:
+            f.write(response.text)
+
+        dm.WriteError("The response content was not valid JSON; it has been saved at '{}' (Error: {}).\n".format(temp_filename, ex))
+        return None
+
+
+# ----------------------------------------------------------------------
+def _IsRepoIncluded(
+    dm: DoneManager,
+    response_item: dict[str, Any],
+    include_exprs: list[Pattern],
+    exclude_exprs: list[Pattern],
+    *,
+    ignore_archived: bool,
+    ignore_forks: bool,
+) -> bool:
+    repository = response_item["name"]
+
+    if response_item["disabled"]:
+        dm.WriteVerbose("'{}' is disabled.\n".format(repository))
+        return False
+
+    if ignore_archived and response_item["archived"]:
+        dm.WriteVerbose("'{}' is archived.\n".format(repository))
+        return False
+
+    if ignore_forks and response_item["fork"]:
+        dm.WriteVerbose("'{}' is a fork.\n".format(repository))
+        return False
+
+    if exclude_exprs and any(expr.match(repository) for expr in exclude_exprs):
+        dm.WriteVerbose("'{}' was excluded.\n".format(repository))
+        return False
+
+    if include_exprs and not any(expr.match(repository) for expr in include_exprs):
+        dm.WriteVerbose("'{}' was not included.\n".format(repository))
+        return False
+
+    return True
+
+
+# ----------------------------------------------------------------------
+@dataclass(frozen=True)
+class _SessionInfo(object):
+    """\
+    Information used by `_ValidateRepo` when the configuration information has already been retrieved
+    (for example, from a snapshot) and GitHub is not accessed.
+    """
+
+    github_url: str
+    github_username: str
+    has_pat: bool
+    timings: Optional["Timings"]
 
 
 # ----------------------------------------------------------------------
 def _ValidateRepo(
     dm: DoneManager,
-    session: GitHubSession,
+    session: Union["GitHubSession", _SessionInfo],
     repository: str,
     plugins: list[Plugin],
     *,
     with_rationale: bool=False,
-) -> None:
+    rule_engine: Optional["RuleEngine"]=None,
+    rule_results: Optional["ResultMatrix.RowType"]=None,       # Results calculated by `RuleEngine.EvaluateMatrix`
+    fetch_plan: Optional["FetchPlan"]=None,
+    repository_info: Optional[dict[str, Any]]=None,
+    fetch_context: Optional["FetchContext"]=None,
+    configurations: Optional["GraphQLConfigurations.ConfigurationsType"]=None,
+) -> tuple[list[Finding], list[str]]:
+    """\
+    Validates the repository; returns the messages produced by the plugins and the names of the plugins
+    that were not evaluated (for example, branch protection plugins when the branch isn't protected).
+    """
+
+    from GitHubConfigurationValidatorLib.FetchPlan import FetchPlan
+    from GitHubConfigurationValidatorLib.RuleEngine import RuleEngine
+
+    if rule_engine is None:
+        rule_engine = RuleEngine(plugins)
+
+    if fetch_plan is None:
+        fetch_plan = FetchPlan(plugins)
+
     grouped_plugins: dict[Plugin.ConfigurationType, list[Plugin]] = {}
 
     for plugin in plugins:
         grouped_plugins.setdefault(plugin.configuration_type, []).append(plugin)
 
+    # Responses are memoized for the lifetime of this repository's validation so that custom plugins
+    # are able to reuse the data retrieved here.
+    if fetch_context is None and (configurations is None or Plugin.ConfigurationType.Custom in grouped_plugins):
+        assert not isinstance(session, _SessionInfo), "A GitHub session is required to retrieve configuration information"
+
+        from GitHubConfigurationValidatorLib.FetchContext import FetchContext
+
+        fetch_context = FetchContext(session)
+
+    if configurations is None:
+        assert fetch_context is not None
+        configurations = fetch_plan.Execute(fetch_context, repository, repository_info)
+
     # Create the repository url to include with errors
     repository_url = session.github_url
 
@@ -757,6 +2156,9 @@ def _ValidateRepo(
         repository,
     )
 
+    findings: list[Finding] = []
+    evaluated_plugin_names: set[str] = set()
+
     # ----------------------------------------------------------------------
     def DisplayResults(
         dm: DoneManager,
@@ -787,6 +2189,8 @@ def _ValidateRepo(
         # ----------------------------------------------------------------------
 
         for message_type, message in EnumResults(results):
+            findings.append(Finding(plugin.name, message_type, message.rstrip()))
+
             if decorate_message_with_plugin_name:
                 message = "[{}] {}".format(plugin.name, message)
 
@@ -814,29 +2218,38 @@ def _ValidateRepo(
     # ----------------------------------------------------------------------
     def RunPlugins(
         header: str,
-        url: str,
-        plugins: Optional[list[Plugin]],
-        *,
-        always_run: bool=False,
-    ) -> Optional[dict[str, Any]]:
-        if not always_run and plugins is None:
-            return None
+        configuration_type: Plugin.ConfigurationType,
+    ) -> None:
+        configuration = configurations.get(configuration_type, None)
+        if configuration is None:
+            return
+
+        plugins = grouped_plugins.get(configuration_type, None)
+
+        # Plugins with rules are evaluated together in a single pass over the configuration
+        if rule_results is not None:
+            configuration_rule_results = rule_results.get(configuration_type, {})
+        else:
+            with _YieldPluginTimer(session.timings, "RuleEngine ({})".format(configuration_type.name)):
+                configuration_rule_results = rule_engine.Evaluate(configuration_type, configuration)
 
         with dm.Nested(
             header,
             suffix="\n",
         ) as run_dm:
-            response = session.get(url)
-
-            response.raise_for_status()
-            response = response.json()
-
             if plugins:
-                with run_dm.Nested("Running {}...".format(inflect.no("plugin", len(plugins)))) as plugin_dm:
+                with run_dm.Nested("Running {}...".format(_CountNoun("plugin", len(plugins)))) as plugin_dm:
                     # Process the plugins
                     for plugin in plugins:
                         try:
-                            results = plugin.Validate(response)
+                            if plugin.name in configuration_rule_results:
+                                results = configuration_rule_results[plugin.name]
+
+                                if isinstance(results, KeyError):
+                                    raise results
+                            else:
+                                with _YieldPluginTimer(session.timings, "{}.Validate".format(plugin.name)):
+                                    results = plugin.Validate(configuration)
                         except KeyError as ex:
                             if session.has_pat:
                                 results = "Unexpected error; errors of this type are generally associated with permission/access issues - ensure that this tool is run by an administrator of the repository (Error: {}).".format(ex)
@@ -847,55 +2260,653 @@ def _ValidateRepo(
                                 )
 
                         DisplayResults(plugin_dm, plugin, results)
-
-            return response
+                        evaluated_plugin_names.add(plugin.name)
 
     # ----------------------------------------------------------------------
 
-    settings = RunPlugins(
-        "Checking repository settings...",
-        "repos/{}/{}".format(session.github_username, repository),
-        grouped_plugins.get(Plugin.ConfigurationType.Repository),
-        always_run=True,
-    )
-
-    assert settings is not None
-
-    default_branch = settings["default_branch"]
-
-    settings = RunPlugins(
-        "Checking branch settings...",
-        "repos/{}/{}/branches/{}".format(session.github_username, repository, default_branch),
-        grouped_plugins.get(Plugin.ConfigurationType.Branch),
-    )
-
-    if settings and settings["protected"]:
-        protection_url = settings["protection_url"]
-
-        assert protection_url.startswith(session.github_url), protection_url
-        protection_url = protection_url[len(session.github_url):]
-
-        settings = RunPlugins(
-            "Checking branch protection settings...",
-            protection_url,
-            grouped_plugins.get(Plugin.ConfigurationType.BranchProtection),
-        )
+    RunPlugins("Checking repository settings...", Plugin.ConfigurationType.Repository)
+    RunPlugins("Checking branch settings...", Plugin.ConfigurationType.Branch)
+    RunPlugins("Checking branch protection settings...", Plugin.ConfigurationType.BranchProtection)
 
     custom_plugins = grouped_plugins.get(Plugin.ConfigurationType.Custom, None)
     if custom_plugins:
-        with dm.Nested("Running {}...".format(inflect.no("custom plugin", len(custom_plugins)))) as custom_dm:
+        with dm.Nested("Running {}...".format(_CountNoun("custom plugin", len(custom_plugins)))) as custom_dm:
             for plugin in custom_plugins:
                 with custom_dm.Nested(
                     "Running '{}'...".format(plugin.name),
                     suffix="\n",
                 ) as plugin_dm:
+                    with _YieldPluginTimer(session.timings, "{}.CustomValidate".format(plugin.name)):
+                        results = plugin.CustomValidate(
+                            plugin_dm,
+                            cast("GitHubSession", fetch_context),  # FetchContext provides the same interface as GitHubSession
+                            repository,
+                        )
+
                     DisplayResults(
                         plugin_dm,
                         plugin,
-                        plugin.CustomValidate(plugin_dm, session, repository),
+                        results,
                         decorate_message_with_plugin_name=False,
                     )
 
+                    evaluated_plugin_names.add(plugin.name)
+
+    return findings, [plugin.name for plugin in plugins if plugin.name not in evaluated_plugin_names]
+
+
+# ----------------------------------------------------------------------
+def _ValidateRepoCaptured(
+    dm: DoneManager,                        # Provides the capabilities and output flags of the captured output
+    session: Union["GitHubSession", _SessionInfo],
+    repository: str,
+    plugins: list[Plugin],
+    ignore_warnings_in_repo: set[str],
+    **validate_repo_kwargs: Any,            # Passed to `_ValidateRepo`
+) -> tuple[int, Optional[str], list[Finding], list[str]]:
+    """\
+    Validates the repository while capturing its output (so that the output of repositories validated
+    concurrently is not interleaved); returns the return code, the output (or None if there isn't
+    anything to display), the findings, and the names of the plugins that were not evaluated.
+    """
+
+    sink = StringIO()
+
+    Capabilities.Set(sink, dm.capabilities)
+
+    with DoneManager.Create(
+        sink,
+        "Checking '{}'...".format(repository),
+        output_flags=DoneManagerFlags.Create(verbose=dm.is_verbose, debug=dm.is_debug),
+    ) as this_dm:
+        findings, skipped_plugin_names = _ValidateRepo(
+            this_dm,
+            session,
+            repository,
+            plugins,
+            **validate_repo_kwargs,
+        )
+
+        original_result = this_dm.result
+
+        if this_dm.result > 0 and repository in ignore_warnings_in_repo:
+            this_dm.result = 0
+
+    if original_result != 0:
+        return this_dm.result, sink.getvalue(), findings, skipped_plugin_names
+
+    return 0, None, findings, skipped_plugin_names
+
+
+# ----------------------------------------------------------------------
+_ValidateReposResultT                       = TypeVar("_ValidateReposResultT")
+
+_ValidateReposFuncType                      = Callable[
+    [dict[str, Any], Optional["FetchContext"], Optional["GraphQLConfigurations.ConfigurationsType"]],
+    _ValidateReposResultT,
+]
+
+# Called with each (non-None) result as soon as it is available; results that are streamed are not
+# returned (None is returned in their place) so that they can be released immediately. Calls are
+# serialized.
+_StreamFuncType                             = Callable[[DoneManager, _ValidateReposResultT], None]
+
+# Called with the repository information of each repository that could not be processed because an
+# error was encountered (the error has already been displayed)
+_ErrorFuncType                              = Callable[[dict[str, Any]], None]
+
+
+# ----------------------------------------------------------------------
+def _ValidateRepos(
+    dm: DoneManager,
+    session: "GitHubSession",
+    plugins: list[Plugin],
+    fetch_plan: "FetchPlan",
+    includes: list[str],
+    excludes: list[str],
+    validate_func: _ValidateReposFuncType[_ValidateReposResultT],
+    *,
+    ignore_archived: bool,
+    ignore_forks: bool,
+    max_concurrency: int,
+    use_graphql: bool=False,
+    is_current_func: Optional[Callable[[dict[str, Any]], bool]]=None,  # Returns True if the repository's previous results can be replayed without accessing GitHub
+    header: str="Validating repositories...",
+    progress_verb: str="validated",
+    stream_func: Optional[_StreamFuncType[_ValidateReposResultT]]=None,
+    on_error_func: Optional[_ErrorFuncType]=None,
+) -> list[Optional[_ValidateReposResultT]]:
+    """\
+    Validates repositories while they are being enumerated; repositories are placed in a bounded queue
+    as each page is received and are processed by worker threads.
+
+    Results are returned in the order in which the repositories were enumerated (unless they are
+    streamed).
+    """
+
+    include_exprs = _CreateRegexes(includes)
+    exclude_exprs = _CreateRegexes(excludes)
+
+    del includes
+    del excludes
+
+    work_queue: queue.Queue[Optional[tuple[int, dict[str, Any]]]] = queue.Queue(maxsize=max_concurrency * 2)
+
+    results: dict[int, Optional[_ValidateReposResultT]] = {}
+    results_lock = threading.Lock()
+    stream_lock = threading.Lock()
+
+    num_found = 0
+    num_matched = 0
+
+    with dm.Nested(
+        header,
+        [
+            lambda: "{} found".format(_CountNoun("repository", num_found)),
+            lambda: "{} matched".format(_CountNoun("repository", num_matched)),
+            lambda: "{} {}".format(_CountNoun("repository", len(results)), progress_verb),
+        ],
+    ) as validate_dm:
+        with ThreadPoolExecutor(max_workers=max_concurrency + 1) as executor:
+            graphql_configurations: Optional[GraphQLConfigurations.PublishedConfigurations] = None
+
+            if use_graphql:
+                from GitHubConfigurationValidatorLib import GraphQLConfigurations
+
+                graphql_configurations = GraphQLConfigurations.PublishedConfigurations()
+
+                executor.submit(
+                    _GetGraphQLConfigurations,
+                    validate_dm,
+                    session,
+                    set(fetch_plan.configuration_types),
+                    graphql_configurations,
+                )
+
+            # ----------------------------------------------------------------------
+            def Worker() -> None:
+                while True:
+                    item = work_queue.get()
+                    if item is None:
+                        break
+
+                    index, repository_info = item
+                    result: Optional[_ValidateReposResultT] = None
+
+                    # The callbacks are invoked within the guarded region as well; a worker that exits
+                    # early would leave the queue undrained.
+                    try:
+                        configurations: Optional[GraphQLConfigurations.ConfigurationsType] = None
+
+                        if (
+                            graphql_configurations is not None
+                            and (is_current_func is None or not is_current_func(repository_info))
+                        ):
+                            configurations = _MergeGraphQLConfigurations(
+                                validate_dm,
+                                repository_info,
+                                graphql_configurations.Get(repository_info["name"]),
+                            )
+
+                        result = validate_func(repository_info, None, configurations)
+
+                        if stream_func is not None and result is not None:
+                            with stream_lock:
+                                stream_func(validate_dm, result)
+
+                            result = None
+
+                    except Exception as ex:  # pylint: disable=broad-exception-caught
+                        validate_dm.WriteError("An error was encountered while validating '{}': {}\n".format(repository_info["name"], ex))
+                        result = None
+
+                        if on_error_func is not None:
+                            try:
+                                on_error_func(repository_info)
+                            except Exception as error_ex:  # pylint: disable=broad-exception-caught
+                                validate_dm.WriteError("An error was encountered while recording the error for '{}': {}\n".format(repository_info["name"], error_ex))
+
+                    with results_lock:
+                        results[index] = result
+
+            # ----------------------------------------------------------------------
+            def OnPage(
+                num_repositories: int,
+            ) -> None:
+                nonlocal num_found
+                num_found += num_repositories
+
+            # ----------------------------------------------------------------------
+            def Enqueue(
+                item: Optional[tuple[int, dict[str, Any]]],
+            ) -> bool:
+                """Returns False if the item could not be enqueued because all of the workers have exited"""
+
+                while True:
+                    try:
+                        work_queue.put(item, timeout=_WORK_QUEUE_POLL_SECONDS)
+                        return True
+                    except queue.Full:
+                        if all(worker.done() for worker in workers):
+                            return False
+
+            # ----------------------------------------------------------------------
+
+            workers = [executor.submit(Worker) for _ in range(max_concurrency)]
+
+            try:
+                for repository_info in _EnumRepos(
+                    validate_dm,
+                    session,
+                    include_exprs,
+                    exclude_exprs,
+                    ignore_archived=ignore_archived,
+                    ignore_forks=ignore_forks,
+                    on_page_func=OnPage,
+                ):
+                    if not Enqueue((num_matched, repository_info)):
+                        break
+
+                    num_matched += 1
+
+            finally:
+                for _ in workers:
+                    if not Enqueue(None):
+                        break
+
+            # Raise any exception that caused a worker to exit early
+            for worker in workers:
+                worker.result()
+
+        return [results[index] for index in range(len(results))]
+
+
+# ----------------------------------------------------------------------
+def _ValidateReposAsync(
+    dm: DoneManager,
+    session: "GitHubSession",
+    plugins: list[Plugin],
+    fetch_plan: "FetchPlan",
+    includes: list[str],
+    excludes: list[str],
+    validate_func: _ValidateReposFuncType[_ValidateReposResultT],
+    *,
+    ignore_archived: bool,
+    ignore_forks: bool,
+    max_concurrency: int,
+    use_graphql: bool=False,
+    is_current_func: Optional[Callable[[dict[str, Any]], bool]]=None,  # Returns True if the repository's previous results can be replayed without accessing GitHub
+    header: str="Validating repositories...",
+    progress_verb: str="validated",
+    stream_func: Optional[_StreamFuncType[_ValidateReposResultT]]=None,
+    on_error_func: Optional[_ErrorFuncType]=None,
+) -> list[Optional[_ValidateReposResultT]]:
+    """\
+    Validates repositories while they are being enumerated via asyncio; repositories are placed in a
+    bounded queue as each page is received and are processed by worker tasks.
+
+    Results are returned in the order in which the repositories were enumerated (unless they are
+    streamed).
+    """
+
+    import asyncio
+
+    # Imported here so that aiohttp is only loaded when the asyncio engine is used
+    from GitHubConfigurationValidatorLib.AsyncGitHubSession import AsyncGitHubSession
+    from GitHubConfigurationValidatorLib.FetchContext import FetchContext
+
+    has_custom_plugins = any(plugin.configuration_type == Plugin.ConfigurationType.Custom for plugin in plugins)
+
+    include_exprs = _CreateRegexes(includes)
+    exclude_exprs = _CreateRegexes(excludes)
+
+    del includes
+    del excludes
+
+    results: dict[int, Optional[_ValidateReposResultT]] = {}
+
+    num_found = 0
+    num_matched = 0
+
+    # ----------------------------------------------------------------------
+    async def ValidateRepository(
+        validate_dm: DoneManager,
+        async_session: AsyncGitHubSession,
+        repository_info: dict[str, Any],
+        graphql_configurations: Optional["GraphQLConfigurations.PublishedConfigurations"],
+    ) -> Optional[_ValidateReposResultT]:
+        try:
+            if is_current_func is not None and is_current_func(repository_info):
+                return validate_func(repository_info, None, None)
+
+            fetch_context = FetchContext(session)
+            configurations: Optional[GraphQLConfigurations.ConfigurationsType] = None
+
+            if graphql_configurations is not None:
+                configurations = _MergeGraphQLConfigurations(
+                    validate_dm,
+                    repository_info,
+                    await graphql_configurations.GetAsync(repository_info["name"]),
+                )
+
+            if configurations is None:
+                await _PrimeFetchContextAsync(
+                    async_session,
+                    fetch_context,
+                    fetch_plan,
+                    repository_info,
+                )
+
+            if has_custom_plugins:
+                # Custom plugins use the synchronous session, so run them in a thread (while still
+                # honoring the concurrency limit).
+                async with async_session.limiter:
+                    return await asyncio.to_thread(validate_func, repository_info, fetch_context, configurations)
+
+            return validate_func(repository_info, fetch_context, configurations)
+
+        except Exception as ex:  # pylint: disable=broad-exception-caught
+            validate_dm.WriteError("An error was encountered while validating '{}': {}\n".format(repository_info["name"], ex))
+
+            if on_error_func is not None:
+                try:
+                    on_error_func(repository_info)
+                except Exception as error_ex:  # pylint: disable=broad-exception-caught
+                    validate_dm.WriteError("An error was encountered while recording the error for '{}': {}\n".format(repository_info["name"], error_ex))
+
+            return None
+
+    # ----------------------------------------------------------------------
+    async def Impl() -> list[Optional[_ValidateReposResultT]]:
+        nonlocal num_matched
+
+        async with AsyncGitHubSession(session, max_concurrency) as async_session:
+            with dm.Nested(
+                header,
+                [
+                    lambda: "{} found".format(_CountNoun("repository", num_found)),
+                    lambda: "{} matched".format(_CountNoun("repository", num_matched)),
+                    lambda: "{} {}".format(_CountNoun("repository", len(results)), progress_verb),
+                ],
+            ) as validate_dm:
+                graphql_configurations: Optional[GraphQLConfigurations.PublishedConfigurations] = None
+                graphql_task: Optional[asyncio.Task[None]] = None
+
+                if use_graphql:
+                    from GitHubConfigurationValidatorLib import GraphQLConfigurations
+
+                    graphql_configurations = GraphQLConfigurations.PublishedConfigurations(asyncio.get_running_loop())
+
+                    graphql_task = asyncio.create_task(
+                        asyncio.to_thread(
+                            _GetGraphQLConfigurations,
+                            validate_dm,
+                            session,
+                            set(fetch_plan.configuration_types),
+                            graphql_configurations,
+                        ),
+                    )
+
+                work_queue: asyncio.Queue[Optional[tuple[int, dict[str, Any]]]] = asyncio.Queue(maxsize=max_concurrency * 2)
+
+                # ----------------------------------------------------------------------
+                async def Worker() -> None:
+                    while True:
+                        item = await work_queue.get()
+                        if item is None:
+                            break
+
+                        index, repository_info = item
+
+                        result = await ValidateRepository(
+                            validate_dm,
+                            async_session,
+                            repository_info,
+                            graphql_configurations,
+                        )
+
+                        if stream_func is not None and result is not None:
+                            # Workers are run on the event loop's thread, so calls are serialized
+                            try:
+                                stream_func(validate_dm, result)
+                            except Exception as ex:  # pylint: disable=broad-exception-caught
+                                validate_dm.WriteError("An error was encountered while validating '{}': {}\n".format(repository_info["name"], ex))
+
+                            result = None
+
+                        results[index] = result
+
+                # ----------------------------------------------------------------------
+                def OnPage(
+                    num_repositories: int,
+                ) -> None:
+                    nonlocal num_found
+                    num_found += num_repositories
+
+                # ----------------------------------------------------------------------
+                async def Enqueue(
+                    item: Optional[tuple[int, dict[str, Any]]],
+                ) -> bool:
+                    """Returns False if the item could not be enqueued because all of the workers have exited"""
+
+                    while True:
+                        try:
+                            await asyncio.wait_for(work_queue.put(item), _WORK_QUEUE_POLL_SECONDS)
+                            return True
+                        except asyncio.TimeoutError:
+                            if all(worker.done() for worker in workers):
+                                return False
+
+                # ----------------------------------------------------------------------
+
+                workers = [asyncio.create_task(Worker()) for _ in range(max_concurrency)]
+
+                try:
+                    async for repository_info in _EnumReposAsync(
+                        validate_dm,
+                        async_session,
+                        include_exprs,
+                        exclude_exprs,
+                        ignore_archived=ignore_archived,
+                        ignore_forks=ignore_forks,
+                        on_page_func=OnPage,
+                    ):
+                        if not await Enqueue((num_matched, repository_info)):
+                            break
+
+                        num_matched += 1
+
+                finally:
+                    for _ in workers:
+                        if not await Enqueue(None):
+                            break
+
+                    await asyncio.gather(*workers)
+
+                    if graphql_task is not None:
+                        await graphql_task
+
+                return [results[index] for index in range(len(results))]
+
+    # ----------------------------------------------------------------------
+
+    return asyncio.run(Impl())
+
+
+# ----------------------------------------------------------------------
+@dataclass(frozen=True)
+class _CollectedRepository(object):
+    """Information retrieved for a repository before the rules of all repositories are evaluated"""
+
+    repository_info: dict[str, Any]
+    fetch_context: Optional["FetchContext"]
+    configurations: Optional["GraphQLConfigurations.ConfigurationsType"]  # None if the repository's previous results will be replayed
+
+
+# ----------------------------------------------------------------------
+def _ValidateReposColumnar(
+    dm: DoneManager,
+    rule_engine: "RuleEngine",
+    collected_repositories: list[Optional[_CollectedRepository]],
+    validate_func: Callable[
+        [dict[str, Any], Optional["FetchContext"], Optional["GraphQLConfigurations.ConfigurationsType"], Optional["ResultMatrix.RowType"]],
+        _ValidateReposResultT,
+    ],
+    *,
+    max_concurrency: int,
+    timings: Optional["Timings"]=None,
+    stream_func: Optional[_StreamFuncType[_ValidateReposResultT]]=None,
+    on_error_func: Optional[_ErrorFuncType]=None,
+) -> list[Optional[_ValidateReposResultT]]:
+    """\
+    Evaluates the rules for all repositories at once (as a repository x plugin matrix) and then
+    validates each repository with its row of the matrix.
+
+    Results are returned in the same order as the collected repositories (unless they are streamed).
+    """
+
+    with _YieldPhaseTimer(timings, "Evaluating rules"):
+        matrix = rule_engine.EvaluateMatrix(
+            [
+                None if collected_repository is None else collected_repository.configurations
+                for collected_repository in collected_repositories
+            ],
+        )
+
+    results: list[Optional[_ValidateReposResultT]] = [None] * len(collected_repositories)
+
+    num_validated = 0
+    num_validated_lock = threading.Lock()
+    stream_lock = threading.Lock()
+
+    with dm.Nested(
+        "Validating repositories...",
+        lambda: "{} validated".format(_CountNoun("repository", num_validated)),
+    ) as validate_dm:
+        # ----------------------------------------------------------------------
+        def ValidateRepository(
+            index: int,
+        ) -> None:
+            nonlocal num_validated
+
+            collected_repository = collected_repositories[index]
+            if collected_repository is None:
+                # Errors were displayed (and reported) when the repository's information was retrieved
+                return
+
+            try:
+                result = validate_func(
+                    collected_repository.repository_info,
+                    collected_repository.fetch_context,
+                    collected_repository.configurations,
+                    matrix.GetRow(index),
+                )
+
+                if stream_func is not None and result is not None:
+                    with stream_lock:
+                        stream_func(validate_dm, result)
+
+                    result = None
+
+                results[index] = result
+
+            except Exception as ex:  # pylint: disable=broad-exception-caught
+                validate_dm.WriteError("An error was encountered while validating '{}': {}\n".format(collected_repository.repository_info["name"], ex))
+
+                if on_error_func is not None:
+                    on_error_func(collected_repository.repository_info)
+
+            with num_validated_lock:
+                num_validated += 1
+
+        # ----------------------------------------------------------------------
+
+        with ThreadPoolExecutor(max_workers=max_concurrency) as executor:
+            # Custom plugins may access GitHub, so repositories are validated concurrently
+            for _ in executor.map(ValidateRepository, range(len(collected_repositories))):
+                pass
+
+    return results
+
+
+# ----------------------------------------------------------------------
+def _GetGraphQLConfigurations(
+    dm: DoneManager,
+    session: "GitHubSession",
+    configuration_types: set[Plugin.ConfigurationType],
+    published_configurations: "GraphQLConfigurations.PublishedConfigurations",
+) -> None:
+    """\
+    Retrieves configuration information via GraphQL and publishes each page as it is received; errors
+    are written to the DoneManager.
+    """
+
+    from GitHubConfigurationValidatorLib import GraphQLConfigurations
+
+    try:
+        GraphQLConfigurations.GetConfigurations(
+            session,
+            configuration_types,
+            on_page_func=published_configurations.Publish,
+        )
+    except Exception as ex:  # pylint: disable=broad-exception-caught
+        dm.WriteError("Configuration information could not be retrieved via GraphQL: {}\n".format(ex))
+    finally:
+        # Repositories that were not published will be retrieved via the REST API
+        published_configurations.Complete()
+
+
+# ----------------------------------------------------------------------
+def _MergeGraphQLConfigurations(
+    dm: DoneManager,
+    repository_info: dict[str, Any],
+    configurations: Optional["GraphQLConfigurations.ConfigurationsType"],
+) -> Optional["GraphQLConfigurations.ConfigurationsType"]:
+    """Returns the GraphQL configuration information for the repository, or None if it must be retrieved via the REST API"""
+
+    if configurations is None:
+        dm.WriteVerbose("'{}' was not returned by GraphQL.\n".format(repository_info["name"]))
+        return None
+
+    repository_configuration = configurations.get(Plugin.ConfigurationType.Repository, None)
+    if repository_configuration is None:
+        return configurations
+
+    # Values that are not available via GraphQL (for example, 'security_and_analysis') are provided
+    # by the REST repository information.
+    return {
+        **configurations,
+        Plugin.ConfigurationType.Repository: {
+            **repository_info,
+            **repository_configuration,
+        },
+    }
+
+
+# ----------------------------------------------------------------------
+async def _PrimeFetchContextAsync(
+    async_session: "AsyncGitHubSession",
+    fetch_context: "FetchContext",
+    fetch_plan: "FetchPlan",
+    repository_info: dict[str, Any],
+) -> None:
+    """Retrieves the configuration information used by FetchPlan.Execute concurrently"""
+
+    import asyncio
+
+    urls = list(
+        fetch_plan.GetUrls(
+            async_session.session.github_username,
+            repository_info["name"],
+            repository_info["default_branch"],
+        ).values(),
+    )
+
+    responses = await asyncio.gather(*(async_session.Get(url) for url in urls))
+
+    for url, response in zip(urls, responses):
+        fetch_context.Prime(url, response)
+
 
 # ----------------------------------------------------------------------
 # ----------------------------------------------------------------------
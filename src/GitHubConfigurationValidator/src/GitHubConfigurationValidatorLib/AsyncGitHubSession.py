@@ -0,0 +1,200 @@
+# ----------------------------------------------------------------------
+# |
+# |  AsyncGitHubSession.py
+# |
+# |  David Brownell <db@DavidBrownell.com>
+# |      2023-11-22 13:41:19
+# |
+# ----------------------------------------------------------------------
+# |
+# |  Copyright David Brownell 2023
+# |  Distributed under the Boost Software License, Version 1.0. See
+# |  accompanying file LICENSE_1_0.txt or copy at
+# |  http://www.boost.org/LICENSE_1_0.txt.
+# |
+# ----------------------------------------------------------------------
+"""Contains the AsyncGitHubSession object"""
+
+import asyncio
+
+from typing import Any, Mapping, Optional
+
+import aiohttp
+import requests
+
+from yarl import URL
+
+from GitHubConfigurationValidatorLib.Cassette import Cassette
+from GitHubConfigurationValidatorLib.GitHubSession import GitHubSession
+from GitHubConfigurationValidatorLib.Impl.ResponseImpl import CreateResponse
+from GitHubConfigurationValidatorLib.Timings import Timings
+
+
+# ----------------------------------------------------------------------
+class AsyncGitHubSession(object):
+    """\
+    Session used to communicate with GitHub via asyncio.
+
+    The session borrows its configuration (url, credentials, response cache, and rate limit scheduler)
+    from a GitHubSession, and all requests (as well as any other work scheduled via `limiter`) share a
+    single bounded-concurrency limiter. Each request also acquires a request slot from the rate limit
+    scheduler, so the number of requests in flight is reduced as the budget is exhausted.
+    """
+
+    # ----------------------------------------------------------------------
+    # |  Public Methods
+    def __init__(
+        self,
+        session: GitHubSession,
+        max_concurrency: int,
+    ):
+        assert max_concurrency > 0, max_concurrency
+
+        self.session                        = session
+        self.limiter                        = asyncio.Semaphore(max_concurrency)
+
+        self._max_concurrency               = max_concurrency
+        self._client: Optional[aiohttp.ClientSession]   = None
+
+    # ----------------------------------------------------------------------
+    async def __aenter__(self) -> "AsyncGitHubSession":
+        assert self._client is None
+
+        self._client = aiohttp.ClientSession(
+            headers=dict(self.session.headers),
+            connector=aiohttp.TCPConnector(limit=self._max_concurrency),
+        )
+
+        return self
+
+    # ----------------------------------------------------------------------
+    async def __aexit__(self, *args) -> None:
+        assert self._client is not None
+
+        await self._client.close()
+        self._client = None
+
+    # ----------------------------------------------------------------------
+    async def Get(
+        self,
+        url: str,
+        params: Optional[Mapping[str, Any]]=None,
+    ) -> requests.Response:
+        url = self.session.CreateUrl(url)
+
+        rate_limit_scheduler = self.session.rate_limit_scheduler
+
+        if rate_limit_scheduler is None:
+            async with self.limiter:
+                return await self._SendRequest(url, params)
+
+        resource = rate_limit_scheduler.GetResource(url)
+        attempt = 0
+
+        while True:
+            async with (
+                self.limiter,
+                rate_limit_scheduler.YieldRequestSlotAsync(resource),
+            ):
+                response = await self._SendRequest(url, params)
+
+            rate_limit_scheduler.Update(resource, response.headers)
+
+            retry_delay = rate_limit_scheduler.GetRetryDelay(
+                response.status_code,
+                response.headers,
+                response.text if response.status_code in [403, 429] else "",
+                attempt,
+            )
+
+            if retry_delay is None:
+                return response
+
+            await rate_limit_scheduler.SleepAsync(retry_delay, is_retry=True)
+            attempt += 1
+
+    # ----------------------------------------------------------------------
+    async def GetJson(
+        self,
+        url: str,
+        params: Optional[Mapping[str, Any]]=None,
+    ) -> Any:
+        response = await self.Get(url, params)
+
+        response.raise_for_status()
+        return response.json()
+
+    # ----------------------------------------------------------------------
+    # |  Private Methods
+    async def _SendRequest(
+        self,
+        url: str,
+        params: Optional[Mapping[str, Any]],
+    ) -> requests.Response:
+        timings = self.session.timings
+
+        if timings is None:
+            return await self._SendRequestImpl(url, params)
+
+        with timings.YieldTimer(
+            Timings.Category.Endpoint,
+            Timings.CreateEndpointName("GET", url, self.session.github_url),
+        ):
+            return await self._SendRequestImpl(url, params)
+
+    # ----------------------------------------------------------------------
+    async def _SendRequestImpl(
+        self,
+        url: str,
+        params: Optional[Mapping[str, Any]],
+    ) -> requests.Response:
+        assert self._client is not None
+
+        cassette = self.session.cassette
+
+        if cassette is not None:
+            cassette_key = Cassette.CreateKey("GET", url, params)
+
+            if cassette.mode == Cassette.Mode.Replay:
+                if cassette.latency:
+                    await asyncio.sleep(cassette.latency)
+
+                return cassette.Replay(cassette_key)
+
+        response_cache = self.session.response_cache
+
+        if response_cache is None:
+            headers: dict[str, str] = {}
+            cache_key = None
+            cache_entry = None
+        else:
+            cache_key, cache_entry, headers = response_cache.PrepareRequest(
+                url,
+                params,
+                self.session.headers.get("Authorization", None),
+                None,
+            )
+
+        # Let requests encode the query parameters so that urls are identical to those generated by
+        # the synchronous session.
+        prepared_request = requests.models.PreparedRequest()
+        prepared_request.prepare_url(url, params)
+
+        assert prepared_request.url is not None
+
+        async with self._client.get(URL(prepared_request.url, encoded=True), headers=headers) as client_response:
+            response = CreateResponse(
+                prepared_request.url,
+                client_response.status,
+                client_response.headers,
+                await client_response.read(),
+            )
+
+        if cassette is not None:
+            cassette.Record(cassette_key, response)
+
+        if response_cache is not None:
+            assert cache_key is not None
+            response = response_cache.ProcessResponse(cache_key, cache_entry, response)
+
+        return response
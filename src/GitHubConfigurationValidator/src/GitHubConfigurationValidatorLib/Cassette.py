@@ -0,0 +1,255 @@
+# ----------------------------------------------------------------------
+# |
+# |  Cassette.py
+# |
+# |  David Brownell <db@DavidBrownell.com>
+# |      2023-11-28 10:27:53
+# |
+# ----------------------------------------------------------------------
+# |
+# |  Copyright David Brownell 2023
+# |  Distributed under the Boost Software License, Version 1.0. See
+# |  accompanying file LICENSE_1_0.txt or copy at
+# |  http://www.boost.org/LICENSE_1_0.txt.
+# |
+# ----------------------------------------------------------------------
+"""Contains the Cassette object"""
+
+import base64
+import gzip
+import hashlib
+import json
+import threading
+
+from dataclasses import dataclass
+from enum import auto, Enum
+from pathlib import Path
+from typing import Any, Mapping, Optional
+
+import requests
+
+from GitHubConfigurationValidatorLib.Impl.ResponseImpl import CreateResponse
+
+
+# ----------------------------------------------------------------------
+class Cassette(object):
+    """\
+    Records the requests sent to GitHub (and the responses received) so that they can be replayed
+    offline; this makes it possible to benchmark and debug the tool deterministically.
+
+    Requests are matched by method, url (including query parameters), and body; when the same request
+    is made multiple times, the recorded responses are replayed in the order in which they were
+    recorded (with the last response repeated once the others have been exhausted).
+    """
+
+    # ----------------------------------------------------------------------
+    # |
+    # |  Public Types
+    # |
+    # ----------------------------------------------------------------------
+    FILE_FORMAT_VERSION                     = 1
+
+    # ----------------------------------------------------------------------
+    class Mode(Enum):
+        """Cassette mode"""
+
+        Record                              = auto()
+        Replay                              = auto()
+
+    # ----------------------------------------------------------------------
+    @dataclass(frozen=True)
+    class Interaction(object):
+        """Recorded response"""
+
+        status_code: int
+        headers: dict[str, str]
+        content: bytes
+
+    # ----------------------------------------------------------------------
+    # |
+    # |  Public Methods
+    # |
+    # ----------------------------------------------------------------------
+    @classmethod
+    def CreateRecorder(
+        cls,
+        filename: Path,
+    ) -> "Cassette":
+        return cls(filename, Cassette.Mode.Record, {}, 0.0)
+
+    # ----------------------------------------------------------------------
+    @classmethod
+    def Load(
+        cls,
+        filename: Path,
+        latency: float=0.0,
+    ) -> "Cassette":
+        """Loads a cassette for replay; `latency` is the number of seconds to wait before returning each response"""
+
+        with gzip.open(filename, "rt", encoding="utf-8") as f:
+            content = json.load(f)
+
+        if content.get("version", None) != cls.FILE_FORMAT_VERSION:
+            raise Exception("'{}' is not a supported cassette file.".format(filename))
+
+        interactions: dict[str, list[Cassette.Interaction]] = {}
+
+        for item in content["interactions"]:
+            interactions.setdefault(item["key"], []).append(
+                Cassette.Interaction(
+                    item["status_code"],
+                    item["headers"],
+                    base64.b64decode(item["content"]),
+                ),
+            )
+
+        return cls(filename, Cassette.Mode.Replay, interactions, latency)
+
+    # ----------------------------------------------------------------------
+    def __init__(
+        self,
+        filename: Path,
+        mode: "Cassette.Mode",
+        interactions: dict[str, list["Cassette.Interaction"]],
+        latency: float,
+    ):
+        assert latency >= 0.0, latency
+
+        self.filename                       = filename
+        self.mode                           = mode
+        self.latency                        = latency
+
+        self._interactions                  = interactions
+        self._lock                          = threading.Lock()
+
+        self._replay_indexes: dict[str, int]    = {}
+        self._recorded_keys: list[str]          = []
+        self._num_requests                  = 0
+
+    # ----------------------------------------------------------------------
+    @property
+    def num_requests(self) -> int:
+        return self._num_requests
+
+    # ----------------------------------------------------------------------
+    def Save(self) -> None:
+        """Writes the recorded interactions to disk"""
+
+        assert self.mode == Cassette.Mode.Record, self.mode
+
+        with self._lock:
+            # Write interactions in the order in which they were recorded
+            indexes: dict[str, int] = {}
+            items: list[dict[str, Any]] = []
+
+            for key in self._recorded_keys:
+                index = indexes.get(key, 0)
+                indexes[key] = index + 1
+
+                interaction = self._interactions[key][index]
+
+                items.append(
+                    {
+                        "key": key,
+                        "status_code": interaction.status_code,
+                        "headers": interaction.headers,
+                        "content": base64.b64encode(interaction.content).decode("ascii"),
+                    },
+                )
+
+        self.filename.parent.mkdir(parents=True, exist_ok=True)
+
+        with gzip.open(self.filename, "wt", encoding="utf-8") as f:
+            json.dump(
+                {
+                    "version": self.__class__.FILE_FORMAT_VERSION,
+                    "interactions": items,
+                },
+                f,
+                separators=(",", ":"),
+            )
+
+    # ----------------------------------------------------------------------
+    @staticmethod
+    def CreateKey(
+        method: str,
+        url: str,
+        params: Optional[Mapping[str, Any]]=None,
+        data: Any=None,
+        json: Any=None,  # pylint: disable=redefined-outer-name
+    ) -> str:
+        prepared_request = requests.Request(
+            method.upper(),
+            url,
+            params=params,
+            data=data,
+            json=json,
+        ).prepare()
+
+        body = prepared_request.body or b""
+        if isinstance(body, str):
+            body = body.encode("utf-8")
+
+        return "{} {} {}".format(
+            prepared_request.method,
+            prepared_request.url,
+            hashlib.sha256(body).hexdigest(),
+        )
+
+    # ----------------------------------------------------------------------
+    def Record(
+        self,
+        key: str,
+        response: requests.Response,
+    ) -> None:
+        assert self.mode == Cassette.Mode.Record, self.mode
+
+        headers = {
+            k: v
+            for k, v in response.headers.items()
+            if k.lower() not in ["content-length", "content-encoding", "transfer-encoding"]
+        }
+
+        with self._lock:
+            self._interactions.setdefault(key, []).append(
+                Cassette.Interaction(response.status_code, headers, response.content),
+            )
+
+            self._recorded_keys.append(key)
+            self._num_requests += 1
+
+    # ----------------------------------------------------------------------
+    def Replay(
+        self,
+        key: str,
+    ) -> requests.Response:
+        """Returns the recorded response; note that the caller is responsible for applying `latency`"""
+
+        assert self.mode == Cassette.Mode.Replay, self.mode
+
+        with self._lock:
+            interactions = self._interactions.get(key, None)
+            if not interactions:
+                raise Exception("The request '{}' was not found in the cassette '{}'.".format(key, self.filename))
+
+            index = self._replay_indexes.get(key, 0)
+            self._replay_indexes[key] = index + 1
+
+            self._num_requests += 1
+
+        interaction = interactions[min(index, len(interactions) - 1)]
+
+        return CreateResponse(
+            key.split(" ")[1],
+            interaction.status_code,
+            interaction.headers,
+            interaction.content,
+        )
+
+    # ----------------------------------------------------------------------
+    def GetStatisticsString(self) -> str:
+        return "Cassette: {} {} request(s) ('{}').\n".format(
+            "recorded" if self.mode == Cassette.Mode.Record else "replayed",
+            self._num_requests,
+            self.filename,
+        )
@@ -0,0 +1,146 @@
+# ----------------------------------------------------------------------
+# |
+# |  FetchContext.py
+# |
+# |  David Brownell <db@DavidBrownell.com>
+# |      2023-11-24 10:18:55
+# |
+# ----------------------------------------------------------------------
+# |
+# |  Copyright David Brownell 2023
+# |  Distributed under the Boost Software License, Version 1.0. See
+# |  accompanying file LICENSE_1_0.txt or copy at
+# |  http://www.boost.org/LICENSE_1_0.txt.
+# |
+# ----------------------------------------------------------------------
+"""Contains the FetchContext object"""
+
+import threading
+
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Mapping, Optional
+
+import requests
+
+from GitHubConfigurationValidatorLib.GitHubSession import GitHubSession
+
+
+# ----------------------------------------------------------------------
+class FetchContext(object):
+    """\
+    Memoizes GET responses for the lifetime of a single repository's validation.
+
+    The object provides the same interface as GitHubSession, so it can be used anywhere a session is
+    expected (for example, it is provided as the session to Plugin.CustomValidate). Requests that
+    have already been made during the repository's validation (by the core pipeline or other plugins)
+    are served from memory rather than being sent to GitHub again.
+    """
+
+    # ----------------------------------------------------------------------
+    # |  Public Methods
+    def __init__(
+        self,
+        session: GitHubSession,
+    ):
+        self.session                        = session
+
+        self._lock                          = threading.Lock()
+        self._responses: dict[str, Future[requests.Response]]   = {}
+
+    # ----------------------------------------------------------------------
+    def __getattr__(
+        self,
+        name: str,
+    ) -> Any:
+        # Forward everything else (github_url, github_username, post, etc.) to the session
+        return getattr(self.session, name)
+
+    # ----------------------------------------------------------------------
+    def Contains(
+        self,
+        url: str,
+        params: Optional[Mapping[str, Any]]=None,
+    ) -> bool:
+        with self._lock:
+            return self._CreateKey(url, params) in self._responses
+
+    # ----------------------------------------------------------------------
+    def Prime(
+        self,
+        url: str,
+        response: requests.Response,
+        params: Optional[Mapping[str, Any]]=None,
+    ) -> None:
+        """Stores a response retrieved by other means (for example, by the asyncio engine)"""
+
+        future: Future[requests.Response] = Future()
+        future.set_result(response)
+
+        with self._lock:
+            self._responses[self._CreateKey(url, params)] = future
+
+    # ----------------------------------------------------------------------
+    def get(  # pylint: disable=invalid-name
+        self,
+        url: str,
+        params: Optional[Mapping[str, Any]]=None,
+        **kwargs,
+    ) -> requests.Response:
+        if kwargs:
+            # Requests with custom headers, timeouts, etc. are not memoized
+            return self.session.get(url, params=params, **kwargs)
+
+        key = self._CreateKey(url, params)
+
+        with self._lock:
+            future = self._responses.get(key, None)
+            is_owner = future is None
+
+            if future is None:
+                future = Future()
+                self._responses[key] = future
+
+        if not is_owner:
+            # Another thread is either retrieving the response or has already retrieved it
+            return future.result()
+
+        try:
+            response = self.session.get(url, params=params)
+        except Exception as ex:
+            # Don't memoize failures so that the request can be attempted again
+            with self._lock:
+                del self._responses[key]
+
+            future.set_exception(ex)
+            raise
+
+        future.set_result(response)
+        return response
+
+    # ----------------------------------------------------------------------
+    def GetMany(
+        self,
+        urls: list[str],
+    ) -> list[requests.Response]:
+        """Returns responses for all of the urls, retrieving those that haven't been retrieved yet concurrently"""
+
+        missing_urls = [url for url in urls if not self.Contains(url)]
+
+        if len(missing_urls) > 1:
+            with ThreadPoolExecutor(max_workers=len(missing_urls)) as executor:
+                list(executor.map(self.get, missing_urls))
+
+        return [self.get(url) for url in urls]
+
+    # ----------------------------------------------------------------------
+    # |  Private Methods
+    def _CreateKey(
+        self,
+        url: str,
+        params: Optional[Mapping[str, Any]],
+    ) -> str:
+        prepared_request = requests.models.PreparedRequest()
+        prepared_request.prepare_url(self.session.CreateUrl(url), params)
+
+        assert prepared_request.url is not None
+        return prepared_request.url
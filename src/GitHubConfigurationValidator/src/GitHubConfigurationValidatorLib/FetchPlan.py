@@ -0,0 +1,121 @@
+# ----------------------------------------------------------------------
+# |
+# |  FetchPlan.py
+# |
+# |  David Brownell <db@DavidBrownell.com>
+# |      2023-12-03 10:22:08
+# |
+# ----------------------------------------------------------------------
+# |
+# |  Copyright David Brownell 2023
+# |  Distributed under the Boost Software License, Version 1.0. See
+# |  accompanying file LICENSE_1_0.txt or copy at
+# |  http://www.boost.org/LICENSE_1_0.txt.
+# |
+# ----------------------------------------------------------------------
+"""Contains the FetchPlan object"""
+
+from typing import Any, Iterable, Optional
+
+import requests
+
+from GitHubConfigurationValidatorLib.FetchContext import FetchContext
+from GitHubConfigurationValidatorLib.GraphQLConfigurations import ConfigurationsType
+from GitHubConfigurationValidatorLib.Plugin import Plugin
+
+
+# ----------------------------------------------------------------------
+class FetchPlan(object):
+    """\
+    The minimal set of GitHub requests needed to retrieve the configuration information used by a set
+    of plugins (as declared by `Plugin.GetRequiredConfigurationTypes`).
+
+    The requests form a small dependency graph: the branch and branch protection urls include the
+    repository's default branch, which is provided by the repository settings (or by the repository
+    information returned when enumerating repositories). Requests that do not depend upon each other
+    are sent concurrently.
+    """
+
+    # ----------------------------------------------------------------------
+    # |
+    # |  Public Methods
+    # |
+    # ----------------------------------------------------------------------
+    def __init__(
+        self,
+        plugins: list[Plugin],
+        additional_configuration_types: Optional[Iterable[Plugin.ConfigurationType]]=None,    # Retrieved even if they are not required by the plugins
+    ):
+        configuration_types: set[Plugin.ConfigurationType] = set(additional_configuration_types or [])
+
+        for plugin in plugins:
+            configuration_types.update(plugin.GetRequiredConfigurationTypes())
+
+        assert Plugin.ConfigurationType.Custom not in configuration_types
+
+        self.configuration_types            = frozenset(configuration_types)
+
+    # ----------------------------------------------------------------------
+    def GetUrls(
+        self,
+        github_username: str,
+        repository: str,
+        default_branch: str,
+    ) -> dict[Plugin.ConfigurationType, str]:
+        """Returns the urls of the requests in the plan; these requests can be sent concurrently"""
+
+        repository_url = "repos/{}/{}".format(github_username, repository)
+        branch_url = "{}/branches/{}".format(repository_url, default_branch)
+
+        urls: dict[Plugin.ConfigurationType, str] = {}
+
+        if Plugin.ConfigurationType.Repository in self.configuration_types:
+            urls[Plugin.ConfigurationType.Repository] = repository_url
+
+        if Plugin.ConfigurationType.Branch in self.configuration_types:
+            urls[Plugin.ConfigurationType.Branch] = branch_url
+
+        if Plugin.ConfigurationType.BranchProtection in self.configuration_types:
+            urls[Plugin.ConfigurationType.BranchProtection] = "{}/protection".format(branch_url)
+
+        return urls
+
+    # ----------------------------------------------------------------------
+    def Execute(
+        self,
+        fetch_context: FetchContext,
+        repository: str,
+        repository_info: Optional[dict[str, Any]],
+    ) -> ConfigurationsType:
+        """Retrieves the configuration information for the repository"""
+
+        if repository_info is None:
+            # The default branch isn't known, so the repository settings must be retrieved before
+            # anything else (the response is memoized, so it will not be retrieved again if the
+            # repository settings are part of the plan).
+            repository_info = self.DecodeResponse(
+                Plugin.ConfigurationType.Repository,
+                fetch_context.get("repos/{}/{}".format(fetch_context.github_username, repository)),
+            )
+
+            assert repository_info is not None
+
+        urls = self.GetUrls(fetch_context.github_username, repository, repository_info["default_branch"])
+
+        return {
+            configuration_type: self.DecodeResponse(configuration_type, response)
+            for configuration_type, response in zip(urls.keys(), fetch_context.GetMany(list(urls.values())))
+        }
+
+    # ----------------------------------------------------------------------
+    @staticmethod
+    def DecodeResponse(
+        configuration_type: Plugin.ConfigurationType,
+        response: requests.Response,
+    ) -> Optional[dict[str, Any]]:
+        if configuration_type == Plugin.ConfigurationType.BranchProtection and response.status_code == 404:
+            # The branch is not protected
+            return None
+
+        response.raise_for_status()
+        return response.json()
@@ -0,0 +1,51 @@
+# ----------------------------------------------------------------------
+# |
+# |  Finding.py
+# |
+# |  David Brownell <db@DavidBrownell.com>
+# |      2023-12-07 08:37:19
+# |
+# ----------------------------------------------------------------------
+# |
+# |  Copyright David Brownell 2023
+# |  Distributed under the Boost Software License, Version 1.0. See
+# |  accompanying file LICENSE_1_0.txt or copy at
+# |  http://www.boost.org/LICENSE_1_0.txt.
+# |
+# ----------------------------------------------------------------------
+"""Contains the Finding object"""
+
+from dataclasses import dataclass
+from typing import Any
+
+from GitHubConfigurationValidatorLib.Plugin import Plugin
+
+
+# ----------------------------------------------------------------------
+@dataclass(frozen=True)
+class Finding(object):
+    """Message produced by a plugin while validating a repository"""
+
+    plugin: str
+    message_type: Plugin.MessageType
+    message: str                            # The message produced by the plugin (without the plugin name decoration or trailing whitespace)
+
+    # ----------------------------------------------------------------------
+    @classmethod
+    def FromJson(
+        cls,
+        value: dict[str, Any],
+    ) -> "Finding":
+        return cls(
+            value["plugin"],
+            Plugin.MessageType[value["type"]],
+            value["message"],
+        )
+
+    # ----------------------------------------------------------------------
+    def ToJson(self) -> dict[str, Any]:
+        return {
+            "plugin": self.plugin,
+            "type": self.message_type.name,
+            "message": self.message,
+        }
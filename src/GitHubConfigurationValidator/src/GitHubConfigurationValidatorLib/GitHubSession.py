@@ -15,11 +15,18 @@
 # ----------------------------------------------------------------------
 """Contains the GitHubSession object"""
 
+import time
+
 from pathlib import Path
 from typing import Optional
 
 import requests
 
+from GitHubConfigurationValidatorLib.Cassette import Cassette
+from GitHubConfigurationValidatorLib.RateLimitScheduler import RateLimitScheduler
+from GitHubConfigurationValidatorLib.ResponseCache import ResponseCache
+from GitHubConfigurationValidatorLib.Timings import Timings
+
 
 # ----------------------------------------------------------------------
 class GitHubSession(requests.Session):
@@ -37,6 +44,10 @@ class GitHubSession(requests.Session):
         github_username: str,
         github_pat: Optional[str],
         *args,
+        response_cache: Optional[ResponseCache]=None,
+        rate_limit_scheduler: Optional[RateLimitScheduler]=None,
+        cassette: Optional[Cassette]=None,
+        timings: Optional[Timings]=None,
         **kwargs,
     ):
         super(GitHubSession, self).__init__(*args, **kwargs)
@@ -63,7 +74,27 @@ class GitHubSession(requests.Session):
         self.github_url                     = github_url
         self.github_username                = github_username
         self.is_enterprise                  = self.github_url != self.__class__.DEFAULT_GITHUB_URL
+        self.graphql_url                    = self.__class__._CreateGraphQLUrl(github_url)
         self.has_pat                        = bool(github_pat)
+        self.response_cache                 = response_cache
+        self.rate_limit_scheduler           = rate_limit_scheduler
+        self.cassette                       = cassette
+        self.timings                        = timings
+
+    # ----------------------------------------------------------------------
+    def CreateUrl(
+        self,
+        url: str,
+    ) -> str:
+        """Returns the fully-qualified url for a url relative to the GitHub API root"""
+
+        if url.startswith("https://") or url.startswith("http://"):
+            return url
+
+        if not url.startswith("/"):
+            url = "/{}".format(url)
+
+        return "{}{}".format(self.github_url, url)
 
     # ----------------------------------------------------------------------
     def request(
@@ -73,12 +104,101 @@ class GitHubSession(requests.Session):
         *args,
         **kwargs,
     ):
-        if not url.startswith("/"):
-            url = "/{}".format(url)
+        url = self.CreateUrl(url)
+
+        if self.rate_limit_scheduler is None:
+            return self._SendRequest(method, url, *args, **kwargs)
+
+        resource = self.rate_limit_scheduler.GetResource(url)
+        attempt = 0
+
+        while True:
+            with self.rate_limit_scheduler.YieldRequestSlot(resource):
+                response = self._SendRequest(method, url, *args, **kwargs)
+
+            self.rate_limit_scheduler.Update(resource, response.headers)
+
+            retry_delay = self.rate_limit_scheduler.GetRetryDelay(
+                response.status_code,
+                response.headers,
+                response.text if response.status_code in [403, 429] else "",
+                attempt,
+            )
+
+            if retry_delay is None:
+                return response
+
+            self.rate_limit_scheduler.Sleep(retry_delay, is_retry=True)
+            attempt += 1
+
+    # ----------------------------------------------------------------------
+    # |  Private Methods
+    @staticmethod
+    def _CreateGraphQLUrl(
+        github_url: str,
+    ) -> str:
+        # GitHub Enterprise Server hosts the REST API at '<host>/api/v3' and the GraphQL API at
+        # '<host>/api/graphql'.
+        if github_url.endswith("/api/v3"):
+            return "{}/graphql".format(github_url[:-len("/v3")])
 
-        return super(GitHubSession, self).request(
-            method,
-            "{}{}".format(self.github_url, url),
-            *args,
-            **kwargs,
+        return "{}/graphql".format(github_url)
+
+    # ----------------------------------------------------------------------
+    def _SendRequest(
+        self,
+        method: str,
+        url: str,
+        *args,
+        **kwargs,
+    ) -> requests.Response:
+        if self.timings is None:
+            return self._SendRequestImpl(method, url, *args, **kwargs)
+
+        with self.timings.YieldTimer(
+            Timings.Category.Endpoint,
+            Timings.CreateEndpointName(method, url, self.github_url),
+        ):
+            return self._SendRequestImpl(method, url, *args, **kwargs)
+
+    # ----------------------------------------------------------------------
+    def _SendRequestImpl(
+        self,
+        method: str,
+        url: str,
+        *args,
+        **kwargs,
+    ) -> requests.Response:
+        if self.cassette is not None:
+            cassette_key = Cassette.CreateKey(
+                method,
+                url,
+                kwargs.get("params", None),
+                kwargs.get("data", None),
+                kwargs.get("json", None),
+            )
+
+            if self.cassette.mode == Cassette.Mode.Replay:
+                if self.cassette.latency:
+                    time.sleep(self.cassette.latency)
+
+                return self.cassette.Replay(cassette_key)
+
+            response = super(GitHubSession, self).request(method, url, *args, **kwargs)
+
+            self.cassette.Record(cassette_key, response)
+            return response
+
+        if self.response_cache is None or method.upper() != "GET":
+            return super(GitHubSession, self).request(method, url, *args, **kwargs)
+
+        cache_key, cache_entry, kwargs["headers"] = self.response_cache.PrepareRequest(
+            url,
+            kwargs.get("params", None),
+            self.headers.get("Authorization", None),
+            kwargs.get("headers", None),
         )
+
+        response = super(GitHubSession, self).request(method, url, *args, **kwargs)
+
+        return self.response_cache.ProcessResponse(cache_key, cache_entry, response)
@@ -0,0 +1,379 @@
+# ----------------------------------------------------------------------
+# |
+# |  GraphQLConfigurations.py
+# |
+# |  David Brownell <db@DavidBrownell.com>
+# |      2023-11-25 09:03:27
+# |
+# ----------------------------------------------------------------------
+# |
+# |  Copyright David Brownell 2023
+# |  Distributed under the Boost Software License, Version 1.0. See
+# |  accompanying file LICENSE_1_0.txt or copy at
+# |  http://www.boost.org/LICENSE_1_0.txt.
+# |
+# ----------------------------------------------------------------------
+"""\
+Retrieves repository, branch, and branch protection configuration information for many repositories
+per request via the GitHub GraphQL API.
+
+The results are converted into the same structures returned by the REST API, so they can be consumed
+by plugins without modification.
+"""
+
+import asyncio
+import threading
+
+from typing import Any, Callable, Optional
+
+from GitHubConfigurationValidatorLib.GitHubSession import GitHubSession
+from GitHubConfigurationValidatorLib.Plugin import Plugin
+
+
+# ----------------------------------------------------------------------
+# |
+# |  Public Types
+# |
+# ----------------------------------------------------------------------
+DEFAULT_PAGE_SIZE                           = 50
+
+ConfigurationsType                          = dict[Plugin.ConfigurationType, Optional[dict[str, Any]]]
+
+
+# ----------------------------------------------------------------------
+class PublishedConfigurations(object):
+    """\
+    Configuration information that is published one page at a time as it is retrieved, so that
+    consumers can begin processing repositories in pages that have already been received.
+    """
+
+    # ----------------------------------------------------------------------
+    # |
+    # |  Public Methods
+    # |
+    # ----------------------------------------------------------------------
+    def __init__(
+        self,
+        loop: Optional[asyncio.AbstractEventLoop]=None,     # Required by GetAsync
+    ):
+        self._loop                          = loop
+        self._async_event                   = None if loop is None else asyncio.Event()
+
+        self._condition                     = threading.Condition()
+        self._configurations: dict[str, ConfigurationsType] = {}
+        self._is_complete                   = False
+
+    # ----------------------------------------------------------------------
+    def Publish(
+        self,
+        configurations: dict[str, ConfigurationsType],
+    ) -> None:
+        with self._condition:
+            self._configurations.update(configurations)
+            self._NotifyImpl()
+
+    # ----------------------------------------------------------------------
+    def Complete(self) -> None:
+        """Called when all pages have been published (or when configurations can no longer be retrieved)"""
+
+        with self._condition:
+            self._is_complete = True
+            self._NotifyImpl()
+
+    # ----------------------------------------------------------------------
+    def Get(
+        self,
+        repository_name: str,
+    ) -> Optional[ConfigurationsType]:
+        """\
+        Returns the configurations for the repository, waiting until the page that contains it has been
+        published; returns None if the repository was not returned.
+        """
+
+        with self._condition:
+            while True:
+                result = self._GetImpl(repository_name)
+                if result is not None or self._is_complete:
+                    return result
+
+                self._condition.wait()
+
+    # ----------------------------------------------------------------------
+    async def GetAsync(
+        self,
+        repository_name: str,
+    ) -> Optional[ConfigurationsType]:
+        """Returns the configurations for the repository without blocking the event loop; see `Get` for more information"""
+
+        assert self._async_event is not None, "A loop must be provided to use GetAsync"
+
+        while True:
+            with self._condition:
+                result = self._GetImpl(repository_name)
+                if result is not None or self._is_complete:
+                    return result
+
+                # Publish and Complete set the event via the loop, so it will not be set before this
+                # task awaits it.
+                self._async_event.clear()
+
+            await self._async_event.wait()
+
+    # ----------------------------------------------------------------------
+    # |
+    # |  Private Methods
+    # |
+    # ----------------------------------------------------------------------
+    def _GetImpl(
+        self,
+        repository_name: str,
+    ) -> Optional[ConfigurationsType]:
+        return self._configurations.get(repository_name, None)
+
+    # ----------------------------------------------------------------------
+    def _NotifyImpl(self) -> None:
+        self._condition.notify_all()
+
+        if self._loop is not None:
+            assert self._async_event is not None
+            self._loop.call_soon_threadsafe(self._async_event.set)
+
+
+# ----------------------------------------------------------------------
+# |
+# |  Public Functions
+# |
+# ----------------------------------------------------------------------
+def GetConfigurations(
+    session: GitHubSession,
+    configuration_types: set[Plugin.ConfigurationType],
+    *,
+    page_size: int=DEFAULT_PAGE_SIZE,
+    on_page_func: Optional[Callable[[dict[str, ConfigurationsType]], None]]=None,  # Called with the configurations of each page, keyed by repository name
+) -> dict[str, ConfigurationsType]:
+    """\
+    Returns configuration information for all repositories owned by the session's user/organization,
+    keyed by repository name.
+
+    Note that the repository configuration only contains values that are not included when listing
+    repositories via the REST API (for example, merge settings); callers should combine these values
+    with the REST repository information. 'security_and_analysis' is not available via GraphQL.
+    """
+
+    assert 0 < page_size <= 100, page_size
+
+    results: dict[str, ConfigurationsType] = {}
+    cursor: Optional[str] = None
+
+    while True:
+        response = session.post(
+            session.graphql_url,
+            json={
+                "query": _QUERY,
+                "variables": {
+                    "login": session.github_username,
+                    "first": page_size,
+                    "after": cursor,
+                },
+            },
+        )
+
+        response.raise_for_status()
+        content = response.json()
+
+        errors = content.get("errors", None)
+        if errors:
+            raise Exception(
+                "GraphQL errors were encountered: {}".format(
+                    "; ".join(error.get("message", str(error)) for error in errors),
+                ),
+            )
+
+        owner = content["data"]["repositoryOwner"]
+        if owner is None:
+            raise Exception("The user/organization '{}' was not found.".format(session.github_username))
+
+        repositories = owner["repositories"]
+
+        page_results: dict[str, ConfigurationsType] = {
+            node["name"]: _CreateConfigurations(node, configuration_types)
+            for node in repositories["nodes"]
+        }
+
+        results.update(page_results)
+
+        if on_page_func is not None:
+            on_page_func(page_results)
+
+        page_info = repositories["pageInfo"]
+
+        if not page_info["hasNextPage"]:
+            break
+
+        cursor = page_info["endCursor"]
+
+    return results
+
+
+# ----------------------------------------------------------------------
+# |
+# |  Private Data
+# |
+# ----------------------------------------------------------------------
+_QUERY                                      = """\
+query($login: String!, $first: Int!, $after: String) {
+  repositoryOwner(login: $login) {
+    repositories(first: $first, after: $after, ownerAffiliations: [OWNER], orderBy: {field: NAME, direction: ASC}) {
+      pageInfo {
+        hasNextPage
+        endCursor
+      }
+      nodes {
+        name
+        autoMergeAllowed
+        deleteBranchOnMerge
+        mergeCommitAllowed
+        mergeCommitMessage
+        mergeCommitTitle
+        rebaseMergeAllowed
+        squashMergeAllowed
+        squashMergeCommitMessage
+        squashMergeCommitTitle
+        allowUpdateBranch
+        hasDiscussionsEnabled
+        hasIssuesEnabled
+        hasProjectsEnabled
+        hasWikiEnabled
+        isTemplate
+        webCommitSignoffRequired
+        defaultBranchRef {
+          name
+          branchProtectionRule {
+            isAdminEnforced
+            allowsDeletions
+            allowsForcePushes
+            lockBranch
+            requiresConversationResolution
+            requiresLinearHistory
+            requiresCommitSignatures
+            requiresApprovingReviews
+            requiredApprovingReviewCount
+            requiresCodeOwnerReviews
+            dismissesStaleReviews
+            requireLastPushApproval
+            requiresStatusChecks
+            requiresStrictStatusChecks
+            requiredStatusChecks {
+              context
+              app {
+                databaseId
+              }
+            }
+          }
+        }
+      }
+    }
+  }
+}
+"""
+
+
+# ----------------------------------------------------------------------
+# |
+# |  Private Functions
+# |
+# ----------------------------------------------------------------------
+def _CreateConfigurations(
+    node: dict[str, Any],
+    configuration_types: set[Plugin.ConfigurationType],
+) -> ConfigurationsType:
+    configurations: ConfigurationsType = {}
+
+    if Plugin.ConfigurationType.Repository in configuration_types:
+        configurations[Plugin.ConfigurationType.Repository] = _CreateRepositoryConfiguration(node)
+
+    branch = node["defaultBranchRef"]
+    protection_rule = None if branch is None else branch["branchProtectionRule"]
+
+    if Plugin.ConfigurationType.Branch in configuration_types:
+        if branch is None:
+            # The repository is empty
+            configurations[Plugin.ConfigurationType.Branch] = None
+        else:
+            configurations[Plugin.ConfigurationType.Branch] = {
+                "name": branch["name"],
+                "protected": protection_rule is not None,
+            }
+
+    if Plugin.ConfigurationType.BranchProtection in configuration_types:
+        configurations[Plugin.ConfigurationType.BranchProtection] = (
+            None if protection_rule is None else _CreateBranchProtectionConfiguration(protection_rule)
+        )
+
+    return configurations
+
+
+# ----------------------------------------------------------------------
+def _CreateRepositoryConfiguration(
+    node: dict[str, Any],
+) -> dict[str, Any]:
+    return {
+        "name": node["name"],
+        "allow_auto_merge": node["autoMergeAllowed"],
+        "delete_branch_on_merge": node["deleteBranchOnMerge"],
+        "allow_merge_commit": node["mergeCommitAllowed"],
+        "merge_commit_message": node["mergeCommitMessage"],
+        "merge_commit_title": node["mergeCommitTitle"],
+        "allow_rebase_merge": node["rebaseMergeAllowed"],
+        "allow_squash_merge": node["squashMergeAllowed"],
+        "squash_merge_commit_message": node["squashMergeCommitMessage"],
+        "squash_merge_commit_title": node["squashMergeCommitTitle"],
+        "allow_update_branch": node["allowUpdateBranch"],
+        "has_discussions": node["hasDiscussionsEnabled"],
+        "has_issues": node["hasIssuesEnabled"],
+        "has_projects": node["hasProjectsEnabled"],
+        "has_wiki": node["hasWikiEnabled"],
+        "is_template": node["isTemplate"],
+        "web_commit_signoff_required": node["webCommitSignoffRequired"],
+    }
+
+
+# ----------------------------------------------------------------------
+def _CreateBranchProtectionConfiguration(
+    rule: dict[str, Any],
+) -> dict[str, Any]:
+    result: dict[str, Any] = {
+        "enforce_admins": {"enabled": rule["isAdminEnforced"]},
+        "allow_deletions": {"enabled": rule["allowsDeletions"]},
+        "allow_force_pushes": {"enabled": rule["allowsForcePushes"]},
+        "lock_branch": {"enabled": rule["lockBranch"]},
+        "required_conversation_resolution": {"enabled": rule["requiresConversationResolution"]},
+        "required_linear_history": {"enabled": rule["requiresLinearHistory"]},
+        "required_signatures": {"enabled": rule["requiresCommitSignatures"]},
+    }
+
+    # The REST API only includes these values when the corresponding setting is enabled
+    if rule["requiresApprovingReviews"]:
+        result["required_pull_request_reviews"] = {
+            "required_approving_review_count": rule["requiredApprovingReviewCount"] or 0,
+            "require_code_owner_reviews": rule["requiresCodeOwnerReviews"],
+            "dismiss_stale_reviews": rule["dismissesStaleReviews"],
+            "require_last_push_approval": rule["requireLastPushApproval"],
+        }
+
+    if rule["requiresStatusChecks"]:
+        checks = [
+            {
+                "context": check["context"],
+                "app_id": None if check["app"] is None else check["app"]["databaseId"],
+            }
+            for check in (rule["requiredStatusChecks"] or [])
+        ]
+
+        result["required_status_checks"] = {
+            "strict": rule["requiresStrictStatusChecks"],
+            "contexts": [check["context"] for check in checks],
+            "checks": checks,
+        }
+
+    return result
@@ -28,6 +28,7 @@ from Common_Foundation.Types import overridemethod
 from Common_FoundationEx.TyperEx import TypeDefinitionsType
 
 from GitHubConfigurationValidatorLib.Plugin import Plugin as PluginBase
+from GitHubConfigurationValidatorLib.RuleEngine import ConfigurationValue, Rule
 
 
 # ----------------------------------------------------------------------
@@ -57,7 +58,7 @@ def CreateEnablePlugin(
     github_settings_url_suffix: str,
     github_settings_section: str,
     github_settings_value: Optional[str],
-    get_configuration_value_func: Callable[[dict[str, Any]], PluginBase.ValidateResultType | bool],
+    get_configuration_value_func: Callable[[dict[str, Any]], PluginBase.ValidateResultType | bool] | ConfigurationValue,  # ConfigurationValue allows the plugin to be evaluated by the RuleEngine
     subject: Optional[str]=None,
     rationale: Optional[str]=None,
 ) -> PythonType:
@@ -71,7 +72,7 @@ def CreateEnablePlugin(
     if not subject:
         subject = github_settings_value
 
-    instantiation_parameter_name = _CreateParameterName()
+    instantiation_parameter_name = _CreateParameterName(name)
 
     # ----------------------------------------------------------------------
     # pylint: disable=missing-class-docstring
@@ -122,8 +123,24 @@ def CreateEnablePlugin(
                 rationale,
             )
 
+            if isinstance(get_configuration_value_func, ConfigurationValue):
+                rule: Optional[Rule] = Rule(
+                    get_configuration_value_func,
+                    enable_value,
+                    # Values that are not booleans (such as None) are not validated
+                    lambda value: "{} is not {}.\n".format(subject, enable_desc) if isinstance(value, bool) else None,
+                )
+            else:
+                rule = None
+
             self._enable_value              = enable_value
             self._enable_desc               = enable_desc
+            self._rule                      = rule
+
+        # ----------------------------------------------------------------------
+        @overridemethod
+        def GetRule(self) -> Optional[Rule]:
+            return self._rule
 
         # ----------------------------------------------------------------------
         @overridemethod
@@ -131,6 +148,10 @@ def CreateEnablePlugin(
             self,
             configuration: dict[str, Any],
         ) -> PluginBase.ValidateResultType:
+            if self._rule is not None:
+                return self._rule.Evaluate(configuration)
+
+            assert not isinstance(get_configuration_value_func, ConfigurationValue)
             result = get_configuration_value_func(configuration)
             if result is not None:
                 if not isinstance(result, bool):
@@ -158,7 +179,7 @@ def CreateValuePlugin(
     github_settings_url_suffix: str,
     github_settings_section: Optional[str],
     github_settings_value: Optional[str],
-    get_configuration_value_func: Callable[[dict[str, Any]], PluginBase.ValidateResultType | Result[Optional[CreateValuePluginT]]],
+    get_configuration_value_func: Callable[[dict[str, Any]], PluginBase.ValidateResultType | Result[Optional[CreateValuePluginT]]] | ConfigurationValue,  # ConfigurationValue allows the plugin to be evaluated by the RuleEngine
     subject: Optional[str]=None,
     rationale: Optional[str]=None,
 ) -> PythonType:
@@ -170,7 +191,7 @@ def CreateValuePlugin(
     if not subject:
         subject = github_settings_value
 
-    instantiation_parameter_name = _CreateParameterName()
+    instantiation_parameter_name = _CreateParameterName(name)
 
     # ----------------------------------------------------------------------
     # pylint: disable=missing-class-docstring
@@ -228,7 +249,26 @@ def CreateValuePlugin(
                 rationale,
             )
 
+            if isinstance(get_configuration_value_func, ConfigurationValue):
+                rule: Optional[Rule] = Rule(
+                    get_configuration_value_func,
+                    value,
+                    lambda actual_value: "{} is not set to '{}' (currently set to '{}').\n".format(
+                        subject,
+                        value,
+                        actual_value,
+                    ),
+                )
+            else:
+                rule = None
+
             self._expected_value            = value
+            self._rule                      = rule
+
+        # ----------------------------------------------------------------------
+        @overridemethod
+        def GetRule(self) -> Optional[Rule]:
+            return self._rule
 
         # ----------------------------------------------------------------------
         @overridemethod
@@ -236,6 +276,10 @@ def CreateValuePlugin(
             self,
             configuration: dict[str, Any],
         ) -> PluginBase.ValidateResultType:
+            if self._rule is not None:
+                return self._rule.Evaluate(configuration)
+
+            assert not isinstance(get_configuration_value_func, ConfigurationValue)
             result = get_configuration_value_func(configuration)
             if result is not None:
                 if not isinstance(result, Result):
@@ -255,23 +299,14 @@ def CreateValuePlugin(
     return Plugin
 
 
-# ----------------------------------------------------------------------
-# |
-# |  Private Data
-# |
-# ----------------------------------------------------------------------
-_parameter_ctr: int                         = 0
-
-
 # ----------------------------------------------------------------------
 # |
 # |  Private Functions
 # |
 # ----------------------------------------------------------------------
-def _CreateParameterName() -> str:
-    global _parameter_ctr  # pylint: disable=global-statement
-
-    result = "parameter{}".format(_parameter_ctr)
-    _parameter_ctr += 1
-
-    return result
+def _CreateParameterName(
+    plugin_name: str,
+) -> str:
+    # The name must be stable across invocations (regardless of the order in which plugins are
+    # imported), as it is stored in the plugin manifest.
+    return "parameter_{}".format(plugin_name)
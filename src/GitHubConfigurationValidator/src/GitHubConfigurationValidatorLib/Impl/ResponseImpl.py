@@ -0,0 +1,50 @@
+# ----------------------------------------------------------------------
+# |
+# |  ResponseImpl.py
+# |
+# |  David Brownell <db@DavidBrownell.com>
+# |      2023-11-22 13:05:47
+# |
+# ----------------------------------------------------------------------
+# |
+# |  Copyright David Brownell 2023
+# |  Distributed under the Boost Software License, Version 1.0. See
+# |  accompanying file LICENSE_1_0.txt or copy at
+# |  http://www.boost.org/LICENSE_1_0.txt.
+# |
+# ----------------------------------------------------------------------
+"""Contains functions that make it easy to generate Response objects"""
+
+from http import HTTPStatus
+from typing import Mapping, Optional
+
+import requests
+
+from requests.structures import CaseInsensitiveDict
+
+
+# ----------------------------------------------------------------------
+def CreateResponse(
+    url: str,
+    status_code: int,
+    headers: Mapping[str, str],
+    content: bytes,
+    request: Optional[requests.PreparedRequest]=None,
+) -> requests.Response:
+    """Creates a requests.Response object from content that wasn't received via a requests.Session"""
+
+    response = requests.Response()
+
+    response.status_code = status_code
+    response.url = url
+    response.headers = CaseInsensitiveDict(headers)
+    response.encoding = requests.utils.get_encoding_from_headers(response.headers)
+    response.request = request  # type: ignore
+    response._content = content  # pylint: disable=protected-access
+
+    try:
+        response.reason = HTTPStatus(status_code).phrase
+    except ValueError:
+        response.reason = ""
+
+    return response
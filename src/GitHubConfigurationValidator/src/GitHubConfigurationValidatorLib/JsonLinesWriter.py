@@ -0,0 +1,162 @@
+# ----------------------------------------------------------------------
+# |
+# |  JsonLinesWriter.py
+# |
+# |  David Brownell <db@DavidBrownell.com>
+# |      2023-12-07 09:02:44
+# |
+# ----------------------------------------------------------------------
+# |
+# |  Copyright David Brownell 2023
+# |  Distributed under the Boost Software License, Version 1.0. See
+# |  accompanying file LICENSE_1_0.txt or copy at
+# |  http://www.boost.org/LICENSE_1_0.txt.
+# |
+# ----------------------------------------------------------------------
+"""Contains the JsonLinesWriter object"""
+
+import json
+import threading
+
+from pathlib import Path
+from typing import Any
+
+from GitHubConfigurationValidatorLib.Finding import Finding
+from GitHubConfigurationValidatorLib.Plugin import Plugin
+
+
+# ----------------------------------------------------------------------
+class JsonLinesWriter(object):
+    """\
+    Writes validation results as JSON Lines (one compact JSON object per line) so that they can be
+    ingested by other systems without parsing the terminal output.
+
+    Each repository's records are written (and flushed) as soon as its validation is complete: one
+    "finding" record for each message produced by a plugin, followed by a "repository" record that
+    summarizes the repository's results. Records for different repositories are never interleaved.
+
+        {"record": "finding", "repository": "<name>", "plugin": "<name>", "type": "Error" | "Warning" | "Info", "message": "<message>"}
+        {"record": "repository", "repository": "<name>", "returncode": <int>, "errors": <int>, "warnings": <int>, "infos": <int>, "replayed": <bool>}
+    """
+
+    # ----------------------------------------------------------------------
+    # |
+    # |  Public Methods
+    # |
+    # ----------------------------------------------------------------------
+    @staticmethod
+    def Load(
+        filename: Path,
+    ) -> dict[str, list[Finding]]:
+        """Returns the findings for each repository in a file written by a JsonLinesWriter"""
+
+        results: dict[str, list[Finding]] = {}
+
+        # Findings are written before the repository's summary record and are only included if the
+        # summary record exists (the file may have been written by a run that was interrupted).
+        pending_findings: dict[str, list[Finding]] = {}
+
+        try:
+            with filename.open(encoding="utf-8") as f:
+                for line in f:
+                    line = line.strip()
+                    if not line:
+                        continue
+
+                    record = json.loads(line)
+
+                    if record["record"] == "finding":
+                        pending_findings.setdefault(record["repository"], []).append(Finding.FromJson(record))
+                    elif record["record"] == "repository":
+                        results[record["repository"]] = pending_findings.pop(record["repository"], [])
+
+        except (OSError, ValueError, KeyError, TypeError) as ex:
+            raise Exception("'{}' is not a valid JSON Lines results file ({}).".format(filename, ex)) from ex
+
+        return results
+
+    # ----------------------------------------------------------------------
+    def __init__(
+        self,
+        filename: Path,
+    ):
+        filename.parent.mkdir(parents=True, exist_ok=True)
+
+        self.filename                       = filename
+
+        self._file                          = filename.open("w", encoding="utf-8")
+        self._lock                          = threading.Lock()
+
+        self._num_repositories              = 0
+        self._num_findings                  = 0
+
+    # ----------------------------------------------------------------------
+    def Close(self) -> None:
+        with self._lock:
+            self._file.close()
+
+    # ----------------------------------------------------------------------
+    def WriteRepository(
+        self,
+        repository: str,
+        returncode: int,
+        findings: list[Finding],
+        *,
+        is_replayed: bool=False,            # True if the results were replayed from a previous validation
+    ) -> None:
+        message_type_counts = {message_type: 0 for message_type in Plugin.MessageType}
+
+        lines: list[str] = []
+
+        for finding in findings:
+            message_type_counts[finding.message_type] += 1
+
+            lines.append(
+                self.__class__._CreateLine(
+                    {
+                        "record": "finding",
+                        "repository": repository,
+                        **finding.ToJson(),
+                    },
+                ),
+            )
+
+        lines.append(
+            self.__class__._CreateLine(
+                {
+                    "record": "repository",
+                    "repository": repository,
+                    "returncode": returncode,
+                    "errors": message_type_counts[Plugin.MessageType.Error],
+                    "warnings": message_type_counts[Plugin.MessageType.Warning],
+                    "infos": message_type_counts[Plugin.MessageType.Info],
+                    "replayed": is_replayed,
+                },
+            ),
+        )
+
+        with self._lock:
+            self._file.write("".join(lines))
+            self._file.flush()
+
+            self._num_repositories += 1
+            self._num_findings += len(findings)
+
+    # ----------------------------------------------------------------------
+    def GetStatisticsString(self) -> str:
+        return "JSON Lines output: {} repositories, {} findings written to '{}'.\n".format(
+            self._num_repositories,
+            self._num_findings,
+            self.filename,
+        )
+
+    # ----------------------------------------------------------------------
+    # |
+    # |  Private Methods
+    # |
+    # ----------------------------------------------------------------------
+    @staticmethod
+    def _CreateLine(
+        record: dict[str, Any],
+    ) -> str:
+        return "{}\n".format(json.dumps(record, separators=(",", ":"), ensure_ascii=False))
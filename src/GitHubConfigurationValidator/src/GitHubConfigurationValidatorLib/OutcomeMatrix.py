@@ -0,0 +1,426 @@
+# ----------------------------------------------------------------------
+# |
+# |  OutcomeMatrix.py
+# |
+# |  David Brownell <db@DavidBrownell.com>
+# |      2023-12-09 09:14:26
+# |
+# ----------------------------------------------------------------------
+# |
+# |  Copyright David Brownell 2023
+# |  Distributed under the Boost Software License, Version 1.0. See
+# |  accompanying file LICENSE_1_0.txt or copy at
+# |  http://www.boost.org/LICENSE_1_0.txt.
+# |
+# ----------------------------------------------------------------------
+"""Contains the OutcomeMatrix object"""
+
+import threading
+
+from array import array
+from collections import Counter
+from enum import IntEnum
+from typing import Iterable, Optional, Union
+
+from Common_Foundation import TextwrapEx
+
+from GitHubConfigurationValidatorLib.Finding import Finding
+from GitHubConfigurationValidatorLib.Plugin import Plugin
+
+
+# ----------------------------------------------------------------------
+class OutcomeMatrix(object):
+    """\
+    Compact repository x plugin matrix of validation outcomes, suitable for summarizing the results of
+    very large organizations.
+
+    Repositories and plugins are identified by integer ids (their indexes). Each cell is stored in 2
+    bits (4 cells per byte, with each repository's row padded to a whole number of bytes), and the
+    findings of each repository are stored as integer triples that reference messages that are
+    interned and stored once. Aggregate queries operate on the packed columns.
+    """
+
+    # ----------------------------------------------------------------------
+    # |
+    # |  Public Types
+    # |
+    # ----------------------------------------------------------------------
+    class Outcome(IntEnum):
+        """Outcome of a plugin for a repository"""
+
+        # Note that both bits are set for Error, so that errors can be identified with a single mask
+        Pass                                = 0
+        Skipped                             = 1     # The plugin was not evaluated
+        Warning                             = 2
+        Error                               = 3
+
+    # ----------------------------------------------------------------------
+    # |
+    # |  Public Methods
+    # |
+    # ----------------------------------------------------------------------
+    def __init__(
+        self,
+        plugin_names: list[str],
+    ):
+        self.plugin_names                   = list(plugin_names)
+        self.repository_names: list[str]    = []
+
+        self._plugin_ids                    = {plugin_name: plugin_id for plugin_id, plugin_name in enumerate(self.plugin_names)}
+        self._row_size                      = (len(self.plugin_names) + 3) // 4
+        self._cells                         = bytearray()
+
+        self._messages: list[str]           = []
+        self._message_ids: dict[str, int]   = {}
+
+        # Each finding is stored as (plugin id, message type value, message id); `_finding_offsets[i]`
+        # is the index of the first finding of repository i.
+        self._findings                      = array("I")
+        self._finding_offsets               = array("I", [0])
+
+        self._lock                          = threading.Lock()
+
+    # ----------------------------------------------------------------------
+    @property
+    def num_repositories(self) -> int:
+        return len(self.repository_names)
+
+    @property
+    def num_messages(self) -> int:
+        return len(self._messages)
+
+    @property
+    def num_bytes(self) -> int:
+        """Number of bytes used by the packed cells and findings (excluding the names and messages)"""
+
+        return (
+            len(self._cells)
+            + self._findings.itemsize * len(self._findings)
+            + self._finding_offsets.itemsize * len(self._finding_offsets)
+        )
+
+    # ----------------------------------------------------------------------
+    def AddRepository(
+        self,
+        repository: str,
+        findings: Optional[list[Finding]],  # None if the repository could not be validated
+        skipped_plugin_names: Iterable[str]=(),         # Plugins that were not evaluated
+    ) -> int:
+        """Adds the repository's outcomes and returns its id"""
+
+        row = bytearray(self._row_size)
+
+        if findings is None:
+            # Every plugin was skipped
+            skipped_plugin_ids: Iterable[int] = range(len(self.plugin_names))
+        else:
+            skipped_plugin_ids = (self._plugin_ids[plugin_name] for plugin_name in skipped_plugin_names)
+
+        for plugin_id in skipped_plugin_ids:
+            self.__class__._SetCell(row, plugin_id, OutcomeMatrix.Outcome.Skipped)
+
+        with self._lock:
+            if findings:
+                for finding in findings:
+                    plugin_id = self._plugin_ids[finding.plugin]
+
+                    if finding.message_type == Plugin.MessageType.Error:
+                        outcome = OutcomeMatrix.Outcome.Error
+                    elif finding.message_type == Plugin.MessageType.Warning:
+                        outcome = OutcomeMatrix.Outcome.Warning
+                    else:
+                        outcome = OutcomeMatrix.Outcome.Pass
+
+                    # Errors take precedence over warnings
+                    if outcome > self.__class__._GetCell(row, plugin_id):
+                        self.__class__._SetCell(row, plugin_id, outcome)
+
+                    message_id = self._message_ids.get(finding.message, None)
+                    if message_id is None:
+                        message_id = len(self._messages)
+
+                        self._messages.append(finding.message)
+                        self._message_ids[finding.message] = message_id
+
+                    self._findings.extend((plugin_id, finding.message_type.value, message_id))
+
+            repository_id = len(self.repository_names)
+
+            self.repository_names.append(repository)
+            self._cells += row
+            self._finding_offsets.append(len(self._findings) // 3)
+
+        return repository_id
+
+    # ----------------------------------------------------------------------
+    def GetOutcome(
+        self,
+        repository_id: int,
+        plugin_id: int,
+    ) -> "OutcomeMatrix.Outcome":
+        return OutcomeMatrix.Outcome(
+            self.__class__._GetCell(
+                memoryview(self._cells)[repository_id * self._row_size:(repository_id + 1) * self._row_size],
+                plugin_id,
+            ),
+        )
+
+    # ----------------------------------------------------------------------
+    def GetFindings(
+        self,
+        repository_id: int,
+    ) -> list[Finding]:
+        start = self._finding_offsets[repository_id] * 3
+        end = self._finding_offsets[repository_id + 1] * 3
+
+        return [
+            Finding(
+                self.plugin_names[self._findings[index]],
+                Plugin.MessageType(self._findings[index + 1]),
+                self._messages[self._findings[index + 2]],
+            )
+            for index in range(start, end, 3)
+        ]
+
+    # ----------------------------------------------------------------------
+    def GetPluginCounts(
+        self,
+        outcome: "OutcomeMatrix.Outcome",
+    ) -> dict[str, int]:
+        """Returns the number of repositories with the outcome for each plugin (for example, failures per plugin)"""
+
+        results: dict[str, int] = {}
+
+        for plugin_id, plugin_name in enumerate(self.plugin_names):
+            shift = (plugin_id % 4) * 2
+
+            # Count the distinct byte values in the plugin's column and then decode the plugin's cell
+            # once for each distinct value.
+            results[plugin_name] = sum(
+                count
+                for value, count in Counter(self._GetColumnBytes(plugin_id)).items()
+                if (value >> shift) & 0b11 == outcome
+            )
+
+        return results
+
+    # ----------------------------------------------------------------------
+    def GetRepositoryCounts(self) -> dict["OutcomeMatrix.Outcome", int]:
+        """\
+        Returns the number of repositories by their most significant outcome (Error, then Warning, then
+        Pass); repositories where every plugin was skipped are Skipped.
+        """
+
+        all_plugin_ids = range(len(self.plugin_names))
+
+        num_repositories, errors = self._GetMatches(all_plugin_ids, [OutcomeMatrix.Outcome.Error])
+        _, warnings = self._GetMatches(all_plugin_ids, [OutcomeMatrix.Outcome.Warning])
+        _, evaluated = self._GetMatches(
+            all_plugin_ids,
+            [OutcomeMatrix.Outcome.Pass, OutcomeMatrix.Outcome.Warning, OutcomeMatrix.Outcome.Error],
+        )
+
+        if not self.plugin_names:
+            # There is nothing to skip
+            evaluated = int.from_bytes(b"\x01" * num_repositories, "big")
+
+        # Each repository is represented by the low bit of a byte, so bits can be counted directly
+        warnings &= ~errors
+        evaluated &= ~(errors | warnings)
+
+        num_errors = errors.bit_count()
+        num_warnings = warnings.bit_count()
+        num_passed = evaluated.bit_count()
+
+        return {
+            OutcomeMatrix.Outcome.Pass: num_passed,
+            OutcomeMatrix.Outcome.Skipped: num_repositories - num_errors - num_warnings - num_passed,
+            OutcomeMatrix.Outcome.Warning: num_warnings,
+            OutcomeMatrix.Outcome.Error: num_errors,
+        }
+
+    # ----------------------------------------------------------------------
+    def GetRepositories(
+        self,
+        plugin_names: Iterable[str],
+        outcomes: Iterable["OutcomeMatrix.Outcome"]=(Outcome.Error, ),
+    ) -> list[str]:
+        """Returns the names of repositories where any of the plugins has any of the outcomes (for example, repositories failing any of a set of plugins)"""
+
+        num_repositories, matches = self._GetMatches(
+            [self._plugin_ids[plugin_name] for plugin_name in plugin_names],
+            outcomes,
+        )
+
+        if not matches:
+            return []
+
+        values = matches.to_bytes(num_repositories, "big")
+
+        return [
+            self.repository_names[repository_id]
+            for repository_id in range(num_repositories)
+            if values[repository_id]
+        ]
+
+    # ----------------------------------------------------------------------
+    def GenerateReport(self) -> str:
+        """Returns a table with the number of repositories with errors and warnings for each plugin (plugins that passed for all repositories are omitted)"""
+
+        error_counts = self.GetPluginCounts(OutcomeMatrix.Outcome.Error)
+        warning_counts = self.GetPluginCounts(OutcomeMatrix.Outcome.Warning)
+        skipped_counts = self.GetPluginCounts(OutcomeMatrix.Outcome.Skipped)
+
+        rows: list[list[str]] = []
+
+        for plugin_name in sorted(
+            self.plugin_names,
+            key=lambda plugin_name: (-error_counts[plugin_name], -warning_counts[plugin_name], plugin_name),
+        ):
+            if not error_counts[plugin_name] and not warning_counts[plugin_name]:
+                continue
+
+            rows.append(
+                [
+                    plugin_name,
+                    str(error_counts[plugin_name]),
+                    str(warning_counts[plugin_name]),
+                    str(skipped_counts[plugin_name]),
+                ],
+            )
+
+        repository_counts = self.GetRepositoryCounts()
+
+        summary = "Repositories: {} with errors, {} with warnings, {} passed, {} skipped.".format(
+            repository_counts[OutcomeMatrix.Outcome.Error],
+            repository_counts[OutcomeMatrix.Outcome.Warning],
+            repository_counts[OutcomeMatrix.Outcome.Pass],
+            repository_counts[OutcomeMatrix.Outcome.Skipped],
+        )
+
+        if not rows:
+            return summary
+
+        return "{}\n\n{}".format(
+            TextwrapEx.CreateTable(
+                ["Plugin", "Errors", "Warnings", "Skipped"],
+                rows,
+                [TextwrapEx.Justify.Left] + [TextwrapEx.Justify.Right] * 3,
+            ),
+            summary,
+        )
+
+    # ----------------------------------------------------------------------
+    # |
+    # |  Private Methods
+    # |
+    # ----------------------------------------------------------------------
+    @staticmethod
+    def _GetCell(
+        row: Union[bytearray, memoryview],
+        plugin_id: int,
+    ) -> int:
+        return (row[plugin_id // 4] >> ((plugin_id % 4) * 2)) & 0b11
+
+    # ----------------------------------------------------------------------
+    @staticmethod
+    def _SetCell(
+        row: bytearray,
+        plugin_id: int,
+        outcome: "OutcomeMatrix.Outcome",
+    ) -> None:
+        shift = (plugin_id % 4) * 2
+
+        row[plugin_id // 4] = (row[plugin_id // 4] & ~(0b11 << shift) & 0xFF) | (outcome << shift)
+
+    # ----------------------------------------------------------------------
+    def _GetColumnBytes(
+        self,
+        plugin_id: int,
+    ) -> bytes:
+        """Returns the byte that contains the plugin's cell for each repository"""
+
+        with self._lock:
+            return bytes(self._cells[plugin_id // 4::self._row_size])
+
+    # ----------------------------------------------------------------------
+    def _GetMatches(
+        self,
+        plugin_ids: Iterable[int],
+        outcomes: Iterable["OutcomeMatrix.Outcome"],
+    ) -> tuple[int, int]:
+        """\
+        Returns the number of repositories and an integer with a byte for each repository (in order),
+        where the byte is 1 if any of the plugins has any of the outcomes and 0 otherwise.
+        """
+
+        outcomes = list(outcomes)
+
+        # Cells are grouped by byte so that each column of bytes is translated once
+        masks: dict[int, int] = {}
+
+        for plugin_id in plugin_ids:
+            masks[plugin_id // 4] = masks.get(plugin_id // 4, 0) | _CreateMask([plugin_id % 4])
+
+        with self._lock:
+            cells = bytes(self._cells)
+            num_repositories = self.num_repositories
+
+        matches = 0
+
+        for byte_index, mask in masks.items():
+            table = bytes(
+                1 if value else 0
+                for value in _CreateOutcomeTable(mask, outcomes)
+            )
+
+            matches |= int.from_bytes(cells[byte_index::self._row_size].translate(table), "big")
+
+        return num_repositories, matches
+
+
+# ----------------------------------------------------------------------
+# |
+# |  Private Functions
+# |
+# ----------------------------------------------------------------------
+def _CreateMask(
+    cell_indexes: Iterable[int],            # Indexes of cells within a byte (0 - 3)
+) -> int:
+    """Returns a mask with the low bit of each cell set"""
+
+    mask = 0
+
+    for cell_index in cell_indexes:
+        mask |= 1 << (cell_index * 2)
+
+    return mask
+
+
+# ----------------------------------------------------------------------
+def _CreateOutcomeTable(
+    mask: int,                              # Cells to consider (as created by `_CreateMask`; 0xFF for all cells)
+    outcomes: Iterable[OutcomeMatrix.Outcome],
+) -> list[int]:
+    """\
+    Returns a translation table that maps each byte value to a value with the low bit of each (masked)
+    cell set if the cell has one of the outcomes.
+    """
+
+    mask &= 0x55
+    outcomes = set(outcomes)
+
+    table: list[int] = []
+
+    for value in range(256):
+        result = 0
+
+        for cell_index in range(4):
+            shift = cell_index * 2
+
+            if (mask >> shift) & 1 and (value >> shift) & 0b11 in outcomes:
+                result |= 1 << shift
+
+        table.append(result)
+
+    return table
@@ -21,7 +21,7 @@ import textwrap
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
 from enum import Enum, auto
-from typing import Any, Optional, Type as PythonType, Union
+from typing import Any, Optional, Type as PythonType, TYPE_CHECKING, Union
 
 from semantic_version import Version as SemVer
 
@@ -31,7 +31,9 @@ from Common_Foundation.Types import extensionmethod
 
 from Common_FoundationEx.TyperEx import typer, TypeDefinitionItem, TypeDefinitionsType
 
-from GitHubConfigurationValidatorLib.GitHubSession import GitHubSession
+if TYPE_CHECKING:
+    from GitHubConfigurationValidatorLib.GitHubSession import GitHubSession  # pragma: no cover
+    from GitHubConfigurationValidatorLib.RuleEngine import Rule  # pragma: no cover
 
 
 # ----------------------------------------------------------------------
@@ -117,15 +119,64 @@ class Plugin(ABC):
 
         raise Exception("Abstract method")  # pragma: no cover
 
+    # ----------------------------------------------------------------------
+    @extensionmethod
+    def GetRequiredConfigurationTypes(self) -> set["Plugin.ConfigurationType"]:
+        """\
+        Returns the configuration types (each of which is retrieved from a different GitHub endpoint)
+        that the plugin depends upon; only the configuration types required by the active plugins are
+        retrieved.
+
+        Custom plugins may override this method so that the configuration information they access
+        through the session provided to `CustomValidate` is retrieved concurrently with the
+        configuration information required by other plugins.
+        """
+
+        # By default, the plugin depends on the configuration that it validates
+        if self.configuration_type == Plugin.ConfigurationType.Custom:
+            return set()
+
+        return {self.configuration_type, }
+
+    # ----------------------------------------------------------------------
+    @extensionmethod
+    def GetRule(self) -> Optional["Rule"]:
+        """\
+        Returns a declarative description of the validation performed by `Validate`; plugins that
+        provide a rule are evaluated by the RuleEngine (along with all other rules) in a single pass
+        over the configuration.
+        """
+
+        # By default, the validation cannot be described declaratively
+        return None
+
+    # ----------------------------------------------------------------------
+    @extensionmethod
+    def Prepare(self) -> None:
+        """\
+        Called once before repositories are validated concurrently. Plugins that import modules only
+        when validating should import them here, so that concurrent validations don't wait on the
+        import lock.
+        """
+
+        # By default, there is nothing to prepare
+        return
+
     # ----------------------------------------------------------------------
     @extensionmethod
     def CustomValidate(
         self,
         dm: DoneManager,
-        session: GitHubSession,
+        session: "GitHubSession",
         repository: str,
     ) -> "Plugin.ValidateResultType":
-        """Perform complex validation via a session object."""
+        """\
+        Perform complex validation via a session object.
+
+        GET responses are memoized for the duration of the repository's validation, so requests for
+        information that has already been retrieved (for example, the repository settings or branch
+        protection) do not result in additional calls to GitHub.
+        """
 
         raise Exception("Abstract method")  # pragma: no cover
 
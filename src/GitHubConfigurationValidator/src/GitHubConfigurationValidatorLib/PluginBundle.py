@@ -0,0 +1,174 @@
+# ----------------------------------------------------------------------
+# |
+# |  PluginBundle.py
+# |
+# |  David Brownell <db@DavidBrownell.com>
+# |      2023-12-06 08:44:31
+# |
+# ----------------------------------------------------------------------
+# |
+# |  Copyright David Brownell 2023
+# |  Distributed under the Boost Software License, Version 1.0. See
+# |  accompanying file LICENSE_1_0.txt or copy at
+# |  http://www.boost.org/LICENSE_1_0.txt.
+# |
+# ----------------------------------------------------------------------
+"""Contains the PluginBundle object"""
+
+import importlib.util
+import json
+import py_compile
+import tempfile
+import zipfile
+
+from pathlib import Path
+from typing import Optional
+
+
+# ----------------------------------------------------------------------
+class PluginBundle(object):
+    """\
+    Zip file containing precompiled plugin modules (and the packages that they use) that is distributed
+    with the frozen executable rather than individual source files.
+
+    The bundle is added to `sys.path` and its modules are imported via zipimport; the bytecode is never
+    written at runtime, so the modules load quickly even when the executable's directory is read-only.
+    The directory layout of the source files is preserved (so plugins can be imported in the same ways
+    as when running from source) and the bundle contains an index of the plugin modules so that the
+    plugins can be enumerated without reading the zip file's directory.
+    """
+
+    # ----------------------------------------------------------------------
+    # |
+    # |  Public Types
+    # |
+    # ----------------------------------------------------------------------
+    FILENAME                                = "PluginBundle.zip"
+    FORMAT_VERSION                          = 1
+
+    INDEX_NAME                              = "PluginBundle.json"
+
+    # ----------------------------------------------------------------------
+    # |
+    # |  Public Methods
+    # |
+    # ----------------------------------------------------------------------
+    @staticmethod
+    def IsPluginFilename(
+        filename: Path,
+    ) -> bool:
+        """Returns True if the file (within a plugin directory) contains a plugin"""
+
+        return filename.suffix == ".py" and filename.stem.endswith("Plugin") and filename.stem != "Plugin"
+
+    # ----------------------------------------------------------------------
+    @classmethod
+    def Create(
+        cls,
+        filename: Path,
+        plugin_dir: Path,
+        package_dirs: list[Path],
+        *,
+        exclude_dir_names: Optional[set[str]]=None,
+    ) -> "PluginBundle":
+        """\
+        Compiles the modules in the plugin directory and in each package directory (each of which is
+        stored relative to its parent directory) into a new bundle.
+        """
+
+        plugin_names = [
+            child.stem
+            for child in sorted(plugin_dir.iterdir())
+            if child.is_file() and cls.IsPluginFilename(child)
+        ]
+
+        filename.parent.mkdir(parents=True, exist_ok=True)
+
+        with (
+            tempfile.TemporaryDirectory() as temp_dir,
+            zipfile.ZipFile(filename, "w", zipfile.ZIP_DEFLATED) as zip_file,
+        ):
+            temp_filename = Path(temp_dir) / "module.pyc"
+
+            # ----------------------------------------------------------------------
+            def AddModule(
+                source_filename: Path,
+                archive_name: str,
+            ) -> None:
+                # The source files are not included in the bundle, so the bytecode is never checked
+                # against them.
+                py_compile.compile(
+                    str(source_filename),
+                    cfile=str(temp_filename),
+                    dfile=archive_name,
+                    doraise=True,
+                    invalidation_mode=py_compile.PycInvalidationMode.UNCHECKED_HASH,
+                )
+
+                zip_file.write(temp_filename, "{}c".format(archive_name))
+
+            # ----------------------------------------------------------------------
+
+            for source_dir in [plugin_dir] + package_dirs:
+                for source_filename in sorted(source_dir.rglob("*.py")):
+                    relative_path = source_filename.relative_to(source_dir.parent)
+
+                    if exclude_dir_names and exclude_dir_names.intersection(relative_path.parts[:-1]):
+                        continue
+
+                    AddModule(source_filename, relative_path.as_posix())
+
+            zip_file.writestr(
+                cls.INDEX_NAME,
+                json.dumps(
+                    {
+                        "format_version": cls.FORMAT_VERSION,
+                        "magic_number": importlib.util.MAGIC_NUMBER.hex(),
+                        "plugin_dir": plugin_dir.name,
+                        "plugins": plugin_names,
+                    },
+                ),
+            )
+
+        return cls(filename, plugin_dir.name, plugin_names)
+
+    # ----------------------------------------------------------------------
+    @classmethod
+    def Load(
+        cls,
+        filename: Path,
+    ) -> "PluginBundle":
+        try:
+            with zipfile.ZipFile(filename) as zip_file:
+                index = json.loads(zip_file.read(cls.INDEX_NAME))
+
+        except (OSError, KeyError, ValueError, zipfile.BadZipFile) as ex:
+            raise Exception("'{}' is not a valid plugin bundle ({}).".format(filename, ex)) from ex
+
+        if index.get("format_version", None) != cls.FORMAT_VERSION:
+            raise Exception("'{}' is not a supported plugin bundle.".format(filename))
+
+        if index.get("magic_number", None) != importlib.util.MAGIC_NUMBER.hex():
+            raise Exception("The plugin bundle '{}' was compiled for a different version of Python.".format(filename))
+
+        return cls(filename, index["plugin_dir"], index["plugins"])
+
+    # ----------------------------------------------------------------------
+    def __init__(
+        self,
+        filename: Path,
+        plugin_dir_name: str,
+        plugin_names: list[str],
+    ):
+        self.filename                       = filename
+        self.plugin_dir                     = filename / plugin_dir_name    # Can be added to `sys.path` to import the plugins as top-level modules
+        self.plugin_names                   = plugin_names
+
+    # ----------------------------------------------------------------------
+    def GetPluginFilenames(self) -> list[Path]:
+        """\
+        Returns names that identify the plugins within the bundle; the names do not exist on the file
+        system but can be used in the same way as the filenames of plugins in a plugin directory.
+        """
+
+        return [self.plugin_dir / "{}.py".format(plugin_name) for plugin_name in self.plugin_names]
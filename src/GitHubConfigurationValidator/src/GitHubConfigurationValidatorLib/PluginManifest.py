@@ -0,0 +1,290 @@
+# ----------------------------------------------------------------------
+# |
+# |  PluginManifest.py
+# |
+# |  David Brownell <db@DavidBrownell.com>
+# |      2023-12-04 08:51:17
+# |
+# ----------------------------------------------------------------------
+# |
+# |  Copyright David Brownell 2023
+# |  Distributed under the Boost Software License, Version 1.0. See
+# |  accompanying file LICENSE_1_0.txt or copy at
+# |  http://www.boost.org/LICENSE_1_0.txt.
+# |
+# ----------------------------------------------------------------------
+"""Contains the PluginManifest object"""
+
+import hashlib
+import json
+import os
+
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Optional, Type as PythonType
+
+import typer
+
+from semantic_version import Version as SemVer
+
+from Common_FoundationEx.TyperEx import TypeDefinitionItem, TypeDefinitionsType
+
+from GitHubConfigurationValidatorLib.Plugin import Plugin
+
+
+# ----------------------------------------------------------------------
+class PluginManifest(object):
+    """\
+    On-disk cache of information about plugins, so that plugin modules only need to be imported (and
+    the plugins instantiated) when they are used.
+
+    Entries are associated with the modification time and size of the plugin's file and are
+    invalidated when either changes; all entries are invalidated when any of the manifest's
+    dependencies (for example, the files that implement the plugin infrastructure) change. Plugins
+    whose instantiation parameters cannot be serialized are not cached.
+
+    Each installation uses its own manifest file (see `GetFilename`), so that installations sharing a
+    cache directory don't invalidate each other's entries.
+    """
+
+    # ----------------------------------------------------------------------
+    # |
+    # |  Public Types
+    # |
+    # ----------------------------------------------------------------------
+    FORMAT_VERSION                          = 1
+
+    # ----------------------------------------------------------------------
+    @dataclass(frozen=True)
+    class Entry(object):
+        """Information about a plugin that is available without importing it"""
+
+        name: str
+        configuration_type: Plugin.ConfigurationType
+        version_introduced: SemVer
+        description: str
+        display_string: str
+        instantiation_parameters: TypeDefinitionsType
+
+        # Note that `description` and `display_string` reflect a plugin instantiated with the default
+        # values of its instantiation parameters.
+
+    # ----------------------------------------------------------------------
+    # |
+    # |  Public Methods
+    # |
+    # ----------------------------------------------------------------------
+    @classmethod
+    def GetFilename(
+        cls,
+        cache_dir: Path,
+        installation_dir: Path,             # Directory (or executable) that identifies the installation
+    ) -> Path:
+        """Returns the name of the manifest file associated with the installation"""
+
+        installation_hash = hashlib.sha256(str(installation_dir.resolve()).encode("utf-8")).hexdigest()
+
+        return cache_dir / "PluginManifest-{}.json".format(installation_hash[:16])
+
+    # ----------------------------------------------------------------------
+    @classmethod
+    def Load(
+        cls,
+        filename: Path,
+        dependencies: list[Path],
+    ) -> "PluginManifest":
+        """Loads the manifest; a missing, corrupt, or outdated manifest results in an empty manifest"""
+
+        key = ";".join(
+            "{}:{}".format(dependency, ":".join(str(value) for value in _GetStat(dependency)))
+            for dependency in dependencies
+        )
+
+        items: dict[str, dict[str, Any]] = {}
+
+        try:
+            with filename.open(encoding="utf-8") as f:
+                content = json.load(f)
+
+            if content.get("format_version", None) == cls.FORMAT_VERSION and content.get("key", None) == key:
+                items = content["items"]
+
+        except (OSError, ValueError, KeyError, AttributeError):
+            pass
+
+        return cls(filename, key, items)
+
+    # ----------------------------------------------------------------------
+    def __init__(
+        self,
+        filename: Path,
+        key: str,
+        items: dict[str, dict[str, Any]],
+    ):
+        self.filename                       = filename
+        self.key                            = key
+
+        self._items                         = items
+        self._is_modified                   = False
+
+    # ----------------------------------------------------------------------
+    def Get(
+        self,
+        plugin_filename: Path,
+        source_filename: Optional[Path]=None,   # File that contains the plugin, if different from `plugin_filename` (for example, a PluginBundle)
+    ) -> Optional["PluginManifest.Entry"]:
+        """Returns the entry associated with the plugin file, or None if it doesn't exist or is stale"""
+
+        item = self._items.get(str(plugin_filename), None)
+
+        if item is None or item["stat"] != _GetStat(source_filename or plugin_filename):
+            return None
+
+        try:
+            return PluginManifest.Entry(
+                item["name"],
+                Plugin.ConfigurationType[item["configuration_type"]],
+                SemVer(item["version_introduced"]),
+                item["description"],
+                item["display_string"],
+                {
+                    parameter_name: _DeserializeParameter(parameter)
+                    for parameter_name, parameter in item["instantiation_parameters"].items()
+                },
+            )
+        except (KeyError, ValueError, TypeError):
+            return None
+
+    # ----------------------------------------------------------------------
+    def Set(
+        self,
+        plugin_filename: Path,
+        entry: "PluginManifest.Entry",
+        source_filename: Optional[Path]=None,   # File that contains the plugin, if different from `plugin_filename` (for example, a PluginBundle)
+    ) -> bool:
+        """Adds the entry to the manifest; returns False if the entry cannot be cached"""
+
+        serialized_parameters: dict[str, Any] = {}
+
+        for parameter_name, parameter in entry.instantiation_parameters.items():
+            serialized_parameter = _SerializeParameter(parameter)
+            if serialized_parameter is None:
+                return False
+
+            serialized_parameters[parameter_name] = serialized_parameter
+
+        self._items[str(plugin_filename)] = {
+            "stat": _GetStat(source_filename or plugin_filename),
+            "name": entry.name,
+            "configuration_type": entry.configuration_type.name,
+            "version_introduced": str(entry.version_introduced),
+            "description": entry.description,
+            "display_string": entry.display_string,
+            "instantiation_parameters": serialized_parameters,
+        }
+
+        self._is_modified = True
+
+        return True
+
+    # ----------------------------------------------------------------------
+    def Save(self) -> None:
+        """Writes the manifest if it has been modified; errors are raised as exceptions"""
+
+        if not self._is_modified:
+            return
+
+        content = {
+            "format_version": self.__class__.FORMAT_VERSION,
+            "key": self.key,
+            "items": self._items,
+        }
+
+        self.filename.parent.mkdir(parents=True, exist_ok=True)
+
+        # Write to a temporary file and then replace the manifest so that concurrent invocations
+        # never see a partially written file.
+        temp_filename = self.filename.parent / "{}.{}.tmp".format(self.filename.name, os.getpid())
+
+        with temp_filename.open("w", encoding="utf-8") as f:
+            json.dump(content, f)
+
+        os.replace(temp_filename, self.filename)
+
+        self._is_modified = False
+
+
+# ----------------------------------------------------------------------
+# |
+# |  Private Data
+# |
+# ----------------------------------------------------------------------
+_PARAMETER_TYPES: dict[str, PythonType]     = {
+    python_type.__name__: python_type
+    for python_type in [bool, int, float, str]
+}
+
+
+# ----------------------------------------------------------------------
+# |
+# |  Private Functions
+# |
+# ----------------------------------------------------------------------
+def _GetStat(
+    filename: Path,
+) -> list[int]:
+    stat = filename.stat()
+    return [stat.st_mtime_ns, stat.st_size]
+
+
+# ----------------------------------------------------------------------
+def _SerializeParameter(
+    parameter: Any,
+) -> Optional[dict[str, Any]]:
+    """Returns None if the parameter cannot be serialized without losing information"""
+
+    if isinstance(parameter, TypeDefinitionItem):
+        python_type = parameter.python_type
+        option_info = parameter.option_info
+    elif (
+        isinstance(parameter, tuple)
+        and len(parameter) == 2
+        and isinstance(parameter[1], typer.models.OptionInfo)
+    ):
+        python_type, option_info = parameter
+    else:
+        return None
+
+    if _PARAMETER_TYPES.get(getattr(python_type, "__name__", None), None) is not python_type:
+        return None
+
+    if option_info.default is not None and not isinstance(option_info.default, tuple(_PARAMETER_TYPES.values())):
+        return None
+
+    serialized_parameter = {
+        "type": python_type.__name__,
+        "default": option_info.default,
+        "param_decls": list(option_info.param_decls),
+        "help": option_info.help,
+    }
+
+    # Only the values serialized above are preserved; parameters that customize anything else can't
+    # be cached.
+    if vars(_DeserializeParameter(serialized_parameter)[1]) != vars(option_info):
+        return None
+
+    return serialized_parameter
+
+
+# ----------------------------------------------------------------------
+def _DeserializeParameter(
+    serialized_parameter: dict[str, Any],
+) -> tuple[PythonType, typer.models.OptionInfo]:
+    return (
+        _PARAMETER_TYPES[serialized_parameter["type"]],
+        typer.Option(
+            serialized_parameter["default"],
+            *serialized_parameter["param_decls"],
+            help=serialized_parameter["help"],
+        ),
+    )
@@ -0,0 +1,157 @@
+# ----------------------------------------------------------------------
+# |
+# |  Profiler.py
+# |
+# |  David Brownell <db@DavidBrownell.com>
+# |      2023-12-01 08:37:44
+# |
+# ----------------------------------------------------------------------
+# |
+# |  Copyright David Brownell 2023
+# |  Distributed under the Boost Software License, Version 1.0. See
+# |  accompanying file LICENSE_1_0.txt or copy at
+# |  http://www.boost.org/LICENSE_1_0.txt.
+# |
+# ----------------------------------------------------------------------
+"""Contains the Profiler object"""
+
+import cProfile
+import io
+import pstats
+import sys
+import threading
+
+from pathlib import Path
+from typing import Optional
+
+
+# ----------------------------------------------------------------------
+class Profiler(object):
+    """\
+    Profiles the current thread and all threads started while profiling is active (for example, the
+    worker threads used when validating repositories).
+    """
+
+    # ----------------------------------------------------------------------
+    # |
+    # |  Public Types
+    # |
+    # ----------------------------------------------------------------------
+    DEFAULT_NUM_SUMMARY_FUNCTIONS           = 50
+
+    # ----------------------------------------------------------------------
+    # |
+    # |  Public Methods
+    # |
+    # ----------------------------------------------------------------------
+    def __init__(self):
+        self._lock                          = threading.Lock()
+        self._profilers: list[cProfile.Profile]     = []
+        self._is_active                     = False
+
+        # Set when a profiler could not be enabled for a new thread
+        self._is_main_thread_only           = False
+
+    # ----------------------------------------------------------------------
+    def Start(self) -> None:
+        assert not self._is_active
+
+        # Each new thread creates (and enables) its own profiler when the first profile event is
+        # received.
+        threading.setprofile(self._OnNewThread)
+
+        profiler = cProfile.Profile()
+
+        with self._lock:
+            self._profilers.append(profiler)
+
+        profiler.enable()
+        self._is_active = True
+
+    # ----------------------------------------------------------------------
+    def Stop(self) -> None:
+        assert self._is_active
+
+        threading.setprofile(None)  # type: ignore
+
+        with self._lock:
+            # Profilers associated with threads that are still running are disabled as well, so that
+            # the data they collected is complete when it is saved.
+            for profiler in self._profilers:
+                profiler.disable()
+
+        self._is_active = False
+
+    # ----------------------------------------------------------------------
+    @property
+    def is_main_thread_only(self) -> bool:
+        """True if profilers could not be enabled for threads other than the main thread"""
+        return self._is_main_thread_only
+
+    # ----------------------------------------------------------------------
+    def Save(
+        self,
+        filename: Path,
+        num_summary_functions: int=DEFAULT_NUM_SUMMARY_FUNCTIONS,
+    ) -> Path:
+        """\
+        Writes the pstats data to `filename` and a text summary of the functions with the highest
+        cumulative times to `<filename>.txt`; returns the name of the summary file.
+        """
+
+        assert not self._is_active
+
+        with self._lock:
+            profilers = list(self._profilers)
+
+        stats: Optional[pstats.Stats] = None
+
+        for profiler in profilers:
+            if stats is None:
+                stats = pstats.Stats(profiler)
+            else:
+                stats.add(profiler)
+
+        assert stats is not None
+
+        filename.parent.mkdir(parents=True, exist_ok=True)
+        stats.dump_stats(filename)
+
+        sink = io.StringIO()
+
+        if self._is_main_thread_only:
+            sink.write(
+                "NOTE: Only the main thread was profiled; Python {}.{} allows a single active profiler, so profilers could not be enabled for other threads.\n\n".format(
+                    sys.version_info.major,
+                    sys.version_info.minor,
+                ),
+            )
+
+        stats.stream = sink  # type: ignore
+        stats.sort_stats(pstats.SortKey.CUMULATIVE).print_stats(num_summary_functions)
+
+        summary_filename = filename.parent / "{}.txt".format(filename.name)
+
+        with summary_filename.open("w", encoding="utf-8") as f:
+            f.write(sink.getvalue())
+
+        return summary_filename
+
+    # ----------------------------------------------------------------------
+    # |
+    # |  Private Methods
+    # |
+    # ----------------------------------------------------------------------
+    def _OnNewThread(self, *args) -> None:  # pylint: disable=unused-argument
+        profiler = cProfile.Profile()
+
+        try:
+            profiler.enable()
+        except ValueError:
+            # Python 3.12+ only allows a single active profiler
+            sys.setprofile(None)
+            self._is_main_thread_only = True
+            return
+
+        with self._lock:
+            self._profilers.append(profiler)
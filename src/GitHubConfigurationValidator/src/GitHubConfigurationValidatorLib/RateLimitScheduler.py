@@ -0,0 +1,407 @@
+# ----------------------------------------------------------------------
+# |
+# |  RateLimitScheduler.py
+# |
+# |  David Brownell <db@DavidBrownell.com>
+# |      2023-11-21 08:34:02
+# |
+# ----------------------------------------------------------------------
+# |
+# |  Copyright David Brownell 2023
+# |  Distributed under the Boost Software License, Version 1.0. See
+# |  accompanying file LICENSE_1_0.txt or copy at
+# |  http://www.boost.org/LICENSE_1_0.txt.
+# |
+# ----------------------------------------------------------------------
+"""Contains the RateLimitScheduler object"""
+
+import math
+import threading
+import time
+
+from contextlib import asynccontextmanager, contextmanager
+from dataclasses import dataclass
+from typing import Any, AsyncIterator, Awaitable, Callable, Iterator, Mapping, Optional
+from urllib.parse import urlparse
+
+
+# ----------------------------------------------------------------------
+class RateLimitScheduler(object):
+    """\
+    Tracks the GitHub rate limit budget for each resource (core, graphql, search) and schedules
+    requests so that the budget is spread over the time remaining until it is reset.
+
+    When GitHub indicates that a limit has been reached (primary or secondary), the scheduler
+    calculates the time to wait before the request can be retried.
+
+    Request slots are shared by threads (`YieldRequestSlot`) and asyncio tasks
+    (`YieldRequestSlotAsync`), so the number of requests in flight is limited across both.
+    """
+
+    # ----------------------------------------------------------------------
+    # |
+    # |  Public Types
+    # |
+    # ----------------------------------------------------------------------
+    DEFAULT_MAX_CONCURRENT_REQUESTS         = 32
+    DEFAULT_SLOWDOWN_THRESHOLD              = 0.1   # Slow down when less than 10% of the budget remains
+    DEFAULT_MAX_RETRIES                     = 5
+
+    SECONDARY_RATE_LIMIT_DELAY              = 60.0  # GitHub recommends waiting at least one minute
+
+    # ----------------------------------------------------------------------
+    @dataclass(frozen=True)
+    class ResourceState(object):
+        """Budget for a single resource"""
+
+        resource: str
+        limit: int
+        remaining: int
+        reset: float                        # Seconds since the epoch
+
+        # ----------------------------------------------------------------------
+        @property
+        def fraction_remaining(self) -> float:
+            if self.limit <= 0:
+                return 1.0
+
+            return self.remaining / self.limit
+
+    # ----------------------------------------------------------------------
+    # |
+    # |  Public Methods
+    # |
+    # ----------------------------------------------------------------------
+    def __init__(
+        self,
+        *,
+        max_concurrent_requests: int=DEFAULT_MAX_CONCURRENT_REQUESTS,
+        slowdown_threshold: float=DEFAULT_SLOWDOWN_THRESHOLD,
+        max_retries: int=DEFAULT_MAX_RETRIES,
+        time_func: Callable[[], float]=time.time,
+        sleep_func: Callable[[float], None]=time.sleep,
+        async_sleep_func: Optional[Callable[[float], Awaitable[None]]]=None,  # asyncio.sleep if None
+    ):
+        assert max_concurrent_requests > 0, max_concurrent_requests
+        assert 0.0 < slowdown_threshold <= 1.0, slowdown_threshold
+
+        self.max_concurrent_requests        = max_concurrent_requests
+        self.slowdown_threshold             = slowdown_threshold
+        self.max_retries                    = max_retries
+
+        self._time_func                     = time_func
+        self._sleep_func                    = sleep_func
+        self._async_sleep_func              = async_sleep_func
+
+        self._condition                     = threading.Condition()
+        self._states: dict[str, RateLimitScheduler.ResourceState]   = {}
+        self._in_flight                     = 0
+        self._async_waiters: list[tuple[Any, Any]]      = []    # (event loop, future)
+
+        self._total_wait_seconds            = 0.0
+        self._num_retries                   = 0
+
+    # ----------------------------------------------------------------------
+    @staticmethod
+    def GetResource(
+        url: str,
+    ) -> str:
+        """Returns the name of the rate limit resource associated with the url"""
+
+        path = urlparse(url).path.rstrip("/")
+
+        if path.endswith("/graphql"):
+            return "graphql"
+
+        if "/search/" in path:
+            return "search"
+
+        return "core"
+
+    # ----------------------------------------------------------------------
+    @property
+    def total_wait_seconds(self) -> float:
+        return self._total_wait_seconds
+
+    @property
+    def num_retries(self) -> int:
+        return self._num_retries
+
+    # ----------------------------------------------------------------------
+    def GetState(self) -> dict[str, "RateLimitScheduler.ResourceState"]:
+        """Returns the budget state for all resources encountered so far"""
+
+        with self._condition:
+            return dict(self._states)
+
+    # ----------------------------------------------------------------------
+    def GetRecommendedConcurrency(
+        self,
+        resource: Optional[str]=None,
+    ) -> int:
+        """\
+        Returns the number of requests that should be in flight at any given time; callers that
+        manage their own workers can use this value to adjust the amount of work they have in flight.
+        """
+
+        with self._condition:
+            return self._GetRecommendedConcurrencyImpl(resource)
+
+    # ----------------------------------------------------------------------
+    def GetDelay(
+        self,
+        resource: str,
+    ) -> float:
+        """Returns the number of seconds to wait before sending a request for the resource"""
+
+        with self._condition:
+            state = self._states.get(resource, None)
+            if state is None:
+                return 0.0
+
+            time_until_reset = max(0.0, state.reset - self._time_func())
+
+            if state.remaining <= 0:
+                # Add a second to account for clock differences between this machine and GitHub
+                return time_until_reset + 1.0 if time_until_reset else 0.0
+
+            if state.fraction_remaining >= self.slowdown_threshold:
+                return 0.0
+
+            # Spread the remaining budget over the time remaining until the reset
+            return time_until_reset * self._GetRecommendedConcurrencyImpl(resource) / state.remaining
+
+    # ----------------------------------------------------------------------
+    def Update(
+        self,
+        resource: str,
+        headers: Mapping[str, str],
+    ) -> None:
+        """Updates the budget state based on the headers returned with a response"""
+
+        try:
+            limit = int(headers["X-RateLimit-Limit"])
+            remaining = int(headers["X-RateLimit-Remaining"])
+            reset = float(headers["X-RateLimit-Reset"])
+        except (KeyError, ValueError):
+            return
+
+        # The resource provided by GitHub is more accurate than the value derived from the url
+        resource = headers.get("X-RateLimit-Resource", None) or resource
+
+        with self._condition:
+            existing_state = self._states.get(resource, None)
+
+            # Responses may be received out of order; don't replace more recent information with
+            # stale information from the same window.
+            if (
+                existing_state is not None
+                and existing_state.reset == reset
+                and existing_state.remaining < remaining
+            ):
+                return
+
+            self._states[resource] = RateLimitScheduler.ResourceState(resource, limit, remaining, reset)
+            self._NotifyAllImpl()
+
+    # ----------------------------------------------------------------------
+    def GetRetryDelay(
+        self,
+        status_code: int,
+        headers: Mapping[str, str],
+        text: str,
+        attempt: int,
+    ) -> Optional[float]:
+        """Returns the number of seconds to wait before retrying a request, or None if the request should not be retried"""
+
+        if status_code not in [403, 429]:
+            return None
+
+        if attempt >= self.max_retries:
+            return None
+
+        retry_after = headers.get("Retry-After", None)
+        if retry_after is not None:
+            try:
+                return float(retry_after)
+            except ValueError:
+                pass
+
+        if headers.get("X-RateLimit-Remaining", None) == "0":
+            try:
+                return max(0.0, float(headers["X-RateLimit-Reset"]) - self._time_func()) + 1.0
+            except (KeyError, ValueError):
+                pass
+
+        if status_code == 429 or "secondary rate limit" in text.lower():
+            return self.SECONDARY_RATE_LIMIT_DELAY * (2 ** attempt)
+
+        # This is a permissions error
+        return None
+
+    # ----------------------------------------------------------------------
+    def Sleep(
+        self,
+        seconds: float,
+        *,
+        is_retry: bool=False,
+    ) -> None:
+        if seconds <= 0:
+            return
+
+        self._RecordWait(seconds, is_retry)
+        self._sleep_func(seconds)
+
+    # ----------------------------------------------------------------------
+    async def SleepAsync(
+        self,
+        seconds: float,
+        *,
+        is_retry: bool=False,
+    ) -> None:
+        if seconds <= 0:
+            return
+
+        self._RecordWait(seconds, is_retry)
+
+        if self._async_sleep_func is None:
+            import asyncio
+
+            await asyncio.sleep(seconds)
+        else:
+            await self._async_sleep_func(seconds)
+
+    # ----------------------------------------------------------------------
+    @contextmanager
+    def YieldRequestSlot(
+        self,
+        resource: str,
+    ) -> Iterator[None]:
+        """Waits until the budget allows a request for the resource to be sent"""
+
+        with self._condition:
+            while self._in_flight >= self._GetRecommendedConcurrencyImpl(resource):
+                self._condition.wait()
+
+            self._in_flight += 1
+
+        try:
+            self.Sleep(self.GetDelay(resource))
+            yield
+
+        finally:
+            self._ReleaseRequestSlot()
+
+    # ----------------------------------------------------------------------
+    @asynccontextmanager
+    async def YieldRequestSlotAsync(
+        self,
+        resource: str,
+    ) -> AsyncIterator[None]:
+        """Waits (without blocking the event loop) until the budget allows a request for the resource to be sent"""
+
+        import asyncio
+
+        loop = asyncio.get_running_loop()
+
+        while True:
+            with self._condition:
+                if self._in_flight < self._GetRecommendedConcurrencyImpl(resource):
+                    self._in_flight += 1
+                    break
+
+                waiter = loop.create_future()
+                self._async_waiters.append((loop, waiter))
+
+            await waiter
+
+        try:
+            await self.SleepAsync(self.GetDelay(resource))
+            yield
+
+        finally:
+            self._ReleaseRequestSlot()
+
+    # ----------------------------------------------------------------------
+    def GetStatisticsString(self) -> str:
+        states = self.GetState()
+
+        return "Rate limits: {}; waited {:.1f} second(s), {} retry(ies).\n".format(
+            ", ".join(
+                "{} {}/{}".format(state.resource, state.remaining, state.limit)
+                for state in sorted(states.values(), key=lambda state: state.resource)
+            ) or "no information",
+            self._total_wait_seconds,
+            self._num_retries,
+        )
+
+    # ----------------------------------------------------------------------
+    # |
+    # |  Private Methods
+    # |
+    # ----------------------------------------------------------------------
+    def _RecordWait(
+        self,
+        seconds: float,
+        is_retry: bool,
+    ) -> None:
+        with self._condition:
+            self._total_wait_seconds += seconds
+
+            if is_retry:
+                self._num_retries += 1
+
+    # ----------------------------------------------------------------------
+    def _ReleaseRequestSlot(self) -> None:
+        with self._condition:
+            self._in_flight -= 1
+            self._NotifyAllImpl()
+
+    # ----------------------------------------------------------------------
+    def _NotifyAllImpl(self) -> None:
+        # Assumes that the condition is held
+        self._condition.notify_all()
+
+        async_waiters = self._async_waiters
+        self._async_waiters = []
+
+        for loop, waiter in async_waiters:
+            # Waiters may be released by a thread other than the one running their event loop
+            try:
+                loop.call_soon_threadsafe(_SetWaiterResult, waiter)
+            except RuntimeError:
+                # The event loop has been closed, so the waiter is no longer waiting
+                pass
+
+    # ----------------------------------------------------------------------
+    def _GetRecommendedConcurrencyImpl(
+        self,
+        resource: Optional[str],
+    ) -> int:
+        if resource is None:
+            states = list(self._states.values())
+        else:
+            state = self._states.get(resource, None)
+            states = [state] if state is not None else []
+
+        if not states:
+            return self.max_concurrent_requests
+
+        fraction_remaining = min(state.fraction_remaining for state in states)
+
+        if fraction_remaining >= self.slowdown_threshold:
+            return self.max_concurrent_requests
+
+        # Scale the concurrency down linearly as the budget is exhausted
+        return max(1, math.ceil(self.max_concurrent_requests * fraction_remaining / self.slowdown_threshold))
+
+
+# ----------------------------------------------------------------------
+# ----------------------------------------------------------------------
+# ----------------------------------------------------------------------
+def _SetWaiterResult(
+    waiter: Any,
+) -> None:
+    # The waiting task may have been cancelled
+    if not waiter.done():
+        waiter.set_result(None)
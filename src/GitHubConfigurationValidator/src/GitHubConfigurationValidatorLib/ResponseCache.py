@@ -0,0 +1,269 @@
+# ----------------------------------------------------------------------
+# |
+# |  ResponseCache.py
+# |
+# |  David Brownell <db@DavidBrownell.com>
+# |      2023-11-20 09:12:41
+# |
+# ----------------------------------------------------------------------
+# |
+# |  Copyright David Brownell 2023
+# |  Distributed under the Boost Software License, Version 1.0. See
+# |  accompanying file LICENSE_1_0.txt or copy at
+# |  http://www.boost.org/LICENSE_1_0.txt.
+# |
+# ----------------------------------------------------------------------
+"""Contains the ResponseCache object"""
+
+import hashlib
+import json
+import sqlite3
+import threading
+
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Mapping, Optional
+
+import requests
+
+from requests.structures import CaseInsensitiveDict
+
+from GitHubConfigurationValidatorLib.Impl.ResponseImpl import CreateResponse
+
+
+# ----------------------------------------------------------------------
+class ResponseCache(object):
+    """\
+    On-disk store of GitHub responses and the validators (ETag/Last-Modified) associated with them.
+
+    Cached responses are revalidated via conditional requests; GitHub responds with '304 Not Modified'
+    when the content hasn't changed, and these responses do not count against the primary rate limit.
+    """
+
+    # ----------------------------------------------------------------------
+    # |
+    # |  Public Types
+    # |
+    # ----------------------------------------------------------------------
+    @dataclass(frozen=True)
+    class Entry(object):
+        """Cached response"""
+
+        url: str
+        etag: Optional[str]
+        last_modified: Optional[str]
+        headers: dict[str, str]
+        content: bytes
+
+        # ----------------------------------------------------------------------
+        def CreateConditionalHeaders(self) -> dict[str, str]:
+            result: dict[str, str] = {}
+
+            if self.etag:
+                result["If-None-Match"] = self.etag
+            if self.last_modified:
+                result["If-Modified-Since"] = self.last_modified
+
+            return result
+
+        # ----------------------------------------------------------------------
+        def CreateResponse(
+            self,
+            not_modified_response: requests.Response,
+        ) -> requests.Response:
+            """Creates a response from the cached content and the headers returned with the '304 Not Modified' response"""
+
+            headers = CaseInsensitiveDict(self.headers)
+
+            # Headers returned with the 304 response (for example, rate limit information) are more
+            # recent than those that were cached.
+            for k, v in not_modified_response.headers.items():
+                if k.lower() in ["content-length", "content-encoding", "transfer-encoding"]:
+                    continue
+
+                headers[k] = v
+
+            return CreateResponse(
+                self.url,
+                200,
+                headers,
+                self.content,
+                not_modified_response.request,
+            )
+
+    # ----------------------------------------------------------------------
+    # |
+    # |  Public Methods
+    # |
+    # ----------------------------------------------------------------------
+    def __init__(
+        self,
+        filename: Path,
+    ):
+        filename.parent.mkdir(parents=True, exist_ok=True)
+
+        connection = sqlite3.connect(
+            filename,
+            check_same_thread=False,
+            isolation_level=None,
+        )
+
+        connection.execute(
+            """
+            CREATE TABLE IF NOT EXISTS responses (
+                key TEXT PRIMARY KEY NOT NULL,
+                url TEXT NOT NULL,
+                etag TEXT,
+                last_modified TEXT,
+                headers TEXT NOT NULL,
+                content BLOB NOT NULL
+            )
+            """,
+        )
+
+        self.filename                       = filename
+
+        self._connection                    = connection
+        self._lock                          = threading.Lock()
+
+        self._hits                          = 0
+        self._misses                        = 0
+
+    # ----------------------------------------------------------------------
+    def Close(self) -> None:
+        with self._lock:
+            self._connection.close()
+
+    # ----------------------------------------------------------------------
+    @property
+    def hits(self) -> int:
+        return self._hits
+
+    @property
+    def misses(self) -> int:
+        return self._misses
+
+    # ----------------------------------------------------------------------
+    @staticmethod
+    def CreateKey(
+        url: str,
+        authorization: Optional[str],
+    ) -> str:
+        """Creates a key based on the url and the identity of the token used to access it; the token itself is never persisted"""
+
+        identity = hashlib.sha256((authorization or "").encode("utf-8")).hexdigest()
+
+        return hashlib.sha256("{}|{}".format(identity, url).encode("utf-8")).hexdigest()
+
+    # ----------------------------------------------------------------------
+    def PrepareRequest(
+        self,
+        url: str,
+        params: Optional[Mapping[str, Any]],
+        authorization: Optional[str],
+        headers: Optional[Mapping[str, str]],
+    ) -> tuple[str, Optional["ResponseCache.Entry"], dict[str, str]]:
+        """Returns the cache key, cache entry (if any), and the headers that should be sent with the request"""
+
+        # Use the fully-qualified url (including query parameters) when creating the cache key
+        prepared_request = requests.models.PreparedRequest()
+        prepared_request.prepare_url(url, params)
+
+        assert prepared_request.url is not None
+
+        cache_key = self.__class__.CreateKey(prepared_request.url, authorization)
+        cache_entry = self.Get(cache_key)
+
+        headers = dict(headers or {})
+
+        if cache_entry is not None:
+            headers.update(cache_entry.CreateConditionalHeaders())
+
+        return cache_key, cache_entry, headers
+
+    # ----------------------------------------------------------------------
+    def ProcessResponse(
+        self,
+        cache_key: str,
+        cache_entry: Optional["ResponseCache.Entry"],
+        response: requests.Response,
+    ) -> requests.Response:
+        """Returns the cached response if the server indicated that it hasn't been modified, updating the cache otherwise"""
+
+        if cache_entry is not None and response.status_code == 304:
+            self.OnHit()
+            return cache_entry.CreateResponse(response)
+
+        self.OnMiss()
+        self.Set(cache_key, response)
+
+        return response
+
+    # ----------------------------------------------------------------------
+    def Get(
+        self,
+        key: str,
+    ) -> Optional["ResponseCache.Entry"]:
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT url, etag, last_modified, headers, content FROM responses WHERE key = ?",
+                (key, ),
+            ).fetchone()
+
+        if row is None:
+            return None
+
+        url, etag, last_modified, headers, content = row
+
+        return ResponseCache.Entry(url, etag, last_modified, json.loads(headers), content)
+
+    # ----------------------------------------------------------------------
+    def Set(
+        self,
+        key: str,
+        response: requests.Response,
+    ) -> bool:
+        """Stores the response if it can be revalidated in the future; returns True if the response was stored"""
+
+        if response.status_code != 200:
+            return False
+
+        etag = response.headers.get("ETag", None)
+        last_modified = response.headers.get("Last-Modified", None)
+
+        if not etag and not last_modified:
+            return False
+
+        headers = {
+            k: v
+            for k, v in response.headers.items()
+            if k.lower() not in ["content-length", "content-encoding", "transfer-encoding"]
+        }
+
+        with self._lock:
+            self._connection.execute(
+                "INSERT OR REPLACE INTO responses (key, url, etag, last_modified, headers, content) VALUES (?, ?, ?, ?, ?, ?)",
+                (key, response.url, etag, last_modified, json.dumps(headers), response.content),
+            )
+
+        return True
+
+    # ----------------------------------------------------------------------
+    def OnHit(self) -> None:
+        with self._lock:
+            self._hits += 1
+
+    # ----------------------------------------------------------------------
+    def OnMiss(self) -> None:
+        with self._lock:
+            self._misses += 1
+
+    # ----------------------------------------------------------------------
+    def GetStatisticsString(self) -> str:
+        total = self._hits + self._misses
+
+        return "Response cache: {} hit(s), {} miss(es) ({:.1f}% hit rate).\n".format(
+            self._hits,
+            self._misses,
+            0.0 if total == 0 else (self._hits / total) * 100,
+        )
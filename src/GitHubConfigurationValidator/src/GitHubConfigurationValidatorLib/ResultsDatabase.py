@@ -0,0 +1,404 @@
+# ----------------------------------------------------------------------
+# |
+# |  ResultsDatabase.py
+# |
+# |  David Brownell <db@DavidBrownell.com>
+# |      2023-12-07 13:18:52
+# |
+# ----------------------------------------------------------------------
+# |
+# |  Copyright David Brownell 2023
+# |  Distributed under the Boost Software License, Version 1.0. See
+# |  accompanying file LICENSE_1_0.txt or copy at
+# |  http://www.boost.org/LICENSE_1_0.txt.
+# |
+# ----------------------------------------------------------------------
+"""Contains the ResultsDatabase object"""
+
+import sqlite3
+import threading
+
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Optional
+
+from GitHubConfigurationValidatorLib.Finding import Finding
+from GitHubConfigurationValidatorLib.Plugin import Plugin
+
+
+# ----------------------------------------------------------------------
+class ResultsDatabase(object):
+    """\
+    SQLite database that accumulates the results of validation runs so that historical questions can
+    be answered without accessing GitHub.
+
+    Tables:
+        runs                One row for each invocation.
+        repositories        One row for each repository (across all runs).
+        plugins             One row for each plugin (across all runs).
+        run_repositories    One row for each repository validated during a run (including repositories
+                            without findings).
+        findings            One row for each message produced by a plugin during a run.
+
+    Results are written in batched transactions as repositories are validated, so the results of a run
+    that is interrupted are available up to the last batch written; `completed_at` is only set for runs
+    that completed.
+
+    Example (repositories that started failing 'RequireApprovals' within the last week):
+
+        SELECT DISTINCT repositories.name
+        FROM findings
+            JOIN runs ON runs.id = findings.run_id
+            JOIN repositories ON repositories.id = findings.repository_id
+            JOIN plugins ON plugins.id = findings.plugin_id
+        WHERE
+            plugins.name = 'RequireApprovals'
+            AND findings.type = 'Error'
+            AND runs.started_at >= datetime('now', '-7 days')
+            AND NOT EXISTS (
+                SELECT 1
+                FROM findings AS previous_findings
+                    JOIN runs AS previous_runs ON previous_runs.id = previous_findings.run_id
+                WHERE
+                    previous_findings.repository_id = findings.repository_id
+                    AND previous_findings.plugin_id = findings.plugin_id
+                    AND previous_findings.type = 'Error'
+                    AND previous_runs.started_at < datetime('now', '-7 days')
+            )
+    """
+
+    # ----------------------------------------------------------------------
+    # |
+    # |  Public Types
+    # |
+    # ----------------------------------------------------------------------
+    DEFAULT_BATCH_SIZE                      = 100   # Number of repositories written in each transaction
+
+    # ----------------------------------------------------------------------
+    # |
+    # |  Public Methods
+    # |
+    # ----------------------------------------------------------------------
+    @staticmethod
+    def LoadRun(
+        filename: Path,
+        github_url: str,
+        username: str,
+        run_id: Optional[int]=None,         # The most recent complete run for the GitHub url and user/organization if None
+    ) -> Optional[dict[str, list[Finding]]]:
+        """Returns the findings for each repository validated during a run, or None if the run doesn't exist"""
+
+        try:
+            connection = sqlite3.connect("{}?mode=ro".format(filename.resolve().as_uri()), uri=True)
+
+            try:
+                if run_id is None:
+                    row = connection.execute(
+                        "SELECT id FROM runs WHERE github_url = ? AND username = ? AND completed_at IS NOT NULL ORDER BY id DESC LIMIT 1",
+                        (github_url, username),
+                    ).fetchone()
+                else:
+                    row = connection.execute(
+                        "SELECT id FROM runs WHERE github_url = ? AND username = ? AND id = ?",
+                        (github_url, username, run_id),
+                    ).fetchone()
+
+                if row is None:
+                    return None
+
+                run_id = row[0]
+
+                results: dict[str, list[Finding]] = {
+                    repository: []
+                    for (repository, ) in connection.execute(
+                        "SELECT repositories.name FROM run_repositories JOIN repositories ON repositories.id = run_repositories.repository_id WHERE run_repositories.run_id = ?",
+                        (run_id, ),
+                    )
+                }
+
+                for repository, plugin_name, message_type, message in connection.execute(
+                    """
+                    SELECT repositories.name, plugins.name, findings.type, findings.message
+                    FROM findings
+                        JOIN repositories ON repositories.id = findings.repository_id
+                        JOIN plugins ON plugins.id = findings.plugin_id
+                    WHERE findings.run_id = ?
+                    ORDER BY findings.id
+                    """,
+                    (run_id, ),
+                ):
+                    results[repository].append(Finding(plugin_name, Plugin.MessageType[message_type], message))
+
+                return results
+
+            finally:
+                connection.close()
+
+        except (sqlite3.Error, KeyError) as ex:
+            raise Exception("'{}' is not a valid results database ({}).".format(filename, ex)) from ex
+
+    # ----------------------------------------------------------------------
+    def __init__(
+        self,
+        filename: Path,
+        github_url: str,
+        username: str,
+        *,
+        batch_size: int=DEFAULT_BATCH_SIZE,
+    ):
+        filename.parent.mkdir(parents=True, exist_ok=True)
+
+        connection = sqlite3.connect(
+            filename,
+            check_same_thread=False,
+            isolation_level=None,
+        )
+
+        connection.execute("PRAGMA foreign_keys = ON")
+        connection.executescript(_SCHEMA)
+
+        run_id = connection.execute(
+            "INSERT INTO runs (started_at, github_url, username) VALUES (?, ?, ?)",
+            (_GetTimestamp(), github_url, username),
+        ).lastrowid
+
+        assert run_id is not None
+
+        self.filename                       = filename
+        self.run_id                         = run_id
+        self.username                       = username
+
+        self._connection                    = connection
+        self._lock                          = threading.Lock()
+        self._batch_size                    = batch_size
+
+        self._repository_ids: dict[str, int]            = {}
+        self._plugin_ids: dict[str, int]                = {}
+
+        self._pending_run_repositories: list[tuple[Any, ...]]   = []
+        self._pending_findings: list[tuple[Any, ...]]           = []
+        self._num_pending_repositories      = 0
+
+        self._num_repositories              = 0
+        self._num_findings                  = 0
+
+    # ----------------------------------------------------------------------
+    def Complete(
+        self,
+        returncode: int,
+    ) -> None:
+        """Writes any pending results and records the completion of the run"""
+
+        with self._lock:
+            self._FlushImpl()
+
+            self._connection.execute(
+                "UPDATE runs SET completed_at = ?, returncode = ? WHERE id = ?",
+                (_GetTimestamp(), returncode, self.run_id),
+            )
+
+    # ----------------------------------------------------------------------
+    def Close(self) -> None:
+        """Writes any pending results; the run remains incomplete unless `Complete` was called"""
+
+        with self._lock:
+            self._FlushImpl()
+            self._connection.close()
+
+    # ----------------------------------------------------------------------
+    def WriteRepository(
+        self,
+        repository: str,
+        returncode: int,
+        findings: list[Finding],
+        *,
+        is_replayed: bool=False,            # True if the results were replayed from a previous validation
+    ) -> None:
+        message_type_counts = {message_type: 0 for message_type in Plugin.MessageType}
+
+        for finding in findings:
+            message_type_counts[finding.message_type] += 1
+
+        with self._lock:
+            repository_id = self._GetRepositoryId(repository)
+
+            self._pending_run_repositories.append(
+                (
+                    self.run_id,
+                    repository_id,
+                    returncode,
+                    message_type_counts[Plugin.MessageType.Error],
+                    message_type_counts[Plugin.MessageType.Warning],
+                    message_type_counts[Plugin.MessageType.Info],
+                    is_replayed,
+                ),
+            )
+
+            for finding in findings:
+                self._pending_findings.append(
+                    (
+                        self.run_id,
+                        repository_id,
+                        self._GetPluginId(finding.plugin),
+                        finding.message_type.name,
+                        finding.message,
+                    ),
+                )
+
+            self._num_pending_repositories += 1
+
+            self._num_repositories += 1
+            self._num_findings += len(findings)
+
+            if self._num_pending_repositories >= self._batch_size:
+                self._FlushImpl()
+
+    # ----------------------------------------------------------------------
+    def GetStatisticsString(self) -> str:
+        return "Results database: {} repositories, {} findings written to '{}' (run {}).\n".format(
+            self._num_repositories,
+            self._num_findings,
+            self.filename,
+            self.run_id,
+        )
+
+    # ----------------------------------------------------------------------
+    # |
+    # |  Private Methods
+    # |
+    # ----------------------------------------------------------------------
+    def _GetRepositoryId(
+        self,
+        repository: str,
+    ) -> int:
+        # Assumes that the lock is held
+        repository_id = self._repository_ids.get(repository, None)
+
+        if repository_id is None:
+            self._connection.execute(
+                "INSERT OR IGNORE INTO repositories (owner, name) VALUES (?, ?)",
+                (self.username, repository),
+            )
+
+            repository_id = self._connection.execute(
+                "SELECT id FROM repositories WHERE owner = ? AND name = ?",
+                (self.username, repository),
+            ).fetchone()[0]
+
+            self._repository_ids[repository] = repository_id
+
+        return repository_id
+
+    # ----------------------------------------------------------------------
+    def _GetPluginId(
+        self,
+        plugin_name: str,
+    ) -> int:
+        # Assumes that the lock is held
+        plugin_id = self._plugin_ids.get(plugin_name, None)
+
+        if plugin_id is None:
+            self._connection.execute("INSERT OR IGNORE INTO plugins (name) VALUES (?)", (plugin_name, ))
+
+            plugin_id = self._connection.execute(
+                "SELECT id FROM plugins WHERE name = ?",
+                (plugin_name, ),
+            ).fetchone()[0]
+
+            self._plugin_ids[plugin_name] = plugin_id
+
+        return plugin_id
+
+    # ----------------------------------------------------------------------
+    def _FlushImpl(self) -> None:
+        # Assumes that the lock is held
+        if not self._num_pending_repositories:
+            return
+
+        self._connection.execute("BEGIN")
+
+        try:
+            self._connection.executemany(
+                "INSERT OR REPLACE INTO run_repositories (run_id, repository_id, returncode, errors, warnings, infos, replayed) VALUES (?, ?, ?, ?, ?, ?, ?)",
+                self._pending_run_repositories,
+            )
+
+            self._connection.executemany(
+                "INSERT INTO findings (run_id, repository_id, plugin_id, type, message) VALUES (?, ?, ?, ?, ?)",
+                self._pending_findings,
+            )
+
+            self._connection.execute("COMMIT")
+
+        except:
+            self._connection.execute("ROLLBACK")
+            raise
+
+        self._pending_run_repositories = []
+        self._pending_findings = []
+        self._num_pending_repositories = 0
+
+
+# ----------------------------------------------------------------------
+# |
+# |  Private Data
+# |
+# ----------------------------------------------------------------------
+_SCHEMA                                     = """
+CREATE TABLE IF NOT EXISTS runs (
+    id INTEGER PRIMARY KEY,
+    started_at TEXT NOT NULL,               -- UTC, in a format that can be compared with SQLite date and time functions
+    completed_at TEXT,                      -- NULL if the run is in progress or was interrupted
+    github_url TEXT NOT NULL,
+    username TEXT NOT NULL,
+    returncode INTEGER
+);
+
+CREATE TABLE IF NOT EXISTS repositories (
+    id INTEGER PRIMARY KEY,
+    owner TEXT NOT NULL,
+    name TEXT NOT NULL,
+    UNIQUE (owner, name)
+);
+
+CREATE TABLE IF NOT EXISTS plugins (
+    id INTEGER PRIMARY KEY,
+    name TEXT NOT NULL UNIQUE
+);
+
+CREATE TABLE IF NOT EXISTS run_repositories (
+    run_id INTEGER NOT NULL REFERENCES runs (id),
+    repository_id INTEGER NOT NULL REFERENCES repositories (id),
+    returncode INTEGER NOT NULL,
+    errors INTEGER NOT NULL,
+    warnings INTEGER NOT NULL,
+    infos INTEGER NOT NULL,
+    replayed INTEGER NOT NULL,
+    PRIMARY KEY (run_id, repository_id)
+);
+
+CREATE INDEX IF NOT EXISTS run_repositories_repository_index ON run_repositories (repository_id, run_id);
+
+CREATE TABLE IF NOT EXISTS findings (
+    id INTEGER PRIMARY KEY,
+    run_id INTEGER NOT NULL REFERENCES runs (id),
+    repository_id INTEGER NOT NULL REFERENCES repositories (id),
+    plugin_id INTEGER NOT NULL REFERENCES plugins (id),
+    type TEXT NOT NULL,                     -- 'Error', 'Warning', or 'Info'
+    message TEXT NOT NULL
+);
+
+CREATE INDEX IF NOT EXISTS findings_run_index ON findings (run_id, repository_id);
+CREATE INDEX IF NOT EXISTS findings_repository_index ON findings (repository_id, plugin_id, run_id);
+CREATE INDEX IF NOT EXISTS findings_plugin_index ON findings (plugin_id, run_id);
+"""
+
+
+# ----------------------------------------------------------------------
+# |
+# |  Private Functions
+# |
+# ----------------------------------------------------------------------
+def _GetTimestamp() -> str:
+    # This format can be compared with the values produced by SQLite's `datetime` function
+    return datetime.now(timezone.utc).strftime("%Y-%m-%d %H:%M:%S")
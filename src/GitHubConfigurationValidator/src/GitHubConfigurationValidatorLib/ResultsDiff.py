@@ -0,0 +1,161 @@
+# ----------------------------------------------------------------------
+# |
+# |  ResultsDiff.py
+# |
+# |  David Brownell <db@DavidBrownell.com>
+# |      2023-12-08 08:26:40
+# |
+# ----------------------------------------------------------------------
+# |
+# |  Copyright David Brownell 2023
+# |  Distributed under the Boost Software License, Version 1.0. See
+# |  accompanying file LICENSE_1_0.txt or copy at
+# |  http://www.boost.org/LICENSE_1_0.txt.
+# |
+# ----------------------------------------------------------------------
+"""Contains the ResultsDiff object"""
+
+from dataclasses import dataclass
+from enum import auto, Enum
+from pathlib import Path
+from typing import Optional
+
+from GitHubConfigurationValidatorLib.Finding import Finding
+from GitHubConfigurationValidatorLib.Plugin import Plugin
+
+
+# ----------------------------------------------------------------------
+class ResultsDiff(object):
+    """\
+    Compares the findings of a repository with the findings of a previous run.
+
+    Findings are matched by plugin and message (within a repository); a finding whose message type is
+    different from the previous run (for example, a warning that is now an error) is considered to
+    have changed. Findings are only considered to be resolved for repositories that are compared, so
+    repositories that were not validated in the current run do not produce changes.
+    """
+
+    # ----------------------------------------------------------------------
+    # |
+    # |  Public Types
+    # |
+    # ----------------------------------------------------------------------
+    class ChangeType(Enum):
+        """Type of change"""
+
+        New                                 = auto()
+        Changed                             = auto()
+        Resolved                            = auto()
+
+    # ----------------------------------------------------------------------
+    @dataclass(frozen=True)
+    class Change(object):
+        """Finding that is different from the previous run"""
+
+        change_type: "ResultsDiff.ChangeType"
+        finding: Finding                                        # The previous finding when the change is Resolved
+        previous_message_type: Optional[Plugin.MessageType]     = None  # Set when the change is Changed
+
+    # ----------------------------------------------------------------------
+    # |
+    # |  Public Methods
+    # |
+    # ----------------------------------------------------------------------
+    @classmethod
+    def Load(
+        cls,
+        filename: Path,
+        github_url: str,
+        username: str,
+    ) -> "ResultsDiff":
+        """\
+        Loads the previous results from a file created via '--output-jsonl' or from the most recent
+        complete run (for the GitHub url and user/organization) in a database created via
+        '--results-db'.
+        """
+
+        try:
+            with filename.open("rb") as f:
+                header = f.read(len(_SQLITE_HEADER))
+
+        except OSError as ex:
+            raise Exception("'{}' could not be read ({}).".format(filename, ex)) from ex
+
+        if header == _SQLITE_HEADER:
+            from GitHubConfigurationValidatorLib.ResultsDatabase import ResultsDatabase
+
+            previous_findings = ResultsDatabase.LoadRun(filename, github_url, username)
+            if previous_findings is None:
+                raise Exception("'{}' does not contain a complete run for '{}' at '{}'.".format(filename, username, github_url))
+
+        else:
+            from GitHubConfigurationValidatorLib.JsonLinesWriter import JsonLinesWriter
+
+            previous_findings = JsonLinesWriter.Load(filename)
+
+        return cls(filename, previous_findings)
+
+    # ----------------------------------------------------------------------
+    def __init__(
+        self,
+        filename: Path,
+        previous_findings: dict[str, list[Finding]],    # Findings for each repository validated during the previous run
+    ):
+        self.filename                       = filename
+
+        self._previous_findings             = previous_findings
+
+    # ----------------------------------------------------------------------
+    @property
+    def num_previous_repositories(self) -> int:
+        return len(self._previous_findings)
+
+    # ----------------------------------------------------------------------
+    def Compare(
+        self,
+        repository: str,
+        findings: list[Finding],
+    ) -> list["ResultsDiff.Change"]:
+        """Returns the new and changed findings (in the order provided) followed by the resolved findings"""
+
+        previous_message_types: dict[tuple[str, str], Plugin.MessageType] = {}
+        previous_findings: list[Finding] = []
+
+        for finding in self._previous_findings.get(repository, []):
+            key = (finding.plugin, finding.message)
+
+            if key not in previous_message_types:
+                previous_message_types[key] = finding.message_type
+                previous_findings.append(finding)
+
+        current_keys: set[tuple[str, str]] = set()
+        changes: list[ResultsDiff.Change] = []
+
+        for finding in findings:
+            key = (finding.plugin, finding.message)
+
+            if key in current_keys:
+                continue
+
+            current_keys.add(key)
+
+            previous_message_type = previous_message_types.get(key, None)
+
+            if previous_message_type is None:
+                changes.append(ResultsDiff.Change(ResultsDiff.ChangeType.New, finding))
+            elif previous_message_type != finding.message_type:
+                changes.append(ResultsDiff.Change(ResultsDiff.ChangeType.Changed, finding, previous_message_type))
+
+        for finding in previous_findings:
+            if (finding.plugin, finding.message) not in current_keys:
+                changes.append(ResultsDiff.Change(ResultsDiff.ChangeType.Resolved, finding))
+
+        return changes
+
+
+# ----------------------------------------------------------------------
+# |
+# |  Private Data
+# |
+# ----------------------------------------------------------------------
+_SQLITE_HEADER                              = b"SQLite format 3\x00"
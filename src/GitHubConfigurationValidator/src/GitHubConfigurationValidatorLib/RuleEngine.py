@@ -0,0 +1,379 @@
+# ----------------------------------------------------------------------
+# |
+# |  RuleEngine.py
+# |
+# |  David Brownell <db@DavidBrownell.com>
+# |      2023-12-02 09:14:36
+# |
+# ----------------------------------------------------------------------
+# |
+# |  Copyright David Brownell 2023
+# |  Distributed under the Boost Software License, Version 1.0. See
+# |  accompanying file LICENSE_1_0.txt or copy at
+# |  http://www.boost.org/LICENSE_1_0.txt.
+# |
+# ----------------------------------------------------------------------
+"""\
+Contains objects that describe plugin validations declaratively (a path to a configuration value, how
+that value is compared, and the expected value) and the RuleEngine, which evaluates the rules of many
+plugins in a single pass over a configuration.
+"""
+
+from dataclasses import dataclass, field
+from enum import auto, Enum
+from typing import Any, Callable, Optional, Union
+
+from GitHubConfigurationValidatorLib.Plugin import Plugin
+
+
+# ----------------------------------------------------------------------
+# |
+# |  Public Types
+# |
+# ----------------------------------------------------------------------
+@dataclass(frozen=True)
+class ConfigurationValue(object):
+    """Declarative description of a value within a configuration (as returned by the GitHub REST API)"""
+
+    # ----------------------------------------------------------------------
+    class Type(Enum):
+        """Determines how the value is compared with the expected value"""
+
+        Value                               = auto()    # The value at `path`
+        Exists                              = auto()    # True if the value at `path` exists and is not None
+        Enabled                             = auto()    # True if the value at `path` is 'enabled' (GitHub status values)
+
+    # ----------------------------------------------------------------------
+    class MissingBehavior(Enum):
+        """Behavior when the top-level object in `path` is missing or None"""
+
+        Error                               = auto()    # Raise a KeyError (consistent with indexing into the configuration)
+        Skip                                = auto()    # The validation is not applicable
+        Null                                = auto()    # The value is None
+        NullIfNone                          = auto()    # The value is None when the top-level object is None (a missing top-level object raises a KeyError)
+        Warning                             = auto()    # Display `missing_message` as a warning
+
+    # ----------------------------------------------------------------------
+    # `missing_message` for values within 'security_and_analysis', which GitHub only returns when the
+    # request is authenticated
+    SECURITY_AND_ANALYSIS_MISSING_MESSAGE   = "'security_and_analysis' was not found in the results; please provide a GitHub Personal Access Token (PAT)."
+
+    # ----------------------------------------------------------------------
+    path: tuple[str, ...]
+    type: "ConfigurationValue.Type"                         = Type.Value
+    missing_behavior: "ConfigurationValue.MissingBehavior"  = MissingBehavior.Error
+    missing_message: Optional[str]                          = None
+    condition_path: Optional[tuple[str, ...]]               = None  # The value is only validated when the value at this path is truthy
+
+    # ----------------------------------------------------------------------
+    def __post_init__(self):
+        assert self.path
+        assert (self.missing_behavior == ConfigurationValue.MissingBehavior.Warning) == (self.missing_message is not None)
+
+
+# ----------------------------------------------------------------------
+@dataclass(frozen=True)
+class Rule(object):
+    """Validates that a configuration value is equal to an expected value"""
+
+    value: ConfigurationValue
+    expected_value: Any
+    create_error_func: Callable[[Any], Plugin.ValidateResultType]   = field(compare=False, repr=False)  # Creates the result for an actual value that doesn't match the expected value
+
+    # Note that `create_error_func` is excluded from the representation of the rule, as that
+    # representation is part of the policy created by `ValidationState.CreatePolicy` and the
+    # representation of a function (which includes its address) is different for each process.
+
+    # ----------------------------------------------------------------------
+    def Evaluate(
+        self,
+        configuration: dict[str, Any],
+    ) -> Plugin.ValidateResultType:
+        """Evaluates the rule in isolation; KeyErrors are raised for missing values"""
+
+        tree: _PathTree = {}
+
+        _AddPath(tree, self.value.path)
+
+        if self.value.condition_path is not None:
+            _AddPath(tree, self.value.condition_path)
+
+        columns: dict[tuple[str, ...], list[Any]] = {}
+
+        _ExtractColumns([configuration], tree, (), columns)
+
+        result = _EvaluateRuleColumn(self, columns)[0]
+
+        if isinstance(result, KeyError):
+            raise result
+
+        return result
+
+
+# ----------------------------------------------------------------------
+@dataclass(frozen=True)
+class ResultMatrix(object):
+    """Results of rules evaluated across many repositories (rows) and plugins (columns)"""
+
+    # ----------------------------------------------------------------------
+    RowType                                 = dict[Plugin.ConfigurationType, dict[str, "RuleEngine.ResultType"]]
+
+    # ----------------------------------------------------------------------
+    num_rows: int
+    columns: dict[Plugin.ConfigurationType, dict[str, list["RuleEngine.ResultType"]]]
+
+    # ----------------------------------------------------------------------
+    def GetRow(
+        self,
+        index: int,
+    ) -> "ResultMatrix.RowType":
+        """Returns the results for a single repository, grouped by configuration type and keyed by plugin name"""
+
+        assert 0 <= index < self.num_rows, index
+
+        return {
+            configuration_type: {
+                plugin_name: column[index]
+                for plugin_name, column in columns.items()
+            }
+            for configuration_type, columns in self.columns.items()
+        }
+
+
+# ----------------------------------------------------------------------
+class RuleEngine(object):
+    """\
+    Evaluates the rules associated with many plugins (as provided by `Plugin.GetRule`).
+
+    The paths referenced by all of the rules are compiled into a tree so that each configuration is
+    traversed once, regardless of the number of rules. Configurations are evaluated in a columnar
+    fashion: the values referenced by the rules are extracted into one column per path (with one row
+    per configuration) and each rule is evaluated over its columns at once.
+    """
+
+    # ----------------------------------------------------------------------
+    # |
+    # |  Public Types
+    # |
+    # ----------------------------------------------------------------------
+    ResultType                              = Union[Plugin.ValidateResultType, KeyError]
+
+    # ----------------------------------------------------------------------
+    # |
+    # |  Public Methods
+    # |
+    # ----------------------------------------------------------------------
+    def __init__(
+        self,
+        plugins: list[Plugin],
+    ):
+        rules: dict[Plugin.ConfigurationType, list[tuple[Plugin, Rule]]] = {}
+        trees: dict[Plugin.ConfigurationType, _PathTree] = {}
+
+        for plugin in plugins:
+            rule = plugin.GetRule()
+            if rule is None:
+                continue
+
+            rules.setdefault(plugin.configuration_type, []).append((plugin, rule))
+
+            tree = trees.setdefault(plugin.configuration_type, {})
+
+            _AddPath(tree, rule.value.path)
+
+            if rule.value.condition_path is not None:
+                _AddPath(tree, rule.value.condition_path)
+
+        self._rules                         = rules
+        self._trees                         = trees
+
+    # ----------------------------------------------------------------------
+    def Evaluate(
+        self,
+        configuration_type: Plugin.ConfigurationType,
+        configuration: dict[str, Any],
+    ) -> dict[str, "RuleEngine.ResultType"]:
+        """\
+        Returns the results of all rules associated with the configuration type, keyed by plugin name;
+        KeyErrors encountered while evaluating a rule are returned (rather than raised) so that they
+        can be handled consistently with errors raised by `Plugin.Validate`.
+        """
+
+        return {
+            plugin_name: column[0]
+            for plugin_name, column in self.EvaluateColumns(configuration_type, [configuration]).items()
+        }
+
+    # ----------------------------------------------------------------------
+    def EvaluateColumns(
+        self,
+        configuration_type: Plugin.ConfigurationType,
+        configurations: list[Optional[dict[str, Any]]],
+    ) -> dict[str, list["RuleEngine.ResultType"]]:
+        """\
+        Returns the results of all rules associated with the configuration type for each configuration,
+        keyed by plugin name (rows associated with a configuration of None are None).
+        """
+
+        rules = self._rules.get(configuration_type, None)
+        if not rules:
+            return {}
+
+        columns: dict[tuple[str, ...], list[Any]] = {}
+
+        _ExtractColumns(configurations, self._trees[configuration_type], (), columns)
+
+        none_indexes = [index for index, configuration in enumerate(configurations) if configuration is None]
+
+        results: dict[str, list[RuleEngine.ResultType]] = {}
+
+        for plugin, rule in rules:
+            column = _EvaluateRuleColumn(rule, columns)
+
+            for index in none_indexes:
+                column[index] = None
+
+            results[plugin.name] = column
+
+        return results
+
+    # ----------------------------------------------------------------------
+    def EvaluateMatrix(
+        self,
+        configurations: list[Optional[dict[Plugin.ConfigurationType, Optional[dict[str, Any]]]]],
+    ) -> ResultMatrix:
+        """Evaluates all rules for each repository's configurations (as returned by GitHub)"""
+
+        return ResultMatrix(
+            len(configurations),
+            {
+                configuration_type: self.EvaluateColumns(
+                    configuration_type,
+                    [
+                        None if repository_configurations is None else repository_configurations.get(configuration_type, None)
+                        for repository_configurations in configurations
+                    ],
+                )
+                for configuration_type in self._rules.keys()
+            },
+        )
+
+
+# ----------------------------------------------------------------------
+# |
+# |  Private Types
+# |
+# ----------------------------------------------------------------------
+_PathTree                                   = dict[str, "_PathTree"]
+
+
+# ----------------------------------------------------------------------
+@dataclass(frozen=True)
+class _Final(object):
+    """Result for a row that is known before the value is compared with the expected value"""
+
+    result: Plugin.ValidateResultType
+
+
+# ----------------------------------------------------------------------
+# |
+# |  Private Functions
+# |
+# ----------------------------------------------------------------------
+def _AddPath(
+    tree: _PathTree,
+    path: tuple[str, ...],
+) -> None:
+    node = tree
+
+    for key in path:
+        node = node.setdefault(key, {})
+
+
+# ----------------------------------------------------------------------
+def _ExtractColumns(
+    values: list[Any],
+    tree: _PathTree,
+    path: tuple[str, ...],
+    columns: dict[tuple[str, ...], list[Any]],
+) -> None:
+    for key, children in tree.items():
+        child_path = path + (key, )
+
+        # Descendants of a missing value produce the same error as the missing value
+        column = [
+            value if isinstance(value, KeyError)
+            else value[key] if isinstance(value, dict) and key in value
+            else KeyError(key)
+            for value in values
+        ]
+
+        columns[child_path] = column
+
+        if children:
+            _ExtractColumns(column, children, child_path, columns)
+
+
+# ----------------------------------------------------------------------
+def _EvaluateRuleColumn(
+    rule: Rule,
+    columns: dict[tuple[str, ...], list[Any]],
+) -> list[RuleEngine.ResultType]:
+    configuration_value = rule.value
+
+    # Rows that are KeyErrors or _Final are not compared with the expected value
+    values = columns[configuration_value.path]
+
+    if configuration_value.type == ConfigurationValue.Type.Exists:
+        values = [not isinstance(value, KeyError) and value is not None for value in values]
+
+    else:
+        if configuration_value.missing_behavior != ConfigurationValue.MissingBehavior.Error:
+            if configuration_value.missing_behavior == ConfigurationValue.MissingBehavior.Skip:
+                missing_value: Any = _Final(None)
+            elif configuration_value.missing_behavior == ConfigurationValue.MissingBehavior.Warning:
+                assert configuration_value.missing_message is not None
+                missing_value = _Final((Plugin.MessageType.Warning, configuration_value.missing_message))
+            elif configuration_value.missing_behavior in [
+                ConfigurationValue.MissingBehavior.Null,
+                ConfigurationValue.MissingBehavior.NullIfNone,
+            ]:
+                missing_value = None
+            else:
+                assert False, configuration_value.missing_behavior  # pragma: no cover
+
+            if configuration_value.missing_behavior == ConfigurationValue.MissingBehavior.NullIfNone:
+                values = [
+                    missing_value if top_value is None else value
+                    for value, top_value in zip(values, columns[configuration_value.path[:1]])
+                ]
+            else:
+                values = [
+                    missing_value if isinstance(top_value, KeyError) or top_value is None else value
+                    for value, top_value in zip(values, columns[configuration_value.path[:1]])
+                ]
+
+        if configuration_value.type == ConfigurationValue.Type.Enabled:
+            values = [
+                value if isinstance(value, (KeyError, _Final)) else value == "enabled"
+                for value in values
+            ]
+
+    if configuration_value.condition_path is not None:
+        values = [
+            condition if isinstance(condition, KeyError)
+            else value if condition
+            else _Final(None)
+            for value, condition in zip(values, columns[configuration_value.condition_path])
+        ]
+
+    expected_value = rule.expected_value
+    create_error_func = rule.create_error_func
+
+    return [
+        value if isinstance(value, KeyError)
+        else value.result if isinstance(value, _Final)
+        else None if value == expected_value
+        else create_error_func(value)
+        for value in values
+    ]
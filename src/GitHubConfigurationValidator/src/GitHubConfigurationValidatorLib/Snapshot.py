@@ -0,0 +1,273 @@
+# ----------------------------------------------------------------------
+# |
+# |  Snapshot.py
+# |
+# |  David Brownell <db@DavidBrownell.com>
+# |      2023-12-08 10:51:07
+# |
+# ----------------------------------------------------------------------
+# |
+# |  Copyright David Brownell 2023
+# |  Distributed under the Boost Software License, Version 1.0. See
+# |  accompanying file LICENSE_1_0.txt or copy at
+# |  http://www.boost.org/LICENSE_1_0.txt.
+# |
+# ----------------------------------------------------------------------
+"""Contains the Snapshot and SnapshotWriter objects"""
+
+import json
+import threading
+import zipfile
+
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Iterator, Optional
+
+from GitHubConfigurationValidatorLib.Plugin import Plugin
+
+
+# ----------------------------------------------------------------------
+# |
+# |  Public Types
+# |
+# ----------------------------------------------------------------------
+ConfigurationsType                          = dict[Plugin.ConfigurationType, Optional[dict[str, Any]]]
+
+
+# ----------------------------------------------------------------------
+class Snapshot(object):
+    """\
+    Repository, branch, and branch protection configuration information for the repositories of a
+    user/organization (as retrieved from GitHub by a SnapshotWriter), so that plugins can be applied
+    without accessing GitHub.
+
+    A snapshot is a zip file: each repository is stored in a separate (compressed) JSON entry, and an
+    index maps repository names to entries so that repositories can be read individually. The index
+    also lists the repositories that could not be exported.
+    """
+
+    # ----------------------------------------------------------------------
+    # |
+    # |  Public Types
+    # |
+    # ----------------------------------------------------------------------
+    FILE_FORMAT_VERSION                     = 1
+
+    INDEX_NAME                              = "index.json"
+
+    CONFIGURATION_TYPES                     = [
+        Plugin.ConfigurationType.Repository,
+        Plugin.ConfigurationType.Branch,
+        Plugin.ConfigurationType.BranchProtection,
+    ]
+
+    # ----------------------------------------------------------------------
+    @dataclass(frozen=True)
+    class Repository(object):
+        """Information about a repository in the snapshot"""
+
+        repository_info: dict[str, Any]     # As provided by GitHub when listing repositories
+        configurations: ConfigurationsType
+
+    # ----------------------------------------------------------------------
+    # |
+    # |  Public Methods
+    # |
+    # ----------------------------------------------------------------------
+    @classmethod
+    def Load(
+        cls,
+        filename: Path,
+    ) -> "Snapshot":
+        try:
+            zip_file = zipfile.ZipFile(filename)
+
+        except (OSError, zipfile.BadZipFile) as ex:
+            raise Exception("'{}' is not a valid snapshot ({}).".format(filename, ex)) from ex
+
+        try:
+            try:
+                index = json.loads(zip_file.read(cls.INDEX_NAME))
+            except (KeyError, ValueError) as ex:
+                raise Exception("'{}' is not a valid snapshot ({}).".format(filename, ex)) from ex
+
+            if index.get("format_version", None) != cls.FILE_FORMAT_VERSION:
+                raise Exception("'{}' is not a supported snapshot.".format(filename))
+
+            return cls(
+                filename,
+                zip_file,
+                index["github_url"],
+                index["username"],
+                index["has_pat"],
+                index["created_at"],
+                index["repositories"],
+                index["failed_repositories"],
+            )
+
+        except:
+            zip_file.close()
+            raise
+
+    # ----------------------------------------------------------------------
+    def __init__(
+        self,
+        filename: Path,
+        zip_file: zipfile.ZipFile,
+        github_url: str,
+        username: str,
+        has_pat: bool,                      # True if the snapshot was created with a GitHub Personal Access Token
+        created_at: str,
+        entry_names: dict[str, str],        # Names of the zip file entries, keyed by repository name
+        failed_repositories: list[dict[str, Any]],      # Information about repositories that could not be exported (as provided by GitHub when listing repositories)
+    ):
+        self.filename                       = filename
+        self.github_url                     = github_url
+        self.username                       = username
+        self.has_pat                        = has_pat
+        self.created_at                     = created_at
+        self.repositories                   = sorted(entry_names.keys())
+        self.failed_repositories            = failed_repositories
+
+        self._zip_file                      = zip_file
+        self._entry_names                   = entry_names
+        self._lock                          = threading.Lock()
+
+    # ----------------------------------------------------------------------
+    def Close(self) -> None:
+        with self._lock:
+            self._zip_file.close()
+
+    # ----------------------------------------------------------------------
+    def GetRepository(
+        self,
+        repository: str,
+    ) -> "Snapshot.Repository":
+        with self._lock:
+            content = json.loads(self._zip_file.read(self._entry_names[repository]))
+
+        return Snapshot.Repository(
+            content["repository_info"],
+            {
+                Plugin.ConfigurationType[configuration_type]: configuration
+                for configuration_type, configuration in content["configurations"].items()
+            },
+        )
+
+    # ----------------------------------------------------------------------
+    def EnumRepositories(self) -> Iterator["Snapshot.Repository"]:
+        for repository in self.repositories:
+            yield self.GetRepository(repository)
+
+
+# ----------------------------------------------------------------------
+class SnapshotWriter(object):
+    """Creates a Snapshot; repositories are written as they are added, and the index is written when closed"""
+
+    # ----------------------------------------------------------------------
+    # |
+    # |  Public Methods
+    # |
+    # ----------------------------------------------------------------------
+    def __init__(
+        self,
+        filename: Path,
+        github_url: str,
+        username: str,
+        has_pat: bool,
+    ):
+        filename.parent.mkdir(parents=True, exist_ok=True)
+
+        # Write to a temporary file so that an incomplete snapshot never replaces an existing snapshot
+        temp_filename = filename.parent / "{}.tmp".format(filename.name)
+
+        self.filename                       = filename
+        self.github_url                     = github_url
+        self.username                       = username
+        self.has_pat                        = has_pat
+
+        self._temp_filename                 = temp_filename
+        self._zip_file                      = zipfile.ZipFile(temp_filename, "w", zipfile.ZIP_DEFLATED)
+        self._lock                          = threading.Lock()
+
+        self._entry_names: dict[str, str]   = {}
+        self._failed_repositories: list[dict[str, Any]]     = []
+
+    # ----------------------------------------------------------------------
+    @property
+    def num_repositories(self) -> int:
+        return len(self._entry_names)
+
+    # ----------------------------------------------------------------------
+    @property
+    def num_failed_repositories(self) -> int:
+        return len(self._failed_repositories)
+
+    # ----------------------------------------------------------------------
+    def Add(
+        self,
+        repository_info: dict[str, Any],
+        configurations: ConfigurationsType,
+    ) -> None:
+        content = json.dumps(
+            {
+                "repository_info": repository_info,
+                "configurations": {
+                    configuration_type.name: configuration
+                    for configuration_type, configuration in configurations.items()
+                },
+            },
+            separators=(",", ":"),
+        )
+
+        with self._lock:
+            repository = repository_info["name"]
+
+            assert repository not in self._entry_names, repository
+
+            entry_name = "repositories/{:06}.json".format(len(self._entry_names))
+
+            self._zip_file.writestr(entry_name, content)
+            self._entry_names[repository] = entry_name
+
+    # ----------------------------------------------------------------------
+    def AddFailure(
+        self,
+        repository_info: dict[str, Any],
+    ) -> None:
+        """Records a repository that could not be exported, so that it is reported when the snapshot is validated"""
+
+        with self._lock:
+            assert repository_info["name"] not in self._entry_names, repository_info["name"]
+            self._failed_repositories.append(repository_info)
+
+    # ----------------------------------------------------------------------
+    def Close(
+        self,
+        *,
+        commit: bool=True,                  # The snapshot is discarded if False
+    ) -> None:
+        with self._lock:
+            if commit:
+                self._zip_file.writestr(
+                    Snapshot.INDEX_NAME,
+                    json.dumps(
+                        {
+                            "format_version": Snapshot.FILE_FORMAT_VERSION,
+                            "github_url": self.github_url,
+                            "username": self.username,
+                            "has_pat": self.has_pat,
+                            "created_at": datetime.now(timezone.utc).strftime("%Y-%m-%d %H:%M:%S"),
+                            "repositories": self._entry_names,
+                            "failed_repositories": self._failed_repositories,
+                        },
+                    ),
+                )
+
+            self._zip_file.close()
+
+            if commit:
+                self._temp_filename.replace(self.filename)
+            else:
+                self._temp_filename.unlink()
@@ -0,0 +1,263 @@
+# ----------------------------------------------------------------------
+# |
+# |  Benchmark.py
+# |
+# |  David Brownell <db@DavidBrownell.com>
+# |      2023-11-29 10:47:05
+# |
+# ----------------------------------------------------------------------
+# |
+# |  Copyright David Brownell 2023
+# |  Distributed under the Boost Software License, Version 1.0. See
+# |  accompanying file LICENSE_1_0.txt or copy at
+# |  http://www.boost.org/LICENSE_1_0.txt.
+# |
+# ----------------------------------------------------------------------
+"""\
+End-to-end throughput benchmarks for GitHubConfigurationValidator.
+
+Each scenario invokes the tool (either a built binary or the source) against a FakeGitHubServer and
+measures repositories/second, requests/repository, and the peak resident set size of the process.
+"""
+
+# Note that this file may be invoked outside of an activated environment and cannot take a dependency
+# on anything in this repository or Common_Foundation (other than FakeGitHubServer, which is in the
+# same directory).
+
+import argparse
+import os
+import subprocess
+import sys
+import tempfile
+import textwrap
+import time
+
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Optional
+
+sys.path.insert(0, str(Path(__file__).parent))
+
+from FakeGitHubServer import FakeGitHubServer  # pylint: disable=wrong-import-position
+
+del sys.path[0]
+
+
+# ----------------------------------------------------------------------
+# |
+# |  Public Types
+# |
+# ----------------------------------------------------------------------
+@dataclass(frozen=True)
+class Scenario(object):
+    """Tool invocation to benchmark"""
+
+    name: str
+    args: list[str]                         # "{username}", "{repository}", and "{github_url}" are populated at runtime
+    processes_all_repositories: bool        # False if the scenario processes a single repository
+
+
+# ----------------------------------------------------------------------
+@dataclass(frozen=True)
+class Result(object):
+    """Measurements for a scenario"""
+
+    scenario: Scenario
+    num_repositories: int
+    returncode: int
+    seconds: float
+    num_requests: int
+    peak_rss_kb: Optional[int]              # None if the value is not available on this platform
+    output: str
+
+    # ----------------------------------------------------------------------
+    @property
+    def repositories_per_second(self) -> float:
+        return self.num_repositories / self.seconds if self.seconds else 0.0
+
+    @property
+    def requests_per_repository(self) -> float:
+        return self.num_requests / self.num_repositories
+
+
+# ----------------------------------------------------------------------
+# |
+# |  Public Data
+# |
+# ----------------------------------------------------------------------
+SCENARIOS: list[Scenario]                   = [
+    Scenario("ListRepos", ["ListRepos", "{username}", "--github-url", "{github_url}"], True),
+    Scenario("ValidateRepo", ["ValidateRepo", "{username}", "{repository}", "--github-url", "{github_url}"], False),
+    Scenario("ValidateRepos", ["ValidateRepos", "{username}", "--github-url", "{github_url}"], True),
+    Scenario("ValidateRepos --async", ["ValidateRepos", "{username}", "--github-url", "{github_url}", "--async"], True),
+    Scenario("ValidateRepos --graphql", ["ValidateRepos", "{username}", "--github-url", "{github_url}", "--graphql"], True),
+]
+
+
+# ----------------------------------------------------------------------
+# |
+# |  Public Functions
+# |
+# ----------------------------------------------------------------------
+def EntryPoint(
+    args: list[str],
+) -> int:
+    parser = argparse.ArgumentParser(description=__doc__, prog=args[0])
+
+    parser.add_argument("--repos", type=int, action="append", help="Number of repositories in the synthetic organization; may be provided multiple times (default: 10 and 1000).")
+    parser.add_argument("--latency", type=float, default=0.05, help="Number of seconds that the server waits before sending each response.")
+    parser.add_argument("--scenario", action="append", choices=[scenario.name for scenario in SCENARIOS], help="Scenario to run; may be provided multiple times (default: all scenarios).")
+    parser.add_argument("--binary", type=Path, help="GitHubConfigurationValidator binary to benchmark (default: the source in this repository).")
+
+    parsed_args = parser.parse_args(args[1:])
+
+    if parsed_args.binary is not None:
+        command_prefix = [str(parsed_args.binary.resolve())]
+    else:
+        command_prefix = [
+            sys.executable,
+            str(Path(__file__).parent.parent.parent / "EntryPoint" / "__main__.py"),
+        ]
+
+    scenarios = [
+        scenario
+        for scenario in SCENARIOS
+        if not parsed_args.scenario or scenario.name in parsed_args.scenario
+    ]
+
+    results: list[Result] = []
+
+    for num_repositories in (parsed_args.repos or [10, 1000]):
+        with FakeGitHubServer(num_repositories, latency=parsed_args.latency) as server:
+            for scenario in scenarios:
+                sys.stdout.write("{} ({} repositories)...".format(scenario.name, num_repositories))
+                sys.stdout.flush()
+
+                result = RunScenario(server, scenario, command_prefix)
+                results.append(result)
+
+                sys.stdout.write("{:.2f}s{}\n".format(result.seconds, "" if result.returncode == 0 else " (returncode: {})".format(result.returncode)))
+
+    sys.stdout.write("\n{}\n".format(CreateReport(results)))
+
+    # Failures are expected when validating (the synthetic repositories do not conform to all of the
+    # plugins); only display output for the scenarios that couldn't complete.
+    failures = [result for result in results if result.returncode < 0 or result.num_requests == 0]
+
+    for result in failures:
+        sys.stdout.write(
+            textwrap.dedent(
+                """\
+
+                {} ({} repositories)
+                {}
+                """,
+            ).format(
+                result.scenario.name,
+                result.num_repositories,
+                result.output,
+            ),
+        )
+
+    return -1 if failures else 0
+
+
+# ----------------------------------------------------------------------
+def RunScenario(
+    server: FakeGitHubServer,
+    scenario: Scenario,
+    command_prefix: list[str],
+) -> Result:
+    command_line = command_prefix + [
+        arg.format(
+            username=server.username,
+            repository=server.GetRepositoryName(0),
+            github_url=server.url,
+        )
+        for arg in scenario.args
+    ]
+
+    server.ResetRequestCounts()
+
+    with tempfile.TemporaryFile() as output:
+        start_time = time.perf_counter()
+
+        process = subprocess.Popen(
+            command_line,
+            stdout=output,
+            stderr=subprocess.STDOUT,
+        )
+
+        peak_rss_kb: Optional[int] = None
+
+        if hasattr(os, "wait4"):
+            # Collect the resource usage of this specific process (rather than all children)
+            _, status, resource_usage = os.wait4(process.pid, 0)
+
+            process.returncode = os.waitstatus_to_exitcode(status)
+
+            # 'ru_maxrss' is in bytes on macOS and kilobytes everywhere else
+            peak_rss_kb = resource_usage.ru_maxrss // (1024 if sys.platform == "darwin" else 1)
+        else:
+            process.wait()
+
+        seconds = time.perf_counter() - start_time
+
+        output.seek(0)
+        content = output.read().decode("utf-8", errors="replace")
+
+    return Result(
+        scenario,
+        server.num_repositories if scenario.processes_all_repositories else 1,
+        process.returncode,
+        seconds,
+        server.num_requests,
+        peak_rss_kb,
+        content,
+    )
+
+
+# ----------------------------------------------------------------------
+def CreateReport(
+    results: list[Result],
+) -> str:
+    rows: list[list[str]] = [
+        ["Scenario", "Repos", "Seconds", "Repos/Sec", "Requests", "Requests/Repo", "Peak RSS (MB)"],
+    ]
+
+    for result in results:
+        rows.append(
+            [
+                result.scenario.name,
+                str(result.num_repositories),
+                "{:.2f}".format(result.seconds),
+                "{:.1f}".format(result.repositories_per_second),
+                str(result.num_requests),
+                "{:.2f}".format(result.requests_per_repository),
+                "N/A" if result.peak_rss_kb is None else "{:.1f}".format(result.peak_rss_kb / 1024),
+            ],
+        )
+
+    col_widths = [max(len(row[index]) for row in rows) for index in range(len(rows[0]))]
+
+    lines: list[str] = []
+
+    for row_index, row in enumerate(rows):
+        lines.append(
+            "  ".join(
+                value.ljust(col_width) if col_index == 0 else value.rjust(col_width)
+                for col_index, (value, col_width) in enumerate(zip(row, col_widths))
+            ).rstrip(),
+        )
+
+        if row_index == 0:
+            lines.append("  ".join("-" * col_width for col_width in col_widths))
+
+    return "\n".join(lines)
+
+
+# ----------------------------------------------------------------------
+# ----------------------------------------------------------------------
+# ----------------------------------------------------------------------
+if __name__ == "__main__":
+    sys.exit(EntryPoint(sys.argv))
@@ -0,0 +1,629 @@
+# ----------------------------------------------------------------------
+# |
+# |  FakeGitHubServer.py
+# |
+# |  David Brownell <db@DavidBrownell.com>
+# |      2023-11-29 08:12:40
+# |
+# ----------------------------------------------------------------------
+# |
+# |  Copyright David Brownell 2023
+# |  Distributed under the Boost Software License, Version 1.0. See
+# |  accompanying file LICENSE_1_0.txt or copy at
+# |  http://www.boost.org/LICENSE_1_0.txt.
+# |
+# ----------------------------------------------------------------------
+"""\
+Local stand-in for the GitHub REST (and GraphQL) endpoints used by GitHubConfigurationValidator.
+
+The server generates a synthetic user/organization with a configurable number of repositories
+(repository settings, branch protection, pull requests, and workflow runs vary deterministically by
+repository index) and can delay each response to simulate network latency.
+"""
+
+# Note that this file may be invoked outside of an activated environment and cannot take a dependency
+# on anything in this repository or Common_Foundation.
+
+import argparse
+import hashlib
+import http.server
+import json
+import re
+import sys
+import threading
+import time
+
+from typing import Any, Optional
+from urllib.parse import parse_qs, urlparse
+
+
+# ----------------------------------------------------------------------
+# |
+# |  Public Types
+# |
+# ----------------------------------------------------------------------
+class FakeGitHubServer(object):
+    """Synthetic GitHub server; use as a context manager to start and stop the server"""
+
+    # ----------------------------------------------------------------------
+    # |
+    # |  Public Types
+    # |
+    # ----------------------------------------------------------------------
+    MIN_NUM_REPOSITORIES                    = 10
+    MAX_NUM_REPOSITORIES                    = 50000
+
+    DEFAULT_USERNAME                        = "benchmark"
+    DEFAULT_BRANCH                          = "main"
+
+    # ----------------------------------------------------------------------
+    # |
+    # |  Public Methods
+    # |
+    # ----------------------------------------------------------------------
+    def __init__(
+        self,
+        num_repositories: int,
+        *,
+        latency: float=0.0,                 # Number of seconds to wait before sending each response
+        port: int=0,                        # 0 to use any available port
+        username: str=DEFAULT_USERNAME,
+    ):
+        if not self.__class__.MIN_NUM_REPOSITORIES <= num_repositories <= self.__class__.MAX_NUM_REPOSITORIES:
+            raise Exception(
+                "The number of repositories must be between {} and {}.".format(
+                    self.__class__.MIN_NUM_REPOSITORIES,
+                    self.__class__.MAX_NUM_REPOSITORIES,
+                ),
+            )
+
+        if latency < 0.0:
+            raise Exception("The latency must be >= 0.0.")
+
+        self.num_repositories               = num_repositories
+        self.latency                        = latency
+        self.username                       = username
+
+        self._server                        = _Server(("127.0.0.1", port), _RequestHandler, self)
+        self._thread: Optional[threading.Thread]    = None
+
+        self._lock                          = threading.Lock()
+        self._request_counts: dict[str, int]        = {}
+
+    # ----------------------------------------------------------------------
+    def __enter__(self) -> "FakeGitHubServer":
+        self.Start()
+        return self
+
+    # ----------------------------------------------------------------------
+    def __exit__(self, *args) -> None:
+        self.Stop()
+
+    # ----------------------------------------------------------------------
+    @property
+    def url(self) -> str:
+        return "http://{}:{}".format(*self._server.server_address[:2])
+
+    # ----------------------------------------------------------------------
+    @property
+    def num_requests(self) -> int:
+        with self._lock:
+            return sum(self._request_counts.values())
+
+    # ----------------------------------------------------------------------
+    def Start(self) -> None:
+        assert self._thread is None
+
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+
+    # ----------------------------------------------------------------------
+    def Stop(self) -> None:
+        assert self._thread is not None
+
+        self._server.shutdown()
+        self._server.server_close()
+
+        self._thread.join()
+        self._thread = None
+
+    # ----------------------------------------------------------------------
+    def GetRequestCounts(self) -> dict[str, int]:
+        """Returns the number of requests received, keyed by endpoint (for example, 'GET /repos/{owner}/{repo}')"""
+
+        with self._lock:
+            return dict(self._request_counts)
+
+    # ----------------------------------------------------------------------
+    def ResetRequestCounts(self) -> None:
+        with self._lock:
+            self._request_counts.clear()
+
+    # ----------------------------------------------------------------------
+    def GetRepositoryName(
+        self,
+        index: int,
+    ) -> str:
+        return "repo{:05d}".format(index)
+
+    # ----------------------------------------------------------------------
+    # |
+    # |  Private Methods
+    # |
+    # ----------------------------------------------------------------------
+    def _OnRequest(
+        self,
+        endpoint: str,
+    ) -> None:
+        with self._lock:
+            self._request_counts[endpoint] = self._request_counts.get(endpoint, 0) + 1
+
+    # ----------------------------------------------------------------------
+    def _GetRepositoryIndex(
+        self,
+        owner: str,
+        name: str,
+    ) -> Optional[int]:
+        if owner != self.username:
+            return None
+
+        match = _REPOSITORY_NAME_REGEX.fullmatch(name)
+        if match is None:
+            return None
+
+        index = int(match.group("index"))
+        if index >= self.num_repositories:
+            return None
+
+        return index
+
+    # ----------------------------------------------------------------------
+    def _CreateRepository(
+        self,
+        index: int,
+    ) -> dict[str, Any]:
+        name = self.GetRepositoryName(index)
+
+        return {
+            "name": name,
+            "full_name": "{}/{}".format(self.username, name),
+            "owner": {"login": self.username},
+            "private": False,
+            "disabled": False,
+            "archived": index % 10 == 3,
+            "fork": index % 7 == 2,
+            "default_branch": self.__class__.DEFAULT_BRANCH,
+            "created_at": "2023-01-01T00:00:00Z",
+            "updated_at": "2023-11-01T00:00:00Z",
+            "pushed_at": "2023-11-01T00:00:00Z",
+            "allow_auto_merge": index % 2 == 0,
+            "delete_branch_on_merge": True,
+            "allow_merge_commit": True,
+            "merge_commit_message": "PR_TITLE",
+            "merge_commit_title": "MERGE_MESSAGE",
+            "allow_rebase_merge": False,
+            "allow_squash_merge": False,
+            "squash_merge_commit_message": "COMMIT_MESSAGES",
+            "squash_merge_commit_title": "COMMIT_OR_PR_TITLE",
+            "allow_update_branch": True,
+            "has_discussions": False,
+            "has_issues": True,
+            "has_projects": True,
+            "has_wiki": True,
+            "is_template": False,
+            "web_commit_signoff_required": True,
+            "license": {"name": "MIT License"} if index % 3 else None,
+            "security_and_analysis": {
+                "dependabot_security_updates": {"status": "enabled"},
+                "secret_scanning": {"status": "enabled"},
+                "secret_scanning_push_protection": {"status": "disabled"},
+            },
+        }
+
+    # ----------------------------------------------------------------------
+    @staticmethod
+    def _IsProtected(
+        index: int,
+    ) -> bool:
+        return index % 4 != 1
+
+    # ----------------------------------------------------------------------
+    def _CreateBranchProtection(
+        self,
+        index: int,
+    ) -> dict[str, Any]:
+        return {
+            "enforce_admins": {"enabled": True},
+            "allow_deletions": {"enabled": False},
+            "allow_force_pushes": {"enabled": False},
+            "lock_branch": {"enabled": False},
+            "required_conversation_resolution": {"enabled": True},
+            "required_linear_history": {"enabled": False},
+            "required_signatures": {"enabled": index % 5 == 0},
+            "required_pull_request_reviews": {
+                "required_approving_review_count": index % 3,
+                "require_code_owner_reviews": False,
+                "dismiss_stale_reviews": True,
+                "require_last_push_approval": True,
+            },
+            "required_status_checks": {
+                "strict": True,
+                "contexts": ["build"],
+                "checks": [{"context": "build", "app_id": None}],
+            },
+        }
+
+    # ----------------------------------------------------------------------
+    def _CreateGraphQLRepository(
+        self,
+        index: int,
+    ) -> dict[str, Any]:
+        repository = self._CreateRepository(index)
+
+        if self.__class__._IsProtected(index):
+            protection = self._CreateBranchProtection(index)
+            reviews = protection["required_pull_request_reviews"]
+
+            protection_rule: Optional[dict[str, Any]] = {
+                "isAdminEnforced": protection["enforce_admins"]["enabled"],
+                "allowsDeletions": protection["allow_deletions"]["enabled"],
+                "allowsForcePushes": protection["allow_force_pushes"]["enabled"],
+                "lockBranch": protection["lock_branch"]["enabled"],
+                "requiresConversationResolution": protection["required_conversation_resolution"]["enabled"],
+                "requiresLinearHistory": protection["required_linear_history"]["enabled"],
+                "requiresCommitSignatures": protection["required_signatures"]["enabled"],
+                "requiresApprovingReviews": True,
+                "requiredApprovingReviewCount": reviews["required_approving_review_count"],
+                "requiresCodeOwnerReviews": reviews["require_code_owner_reviews"],
+                "dismissesStaleReviews": reviews["dismiss_stale_reviews"],
+                "requireLastPushApproval": reviews["require_last_push_approval"],
+                "requiresStatusChecks": True,
+                "requiresStrictStatusChecks": protection["required_status_checks"]["strict"],
+                "requiredStatusChecks": [
+                    {"context": check["context"], "app": None}
+                    for check in protection["required_status_checks"]["checks"]
+                ],
+            }
+        else:
+            protection_rule = None
+
+        return {
+            "name": repository["name"],
+            "autoMergeAllowed": repository["allow_auto_merge"],
+            "deleteBranchOnMerge": repository["delete_branch_on_merge"],
+            "mergeCommitAllowed": repository["allow_merge_commit"],
+            "mergeCommitMessage": repository["merge_commit_message"],
+            "mergeCommitTitle": repository["merge_commit_title"],
+            "rebaseMergeAllowed": repository["allow_rebase_merge"],
+            "squashMergeAllowed": repository["allow_squash_merge"],
+            "squashMergeCommitMessage": repository["squash_merge_commit_message"],
+            "squashMergeCommitTitle": repository["squash_merge_commit_title"],
+            "allowUpdateBranch": repository["allow_update_branch"],
+            "hasDiscussionsEnabled": repository["has_discussions"],
+            "hasIssuesEnabled": repository["has_issues"],
+            "hasProjectsEnabled": repository["has_projects"],
+            "hasWikiEnabled": repository["has_wiki"],
+            "isTemplate": repository["is_template"],
+            "webCommitSignoffRequired": repository["web_commit_signoff_required"],
+            "defaultBranchRef": {
+                "name": self.__class__.DEFAULT_BRANCH,
+                "branchProtectionRule": protection_rule,
+            },
+        }
+
+
+# ----------------------------------------------------------------------
+# |
+# |  Public Functions
+# |
+# ----------------------------------------------------------------------
+def EntryPoint(
+    args: list[str],
+) -> int:
+    parser = argparse.ArgumentParser(description=__doc__, prog=args[0])
+
+    parser.add_argument("num_repositories", type=int, help="Number of repositories to generate.")
+    parser.add_argument("--latency", type=float, default=0.0, help="Number of seconds to wait before sending each response.")
+    parser.add_argument("--port", type=int, default=0, help="Port used by the server (0 to use any available port).")
+    parser.add_argument("--username", default=FakeGitHubServer.DEFAULT_USERNAME, help="Name of the synthetic user/organization.")
+
+    parsed_args = parser.parse_args(args[1:])
+
+    with FakeGitHubServer(
+        parsed_args.num_repositories,
+        latency=parsed_args.latency,
+        port=parsed_args.port,
+        username=parsed_args.username,
+    ) as server:
+        sys.stdout.write(
+            "Serving {} repositories for '{}' at '{}'; press Ctrl+C to exit.\n".format(
+                server.num_repositories,
+                server.username,
+                server.url,
+            ),
+        )
+        sys.stdout.flush()
+
+        try:
+            while True:
+                time.sleep(1)
+        except KeyboardInterrupt:
+            pass
+
+        sys.stdout.write(
+            "\n{}\n".format(
+                "\n".join(
+                    "{:>8}  {}".format(count, endpoint)
+                    for endpoint, count in sorted(server.GetRequestCounts().items())
+                ),
+            ),
+        )
+
+    return 0
+
+
+# ----------------------------------------------------------------------
+# ----------------------------------------------------------------------
+# ----------------------------------------------------------------------
+_REPOSITORY_NAME_REGEX                      = re.compile(r"repo(?P<index>\d+)")
+
+_PULL_REQUEST_SHA                           = "0123456789abcdef0123456789abcdef01234567"
+_WORKFLOW_ID                                = 1
+_WORKFLOW_RUN_ID                            = 7
+
+
+# ----------------------------------------------------------------------
+class _Server(http.server.ThreadingHTTPServer):
+    daemon_threads                          = True
+    request_queue_size                      = 256
+
+    # ----------------------------------------------------------------------
+    def __init__(
+        self,
+        server_address: tuple[str, int],
+        request_handler_class: type,
+        github: FakeGitHubServer,
+    ):
+        super(_Server, self).__init__(server_address, request_handler_class)
+
+        self.github                         = github
+
+
+# ----------------------------------------------------------------------
+class _RequestHandler(http.server.BaseHTTPRequestHandler):
+    protocol_version                        = "HTTP/1.1"
+
+    # ----------------------------------------------------------------------
+    def log_message(self, *args) -> None:  # pylint: disable=arguments-differ
+        # Don't write anything to stderr
+        pass
+
+    # ----------------------------------------------------------------------
+    def do_GET(self) -> None:  # pylint: disable=invalid-name
+        github = self._github
+        url = urlparse(self.path)
+        query = parse_qs(url.query)
+
+        page = int(query.get("page", ["1"])[0])
+        per_page = int(query.get("per_page", ["30"])[0])
+
+        # Repository listing
+        match = re.fullmatch(r"/(?P<type>users|orgs)/(?P<owner>[^/]+)/repos", url.path)
+        if match:
+            self._OnRequest("GET /{}/{{owner}}/repos".format(match.group("type")))
+
+            if match.group("owner") != github.username:
+                return self._SendNotFound()
+
+            start = (page - 1) * per_page
+            end = min(github.num_repositories, start + per_page)
+            last_page = max(1, (github.num_repositories + per_page - 1) // per_page)
+
+            headers: dict[str, str] = {}
+
+            if page < last_page:
+                link_template = "<{}{}?per_page={}&page={{}}>".format(github.url, url.path, per_page)
+
+                headers["Link"] = '{}; rel="next", {}; rel="last"'.format(
+                    link_template.format(page + 1),
+                    link_template.format(last_page),
+                )
+
+            return self._SendJson(
+                [github._CreateRepository(index) for index in range(start, end)],  # pylint: disable=protected-access
+                headers=headers,
+            )
+
+        # Repository endpoints
+        match = re.fullmatch(r"/repos/(?P<owner>[^/]+)/(?P<repo>[^/]+)(?P<remainder>/.*)?", url.path)
+        if match:
+            remainder = match.group("remainder") or ""
+
+            self._OnRequest(
+                "GET /repos/{{owner}}/{{repo}}{}".format(
+                    re.sub(r"/branches/[^/]+", "/branches/{branch}", remainder),
+                ),
+            )
+
+            index = github._GetRepositoryIndex(match.group("owner"), match.group("repo"))  # pylint: disable=protected-access
+            if index is None:
+                return self._SendNotFound()
+
+            if not remainder:
+                return self._SendJson(github._CreateRepository(index))  # pylint: disable=protected-access
+
+            match = re.fullmatch(r"/branches/(?P<branch>[^/]+)(?P<protection>/protection)?", remainder)
+            if match:
+                if match.group("branch") != FakeGitHubServer.DEFAULT_BRANCH:
+                    return self._SendNotFound("Branch not found")
+
+                is_protected = FakeGitHubServer._IsProtected(index)  # pylint: disable=protected-access
+
+                if match.group("protection"):
+                    if not is_protected:
+                        return self._SendNotFound("Branch not protected")
+
+                    return self._SendJson(github._CreateBranchProtection(index))  # pylint: disable=protected-access
+
+                return self._SendJson(
+                    {
+                        "name": match.group("branch"),
+                        "protected": is_protected,
+                        "protection_url": "{}{}/protection".format(github.url, url.path),
+                    },
+                )
+
+            # The remaining endpoints are paginated and return a single item on the first page
+            is_first_page = page == 1
+
+            if remainder == "/pulls":
+                return self._SendJson(
+                    [
+                        {
+                            "number": 1,
+                            "base": {"ref": FakeGitHubServer.DEFAULT_BRANCH},
+                            "head": {"sha": _PULL_REQUEST_SHA},
+                        },
+                    ] if is_first_page else [],
+                )
+
+            if remainder == "/actions/workflows":
+                return self._SendJson(
+                    {
+                        "workflows": [{"id": _WORKFLOW_ID, "name": "CI"}] if is_first_page else [],
+                    },
+                )
+
+            if remainder == "/actions/workflows/{}/runs".format(_WORKFLOW_ID):
+                return self._SendJson(
+                    {
+                        "workflow_runs": [
+                            {
+                                "id": _WORKFLOW_RUN_ID,
+                                "head_sha": _PULL_REQUEST_SHA,
+                                "created_at": "2023-11-01T00:00:00Z",
+                            },
+                        ] if is_first_page else [],
+                    },
+                )
+
+            if remainder == "/actions/runs/{}/jobs".format(_WORKFLOW_RUN_ID):
+                return self._SendJson(
+                    {
+                        "jobs": [{"name": "build"}] if is_first_page else [],
+                    },
+                )
+
+            return self._SendNotFound()
+
+        self._OnRequest("GET {}".format(url.path))
+        return self._SendNotFound()
+
+    # ----------------------------------------------------------------------
+    def do_POST(self) -> None:  # pylint: disable=invalid-name
+        github = self._github
+        url = urlparse(self.path)
+
+        content_length = int(self.headers.get("Content-Length", "0"))
+        content = self.rfile.read(content_length)
+
+        if not url.path.endswith("/graphql"):
+            self._OnRequest("POST {}".format(url.path))
+            return self._SendNotFound()
+
+        self._OnRequest("POST /graphql")
+
+        variables = json.loads(content).get("variables", {})
+
+        if variables.get("login", None) != github.username:
+            return self._SendJson({"data": {"repositoryOwner": None}})
+
+        start = int(variables.get("after", None) or 0)
+        end = min(github.num_repositories, start + int(variables.get("first", 100)))
+
+        return self._SendJson(
+            {
+                "data": {
+                    "repositoryOwner": {
+                        "repositories": {
+                            "pageInfo": {
+                                "hasNextPage": end < github.num_repositories,
+                                "endCursor": str(end),
+                            },
+                            "nodes": [
+                                github._CreateGraphQLRepository(index)  # pylint: disable=protected-access
+                                for index in range(start, end)
+                            ],
+                        },
+                    },
+                },
+            },
+            headers={"X-RateLimit-Resource": "graphql"},
+        )
+
+    # ----------------------------------------------------------------------
+    # ----------------------------------------------------------------------
+    # ----------------------------------------------------------------------
+    @property
+    def _github(self) -> FakeGitHubServer:
+        return self.server.github  # type: ignore
+
+    # ----------------------------------------------------------------------
+    def _OnRequest(
+        self,
+        endpoint: str,
+    ) -> None:
+        self._github._OnRequest(endpoint)  # pylint: disable=protected-access
+
+        if self._github.latency:
+            time.sleep(self._github.latency)
+
+    # ----------------------------------------------------------------------
+    def _SendNotFound(
+        self,
+        message: str="Not Found",
+    ) -> None:
+        self._SendJson({"message": message}, status_code=404)
+
+    # ----------------------------------------------------------------------
+    def _SendJson(
+        self,
+        content: Any,
+        *,
+        status_code: int=200,
+        headers: Optional[dict[str, str]]=None,
+    ) -> None:
+        encoded_content = json.dumps(content).encode("utf-8")
+        etag = '"{}"'.format(hashlib.sha1(encoded_content).hexdigest())
+
+        if status_code == 200 and self.headers.get("If-None-Match", None) == etag:
+            status_code = 304
+            encoded_content = b""
+
+        self.send_response(status_code)
+
+        all_headers = {
+            "Content-Type": "application/json; charset=utf-8",
+            "ETag": etag,
+            "X-RateLimit-Limit": "5000",
+            "X-RateLimit-Remaining": "4999",
+            "X-RateLimit-Reset": str(int(time.time()) + 3600),
+            "X-RateLimit-Resource": "core",
+        }
+
+        all_headers.update(headers or {})
+
+        for key, value in all_headers.items():
+            self.send_header(key, value)
+
+        self.send_header("Content-Length", str(len(encoded_content)))
+        self.end_headers()
+
+        self.wfile.write(encoded_content)
+
+
+# ----------------------------------------------------------------------
+# ----------------------------------------------------------------------
+# ----------------------------------------------------------------------
+if __name__ == "__main__":
+    sys.exit(EntryPoint(sys.argv))
@@ -0,0 +1,255 @@
+# ----------------------------------------------------------------------
+# |
+# |  StartupBenchmark.py
+# |
+# |  David Brownell <db@DavidBrownell.com>
+# |      2023-12-05 09:12:48
+# |
+# ----------------------------------------------------------------------
+# |
+# |  Copyright David Brownell 2023
+# |  Distributed under the Boost Software License, Version 1.0. See
+# |  accompanying file LICENSE_1_0.txt or copy at
+# |  http://www.boost.org/LICENSE_1_0.txt.
+# |
+# ----------------------------------------------------------------------
+"""\
+Startup time benchmarks for GitHubConfigurationValidator.
+
+Each scenario invokes a command that doesn't access GitHub multiple times and compares the median
+duration with the scenario's budget. When a source scenario exceeds its budget, the modules that
+took the longest to import are displayed.
+"""
+
+# Note that this file may be invoked outside of an activated environment and cannot take a dependency
+# on anything in this repository or Common_Foundation.
+
+import argparse
+import re
+import statistics
+import subprocess
+import sys
+import textwrap
+import time
+
+from dataclasses import dataclass
+from pathlib import Path
+
+
+# ----------------------------------------------------------------------
+# |
+# |  Public Types
+# |
+# ----------------------------------------------------------------------
+@dataclass(frozen=True)
+class Scenario(object):
+    """Tool invocation to benchmark"""
+
+    name: str
+    args: list[str]
+    budget: float                           # Maximum median duration (in seconds)
+
+
+# ----------------------------------------------------------------------
+@dataclass(frozen=True)
+class Result(object):
+    """Measurements for a scenario"""
+
+    scenario: Scenario
+    durations: list[float]
+    returncode: int
+    output: str
+
+    # ----------------------------------------------------------------------
+    @property
+    def median(self) -> float:
+        return statistics.median(self.durations)
+
+    @property
+    def is_within_budget(self) -> bool:
+        return self.returncode == 0 and self.median <= self.scenario.budget
+
+
+# ----------------------------------------------------------------------
+# |
+# |  Public Data
+# |
+# ----------------------------------------------------------------------
+SCENARIOS: list[Scenario]                   = [
+    Scenario("--help", ["--help"], 0.5),
+    Scenario("ValidateRepos --help", ["ValidateRepos", "--help"], 0.5),
+    Scenario("ListPlugins", ["ListPlugins"], 0.75),
+]
+
+
+# ----------------------------------------------------------------------
+# |
+# |  Public Functions
+# |
+# ----------------------------------------------------------------------
+def EntryPoint(
+    args: list[str],
+) -> int:
+    parser = argparse.ArgumentParser(description=__doc__, prog=args[0])
+
+    parser.add_argument("--iterations", type=int, default=10, help="Number of times that each scenario is invoked.")
+    parser.add_argument("--scenario", action="append", choices=[scenario.name for scenario in SCENARIOS], help="Scenario to run; may be provided multiple times (default: all scenarios).")
+    parser.add_argument("--budget-scale", type=float, default=1.0, help="Value multiplied by each scenario's budget (for example, '2.0' on slow machines).")
+    parser.add_argument("--binary", type=Path, help="GitHubConfigurationValidator binary to benchmark (default: the source in this repository).")
+
+    parsed_args = parser.parse_args(args[1:])
+
+    if parsed_args.binary is not None:
+        command_prefix = [str(parsed_args.binary.resolve())]
+    else:
+        command_prefix = [
+            sys.executable,
+            str(Path(__file__).parent.parent.parent / "EntryPoint" / "__main__.py"),
+        ]
+
+    scenarios = [
+        Scenario(scenario.name, scenario.args, scenario.budget * parsed_args.budget_scale)
+        for scenario in SCENARIOS
+        if not parsed_args.scenario or scenario.name in parsed_args.scenario
+    ]
+
+    results: list[Result] = []
+
+    for scenario in scenarios:
+        sys.stdout.write("{}...".format(scenario.name))
+        sys.stdout.flush()
+
+        result = RunScenario(scenario, command_prefix, parsed_args.iterations)
+        results.append(result)
+
+        sys.stdout.write("{:.3f}s{}\n".format(result.median, "" if result.returncode == 0 else " (returncode: {})".format(result.returncode)))
+
+    sys.stdout.write("\n{}\n".format(CreateReport(results)))
+
+    failures = [result for result in results if not result.is_within_budget]
+
+    for result in failures:
+        if result.returncode != 0 or parsed_args.binary is not None:
+            details = result.output
+        else:
+            details = GetSlowestImports(command_prefix + result.scenario.args)
+
+        sys.stdout.write(
+            textwrap.dedent(
+                """\
+
+                {} ({:.3f}s > {:.3f}s)
+                {}
+                """,
+            ).format(
+                result.scenario.name,
+                result.median,
+                result.scenario.budget,
+                details,
+            ),
+        )
+
+    return -1 if failures else 0
+
+
+# ----------------------------------------------------------------------
+def RunScenario(
+    scenario: Scenario,
+    command_prefix: list[str],
+    iterations: int,
+) -> Result:
+    command_line = command_prefix + scenario.args
+
+    # The first invocation isn't measured, as it may compile bytecode or create the plugin manifest
+    result = subprocess.run(command_line, capture_output=True, check=False)
+
+    durations: list[float] = []
+
+    for _ in range(iterations):
+        start_time = time.perf_counter()
+        result = subprocess.run(command_line, capture_output=True, check=False)
+        durations.append(time.perf_counter() - start_time)
+
+    return Result(
+        scenario,
+        durations,
+        result.returncode,
+        (result.stdout + result.stderr).decode("utf-8", errors="replace"),
+    )
+
+
+# ----------------------------------------------------------------------
+def GetSlowestImports(
+    command_line: list[str],
+    num_imports: int=15,
+) -> str:
+    """Returns the top-level modules with the highest cumulative import times (via `-X importtime`)"""
+
+    assert command_line[0] == sys.executable, command_line
+
+    result = subprocess.run(
+        [command_line[0], "-X", "importtime"] + command_line[1:],
+        capture_output=True,
+        check=False,
+    )
+
+    imports: list[tuple[int, str]] = []
+
+    for line in result.stderr.decode("utf-8", errors="replace").splitlines():
+        # Lines are in the form 'import time: <self us> | <cumulative us> | <indented module name>';
+        # only modules imported directly (rather than by other modules) are displayed.
+        match = re.match(r"^import time:\s+\d+\s+\|\s+(?P<cumulative>\d+)\s+\|\s(?P<name>\S.*)$", line)
+        if match:
+            imports.append((int(match.group("cumulative")), match.group("name")))
+
+    imports.sort(reverse=True)
+
+    return "\n".join(
+        "{:>10.1f}ms  {}".format(cumulative / 1000, name)
+        for cumulative, name in imports[:num_imports]
+    )
+
+
+# ----------------------------------------------------------------------
+def CreateReport(
+    results: list[Result],
+) -> str:
+    rows: list[list[str]] = [
+        ["Scenario", "Median", "Min", "Max", "Budget", "Status"],
+    ]
+
+    for result in results:
+        rows.append(
+            [
+                result.scenario.name,
+                "{:.3f}s".format(result.median),
+                "{:.3f}s".format(min(result.durations)),
+                "{:.3f}s".format(max(result.durations)),
+                "{:.3f}s".format(result.scenario.budget),
+                "OK" if result.is_within_budget else "FAILED",
+            ],
+        )
+
+    col_widths = [max(len(row[index]) for row in rows) for index in range(len(rows[0]))]
+
+    lines: list[str] = []
+
+    for row_index, row in enumerate(rows):
+        lines.append(
+            "  ".join(
+                value.ljust(col_width) if col_index == 0 else value.rjust(col_width)
+                for col_index, (value, col_width) in enumerate(zip(row, col_widths))
+            ).rstrip(),
+        )
+
+        if row_index == 0:
+            lines.append("  ".join("-" * col_width for col_width in col_widths))
+
+    return "\n".join(lines)
+
+
+# ----------------------------------------------------------------------
+# ----------------------------------------------------------------------
+# ----------------------------------------------------------------------
+if __name__ == "__main__":
+    sys.exit(EntryPoint(sys.argv))
@@ -0,0 +1,171 @@
+# ----------------------------------------------------------------------
+# |
+# |  Timings.py
+# |
+# |  David Brownell <db@DavidBrownell.com>
+# |      2023-11-30 09:05:21
+# |
+# ----------------------------------------------------------------------
+# |
+# |  Copyright David Brownell 2023
+# |  Distributed under the Boost Software License, Version 1.0. See
+# |  accompanying file LICENSE_1_0.txt or copy at
+# |  http://www.boost.org/LICENSE_1_0.txt.
+# |
+# ----------------------------------------------------------------------
+"""Contains the Timings object"""
+
+import math
+import re
+import threading
+import time
+
+from contextlib import contextmanager
+from enum import Enum
+from typing import Iterator
+from urllib.parse import urlparse
+
+from Common_Foundation import TextwrapEx
+
+
+# ----------------------------------------------------------------------
+class Timings(object):
+    """Collects the durations of requests sent to GitHub, plugin invocations, and command phases"""
+
+    # ----------------------------------------------------------------------
+    # |
+    # |  Public Types
+    # |
+    # ----------------------------------------------------------------------
+    class Category(Enum):
+        """Type of activity timed; the values are used as headers in the report"""
+
+        Phase                               = "Phases"
+        Endpoint                            = "Endpoints"
+        Plugin                              = "Plugins"
+
+    # ----------------------------------------------------------------------
+    # |
+    # |  Public Methods
+    # |
+    # ----------------------------------------------------------------------
+    def __init__(self):
+        self._lock                          = threading.Lock()
+        self._durations: dict[Timings.Category, dict[str, list[float]]]     = {
+            category: {} for category in Timings.Category
+        }
+
+    # ----------------------------------------------------------------------
+    @staticmethod
+    def CreateEndpointName(
+        method: str,
+        url: str,
+        github_url: str,
+    ) -> str:
+        """Returns the endpoint template associated with the url (for example, 'GET /repos/{owner}/{repo}')"""
+
+        path = urlparse(url).path
+
+        base_path = urlparse(github_url).path.rstrip("/")
+        if base_path and path.startswith(base_path):
+            path = path[len(base_path):]
+
+        for regex, replacement in _ENDPOINT_REPLACEMENTS:
+            path = regex.sub(replacement, path)
+
+        return "{} {}".format(method.upper(), path)
+
+    # ----------------------------------------------------------------------
+    def Add(
+        self,
+        category: "Timings.Category",
+        name: str,
+        seconds: float,
+    ) -> None:
+        with self._lock:
+            self._durations[category].setdefault(name, []).append(seconds)
+
+    # ----------------------------------------------------------------------
+    @contextmanager
+    def YieldTimer(
+        self,
+        category: "Timings.Category",
+        name: str,
+    ) -> Iterator[None]:
+        start_time = time.perf_counter()
+
+        try:
+            yield
+        finally:
+            self.Add(category, name, time.perf_counter() - start_time)
+
+    # ----------------------------------------------------------------------
+    def GenerateReport(self) -> str:
+        """Returns a table with the call counts, total, p50, p95, and max durations for each item"""
+
+        with self._lock:
+            durations = {
+                category: {name: sorted(values) for name, values in items.items()}
+                for category, items in self._durations.items()
+            }
+
+        sections: list[str] = []
+
+        for category in Timings.Category:
+            items = durations[category]
+            if not items:
+                continue
+
+            rows: list[list[str]] = []
+
+            for name, values in sorted(items.items(), key=lambda item: sum(item[1]), reverse=True):
+                rows.append(
+                    [
+                        name,
+                        str(len(values)),
+                        _FormatDuration(sum(values)),
+                        _FormatDuration(_GetPercentile(values, 0.50)),
+                        _FormatDuration(_GetPercentile(values, 0.95)),
+                        _FormatDuration(values[-1]),
+                    ],
+                )
+
+            sections.append(
+                TextwrapEx.CreateTable(
+                    [category.value, "Count", "Total", "p50", "p95", "Max"],
+                    rows,
+                    [TextwrapEx.Justify.Left] + [TextwrapEx.Justify.Right] * 5,
+                ),
+            )
+
+        return "\n\n".join(sections)
+
+
+# ----------------------------------------------------------------------
+# ----------------------------------------------------------------------
+# ----------------------------------------------------------------------
+_ENDPOINT_REPLACEMENTS: list[tuple[re.Pattern, str]]    = [
+    (re.compile(r"^/(users|orgs)/[^/]+"), r"/\1/{owner}"),
+    (re.compile(r"^/repos/[^/]+/[^/]+"), "/repos/{owner}/{repo}"),
+    (re.compile(r"/branches/[^/]+"), "/branches/{branch}"),
+    (re.compile(r"/\d+(?=/|$)"), "/{id}"),
+]
+
+
+# ----------------------------------------------------------------------
+def _FormatDuration(
+    seconds: float,
+) -> str:
+    if seconds < 1.0:
+        return "{:.3f}ms".format(seconds * 1000)
+
+    return "{:.3f}s".format(seconds)
+
+
+# ----------------------------------------------------------------------
+def _GetPercentile(
+    sorted_values: list[float],
+    percentile: float,
+) -> float:
+    # Nearest-rank method
+    return sorted_values[max(0, math.ceil(percentile * len(sorted_values)) - 1)]
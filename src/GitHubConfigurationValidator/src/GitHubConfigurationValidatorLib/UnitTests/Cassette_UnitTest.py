@@ -0,0 +1,135 @@
+# ----------------------------------------------------------------------
+# |
+# |  Cassette_UnitTest.py
+# |
+# |  David Brownell <db@DavidBrownell.com>
+# |      2023-12-11 13:06:48
+# |
+# ----------------------------------------------------------------------
+# |
+# |  Copyright David Brownell 2023
+# |  Distributed under the Boost Software License, Version 1.0. See
+# |  accompanying file LICENSE_1_0.txt or copy at
+# |  http://www.boost.org/LICENSE_1_0.txt.
+# |
+# ----------------------------------------------------------------------
+"""Unit tests for Cassette.py"""
+
+import gzip
+import json
+import sys
+
+from pathlib import Path
+
+import pytest
+
+from Common_Foundation.ContextlibEx import ExitStack
+from Common_Foundation import PathEx
+
+
+# ----------------------------------------------------------------------
+sys.path.insert(0, str(PathEx.EnsureDir(Path(__file__).parent.parent.parent)))
+with ExitStack(lambda: sys.path.pop(0)):
+    from GitHubConfigurationValidatorLib.Cassette import Cassette
+    from GitHubConfigurationValidatorLib.Impl.ResponseImpl import CreateResponse
+
+
+# ----------------------------------------------------------------------
+_URL                                        = "https://api.github.com/repos/owner/repo"
+
+
+# ----------------------------------------------------------------------
+def test_CreateKey():
+    key = Cassette.CreateKey("get", _URL, {"page": 2})
+
+    assert key.startswith("GET {}?page=2 ".format(_URL))
+    assert key == Cassette.CreateKey("GET", _URL + "?page=2")
+
+    # The body is a part of the key
+    assert Cassette.CreateKey("POST", _URL, json={"value": 1}) != Cassette.CreateKey("POST", _URL, json={"value": 2})
+    assert Cassette.CreateKey("POST", _URL, json={"value": 1}) == Cassette.CreateKey("POST", _URL, json={"value": 1})
+    assert Cassette.CreateKey("POST", _URL, data="value") != Cassette.CreateKey("POST", _URL)
+
+
+# ----------------------------------------------------------------------
+def test_RecordAndReplay(tmp_path):
+    filename = tmp_path / "Dir" / "Cassette.json.gz"
+
+    key1 = Cassette.CreateKey("GET", _URL)
+    key2 = Cassette.CreateKey("GET", _URL + "/branches")
+
+    recorder = Cassette.CreateRecorder(filename)
+
+    recorder.Record(key1, CreateResponse(_URL, 200, {"ETag": '"1"', "Content-Length": "5"}, b"first"))
+    recorder.Record(key2, CreateResponse(_URL + "/branches", 404, {}, b"[]"))
+    recorder.Record(key1, CreateResponse(_URL, 200, {"ETag": '"2"'}, b"second"))
+
+    assert recorder.num_requests == 3
+    assert recorder.GetStatisticsString() == "Cassette: recorded 3 request(s) ('{}').\n".format(filename)
+
+    recorder.Save()
+
+    # Interactions are saved in the order in which they were recorded
+    with gzip.open(filename, "rt", encoding="utf-8") as f:
+        content = json.load(f)
+
+    assert content["version"] == Cassette.FILE_FORMAT_VERSION
+    assert [item["key"] for item in content["interactions"]] == [key1, key2, key1]
+
+    player = Cassette.Load(filename, latency=0.5)
+
+    assert player.mode == Cassette.Mode.Replay
+    assert player.latency == 0.5
+
+    response = player.Replay(key1)
+
+    assert response.status_code == 200
+    assert response.url == _URL
+    assert response.content == b"first"
+    assert response.headers["ETag"] == '"1"'
+    assert "Content-Length" not in response.headers
+
+    response = player.Replay(key2)
+
+    assert response.status_code == 404
+    assert response.json() == []
+
+    assert player.Replay(key1).content == b"second"
+
+    # The last response is repeated
+    assert player.Replay(key1).content == b"second"
+
+    assert player.num_requests == 4
+    assert player.GetStatisticsString() == "Cassette: replayed 4 request(s) ('{}').\n".format(filename)
+
+    with pytest.raises(Exception, match="was not found in the cassette"):
+        player.Replay(Cassette.CreateKey("GET", _URL + "/other"))
+
+
+# ----------------------------------------------------------------------
+def test_InvalidFile(tmp_path):
+    filename = tmp_path / "Cassette.json.gz"
+
+    with gzip.open(filename, "wt", encoding="utf-8") as f:
+        json.dump({"version": Cassette.FILE_FORMAT_VERSION + 1, "interactions": []}, f)
+
+    with pytest.raises(Exception, match="is not a supported cassette file"):
+        Cassette.Load(filename)
+
+
+# ----------------------------------------------------------------------
+def test_InvalidMode(tmp_path):
+    recorder = Cassette.CreateRecorder(tmp_path / "Cassette.json.gz")
+
+    with pytest.raises(AssertionError):
+        recorder.Replay(Cassette.CreateKey("GET", _URL))
+
+    recorder.Save()
+
+    player = Cassette.Load(tmp_path / "Cassette.json.gz")
+
+    with pytest.raises(AssertionError):
+        player.Record(Cassette.CreateKey("GET", _URL), CreateResponse(_URL, 200, {}, b""))
+
+    with pytest.raises(AssertionError):
+        player.Save()
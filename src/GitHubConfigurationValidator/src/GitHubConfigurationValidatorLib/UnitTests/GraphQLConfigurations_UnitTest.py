@@ -0,0 +1,439 @@
+# ----------------------------------------------------------------------
+# |
+# |  GraphQLConfigurations_UnitTest.py
+# |
+# |  David Brownell <db@DavidBrownell.com>
+# |      2023-12-14 08:42:19
+# |
+# ----------------------------------------------------------------------
+# |
+# |  Copyright David Brownell 2023
+# |  Distributed under the Boost Software License, Version 1.0. See
+# |  accompanying file LICENSE_1_0.txt or copy at
+# |  http://www.boost.org/LICENSE_1_0.txt.
+# |
+# ----------------------------------------------------------------------
+"""Unit tests for GraphQLConfigurations.py"""
+
+import asyncio
+import copy
+import sys
+import threading
+
+from pathlib import Path
+from typing import Any, Optional
+from unittest import mock
+
+import pytest
+
+from Common_Foundation.ContextlibEx import ExitStack
+from Common_Foundation import PathEx
+
+
+# ----------------------------------------------------------------------
+sys.path.insert(0, str(PathEx.EnsureDir(Path(__file__).parent.parent.parent)))
+with ExitStack(lambda: sys.path.pop(0)):
+    from GitHubConfigurationValidatorLib import GraphQLConfigurations
+    from GitHubConfigurationValidatorLib.Plugin import Plugin
+
+
+# ----------------------------------------------------------------------
+# Payloads in the form returned by the GraphQL API for the query in GraphQLConfigurations.py
+_REPOSITORY_NODE: dict[str, Any]            = {
+    "name": "Repo",
+    "autoMergeAllowed": True,
+    "deleteBranchOnMerge": False,
+    "mergeCommitAllowed": False,
+    "mergeCommitMessage": "PR_BODY",
+    "mergeCommitTitle": "PR_TITLE",
+    "rebaseMergeAllowed": False,
+    "squashMergeAllowed": True,
+    "squashMergeCommitMessage": "COMMIT_MESSAGES",
+    "squashMergeCommitTitle": "COMMIT_OR_PR_TITLE",
+    "allowUpdateBranch": True,
+    "hasDiscussionsEnabled": False,
+    "hasIssuesEnabled": True,
+    "hasProjectsEnabled": False,
+    "hasWikiEnabled": False,
+    "isTemplate": False,
+    "webCommitSignoffRequired": True,
+    "defaultBranchRef": None,
+}
+
+_BRANCH_PROTECTION_RULE: dict[str, Any]     = {
+    "isAdminEnforced": True,
+    "allowsDeletions": False,
+    "allowsForcePushes": False,
+    "lockBranch": False,
+    "requiresConversationResolution": True,
+    "requiresLinearHistory": True,
+    "requiresCommitSignatures": False,
+    "requiresApprovingReviews": False,
+    "requiredApprovingReviewCount": None,
+    "requiresCodeOwnerReviews": False,
+    "dismissesStaleReviews": False,
+    "requireLastPushApproval": False,
+    "requiresStatusChecks": False,
+    "requiresStrictStatusChecks": False,
+    "requiredStatusChecks": [],
+}
+
+# The values that are always present in the REST-shaped branch protection information for the rule above
+_BRANCH_PROTECTION: dict[str, Any]          = {
+    "enforce_admins": {"enabled": True},
+    "allow_deletions": {"enabled": False},
+    "allow_force_pushes": {"enabled": False},
+    "lock_branch": {"enabled": False},
+    "required_conversation_resolution": {"enabled": True},
+    "required_linear_history": {"enabled": True},
+    "required_signatures": {"enabled": False},
+}
+
+_ALL_CONFIGURATION_TYPES                    = {
+    Plugin.ConfigurationType.Repository,
+    Plugin.ConfigurationType.Branch,
+    Plugin.ConfigurationType.BranchProtection,
+}
+
+
+# ----------------------------------------------------------------------
+def _CreateNode(
+    name: str,
+    branch_name: Optional[str]="main",
+    protection_rule: Optional[dict[str, Any]]=None,
+) -> dict[str, Any]:
+    node = copy.deepcopy(_REPOSITORY_NODE)
+
+    node["name"] = name
+
+    if branch_name is not None:
+        node["defaultBranchRef"] = {
+            "name": branch_name,
+            "branchProtectionRule": protection_rule,
+        }
+
+    return node
+
+
+# ----------------------------------------------------------------------
+def test_CreateRepositoryConfiguration():
+    assert GraphQLConfigurations._CreateRepositoryConfiguration(_REPOSITORY_NODE) == {
+        "name": "Repo",
+        "allow_auto_merge": True,
+        "delete_branch_on_merge": False,
+        "allow_merge_commit": False,
+        "merge_commit_message": "PR_BODY",
+        "merge_commit_title": "PR_TITLE",
+        "allow_rebase_merge": False,
+        "allow_squash_merge": True,
+        "squash_merge_commit_message": "COMMIT_MESSAGES",
+        "squash_merge_commit_title": "COMMIT_OR_PR_TITLE",
+        "allow_update_branch": True,
+        "has_discussions": False,
+        "has_issues": True,
+        "has_projects": False,
+        "has_wiki": False,
+        "is_template": False,
+        "web_commit_signoff_required": True,
+    }
+
+
+# ----------------------------------------------------------------------
+class TestCreateBranchProtectionConfiguration(object):
+    # ----------------------------------------------------------------------
+    def test_Standard(self):
+        # The REST API doesn't include reviews or status checks when they are not required
+        assert GraphQLConfigurations._CreateBranchProtectionConfiguration(_BRANCH_PROTECTION_RULE) == _BRANCH_PROTECTION
+
+    # ----------------------------------------------------------------------
+    def test_RequiredPullRequestReviews(self):
+        rule = {
+            **_BRANCH_PROTECTION_RULE,
+            "requiresApprovingReviews": True,
+            "requiredApprovingReviewCount": 2,
+            "requiresCodeOwnerReviews": True,
+            "dismissesStaleReviews": False,
+            "requireLastPushApproval": True,
+        }
+
+        assert GraphQLConfigurations._CreateBranchProtectionConfiguration(rule) == {
+            **_BRANCH_PROTECTION,
+            "required_pull_request_reviews": {
+                "required_approving_review_count": 2,
+                "require_code_owner_reviews": True,
+                "dismiss_stale_reviews": False,
+                "require_last_push_approval": True,
+            },
+        }
+
+    # ----------------------------------------------------------------------
+    def test_RequiredPullRequestReviewsWithoutCount(self):
+        rule = {
+            **_BRANCH_PROTECTION_RULE,
+            "requiresApprovingReviews": True,
+            "requiredApprovingReviewCount": None,
+        }
+
+        assert GraphQLConfigurations._CreateBranchProtectionConfiguration(rule)["required_pull_request_reviews"] == {
+            "required_approving_review_count": 0,
+            "require_code_owner_reviews": False,
+            "dismiss_stale_reviews": False,
+            "require_last_push_approval": False,
+        }
+
+    # ----------------------------------------------------------------------
+    def test_RequiredStatusChecks(self):
+        rule = {
+            **_BRANCH_PROTECTION_RULE,
+            "requiresStatusChecks": True,
+            "requiresStrictStatusChecks": True,
+            "requiredStatusChecks": [
+                {"context": "ci/build", "app": {"databaseId": 15368}},
+                {"context": "ci/lint", "app": None},
+            ],
+        }
+
+        assert GraphQLConfigurations._CreateBranchProtectionConfiguration(rule) == {
+            **_BRANCH_PROTECTION,
+            "required_status_checks": {
+                "strict": True,
+                "contexts": ["ci/build", "ci/lint"],
+                "checks": [
+                    {"context": "ci/build", "app_id": 15368},
+                    {"context": "ci/lint", "app_id": None},
+                ],
+            },
+        }
+
+    # ----------------------------------------------------------------------
+    def test_RequiredStatusChecksWithoutChecks(self):
+        rule = {
+            **_BRANCH_PROTECTION_RULE,
+            "requiresStatusChecks": True,
+            "requiredStatusChecks": None,
+        }
+
+        assert GraphQLConfigurations._CreateBranchProtectionConfiguration(rule)["required_status_checks"] == {
+            "strict": False,
+            "contexts": [],
+            "checks": [],
+        }
+
+
+# ----------------------------------------------------------------------
+class TestCreateConfigurations(object):
+    # ----------------------------------------------------------------------
+    def test_Protected(self):
+        configurations = GraphQLConfigurations._CreateConfigurations(
+            _CreateNode("Repo", "main", _BRANCH_PROTECTION_RULE),
+            _ALL_CONFIGURATION_TYPES,
+        )
+
+        assert configurations == {
+            Plugin.ConfigurationType.Repository: GraphQLConfigurations._CreateRepositoryConfiguration(_REPOSITORY_NODE),
+            Plugin.ConfigurationType.Branch: {"name": "main", "protected": True},
+            Plugin.ConfigurationType.BranchProtection: _BRANCH_PROTECTION,
+        }
+
+    # ----------------------------------------------------------------------
+    def test_Unprotected(self):
+        configurations = GraphQLConfigurations._CreateConfigurations(
+            _CreateNode("Repo", "develop"),
+            _ALL_CONFIGURATION_TYPES,
+        )
+
+        assert configurations[Plugin.ConfigurationType.Branch] == {"name": "develop", "protected": False}
+        assert configurations[Plugin.ConfigurationType.BranchProtection] is None
+
+    # ----------------------------------------------------------------------
+    def test_EmptyRepository(self):
+        # Empty repositories don't have a default branch
+        configurations = GraphQLConfigurations._CreateConfigurations(
+            _CreateNode("Repo", None),
+            _ALL_CONFIGURATION_TYPES,
+        )
+
+        assert configurations == {
+            Plugin.ConfigurationType.Repository: GraphQLConfigurations._CreateRepositoryConfiguration(_REPOSITORY_NODE),
+            Plugin.ConfigurationType.Branch: None,
+            Plugin.ConfigurationType.BranchProtection: None,
+        }
+
+    # ----------------------------------------------------------------------
+    def test_ConfigurationTypes(self):
+        node = _CreateNode("Repo", "main", _BRANCH_PROTECTION_RULE)
+
+        # Only the requested configurations are created
+        assert GraphQLConfigurations._CreateConfigurations(node, set()) == {}
+
+        assert GraphQLConfigurations._CreateConfigurations(node, {Plugin.ConfigurationType.Branch}) == {
+            Plugin.ConfigurationType.Branch: {"name": "main", "protected": True},
+        }
+
+        assert GraphQLConfigurations._CreateConfigurations(node, {Plugin.ConfigurationType.BranchProtection}) == {
+            Plugin.ConfigurationType.BranchProtection: _BRANCH_PROTECTION,
+        }
+
+
+# ----------------------------------------------------------------------
+class TestGetConfigurations(object):
+    # ----------------------------------------------------------------------
+    @staticmethod
+    def _CreateSession(
+        *contents: dict[str, Any],
+    ) -> mock.MagicMock:
+        session = mock.MagicMock()
+
+        session.graphql_url = "https://api.github.com/graphql"
+        session.github_username = "owner"
+        session.post.return_value.json.side_effect = list(contents)
+
+        return session
+
+    # ----------------------------------------------------------------------
+    @staticmethod
+    def _CreatePage(
+        nodes: list[dict[str, Any]],
+        end_cursor: Optional[str]=None,
+    ) -> dict[str, Any]:
+        return {
+            "data": {
+                "repositoryOwner": {
+                    "repositories": {
+                        "pageInfo": {
+                            "hasNextPage": end_cursor is not None,
+                            "endCursor": end_cursor,
+                        },
+                        "nodes": nodes,
+                    },
+                },
+            },
+        }
+
+    # ----------------------------------------------------------------------
+    def test_Pages(self):
+        session = self._CreateSession(
+            self._CreatePage([_CreateNode("Repo1"), _CreateNode("Repo2", None)], "cursor1"),
+            self._CreatePage([_CreateNode("Repo3", "main", _BRANCH_PROTECTION_RULE)]),
+        )
+
+        pages: list[list[str]] = []
+
+        results = GraphQLConfigurations.GetConfigurations(
+            session,
+            {Plugin.ConfigurationType.Branch},
+            page_size=2,
+            on_page_func=lambda configurations: pages.append(list(configurations.keys())),
+        )
+
+        assert results == {
+            "Repo1": {Plugin.ConfigurationType.Branch: {"name": "main", "protected": False}},
+            "Repo2": {Plugin.ConfigurationType.Branch: None},
+            "Repo3": {Plugin.ConfigurationType.Branch: {"name": "main", "protected": True}},
+        }
+
+        assert pages == [["Repo1", "Repo2"], ["Repo3"]]
+
+        # The cursor of the previous page is provided when requesting the next page
+        assert [call.kwargs["json"]["variables"] for call in session.post.call_args_list] == [
+            {"login": "owner", "first": 2, "after": None},
+            {"login": "owner", "first": 2, "after": "cursor1"},
+        ]
+
+    # ----------------------------------------------------------------------
+    def test_Errors(self):
+        session = self._CreateSession({"errors": [{"message": "First"}, {"type": "Second"}]})
+
+        with pytest.raises(Exception, match="GraphQL errors were encountered: First; {'type': 'Second'}"):
+            GraphQLConfigurations.GetConfigurations(session, _ALL_CONFIGURATION_TYPES)
+
+    # ----------------------------------------------------------------------
+    def test_UnknownOwner(self):
+        session = self._CreateSession({"data": {"repositoryOwner": None}})
+
+        with pytest.raises(Exception, match="The user/organization 'owner' was not found."):
+            GraphQLConfigurations.GetConfigurations(session, _ALL_CONFIGURATION_TYPES)
+
+
+# ----------------------------------------------------------------------
+class TestPublishedConfigurations(object):
+    # ----------------------------------------------------------------------
+    def test_Get(self):
+        published = GraphQLConfigurations.PublishedConfigurations()
+
+        configurations = {Plugin.ConfigurationType.Branch: None}
+        results: dict[str, Any] = {}
+
+        # ----------------------------------------------------------------------
+        def Get(
+            repository_name: str,
+        ) -> None:
+            results[repository_name] = published.Get(repository_name)
+
+        # ----------------------------------------------------------------------
+
+        threads = [
+            threading.Thread(target=Get, args=(repository_name, ))
+            for repository_name in ["Repo1", "Missing"]
+        ]
+
+        for thread in threads:
+            thread.start()
+
+        # Both threads wait until the page that contains their repository has been published
+        published.Publish({"Repo1": configurations})
+
+        threads[0].join(5)
+        assert not threads[0].is_alive()
+        assert results == {"Repo1": configurations}
+
+        # A repository that isn't published is not available until everything has been published
+        threads[1].join(0.1)
+        assert threads[1].is_alive()
+
+        published.Complete()
+
+        threads[1].join(5)
+        assert not threads[1].is_alive()
+        assert results == {"Repo1": configurations, "Missing": None}
+
+        # Published repositories are available immediately
+        assert published.Get("Repo1") == configurations
+        assert published.Get("Missing") is None
+
+    # ----------------------------------------------------------------------
+    def test_GetAsync(self):
+        configurations = {Plugin.ConfigurationType.Branch: None}
+
+        # ----------------------------------------------------------------------
+        async def Impl():
+            published = GraphQLConfigurations.PublishedConfigurations(asyncio.get_running_loop())
+
+            repo_task = asyncio.create_task(published.GetAsync("Repo1"))
+            missing_task = asyncio.create_task(published.GetAsync("Missing"))
+
+            await asyncio.sleep(0.05)
+            assert not repo_task.done()
+
+            # Configurations are published from another thread
+            await asyncio.to_thread(published.Publish, {"Repo1": configurations})
+
+            assert await asyncio.wait_for(repo_task, 5) == configurations
+
+            await asyncio.sleep(0.05)
+            assert not missing_task.done()
+
+            await asyncio.to_thread(published.Complete)
+
+            assert await asyncio.wait_for(missing_task, 5) is None
+
+        # ----------------------------------------------------------------------
+
+        asyncio.run(Impl())
+
+    # ----------------------------------------------------------------------
+    def test_GetAsyncWithoutLoop(self):
+        published = GraphQLConfigurations.PublishedConfigurations()
+
+        with pytest.raises(AssertionError, match="A loop must be provided to use GetAsync"):
+            asyncio.run(published.GetAsync("Repo"))
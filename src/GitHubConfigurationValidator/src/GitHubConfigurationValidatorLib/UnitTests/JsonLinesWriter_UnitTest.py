@@ -0,0 +1,160 @@
+# ----------------------------------------------------------------------
+# |
+# |  JsonLinesWriter_UnitTest.py
+# |
+# |  David Brownell <db@DavidBrownell.com>
+# |      2023-12-11 15:52:30
+# |
+# ----------------------------------------------------------------------
+# |
+# |  Copyright David Brownell 2023
+# |  Distributed under the Boost Software License, Version 1.0. See
+# |  accompanying file LICENSE_1_0.txt or copy at
+# |  http://www.boost.org/LICENSE_1_0.txt.
+# |
+# ----------------------------------------------------------------------
+"""Unit tests for JsonLinesWriter.py"""
+
+import json
+import sys
+import threading
+
+from pathlib import Path
+
+import pytest
+
+from Common_Foundation.ContextlibEx import ExitStack
+from Common_Foundation import PathEx
+
+
+# ----------------------------------------------------------------------
+sys.path.insert(0, str(PathEx.EnsureDir(Path(__file__).parent.parent.parent)))
+with ExitStack(lambda: sys.path.pop(0)):
+    from GitHubConfigurationValidatorLib.Finding import Finding
+    from GitHubConfigurationValidatorLib.JsonLinesWriter import JsonLinesWriter
+    from GitHubConfigurationValidatorLib.Plugin import Plugin
+
+
+# ----------------------------------------------------------------------
+_FINDINGS                                   = [
+    Finding("One", Plugin.MessageType.Error, "Error message"),
+    Finding("Two", Plugin.MessageType.Warning, "Warning message (ünicode)"),
+    Finding("Three", Plugin.MessageType.Info, "Info message"),
+    Finding("Four", Plugin.MessageType.Error, "Another error\nwith multiple lines"),
+]
+
+
+# ----------------------------------------------------------------------
+def test_Write(tmp_path):
+    filename = tmp_path / "Dir" / "Results.jsonl"
+
+    writer = JsonLinesWriter(filename)
+
+    try:
+        writer.WriteRepository("Repo1", -1, _FINDINGS)
+
+        # Records are flushed as each repository is written
+        assert len(filename.read_text(encoding="utf-8").splitlines()) == 5
+
+        writer.WriteRepository("Repo2", 0, [], is_replayed=True)
+
+        assert writer.GetStatisticsString() == "JSON Lines output: 2 repositories, 4 findings written to '{}'.\n".format(filename)
+
+    finally:
+        writer.Close()
+
+    records = [json.loads(line) for line in filename.read_text(encoding="utf-8").splitlines()]
+
+    assert records == [
+        {"record": "finding", "repository": "Repo1", "plugin": "One", "type": "Error", "message": "Error message"},
+        {"record": "finding", "repository": "Repo1", "plugin": "Two", "type": "Warning", "message": "Warning message (ünicode)"},
+        {"record": "finding", "repository": "Repo1", "plugin": "Three", "type": "Info", "message": "Info message"},
+        {"record": "finding", "repository": "Repo1", "plugin": "Four", "type": "Error", "message": "Another error\nwith multiple lines"},
+        {"record": "repository", "repository": "Repo1", "returncode": -1, "errors": 2, "warnings": 1, "infos": 1, "replayed": False},
+        {"record": "repository", "repository": "Repo2", "returncode": 0, "errors": 0, "warnings": 0, "infos": 0, "replayed": True},
+    ]
+
+    assert JsonLinesWriter.Load(filename) == {
+        "Repo1": _FINDINGS,
+        "Repo2": [],
+    }
+
+
+# ----------------------------------------------------------------------
+def test_NotInterleaved(tmp_path):
+    filename = tmp_path / "Results.jsonl"
+
+    writer = JsonLinesWriter(filename)
+
+    try:
+        # ----------------------------------------------------------------------
+        def Write(
+            index: int,
+        ) -> None:
+            for repository_index in range(20):
+                writer.WriteRepository("Repo{}_{}".format(index, repository_index), -1, _FINDINGS)
+
+        # ----------------------------------------------------------------------
+
+        threads = [threading.Thread(target=Write, args=(index, )) for index in range(8)]
+
+        for thread in threads:
+            thread.start()
+
+        for thread in threads:
+            thread.join()
+
+    finally:
+        writer.Close()
+
+    records = [json.loads(line) for line in filename.read_text(encoding="utf-8").splitlines()]
+
+    assert len(records) == 8 * 20 * (len(_FINDINGS) + 1)
+
+    for index in range(0, len(records), len(_FINDINGS) + 1):
+        group = records[index:index + len(_FINDINGS) + 1]
+
+        assert len({record["repository"] for record in group}) == 1
+        assert [record["record"] for record in group] == ["finding"] * len(_FINDINGS) + ["repository"]
+
+
+# ----------------------------------------------------------------------
+def test_LoadInterrupted(tmp_path):
+    filename = tmp_path / "Results.jsonl"
+
+    writer = JsonLinesWriter(filename)
+
+    try:
+        writer.WriteRepository("Repo1", -1, _FINDINGS[:1])
+    finally:
+        writer.Close()
+
+    # Findings without a repository record were written by a run that was interrupted
+    with filename.open("a", encoding="utf-8") as f:
+        f.write(json.dumps({"record": "finding", "repository": "Repo2", **_FINDINGS[1].ToJson()}))
+        f.write("\n\n")
+
+    assert JsonLinesWriter.Load(filename) == {"Repo1": _FINDINGS[:1]}
+
+
+# ----------------------------------------------------------------------
+@pytest.mark.parametrize(
+    "content",
+    [
+        "not json\n",
+        '{"repository": "Repo"}\n',
+        '{"record": "finding", "repository": "Repo", "plugin": "One", "type": "Unknown", "message": ""}\n',
+    ],
+)
+def test_LoadInvalid(tmp_path, content):
+    filename = tmp_path / "Results.jsonl"
+    filename.write_text(content, encoding="utf-8")
+
+    with pytest.raises(Exception, match="is not a valid JSON Lines results file"):
+        JsonLinesWriter.Load(filename)
+
+
+# ----------------------------------------------------------------------
+def test_LoadMissing(tmp_path):
+    with pytest.raises(Exception, match="is not a valid JSON Lines results file"):
+        JsonLinesWriter.Load(tmp_path / "Missing.jsonl")
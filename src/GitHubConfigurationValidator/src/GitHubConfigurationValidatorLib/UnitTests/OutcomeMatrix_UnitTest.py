@@ -0,0 +1,234 @@
+# ----------------------------------------------------------------------
+# |
+# |  OutcomeMatrix_UnitTest.py
+# |
+# |  David Brownell <db@DavidBrownell.com>
+# |      2023-12-12 15:08:44
+# |
+# ----------------------------------------------------------------------
+# |
+# |  Copyright David Brownell 2023
+# |  Distributed under the Boost Software License, Version 1.0. See
+# |  accompanying file LICENSE_1_0.txt or copy at
+# |  http://www.boost.org/LICENSE_1_0.txt.
+# |
+# ----------------------------------------------------------------------
+"""Unit tests for OutcomeMatrix.py"""
+
+import sys
+
+from pathlib import Path
+
+import pytest
+
+from Common_Foundation.ContextlibEx import ExitStack
+from Common_Foundation import PathEx
+
+
+# ----------------------------------------------------------------------
+sys.path.insert(0, str(PathEx.EnsureDir(Path(__file__).parent.parent.parent)))
+with ExitStack(lambda: sys.path.pop(0)):
+    from GitHubConfigurationValidatorLib.Finding import Finding
+    from GitHubConfigurationValidatorLib.OutcomeMatrix import OutcomeMatrix
+    from GitHubConfigurationValidatorLib.Plugin import Plugin
+
+
+# ----------------------------------------------------------------------
+Outcome                                     = OutcomeMatrix.Outcome
+
+# 5 plugins, so the second byte of each row contains 3 padding cells
+_PLUGIN_NAMES                               = ["P0", "P1", "P2", "P3", "P4"]
+
+
+# ----------------------------------------------------------------------
+def _CreateMatrix() -> OutcomeMatrix:
+    matrix = OutcomeMatrix(_PLUGIN_NAMES)
+
+    # Errors take precedence over warnings, regardless of the order of the findings
+    assert matrix.AddRepository(
+        "Repo0",
+        [
+            Finding("P0", Plugin.MessageType.Error, "Error"),
+            Finding("P0", Plugin.MessageType.Warning, "Warning"),
+            Finding("P1", Plugin.MessageType.Warning, "Warning"),
+            Finding("P1", Plugin.MessageType.Error, "Error"),
+            Finding("P2", Plugin.MessageType.Info, "Info"),
+        ],
+        ["P3"],
+    ) == 0
+
+    # The repository could not be validated
+    assert matrix.AddRepository("Repo1", None) == 1
+
+    # Warnings take precedence over skipped
+    assert matrix.AddRepository(
+        "Repo2",
+        [Finding("P4", Plugin.MessageType.Warning, "Warning")],
+        ["P4", "P0"],
+    ) == 2
+
+    assert matrix.AddRepository("Repo3", []) == 3
+    assert matrix.AddRepository("Repo4", [Finding("P2", Plugin.MessageType.Warning, "Another warning")]) == 4
+
+    return matrix
+
+
+# ----------------------------------------------------------------------
+def test_AddRepository():
+    matrix = _CreateMatrix()
+
+    assert matrix.num_repositories == 5
+    assert matrix.repository_names == ["Repo0", "Repo1", "Repo2", "Repo3", "Repo4"]
+
+    assert [
+        [matrix.GetOutcome(repository_id, plugin_id) for plugin_id in range(len(_PLUGIN_NAMES))]
+        for repository_id in range(matrix.num_repositories)
+    ] == [
+        [Outcome.Error, Outcome.Error, Outcome.Pass, Outcome.Skipped, Outcome.Pass],
+        [Outcome.Skipped, Outcome.Skipped, Outcome.Skipped, Outcome.Skipped, Outcome.Skipped],
+        [Outcome.Skipped, Outcome.Pass, Outcome.Pass, Outcome.Pass, Outcome.Warning],
+        [Outcome.Pass, Outcome.Pass, Outcome.Pass, Outcome.Pass, Outcome.Pass],
+        [Outcome.Pass, Outcome.Pass, Outcome.Warning, Outcome.Pass, Outcome.Pass],
+    ]
+
+    # Each row is padded to 2 bytes
+    assert matrix._cells == bytearray(
+        [
+            0b01_00_11_11, 0b00,
+            0b01_01_01_01, 0b01,
+            0b00_00_00_01, 0b10,
+            0b00_00_00_00, 0b00,
+            0b00_10_00_00, 0b00,
+        ],
+    )
+
+
+# ----------------------------------------------------------------------
+def test_GetFindings():
+    matrix = _CreateMatrix()
+
+    assert matrix.GetFindings(0) == [
+        Finding("P0", Plugin.MessageType.Error, "Error"),
+        Finding("P0", Plugin.MessageType.Warning, "Warning"),
+        Finding("P1", Plugin.MessageType.Warning, "Warning"),
+        Finding("P1", Plugin.MessageType.Error, "Error"),
+        Finding("P2", Plugin.MessageType.Info, "Info"),
+    ]
+
+    assert matrix.GetFindings(1) == []
+    assert matrix.GetFindings(2) == [Finding("P4", Plugin.MessageType.Warning, "Warning")]
+    assert matrix.GetFindings(3) == []
+    assert matrix.GetFindings(4) == [Finding("P2", Plugin.MessageType.Warning, "Another warning")]
+
+    # Messages are only stored once
+    assert matrix.num_messages == 4
+
+
+# ----------------------------------------------------------------------
+def test_GetPluginCounts():
+    matrix = _CreateMatrix()
+
+    assert matrix.GetPluginCounts(Outcome.Error) == {"P0": 1, "P1": 1, "P2": 0, "P3": 0, "P4": 0}
+    assert matrix.GetPluginCounts(Outcome.Warning) == {"P0": 0, "P1": 0, "P2": 1, "P3": 0, "P4": 1}
+    assert matrix.GetPluginCounts(Outcome.Skipped) == {"P0": 2, "P1": 1, "P2": 1, "P3": 2, "P4": 1}
+    assert matrix.GetPluginCounts(Outcome.Pass) == {"P0": 2, "P1": 3, "P2": 3, "P3": 3, "P4": 3}
+
+
+# ----------------------------------------------------------------------
+def test_GetRepositoryCounts():
+    matrix = _CreateMatrix()
+
+    # Repo1 is skipped even though the padding cells in its row are 0 (Pass)
+    assert matrix.GetRepositoryCounts() == {
+        Outcome.Pass: 1,
+        Outcome.Skipped: 1,
+        Outcome.Warning: 2,
+        Outcome.Error: 1,
+    }
+
+
+# ----------------------------------------------------------------------
+def test_GetRepositories():
+    matrix = _CreateMatrix()
+
+    assert matrix.GetRepositories(["P0"]) == ["Repo0"]
+    assert matrix.GetRepositories(["P0", "P1", "P2", "P3", "P4"]) == ["Repo0"]
+    assert matrix.GetRepositories(["P4"]) == []
+    assert matrix.GetRepositories([]) == []
+
+    assert matrix.GetRepositories(["P4"], [Outcome.Warning]) == ["Repo2"]
+    assert matrix.GetRepositories(["P2", "P4"], [Outcome.Warning]) == ["Repo2", "Repo4"]
+    assert matrix.GetRepositories(["P0", "P3"], [Outcome.Skipped]) == ["Repo0", "Repo1", "Repo2"]
+    assert matrix.GetRepositories(["P1"], [Outcome.Warning, Outcome.Error]) == ["Repo0"]
+    assert matrix.GetRepositories(["P0"], [Outcome.Pass]) == ["Repo3", "Repo4"]
+
+    with pytest.raises(KeyError):
+        matrix.GetRepositories(["Unknown"])
+
+
+# ----------------------------------------------------------------------
+@pytest.mark.parametrize("num_plugins", [1, 3, 4, 5, 8, 9])
+def test_Padding(num_plugins):
+    plugin_names = ["Plugin{}".format(index) for index in range(num_plugins)]
+    last_plugin_name = plugin_names[-1]
+
+    matrix = OutcomeMatrix(plugin_names)
+
+    matrix.AddRepository("Skipped", None)
+    matrix.AddRepository("Passed", [])
+    matrix.AddRepository("Warning", [Finding(last_plugin_name, Plugin.MessageType.Warning, "Warning")])
+    matrix.AddRepository("Error", [Finding(last_plugin_name, Plugin.MessageType.Error, "Error")])
+
+    assert len(matrix._cells) == 4 * ((num_plugins + 3) // 4)
+
+    assert matrix.GetRepositoryCounts() == {
+        Outcome.Pass: 1,
+        Outcome.Skipped: 1,
+        Outcome.Warning: 1,
+        Outcome.Error: 1,
+    }
+
+    expected_pass_counts = {plugin_name: 3 for plugin_name in plugin_names}
+    expected_pass_counts[last_plugin_name] = 1
+
+    assert matrix.GetPluginCounts(Outcome.Pass) == expected_pass_counts
+    assert matrix.GetPluginCounts(Outcome.Skipped) == {plugin_name: 1 for plugin_name in plugin_names}
+
+    assert matrix.GetRepositories(plugin_names) == ["Error"]
+    assert matrix.GetRepositories(plugin_names, [Outcome.Pass]) == ["Passed"] + (["Warning", "Error"] if num_plugins > 1 else [])
+    assert matrix.GetRepositories([last_plugin_name], [Outcome.Warning, Outcome.Error]) == ["Warning", "Error"]
+
+
+# ----------------------------------------------------------------------
+def test_NoPlugins():
+    matrix = OutcomeMatrix([])
+
+    matrix.AddRepository("Repo1", [])
+    matrix.AddRepository("Repo2", None)
+
+    assert matrix.num_bytes == 3 * 4
+    assert matrix.GetPluginCounts(Outcome.Error) == {}
+    assert matrix.GetRepositories([]) == []
+
+    # There is nothing to skip
+    assert matrix.GetRepositoryCounts() == {
+        Outcome.Pass: 2,
+        Outcome.Skipped: 0,
+        Outcome.Warning: 0,
+        Outcome.Error: 0,
+    }
+
+
+# ----------------------------------------------------------------------
+def test_Empty():
+    matrix = OutcomeMatrix(_PLUGIN_NAMES)
+
+    assert matrix.GetPluginCounts(Outcome.Error) == {plugin_name: 0 for plugin_name in _PLUGIN_NAMES}
+    assert matrix.GetRepositories(_PLUGIN_NAMES) == []
+
+    assert matrix.GetRepositoryCounts() == {
+        Outcome.Pass: 0,
+        Outcome.Skipped: 0,
+        Outcome.Warning: 0,
+        Outcome.Error: 0,
+    }
@@ -0,0 +1,242 @@
+# ----------------------------------------------------------------------
+# |
+# |  PluginManifest_UnitTest.py
+# |
+# |  David Brownell <db@DavidBrownell.com>
+# |      2023-12-11 14:37:09
+# |
+# ----------------------------------------------------------------------
+# |
+# |  Copyright David Brownell 2023
+# |  Distributed under the Boost Software License, Version 1.0. See
+# |  accompanying file LICENSE_1_0.txt or copy at
+# |  http://www.boost.org/LICENSE_1_0.txt.
+# |
+# ----------------------------------------------------------------------
+"""Unit tests for PluginManifest.py"""
+
+import os
+import sys
+
+from pathlib import Path
+
+import typer
+
+from semantic_version import Version as SemVer
+
+from Common_Foundation.ContextlibEx import ExitStack
+from Common_Foundation import PathEx
+
+
+# ----------------------------------------------------------------------
+sys.path.insert(0, str(PathEx.EnsureDir(Path(__file__).parent.parent.parent)))
+with ExitStack(lambda: sys.path.pop(0)):
+    from GitHubConfigurationValidatorLib.Plugin import Plugin
+    from GitHubConfigurationValidatorLib.PluginManifest import PluginManifest
+
+
+# ----------------------------------------------------------------------
+def _CreateEntry(
+    **instantiation_parameters,
+) -> PluginManifest.Entry:
+    return PluginManifest.Entry(
+        "MyPlugin",
+        Plugin.ConfigurationType.Repository,
+        SemVer("0.1.0"),
+        "Description",
+        "Display string",
+        instantiation_parameters,
+    )
+
+
+# ----------------------------------------------------------------------
+def _Touch(
+    filename: Path,
+    content: str,
+    mtime: int,
+) -> None:
+    filename.write_text(content, encoding="utf-8")
+    os.utime(filename, ns=(mtime, mtime))
+
+
+# ----------------------------------------------------------------------
+def test_SetAndGet(tmp_path):
+    plugin_filename = tmp_path / "MyPlugin.py"
+    _Touch(plugin_filename, "# Plugin", 1_000_000_000)
+
+    dependency = tmp_path / "Dependency.py"
+    _Touch(dependency, "# Dependency", 1_000_000_000)
+
+    manifest_filename = tmp_path / "Manifest" / "Manifest.json"
+
+    manifest = PluginManifest.Load(manifest_filename, [dependency])
+
+    assert manifest.Get(plugin_filename) is None
+
+    entry = _CreateEntry(
+        parameter_value=(str, typer.Option("default", "--value", help="The value.")),
+        parameter_flag=(bool, typer.Option(False, "--flag")),
+        parameter_count=(int, typer.Option(3, "--count")),
+        parameter_none=(str, typer.Option(None, "--none")),
+    )
+
+    assert manifest.Set(plugin_filename, entry) is True
+
+    manifest.Save()
+    assert manifest_filename.is_file()
+
+    manifest = PluginManifest.Load(manifest_filename, [dependency])
+
+    result = manifest.Get(plugin_filename)
+
+    assert result is not None
+    assert result.name == entry.name
+    assert result.configuration_type == entry.configuration_type
+    assert result.version_introduced == entry.version_introduced
+    assert result.description == entry.description
+    assert result.display_string == entry.display_string
+
+    assert result.instantiation_parameters.keys() == entry.instantiation_parameters.keys()
+
+    for parameter_name, (python_type, option_info) in result.instantiation_parameters.items():
+        expected_python_type, expected_option_info = entry.instantiation_parameters[parameter_name]
+
+        assert python_type is expected_python_type
+        assert vars(option_info) == vars(expected_option_info)
+
+
+# ----------------------------------------------------------------------
+def test_StaleEntries(tmp_path):
+    plugin_filename = tmp_path / "MyPlugin.py"
+    _Touch(plugin_filename, "# Plugin", 1_000_000_000)
+
+    dependency = tmp_path / "Dependency.py"
+    _Touch(dependency, "# Dependency", 1_000_000_000)
+
+    manifest_filename = tmp_path / "Manifest.json"
+
+    manifest = PluginManifest.Load(manifest_filename, [dependency])
+    manifest.Set(plugin_filename, _CreateEntry())
+    manifest.Save()
+
+    assert PluginManifest.Load(manifest_filename, [dependency]).Get(plugin_filename) is not None
+
+    # The plugin has changed
+    _Touch(plugin_filename, "# Plugin", 2_000_000_000)
+    assert PluginManifest.Load(manifest_filename, [dependency]).Get(plugin_filename) is None
+
+    _Touch(plugin_filename, "# Plugin (modified)", 1_000_000_000)
+    assert PluginManifest.Load(manifest_filename, [dependency]).Get(plugin_filename) is None
+
+    # A dependency has changed
+    _Touch(plugin_filename, "# Plugin", 1_000_000_000)
+    assert PluginManifest.Load(manifest_filename, [dependency]).Get(plugin_filename) is not None
+
+    _Touch(dependency, "# Dependency", 2_000_000_000)
+    assert PluginManifest.Load(manifest_filename, [dependency]).Get(plugin_filename) is None
+
+
+# ----------------------------------------------------------------------
+def test_SourceFilename(tmp_path):
+    bundle_filename = tmp_path / "Plugins.zip"
+    _Touch(bundle_filename, "Bundle", 1_000_000_000)
+
+    plugin_filename = tmp_path / "Plugins" / "MyPlugin.py"
+
+    manifest = PluginManifest.Load(tmp_path / "Manifest.json", [])
+
+    assert manifest.Set(plugin_filename, _CreateEntry(), bundle_filename) is True
+    assert manifest.Get(plugin_filename, bundle_filename) is not None
+
+    _Touch(bundle_filename, "Bundle", 2_000_000_000)
+    assert manifest.Get(plugin_filename, bundle_filename) is None
+
+
+# ----------------------------------------------------------------------
+def test_UnsupportedParameters(tmp_path):
+    plugin_filename = tmp_path / "MyPlugin.py"
+    _Touch(plugin_filename, "# Plugin", 1_000_000_000)
+
+    manifest_filename = tmp_path / "Manifest.json"
+
+    manifest = PluginManifest.Load(manifest_filename, [])
+
+    # Unsupported type
+    assert manifest.Set(plugin_filename, _CreateEntry(value=(list[str], typer.Option([], "--value")))) is False
+
+    # Customizations that aren't serialized
+    assert manifest.Set(plugin_filename, _CreateEntry(value=(int, typer.Option(1, "--value", min=0)))) is False
+
+    # Not a typer.Option
+    assert manifest.Set(plugin_filename, _CreateEntry(value=(str, typer.Argument("value")))) is False
+
+    # Nothing was modified
+    manifest.Save()
+    assert not manifest_filename.exists()
+
+
+# ----------------------------------------------------------------------
+def test_InvalidManifest(tmp_path):
+    plugin_filename = tmp_path / "MyPlugin.py"
+    _Touch(plugin_filename, "# Plugin", 1_000_000_000)
+
+    manifest_filename = tmp_path / "Manifest.json"
+
+    for content in [
+        "not json",
+        "[]",
+        '{"format_version": 0, "key": "", "items": {}}',
+    ]:
+        manifest_filename.write_text(content, encoding="utf-8")
+
+        manifest = PluginManifest.Load(manifest_filename, [])
+
+        assert manifest.Get(plugin_filename) is None
+
+        # The manifest can be updated
+        assert manifest.Set(plugin_filename, _CreateEntry()) is True
+        manifest.Save()
+
+        assert PluginManifest.Load(manifest_filename, []).Get(plugin_filename) is not None
+
+
+# ----------------------------------------------------------------------
+def test_GetFilename(tmp_path):
+    cache_dir = tmp_path / "Cache"
+
+    installation1 = tmp_path / "Installation1"
+    installation2 = tmp_path / "Installation2"
+
+    filename1 = PluginManifest.GetFilename(cache_dir, installation1)
+    filename2 = PluginManifest.GetFilename(cache_dir, installation2)
+
+    assert filename1.parent == cache_dir
+    assert filename2.parent == cache_dir
+    assert filename1 != filename2
+
+    # The filename is stable for an installation, regardless of how its path is spelled
+    assert PluginManifest.GetFilename(cache_dir, installation1) == filename1
+    assert PluginManifest.GetFilename(cache_dir, installation2 / ".." / installation1.name) == filename1
+
+    # Installations that share a cache directory don't invalidate each other's entries
+    for installation_dir in [installation1, installation2]:
+        installation_dir.mkdir()
+
+        dependency = installation_dir / "Plugin.py"
+        _Touch(dependency, "# Dependency", 1_000_000_000)
+
+        plugin_filename = installation_dir / "MyPlugin.py"
+        _Touch(plugin_filename, "# Plugin", 1_000_000_000)
+
+        manifest = PluginManifest.Load(PluginManifest.GetFilename(cache_dir, installation_dir), [dependency])
+
+        assert manifest.Set(plugin_filename, _CreateEntry()) is True
+        manifest.Save()
+
+    for installation_dir in [installation1, installation2]:
+        manifest = PluginManifest.Load(
+            PluginManifest.GetFilename(cache_dir, installation_dir),
+            [installation_dir / "Plugin.py"],
+        )
+
+        assert manifest.Get(installation_dir / "MyPlugin.py") is not None
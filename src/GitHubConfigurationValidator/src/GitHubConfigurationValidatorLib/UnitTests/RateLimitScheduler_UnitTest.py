@@ -0,0 +1,365 @@
+# ----------------------------------------------------------------------
+# |
+# |  RateLimitScheduler_UnitTest.py
+# |
+# |  David Brownell <db@DavidBrownell.com>
+# |      2023-12-11 09:40:22
+# |
+# ----------------------------------------------------------------------
+# |
+# |  Copyright David Brownell 2023
+# |  Distributed under the Boost Software License, Version 1.0. See
+# |  accompanying file LICENSE_1_0.txt or copy at
+# |  http://www.boost.org/LICENSE_1_0.txt.
+# |
+# ----------------------------------------------------------------------
+"""Unit tests for RateLimitScheduler.py"""
+
+import asyncio
+import sys
+import threading
+
+from pathlib import Path
+
+import pytest
+
+from Common_Foundation.ContextlibEx import ExitStack
+from Common_Foundation import PathEx
+
+
+# ----------------------------------------------------------------------
+sys.path.insert(0, str(PathEx.EnsureDir(Path(__file__).parent.parent.parent)))
+with ExitStack(lambda: sys.path.pop(0)):
+    from GitHubConfigurationValidatorLib.RateLimitScheduler import RateLimitScheduler
+
+
+# ----------------------------------------------------------------------
+_NOW                                        = 1000.0
+
+
+# ----------------------------------------------------------------------
+def _CreateScheduler(**kwargs) -> tuple[RateLimitScheduler, list[float]]:
+    sleeps: list[float] = []
+
+    return (
+        RateLimitScheduler(
+            time_func=lambda: _NOW,
+            sleep_func=sleeps.append,
+            **kwargs,
+        ),
+        sleeps,
+    )
+
+
+# ----------------------------------------------------------------------
+def _CreateHeaders(
+    limit: int,
+    remaining: int,
+    reset: float=_NOW + 100,
+    resource: str | None=None,
+) -> dict[str, str]:
+    headers = {
+        "X-RateLimit-Limit": str(limit),
+        "X-RateLimit-Remaining": str(remaining),
+        "X-RateLimit-Reset": str(reset),
+    }
+
+    if resource is not None:
+        headers["X-RateLimit-Resource"] = resource
+
+    return headers
+
+
+# ----------------------------------------------------------------------
+@pytest.mark.parametrize(
+    "url, expected",
+    [
+        ("https://api.github.com/repos/owner/repo", "core"),
+        ("https://api.github.com/graphql", "graphql"),
+        ("https://github.example.com/api/graphql/", "graphql"),
+        ("https://api.github.com/search/repositories?q=graphql", "search"),
+    ],
+)
+def test_GetResource(url, expected):
+    assert RateLimitScheduler.GetResource(url) == expected
+
+
+# ----------------------------------------------------------------------
+def test_Update():
+    scheduler, _ = _CreateScheduler()
+
+    # Responses without rate limit information are ignored
+    scheduler.Update("core", {})
+    scheduler.Update("core", _CreateHeaders(100, 50) | {"X-RateLimit-Limit": "invalid"})
+
+    assert scheduler.GetState() == {}
+
+    scheduler.Update("core", _CreateHeaders(100, 50))
+    assert scheduler.GetState()["core"] == RateLimitScheduler.ResourceState("core", 100, 50, _NOW + 100)
+
+    # Stale information for the same window is ignored
+    scheduler.Update("core", _CreateHeaders(100, 60))
+    assert scheduler.GetState()["core"].remaining == 50
+
+    # Information for a new window replaces the existing information
+    scheduler.Update("core", _CreateHeaders(100, 90, _NOW + 3700))
+    assert scheduler.GetState()["core"].remaining == 90
+
+    # The resource provided by GitHub takes precedence
+    scheduler.Update("core", _CreateHeaders(5000, 4000, resource="graphql"))
+    assert scheduler.GetState()["graphql"].remaining == 4000
+
+
+# ----------------------------------------------------------------------
+def test_ConcurrencyAndDelay():
+    scheduler, _ = _CreateScheduler(max_concurrent_requests=10, slowdown_threshold=0.1)
+
+    assert scheduler.GetRecommendedConcurrency() == 10
+    assert scheduler.GetDelay("core") == 0.0
+
+    # Plenty of budget remaining
+    scheduler.Update("core", _CreateHeaders(1000, 500))
+
+    assert scheduler.GetRecommendedConcurrency("core") == 10
+    assert scheduler.GetDelay("core") == 0.0
+
+    # Less than 10% of the budget remaining
+    scheduler.Update("core", _CreateHeaders(1000, 50, _NOW + 200))
+
+    assert scheduler.GetRecommendedConcurrency("core") == 5
+    assert scheduler.GetRecommendedConcurrency("graphql") == 10
+    assert scheduler.GetRecommendedConcurrency() == 5
+    assert scheduler.GetDelay("core") == pytest.approx(200 * 5 / 50)
+
+    # Concurrency is never less than 1
+    scheduler.Update("core", _CreateHeaders(1000, 1, _NOW + 300))
+    assert scheduler.GetRecommendedConcurrency("core") == 1
+
+    # Budget exhausted
+    scheduler.Update("core", _CreateHeaders(1000, 0, _NOW + 400))
+    assert scheduler.GetDelay("core") == 401.0
+
+    # Budget exhausted but the window has been reset
+    scheduler.Update("core", _CreateHeaders(1000, 0, _NOW - 1))
+    assert scheduler.GetDelay("core") == 0.0
+
+
+# ----------------------------------------------------------------------
+def test_GetRetryDelay():
+    scheduler, _ = _CreateScheduler(max_retries=3)
+
+    # Not a rate limit error
+    assert scheduler.GetRetryDelay(200, {}, "", 0) is None
+    assert scheduler.GetRetryDelay(500, {}, "", 0) is None
+
+    # Retry-After
+    assert scheduler.GetRetryDelay(403, {"Retry-After": "30"}, "", 0) == 30.0
+    assert scheduler.GetRetryDelay(429, {"Retry-After": "30"}, "", 0) == 30.0
+
+    # Primary rate limit
+    assert scheduler.GetRetryDelay(403, {"X-RateLimit-Remaining": "0", "X-RateLimit-Reset": str(_NOW + 10)}, "", 0) == 11.0
+
+    # Secondary rate limit
+    assert scheduler.GetRetryDelay(403, {}, "You have exceeded a Secondary Rate Limit.", 0) == 60.0
+    assert scheduler.GetRetryDelay(429, {}, "", 2) == 240.0
+
+    # Too many retries
+    assert scheduler.GetRetryDelay(429, {"Retry-After": "30"}, "", 3) is None
+
+    # Permissions error
+    assert scheduler.GetRetryDelay(403, {}, "Resource not accessible by integration", 0) is None
+
+
+# ----------------------------------------------------------------------
+def test_Sleep():
+    scheduler, sleeps = _CreateScheduler()
+
+    scheduler.Sleep(0)
+    scheduler.Sleep(1.5)
+    scheduler.Sleep(2.0, is_retry=True)
+
+    assert sleeps == [1.5, 2.0]
+    assert scheduler.total_wait_seconds == 3.5
+    assert scheduler.num_retries == 1
+
+
+# ----------------------------------------------------------------------
+def test_YieldRequestSlot():
+    scheduler, sleeps = _CreateScheduler(max_concurrent_requests=2, slowdown_threshold=0.5)
+
+    scheduler.Update("core", _CreateHeaders(100, 10, _NOW + 100))
+
+    # Concurrency is reduced to 1 and each request is delayed
+    assert scheduler.GetRecommendedConcurrency("core") == 1
+
+    entered = threading.Event()
+    release = threading.Event()
+    second_entered = threading.Event()
+
+    # ----------------------------------------------------------------------
+    def First():
+        with scheduler.YieldRequestSlot("core"):
+            entered.set()
+            release.wait()
+
+    # ----------------------------------------------------------------------
+    def Second():
+        with scheduler.YieldRequestSlot("core"):
+            second_entered.set()
+
+    # ----------------------------------------------------------------------
+
+    first_thread = threading.Thread(target=First)
+    first_thread.start()
+
+    assert entered.wait(5)
+
+    second_thread = threading.Thread(target=Second)
+    second_thread.start()
+
+    # The second request must wait for the first
+    assert not second_entered.wait(0.2)
+
+    release.set()
+
+    assert second_entered.wait(5)
+
+    first_thread.join()
+    second_thread.join()
+
+    assert sleeps == [10.0, 10.0]
+
+
+# ----------------------------------------------------------------------
+def test_YieldRequestSlotAsync():
+    async_sleeps: list[float] = []
+
+    # ----------------------------------------------------------------------
+    async def AsyncSleep(seconds):
+        async_sleeps.append(seconds)
+
+    # ----------------------------------------------------------------------
+
+    scheduler, sleeps = _CreateScheduler(
+        max_concurrent_requests=2,
+        slowdown_threshold=0.5,
+        async_sleep_func=AsyncSleep,
+    )
+
+    scheduler.Update("core", _CreateHeaders(100, 10, _NOW + 100))
+
+    # ----------------------------------------------------------------------
+    async def Impl():
+        release = asyncio.Event()
+        order: list[str] = []
+
+        # ----------------------------------------------------------------------
+        async def First():
+            async with scheduler.YieldRequestSlotAsync("core"):
+                order.append("first")
+                await release.wait()
+
+            order.append("first released")
+
+        # ----------------------------------------------------------------------
+        async def Second():
+            async with scheduler.YieldRequestSlotAsync("core"):
+                order.append("second")
+
+        # ----------------------------------------------------------------------
+
+        first_task = asyncio.create_task(First())
+        await asyncio.sleep(0.05)
+
+        second_task = asyncio.create_task(Second())
+        await asyncio.sleep(0.05)
+
+        # The second request must wait for the first
+        assert order == ["first"]
+
+        release.set()
+        await asyncio.gather(first_task, second_task)
+
+        assert order == ["first", "first released", "second"]
+
+    # ----------------------------------------------------------------------
+
+    asyncio.run(Impl())
+
+    assert async_sleeps == [10.0, 10.0]
+    assert sleeps == []
+    assert scheduler.total_wait_seconds == 20.0
+
+
+# ----------------------------------------------------------------------
+def test_YieldRequestSlotAsyncShared():
+    scheduler, _ = _CreateScheduler(max_concurrent_requests=1)
+
+    entered = threading.Event()
+    release = threading.Event()
+
+    # ----------------------------------------------------------------------
+    def Thread():
+        with scheduler.YieldRequestSlot("core"):
+            entered.set()
+            release.wait()
+
+    # ----------------------------------------------------------------------
+    async def Impl():
+        # ----------------------------------------------------------------------
+        async def Request():
+            async with scheduler.YieldRequestSlotAsync("core"):
+                pass
+
+        # ----------------------------------------------------------------------
+
+        task = asyncio.create_task(Request())
+
+        # The slot is held by the thread, so the task waits (without blocking the event loop)
+        done, _ = await asyncio.wait([task], timeout=0.2)
+        assert not done
+
+        # The slot is released by the thread, which must wake the task on the event loop
+        release.set()
+
+        await asyncio.wait_for(task, 5)
+
+    # ----------------------------------------------------------------------
+
+    thread = threading.Thread(target=Thread)
+    thread.start()
+
+    assert entered.wait(5)
+
+    asyncio.run(Impl())
+    thread.join()
+
+    # Slots are available to threads once the task has released its slot
+    with scheduler.YieldRequestSlot("core"):
+        pass
+
+
+# ----------------------------------------------------------------------
+def test_SleepAsync():
+    scheduler, sleeps = _CreateScheduler()
+
+    # asyncio.sleep is used by default
+    asyncio.run(scheduler.SleepAsync(0))
+    asyncio.run(scheduler.SleepAsync(0.01, is_retry=True))
+
+    assert sleeps == []
+    assert scheduler.total_wait_seconds == 0.01
+    assert scheduler.num_retries == 1
+
+
+# ----------------------------------------------------------------------
+def test_GetStatisticsString():
+    scheduler, _ = _CreateScheduler()
+
+    assert scheduler.GetStatisticsString() == "Rate limits: no information; waited 0.0 second(s), 0 retry(ies).\n"
+
+    scheduler.Update("graphql", _CreateHeaders(5000, 4999))
+    scheduler.Update("core", _CreateHeaders(5000, 4000))
+    scheduler.Sleep(1.5, is_retry=True)
+
+    assert scheduler.GetStatisticsString() == "Rate limits: core 4000/5000, graphql 4999/5000; waited 1.5 second(s), 1 retry(ies).\n"
@@ -0,0 +1,194 @@
+# ----------------------------------------------------------------------
+# |
+# |  ResponseCache_UnitTest.py
+# |
+# |  David Brownell <db@DavidBrownell.com>
+# |      2023-12-11 08:12:05
+# |
+# ----------------------------------------------------------------------
+# |
+# |  Copyright David Brownell 2023
+# |  Distributed under the Boost Software License, Version 1.0. See
+# |  accompanying file LICENSE_1_0.txt or copy at
+# |  http://www.boost.org/LICENSE_1_0.txt.
+# |
+# ----------------------------------------------------------------------
+"""Unit tests for ResponseCache.py"""
+
+import sys
+
+from pathlib import Path
+
+from Common_Foundation.ContextlibEx import ExitStack
+from Common_Foundation import PathEx
+
+
+# ----------------------------------------------------------------------
+sys.path.insert(0, str(PathEx.EnsureDir(Path(__file__).parent.parent.parent)))
+with ExitStack(lambda: sys.path.pop(0)):
+    from GitHubConfigurationValidatorLib.Impl.ResponseImpl import CreateResponse
+    from GitHubConfigurationValidatorLib.ResponseCache import ResponseCache
+
+
+# ----------------------------------------------------------------------
+_URL                                        = "https://api.github.com/repos/owner/repo"
+
+
+# ----------------------------------------------------------------------
+def test_CreateKey():
+    key = ResponseCache.CreateKey(_URL, "token 1")
+
+    assert key == ResponseCache.CreateKey(_URL, "token 1")
+    assert key != ResponseCache.CreateKey(_URL, "token 2")
+    assert key != ResponseCache.CreateKey(_URL, None)
+    assert key != ResponseCache.CreateKey(_URL + "/branches", "token 1")
+
+    # The token is never persisted
+    assert "token" not in key
+
+
+# ----------------------------------------------------------------------
+def test_Set(tmp_path):
+    cache = ResponseCache(tmp_path / "Cache.db")
+
+    try:
+        # Responses that can't be revalidated are not stored
+        assert cache.Set("key", CreateResponse(_URL, 200, {}, b"content")) is False
+        assert cache.Set("key", CreateResponse(_URL, 404, {"ETag": '"123"'}, b"content")) is False
+        assert cache.Get("key") is None
+
+        assert cache.Set(
+            "key",
+            CreateResponse(
+                _URL,
+                200,
+                {
+                    "ETag": '"123"',
+                    "Last-Modified": "Mon, 11 Dec 2023 08:00:00 GMT",
+                    "Content-Length": "7",
+                    "X-Value": "value",
+                },
+                b"content",
+            ),
+        ) is True
+
+        entry = cache.Get("key")
+
+        assert entry is not None
+        assert entry.url == _URL
+        assert entry.etag == '"123"'
+        assert entry.last_modified == "Mon, 11 Dec 2023 08:00:00 GMT"
+        assert entry.content == b"content"
+
+        # Headers describing the encoding of the original response are not stored
+        assert entry.headers == {
+            "ETag": '"123"',
+            "Last-Modified": "Mon, 11 Dec 2023 08:00:00 GMT",
+            "X-Value": "value",
+        }
+
+        assert entry.CreateConditionalHeaders() == {
+            "If-None-Match": '"123"',
+            "If-Modified-Since": "Mon, 11 Dec 2023 08:00:00 GMT",
+        }
+
+    finally:
+        cache.Close()
+
+
+# ----------------------------------------------------------------------
+def test_Persistence(tmp_path):
+    filename = tmp_path / "Dir" / "Cache.db"
+
+    cache = ResponseCache(filename)
+    cache.Set("key", CreateResponse(_URL, 200, {"ETag": '"123"'}, b"content"))
+    cache.Close()
+
+    cache = ResponseCache(filename)
+
+    try:
+        entry = cache.Get("key")
+
+        assert entry is not None
+        assert entry.content == b"content"
+
+    finally:
+        cache.Close()
+
+
+# ----------------------------------------------------------------------
+def test_RequestAndResponse(tmp_path):
+    cache = ResponseCache(tmp_path / "Cache.db")
+
+    try:
+        # Initial request
+        cache_key, cache_entry, headers = cache.PrepareRequest(_URL, {"page": 2}, "token", {"Accept": "json"})
+
+        assert cache_key == ResponseCache.CreateKey(_URL + "?page=2", "token")
+        assert cache_entry is None
+        assert headers == {"Accept": "json"}
+
+        response = CreateResponse(_URL + "?page=2", 200, {"ETag": '"123"', "X-RateLimit-Remaining": "10"}, b"content")
+
+        assert cache.ProcessResponse(cache_key, cache_entry, response) is response
+        assert (cache.hits, cache.misses) == (0, 1)
+
+        # Conditional request
+        cache_key, cache_entry, headers = cache.PrepareRequest(_URL, {"page": 2}, "token", {"Accept": "json"})
+
+        assert cache_entry is not None
+        assert headers == {"Accept": "json", "If-None-Match": '"123"'}
+
+        not_modified_response = CreateResponse(
+            _URL + "?page=2",
+            304,
+            {
+                "ETag": '"123"',
+                "X-RateLimit-Remaining": "9",
+                "Content-Length": "0",
+            },
+            b"",
+        )
+
+        response = cache.ProcessResponse(cache_key, cache_entry, not_modified_response)
+
+        assert response.status_code == 200
+        assert response.content == b"content"
+
+        # Headers from the 304 response are more recent than the cached headers
+        assert response.headers["X-RateLimit-Remaining"] == "9"
+        assert "Content-Length" not in response.headers
+
+        assert (cache.hits, cache.misses) == (1, 1)
+
+        # Modified content
+        response = CreateResponse(_URL + "?page=2", 200, {"ETag": '"456"'}, b"new content")
+
+        assert cache.ProcessResponse(cache_key, cache_entry, response) is response
+        assert (cache.hits, cache.misses) == (1, 2)
+
+        cache_entry = cache.Get(cache_key)
+
+        assert cache_entry is not None
+        assert cache_entry.content == b"new content"
+
+        # A different identity doesn't use the cached response
+        cache_key, cache_entry, headers = cache.PrepareRequest(_URL, {"page": 2}, "other token", None)
+
+        assert cache_entry is None
+        assert headers == {}
+
+        assert cache.GetStatisticsString() == "Response cache: 1 hit(s), 2 miss(es) (33.3% hit rate).\n"
+
+    finally:
+        cache.Close()
+
+
+# ----------------------------------------------------------------------
+def test_EmptyStatistics(tmp_path):
+    cache = ResponseCache(tmp_path / "Cache.db")
+
+    try:
+        assert cache.GetStatisticsString() == "Response cache: 0 hit(s), 0 miss(es) (0.0% hit rate).\n"
+    finally:
+        cache.Close()
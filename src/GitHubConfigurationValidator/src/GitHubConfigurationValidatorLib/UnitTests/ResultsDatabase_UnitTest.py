@@ -0,0 +1,214 @@
+# ----------------------------------------------------------------------
+# |
+# |  ResultsDatabase_UnitTest.py
+# |
+# |  David Brownell <db@DavidBrownell.com>
+# |      2023-12-12 08:24:53
+# |
+# ----------------------------------------------------------------------
+# |
+# |  Copyright David Brownell 2023
+# |  Distributed under the Boost Software License, Version 1.0. See
+# |  accompanying file LICENSE_1_0.txt or copy at
+# |  http://www.boost.org/LICENSE_1_0.txt.
+# |
+# ----------------------------------------------------------------------
+"""Unit tests for ResultsDatabase.py"""
+
+import sqlite3
+import sys
+
+from pathlib import Path
+
+import pytest
+
+from Common_Foundation.ContextlibEx import ExitStack
+from Common_Foundation import PathEx
+
+
+# ----------------------------------------------------------------------
+sys.path.insert(0, str(PathEx.EnsureDir(Path(__file__).parent.parent.parent)))
+with ExitStack(lambda: sys.path.pop(0)):
+    from GitHubConfigurationValidatorLib.Finding import Finding
+    from GitHubConfigurationValidatorLib.Plugin import Plugin
+    from GitHubConfigurationValidatorLib.ResultsDatabase import ResultsDatabase
+
+
+# ----------------------------------------------------------------------
+_GITHUB_URL                                 = "https://github.com"
+
+_FINDINGS                                   = [
+    Finding("One", Plugin.MessageType.Error, "Error message"),
+    Finding("Two", Plugin.MessageType.Warning, "Warning message"),
+    Finding("One", Plugin.MessageType.Info, "Info message"),
+]
+
+
+# ----------------------------------------------------------------------
+def _WriteRun(
+    filename: Path,
+    results: dict[str, list[Finding]],
+    *,
+    github_url: str=_GITHUB_URL,
+    username: str="owner",
+    complete: bool=True,
+    batch_size: int=ResultsDatabase.DEFAULT_BATCH_SIZE,
+) -> int:
+    results_db = ResultsDatabase(filename, github_url, username, batch_size=batch_size)
+
+    try:
+        for repository, findings in results.items():
+            results_db.WriteRepository(repository, -1 if findings else 0, findings)
+
+        if complete:
+            results_db.Complete(0)
+
+    finally:
+        results_db.Close()
+
+    return results_db.run_id
+
+
+# ----------------------------------------------------------------------
+def test_WriteAndLoad(tmp_path):
+    filename = tmp_path / "Dir" / "Results.db"
+
+    results_db = ResultsDatabase(filename, _GITHUB_URL, "owner")
+
+    try:
+        results_db.WriteRepository("Repo1", -1, _FINDINGS)
+        results_db.WriteRepository("Repo2", 0, [], is_replayed=True)
+
+        results_db.Complete(-1)
+
+        assert results_db.GetStatisticsString() == "Results database: 2 repositories, 3 findings written to '{}' (run {}).\n".format(
+            filename,
+            results_db.run_id,
+        )
+
+    finally:
+        results_db.Close()
+
+    assert ResultsDatabase.LoadRun(filename, _GITHUB_URL, "owner") == {
+        "Repo1": _FINDINGS,
+        "Repo2": [],
+    }
+
+    connection = sqlite3.connect(filename)
+
+    try:
+        assert connection.execute("SELECT github_url, username, returncode, completed_at IS NOT NULL FROM runs").fetchall() == [
+            (_GITHUB_URL, "owner", -1, 1),
+        ]
+
+        assert connection.execute(
+            """
+            SELECT repositories.name, returncode, errors, warnings, infos, replayed
+            FROM run_repositories
+                JOIN repositories ON repositories.id = run_repositories.repository_id
+            ORDER BY repositories.name
+            """,
+        ).fetchall() == [
+            ("Repo1", -1, 1, 1, 1, 0),
+            ("Repo2", 0, 0, 0, 0, 1),
+        ]
+
+        # Plugins are stored once
+        assert connection.execute("SELECT name FROM plugins ORDER BY name").fetchall() == [("One", ), ("Two", )]
+
+    finally:
+        connection.close()
+
+
+# ----------------------------------------------------------------------
+def test_LoadRun(tmp_path):
+    filename = tmp_path / "Results.db"
+
+    run1 = _WriteRun(filename, {"Repo": _FINDINGS[:1]})
+    run2 = _WriteRun(filename, {"Repo": _FINDINGS[:2]})
+
+    # Runs for other GitHub instances and users/organizations
+    _WriteRun(filename, {"Repo": []}, github_url="https://github.example.com")
+    _WriteRun(filename, {"Repo": []}, username="other_owner")
+
+    # Incomplete run
+    run5 = _WriteRun(filename, {"Repo": _FINDINGS}, complete=False)
+
+    # The most recent complete run
+    assert ResultsDatabase.LoadRun(filename, _GITHUB_URL, "owner") == {"Repo": _FINDINGS[:2]}
+
+    # A specific run
+    assert ResultsDatabase.LoadRun(filename, _GITHUB_URL, "owner", run1) == {"Repo": _FINDINGS[:1]}
+    assert ResultsDatabase.LoadRun(filename, _GITHUB_URL, "owner", run2) == {"Repo": _FINDINGS[:2]}
+
+    # Incomplete runs can be loaded explicitly
+    assert ResultsDatabase.LoadRun(filename, _GITHUB_URL, "owner", run5) == {"Repo": _FINDINGS}
+
+    # Runs must match the GitHub instance and user/organization
+    assert ResultsDatabase.LoadRun(filename, "https://github.example.com", "owner") == {"Repo": []}
+    assert ResultsDatabase.LoadRun(filename, "https://github.example.com", "owner", run1) is None
+    assert ResultsDatabase.LoadRun(filename, _GITHUB_URL, "other_owner", run1) is None
+    assert ResultsDatabase.LoadRun(filename, "https://github.other.com", "owner") is None
+    assert ResultsDatabase.LoadRun(filename, _GITHUB_URL, "owner", 1000) is None
+
+
+# ----------------------------------------------------------------------
+def test_IncompleteRun(tmp_path):
+    filename = tmp_path / "Results.db"
+
+    results = {"Repo{}".format(index): _FINDINGS[:index % 3] for index in range(5)}
+
+    run_id = _WriteRun(filename, results, complete=False, batch_size=2)
+
+    # Incomplete runs are not used as the most recent run, but their results are available
+    assert ResultsDatabase.LoadRun(filename, _GITHUB_URL, "owner") is None
+    assert ResultsDatabase.LoadRun(filename, _GITHUB_URL, "owner", run_id) == results
+
+    connection = sqlite3.connect(filename)
+
+    try:
+        assert connection.execute("SELECT completed_at, returncode FROM runs").fetchall() == [(None, None)]
+    finally:
+        connection.close()
+
+
+# ----------------------------------------------------------------------
+def test_Batches(tmp_path):
+    filename = tmp_path / "Results.db"
+
+    results_db = ResultsDatabase(filename, _GITHUB_URL, "owner", batch_size=2)
+
+    try:
+        results_db.WriteRepository("Repo1", 0, [])
+        assert ResultsDatabase.LoadRun(filename, _GITHUB_URL, "owner", results_db.run_id) == {}
+
+        # Results are written once the batch is full
+        results_db.WriteRepository("Repo2", -1, _FINDINGS[:1])
+        assert ResultsDatabase.LoadRun(filename, _GITHUB_URL, "owner", results_db.run_id) == {
+            "Repo1": [],
+            "Repo2": _FINDINGS[:1],
+        }
+
+        results_db.WriteRepository("Repo3", 0, [])
+
+    finally:
+        results_db.Close()
+
+    # Pending results are written when the database is closed
+    assert ResultsDatabase.LoadRun(filename, _GITHUB_URL, "owner", results_db.run_id) == {
+        "Repo1": [],
+        "Repo2": _FINDINGS[:1],
+        "Repo3": [],
+    }
+
+
+# ----------------------------------------------------------------------
+def test_InvalidDatabase(tmp_path):
+    filename = tmp_path / "Results.db"
+    filename.write_text("This is not a database", encoding="utf-8")
+
+    with pytest.raises(Exception, match="is not a valid results database"):
+        ResultsDatabase.LoadRun(filename, _GITHUB_URL, "owner")
+
+    with pytest.raises(Exception, match="is not a valid results database"):
+        ResultsDatabase.LoadRun(tmp_path / "Missing.db", _GITHUB_URL, "owner")
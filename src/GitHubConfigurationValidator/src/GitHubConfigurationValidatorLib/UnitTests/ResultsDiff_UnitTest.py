@@ -0,0 +1,152 @@
+# ----------------------------------------------------------------------
+# |
+# |  ResultsDiff_UnitTest.py
+# |
+# |  David Brownell <db@DavidBrownell.com>
+# |      2023-12-12 10:45:16
+# |
+# ----------------------------------------------------------------------
+# |
+# |  Copyright David Brownell 2023
+# |  Distributed under the Boost Software License, Version 1.0. See
+# |  accompanying file LICENSE_1_0.txt or copy at
+# |  http://www.boost.org/LICENSE_1_0.txt.
+# |
+# ----------------------------------------------------------------------
+"""Unit tests for ResultsDiff.py"""
+
+import sys
+
+from pathlib import Path
+
+import pytest
+
+from Common_Foundation.ContextlibEx import ExitStack
+from Common_Foundation import PathEx
+
+
+# ----------------------------------------------------------------------
+sys.path.insert(0, str(PathEx.EnsureDir(Path(__file__).parent.parent.parent)))
+with ExitStack(lambda: sys.path.pop(0)):
+    from GitHubConfigurationValidatorLib.Finding import Finding
+    from GitHubConfigurationValidatorLib.JsonLinesWriter import JsonLinesWriter
+    from GitHubConfigurationValidatorLib.Plugin import Plugin
+    from GitHubConfigurationValidatorLib.ResultsDatabase import ResultsDatabase
+    from GitHubConfigurationValidatorLib.ResultsDiff import ResultsDiff
+
+
+# ----------------------------------------------------------------------
+_GITHUB_URL                                 = "https://github.com"
+
+_ERROR                                      = Finding("One", Plugin.MessageType.Error, "Error message")
+_WARNING                                    = Finding("Two", Plugin.MessageType.Warning, "Warning message")
+_INFO                                       = Finding("Three", Plugin.MessageType.Info, "Info message")
+
+
+# ----------------------------------------------------------------------
+def test_Compare():
+    diff = ResultsDiff(
+        Path("Previous.jsonl"),
+        {
+            "Repo": [_ERROR, _WARNING, _INFO],
+            "Clean": [],
+        },
+    )
+
+    assert diff.num_previous_repositories == 2
+
+    # No changes
+    assert diff.Compare("Repo", [_INFO, _WARNING, _ERROR]) == []
+    assert diff.Compare("Clean", []) == []
+
+    new_error = Finding("Four", Plugin.MessageType.Error, "New error")
+    changed_warning = Finding("Two", Plugin.MessageType.Error, "Warning message")
+
+    assert diff.Compare("Repo", [new_error, changed_warning, _INFO]) == [
+        ResultsDiff.Change(ResultsDiff.ChangeType.New, new_error),
+        ResultsDiff.Change(ResultsDiff.ChangeType.Changed, changed_warning, Plugin.MessageType.Warning),
+        ResultsDiff.Change(ResultsDiff.ChangeType.Resolved, _ERROR),
+    ]
+
+    # The same message from a different plugin is a different finding
+    other_plugin = Finding("Other", Plugin.MessageType.Error, "Error message")
+
+    assert diff.Compare("Repo", [other_plugin, _WARNING, _INFO]) == [
+        ResultsDiff.Change(ResultsDiff.ChangeType.New, other_plugin),
+        ResultsDiff.Change(ResultsDiff.ChangeType.Resolved, _ERROR),
+    ]
+
+    # Repositories that were not validated during the previous run
+    assert diff.Compare("NewRepo", [_ERROR]) == [ResultsDiff.Change(ResultsDiff.ChangeType.New, _ERROR)]
+    assert diff.Compare("NewRepo", []) == []
+
+
+# ----------------------------------------------------------------------
+def test_CompareDuplicates():
+    diff = ResultsDiff(Path("Previous.jsonl"), {"Repo": [_ERROR, _ERROR, _WARNING]})
+
+    # Duplicate findings are only reported once
+    assert diff.Compare("Repo", [_WARNING, _WARNING]) == [
+        ResultsDiff.Change(ResultsDiff.ChangeType.Resolved, _ERROR),
+    ]
+
+    assert diff.Compare("Repo", [_ERROR, _WARNING, _INFO, _INFO]) == [
+        ResultsDiff.Change(ResultsDiff.ChangeType.New, _INFO),
+    ]
+
+
+# ----------------------------------------------------------------------
+def test_LoadJsonLines(tmp_path):
+    filename = tmp_path / "Results.jsonl"
+
+    writer = JsonLinesWriter(filename)
+
+    try:
+        writer.WriteRepository("Repo", -1, [_ERROR, _WARNING])
+        writer.WriteRepository("Clean", 0, [])
+    finally:
+        writer.Close()
+
+    diff = ResultsDiff.Load(filename, _GITHUB_URL, "owner")
+
+    assert diff.filename == filename
+    assert diff.num_previous_repositories == 2
+    assert diff.Compare("Repo", [_WARNING]) == [ResultsDiff.Change(ResultsDiff.ChangeType.Resolved, _ERROR)]
+
+
+# ----------------------------------------------------------------------
+def test_LoadDatabase(tmp_path):
+    filename = tmp_path / "Results.db"
+
+    results_db = ResultsDatabase(filename, _GITHUB_URL, "owner")
+
+    try:
+        results_db.WriteRepository("Repo", -1, [_ERROR, _WARNING])
+        results_db.WriteRepository("Clean", 0, [])
+        results_db.Complete(-1)
+    finally:
+        results_db.Close()
+
+    diff = ResultsDiff.Load(filename, _GITHUB_URL, "owner")
+
+    assert diff.num_previous_repositories == 2
+    assert diff.Compare("Repo", [_WARNING]) == [ResultsDiff.Change(ResultsDiff.ChangeType.Resolved, _ERROR)]
+
+    # The database must contain a complete run for the GitHub url and user/organization
+    with pytest.raises(Exception, match="does not contain a complete run for 'owner' at 'https://github.example.com'"):
+        ResultsDiff.Load(filename, "https://github.example.com", "owner")
+
+    with pytest.raises(Exception, match="does not contain a complete run for 'other_owner'"):
+        ResultsDiff.Load(filename, _GITHUB_URL, "other_owner")
+
+
+# ----------------------------------------------------------------------
+def test_LoadErrors(tmp_path):
+    with pytest.raises(Exception, match="could not be read"):
+        ResultsDiff.Load(tmp_path / "Missing.jsonl", _GITHUB_URL, "owner")
+
+    filename = tmp_path / "Invalid.jsonl"
+    filename.write_text("not json\n", encoding="utf-8")
+
+    with pytest.raises(Exception, match="is not a valid JSON Lines results file"):
+        ResultsDiff.Load(filename, _GITHUB_URL, "owner")
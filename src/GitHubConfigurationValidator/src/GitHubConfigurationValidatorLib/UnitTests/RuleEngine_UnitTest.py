@@ -0,0 +1,348 @@
+# ----------------------------------------------------------------------
+# |
+# |  RuleEngine_UnitTest.py
+# |
+# |  David Brownell <db@DavidBrownell.com>
+# |      2023-12-04 08:02:44
+# |
+# ----------------------------------------------------------------------
+# |
+# |  Copyright David Brownell 2023
+# |  Distributed under the Boost Software License, Version 1.0. See
+# |  accompanying file LICENSE_1_0.txt or copy at
+# |  http://www.boost.org/LICENSE_1_0.txt.
+# |
+# ----------------------------------------------------------------------
+"""Unit tests for RuleEngine.py"""
+
+import sys
+
+from pathlib import Path
+from typing import Any, Optional
+
+import pytest
+
+from semantic_version import Version as SemVer
+
+from Common_Foundation.ContextlibEx import ExitStack
+from Common_Foundation import PathEx
+
+
+# ----------------------------------------------------------------------
+sys.path.insert(0, str(PathEx.EnsureDir(Path(__file__).parent.parent.parent)))
+with ExitStack(lambda: sys.path.pop(0)):
+    from GitHubConfigurationValidatorLib.Plugin import Plugin
+    from GitHubConfigurationValidatorLib.RuleEngine import *
+
+
+# ----------------------------------------------------------------------
+class _Plugin(Plugin):
+    # ----------------------------------------------------------------------
+    def __init__(
+        self,
+        name: str,
+        rule: Optional[Rule],
+        configuration_type: Plugin.ConfigurationType=Plugin.ConfigurationType.Repository,
+    ):
+        super(_Plugin, self).__init__(name, configuration_type, SemVer("0.1.0"), "Description", "Resolution")
+
+        self._rule                          = rule
+
+    # ----------------------------------------------------------------------
+    def GetRule(self) -> Optional[Rule]:
+        return self._rule
+
+    # ----------------------------------------------------------------------
+    def Validate(
+        self,
+        configuration: dict[str, Any],
+    ) -> Plugin.ValidateResultType:
+        assert self._rule is not None
+        return self._rule.Evaluate(configuration)
+
+
+# ----------------------------------------------------------------------
+def _CreateRule(
+    value: ConfigurationValue,
+    expected_value: Any=True,
+) -> Rule:
+    return Rule(value, expected_value, lambda value: "Actual: {}".format(value))
+
+
+# ----------------------------------------------------------------------
+class TestConfigurationValue(object):
+    # ----------------------------------------------------------------------
+    def test_Defaults(self):
+        value = ConfigurationValue(("a", "b"))
+
+        assert value.path == ("a", "b")
+        assert value.type == ConfigurationValue.Type.Value
+        assert value.missing_behavior == ConfigurationValue.MissingBehavior.Error
+        assert value.missing_message is None
+        assert value.condition_path is None
+
+    # ----------------------------------------------------------------------
+    def test_InvalidMissingMessage(self):
+        with pytest.raises(AssertionError):
+            ConfigurationValue(("a", ), missing_behavior=ConfigurationValue.MissingBehavior.Warning)
+
+        with pytest.raises(AssertionError):
+            ConfigurationValue(("a", ), missing_message="Missing")
+
+    # ----------------------------------------------------------------------
+    def test_InvalidPath(self):
+        with pytest.raises(AssertionError):
+            ConfigurationValue(())
+
+
+# ----------------------------------------------------------------------
+class TestRule(object):
+    # ----------------------------------------------------------------------
+    def test_Value(self):
+        rule = _CreateRule(ConfigurationValue(("a", "b")))
+
+        assert rule.Evaluate({"a": {"b": True}}) is None
+        assert rule.Evaluate({"a": {"b": False}}) == "Actual: False"
+        assert rule.Evaluate({"a": {"b": None}}) == "Actual: None"
+
+    # ----------------------------------------------------------------------
+    def test_ValueMissing(self):
+        rule = _CreateRule(ConfigurationValue(("a", "b")))
+
+        with pytest.raises(KeyError, match="'a'"):
+            rule.Evaluate({})
+
+        with pytest.raises(KeyError, match="'b'"):
+            rule.Evaluate({"a": {}})
+
+        # None sub-objects are treated as missing
+        with pytest.raises(KeyError, match="'b'"):
+            rule.Evaluate({"a": None})
+
+    # ----------------------------------------------------------------------
+    def test_Exists(self):
+        rule = _CreateRule(ConfigurationValue(("a", ), ConfigurationValue.Type.Exists))
+
+        assert rule.Evaluate({"a": {}}) is None
+        assert rule.Evaluate({"a": None}) == "Actual: False"
+        assert rule.Evaluate({}) == "Actual: False"
+
+    # ----------------------------------------------------------------------
+    def test_Enabled(self):
+        rule = _CreateRule(ConfigurationValue(("a", "status"), ConfigurationValue.Type.Enabled))
+
+        assert rule.Evaluate({"a": {"status": "enabled"}}) is None
+        assert rule.Evaluate({"a": {"status": "disabled"}}) == "Actual: False"
+
+        with pytest.raises(KeyError, match="'status'"):
+            rule.Evaluate({"a": {}})
+
+    # ----------------------------------------------------------------------
+    @pytest.mark.parametrize("configuration", [{}, {"a": None}])
+    def test_MissingSkip(self, configuration):
+        rule = _CreateRule(ConfigurationValue(("a", "b"), missing_behavior=ConfigurationValue.MissingBehavior.Skip))
+
+        assert rule.Evaluate(configuration) is None
+        assert rule.Evaluate({"a": {"b": False}}) == "Actual: False"
+
+        # Only the top-level object is optional
+        with pytest.raises(KeyError, match="'b'"):
+            rule.Evaluate({"a": {}})
+
+    # ----------------------------------------------------------------------
+    @pytest.mark.parametrize("configuration", [{}, {"a": None}])
+    def test_MissingNull(self, configuration):
+        rule = _CreateRule(ConfigurationValue(("a", "b"), missing_behavior=ConfigurationValue.MissingBehavior.Null))
+
+        assert rule.Evaluate(configuration) == "Actual: None"
+        assert _CreateRule(rule.value, None).Evaluate(configuration) is None
+
+    # ----------------------------------------------------------------------
+    def test_MissingNullIfNone(self):
+        rule = _CreateRule(ConfigurationValue(("a", "b"), missing_behavior=ConfigurationValue.MissingBehavior.NullIfNone))
+
+        assert rule.Evaluate({"a": None}) == "Actual: None"
+        assert rule.Evaluate({"a": {"b": True}}) is None
+
+        with pytest.raises(KeyError, match="'a'"):
+            rule.Evaluate({})
+
+    # ----------------------------------------------------------------------
+    @pytest.mark.parametrize("configuration", [{}, {"a": None}])
+    def test_MissingWarning(self, configuration):
+        rule = _CreateRule(
+            ConfigurationValue(
+                ("a", "b"),
+                missing_behavior=ConfigurationValue.MissingBehavior.Warning,
+                missing_message="Missing 'a'",
+            ),
+        )
+
+        assert rule.Evaluate(configuration) == (Plugin.MessageType.Warning, "Missing 'a'")
+
+    # ----------------------------------------------------------------------
+    def test_MissingEnabled(self):
+        rule = _CreateRule(
+            ConfigurationValue(
+                ("a", "b", "status"),
+                ConfigurationValue.Type.Enabled,
+                ConfigurationValue.MissingBehavior.Warning,
+                "Missing 'a'",
+            ),
+        )
+
+        assert rule.Evaluate({}) == (Plugin.MessageType.Warning, "Missing 'a'")
+        assert rule.Evaluate({"a": {"b": {"status": "enabled"}}}) is None
+        assert rule.Evaluate({"a": {"b": {"status": "disabled"}}}) == "Actual: False"
+
+    # ----------------------------------------------------------------------
+    def test_Condition(self):
+        rule = _CreateRule(ConfigurationValue(("value", ), condition_path=("condition", )), "expected")
+
+        assert rule.Evaluate({"condition": True, "value": "expected"}) is None
+        assert rule.Evaluate({"condition": True, "value": "other"}) == "Actual: other"
+        assert rule.Evaluate({"condition": False, "value": "other"}) is None
+        assert rule.Evaluate({"condition": None, "value": "other"}) is None
+
+        # The value isn't required when the condition is not satisfied
+        assert rule.Evaluate({"condition": False}) is None
+
+        with pytest.raises(KeyError, match="'value'"):
+            rule.Evaluate({"condition": True})
+
+        with pytest.raises(KeyError, match="'condition'"):
+            rule.Evaluate({"value": "expected"})
+
+    # ----------------------------------------------------------------------
+    def test_Representation(self):
+        # The error function is not a part of the representation or comparison, as the representation
+        # is a part of the persisted policy
+        rule1 = Rule(ConfigurationValue(("a", )), True, lambda value: "One")
+        rule2 = Rule(ConfigurationValue(("a", )), True, lambda value: "Two")
+
+        assert repr(rule1) == repr(rule2)
+        assert rule1 == rule2
+        assert "lambda" not in repr(rule1)
+
+
+# ----------------------------------------------------------------------
+class TestRuleEngine(object):
+    # ----------------------------------------------------------------------
+    def test_Evaluate(self):
+        engine = RuleEngine(
+            [
+                _Plugin("One", _CreateRule(ConfigurationValue(("a", )))),
+                _Plugin("Two", _CreateRule(ConfigurationValue(("b", "c")), "value")),
+                _Plugin("Three", _CreateRule(ConfigurationValue(("b", "d")))),
+                _Plugin("Four", None),
+                _Plugin("Five", _CreateRule(ConfigurationValue(("a", ))), Plugin.ConfigurationType.Branch),
+            ],
+        )
+
+        results = engine.Evaluate(Plugin.ConfigurationType.Repository, {"a": True, "b": {"c": "other"}})
+
+        assert list(results.keys()) == ["One", "Two", "Three"]
+        assert results["One"] is None
+        assert results["Two"] == "Actual: other"
+
+        # KeyErrors are returned rather than raised
+        assert isinstance(results["Three"], KeyError)
+        assert results["Three"].args == ("d", )
+
+        assert engine.Evaluate(Plugin.ConfigurationType.Branch, {"a": False}) == {"Five": "Actual: False"}
+        assert engine.Evaluate(Plugin.ConfigurationType.BranchProtection, {"a": False}) == {}
+
+    # ----------------------------------------------------------------------
+    def test_EvaluateMatchesRule(self):
+        configurations: list[dict[str, Any]] = [
+            {},
+            {"a": None},
+            {"a": {}},
+            {"a": {"b": True}},
+            {"a": {"b": False}},
+            {"a": {"b": None}},
+        ]
+
+        values = [
+            ConfigurationValue(("a", "b")),
+            ConfigurationValue(("a", ), ConfigurationValue.Type.Exists),
+            ConfigurationValue(("a", "b"), missing_behavior=ConfigurationValue.MissingBehavior.Skip),
+            ConfigurationValue(("a", "b"), missing_behavior=ConfigurationValue.MissingBehavior.Null),
+            ConfigurationValue(("a", "b"), missing_behavior=ConfigurationValue.MissingBehavior.NullIfNone),
+            ConfigurationValue(("a", "b"), missing_behavior=ConfigurationValue.MissingBehavior.Warning, missing_message="Missing"),
+        ]
+
+        plugins = [_Plugin("Plugin{}".format(index), _CreateRule(value)) for index, value in enumerate(values)]
+
+        engine = RuleEngine(plugins)
+
+        columns = engine.EvaluateColumns(Plugin.ConfigurationType.Repository, configurations)
+
+        for row_index, configuration in enumerate(configurations):
+            results = engine.Evaluate(Plugin.ConfigurationType.Repository, configuration)
+
+            for plugin in plugins:
+                try:
+                    expected = plugin.Validate(configuration)
+                except KeyError as ex:
+                    expected = ex
+
+                for result in [results[plugin.name], columns[plugin.name][row_index]]:
+                    if isinstance(expected, KeyError):
+                        assert isinstance(result, KeyError)
+                        assert result.args == expected.args
+                    else:
+                        assert result == expected
+
+    # ----------------------------------------------------------------------
+    def test_EvaluateColumnsNoneConfigurations(self):
+        engine = RuleEngine([_Plugin("One", _CreateRule(ConfigurationValue(("a", ))))])
+
+        assert engine.EvaluateColumns(
+            Plugin.ConfigurationType.Repository,
+            [{"a": True}, None, {"a": False}],
+        ) == {
+            "One": [None, None, "Actual: False"],
+        }
+
+    # ----------------------------------------------------------------------
+    def test_EvaluateMatrix(self):
+        engine = RuleEngine(
+            [
+                _Plugin("One", _CreateRule(ConfigurationValue(("a", )))),
+                _Plugin("Two", _CreateRule(ConfigurationValue(("protected", ))), Plugin.ConfigurationType.Branch),
+            ],
+        )
+
+        matrix = engine.EvaluateMatrix(
+            [
+                {
+                    Plugin.ConfigurationType.Repository: {"a": False},
+                    Plugin.ConfigurationType.Branch: {"protected": True},
+                },
+                None,
+                {
+                    Plugin.ConfigurationType.Repository: {"a": True},
+                },
+            ],
+        )
+
+        assert matrix.num_rows == 3
+
+        assert matrix.GetRow(0) == {
+            Plugin.ConfigurationType.Repository: {"One": "Actual: False"},
+            Plugin.ConfigurationType.Branch: {"Two": None},
+        }
+
+        assert matrix.GetRow(1) == {
+            Plugin.ConfigurationType.Repository: {"One": None},
+            Plugin.ConfigurationType.Branch: {"Two": None},
+        }
+
+        assert matrix.GetRow(2) == {
+            Plugin.ConfigurationType.Repository: {"One": None},
+            Plugin.ConfigurationType.Branch: {"Two": None},
+        }
+
+        with pytest.raises(AssertionError):
+            matrix.GetRow(3)
@@ -0,0 +1,223 @@
+# ----------------------------------------------------------------------
+# |
+# |  Snapshot_UnitTest.py
+# |
+# |  David Brownell <db@DavidBrownell.com>
+# |      2023-12-12 13:20:37
+# |
+# ----------------------------------------------------------------------
+# |
+# |  Copyright David Brownell 2023
+# |  Distributed under the Boost Software License, Version 1.0. See
+# |  accompanying file LICENSE_1_0.txt or copy at
+# |  http://www.boost.org/LICENSE_1_0.txt.
+# |
+# ----------------------------------------------------------------------
+"""Unit tests for Snapshot.py"""
+
+import json
+import sys
+import zipfile
+
+from pathlib import Path
+
+import pytest
+
+from Common_Foundation.ContextlibEx import ExitStack
+from Common_Foundation import PathEx
+
+
+# ----------------------------------------------------------------------
+sys.path.insert(0, str(PathEx.EnsureDir(Path(__file__).parent.parent.parent)))
+with ExitStack(lambda: sys.path.pop(0)):
+    from GitHubConfigurationValidatorLib.Plugin import Plugin
+    from GitHubConfigurationValidatorLib.Snapshot import Snapshot, SnapshotWriter
+
+
+# ----------------------------------------------------------------------
+_GITHUB_URL                                 = "https://github.com"
+
+
+# ----------------------------------------------------------------------
+def _CreateRepository(
+    name: str,
+    is_protected: bool,
+) -> Snapshot.Repository:
+    return Snapshot.Repository(
+        {
+            "name": name,
+            "default_branch": "main",
+        },
+        {
+            Plugin.ConfigurationType.Repository: {
+                "name": name,
+                "allow_auto_merge": True,
+            },
+            Plugin.ConfigurationType.Branch: {
+                "name": "main",
+                "protected": is_protected,
+            },
+            Plugin.ConfigurationType.BranchProtection: {"enforce_admins": {"enabled": True}} if is_protected else None,
+        },
+    )
+
+
+# ----------------------------------------------------------------------
+def test_WriteAndLoad(tmp_path):
+    filename = tmp_path / "Dir" / "Snapshot.zip"
+
+    repositories = [
+        _CreateRepository("Repo2", True),
+        _CreateRepository("Repo1", False),
+    ]
+
+    writer = SnapshotWriter(filename, _GITHUB_URL, "owner", True)
+
+    for repository in repositories:
+        writer.Add(repository.repository_info, repository.configurations)
+
+    assert writer.num_repositories == 2
+
+    # The snapshot isn't available until it is closed
+    assert not filename.exists()
+
+    writer.Close()
+
+    assert filename.is_file()
+    assert not (tmp_path / "Dir" / "Snapshot.zip.tmp").exists()
+
+    snapshot = Snapshot.Load(filename)
+
+    try:
+        assert snapshot.filename == filename
+        assert snapshot.github_url == _GITHUB_URL
+        assert snapshot.username == "owner"
+        assert snapshot.has_pat is True
+        assert snapshot.created_at
+
+        assert snapshot.repositories == ["Repo1", "Repo2"]
+        assert snapshot.failed_repositories == []
+
+        assert snapshot.GetRepository("Repo2") == repositories[0]
+        assert snapshot.GetRepository("Repo1") == repositories[1]
+
+        assert list(snapshot.EnumRepositories()) == [repositories[1], repositories[0]]
+
+        with pytest.raises(KeyError):
+            snapshot.GetRepository("Repo3")
+
+    finally:
+        snapshot.Close()
+
+
+# ----------------------------------------------------------------------
+def test_PartialConfigurations(tmp_path):
+    filename = tmp_path / "Snapshot.zip"
+
+    # Configurations that were not retrieved are not included
+    writer = SnapshotWriter(filename, _GITHUB_URL, "owner", False)
+    writer.Add({"name": "Repo"}, {Plugin.ConfigurationType.Repository: {"name": "Repo"}})
+    writer.Close()
+
+    snapshot = Snapshot.Load(filename)
+
+    try:
+        assert snapshot.has_pat is False
+        assert snapshot.GetRepository("Repo").configurations == {Plugin.ConfigurationType.Repository: {"name": "Repo"}}
+    finally:
+        snapshot.Close()
+
+
+# ----------------------------------------------------------------------
+def test_FailedRepositories(tmp_path):
+    filename = tmp_path / "Snapshot.zip"
+
+    writer = SnapshotWriter(filename, _GITHUB_URL, "owner", True)
+    writer.Add({"name": "Repo"}, {})
+    writer.AddFailure({"name": "Failed", "archived": False})
+
+    assert writer.num_repositories == 1
+    assert writer.num_failed_repositories == 1
+
+    with pytest.raises(AssertionError):
+        writer.AddFailure({"name": "Repo"})
+
+    writer.Close()
+
+    snapshot = Snapshot.Load(filename)
+
+    try:
+        # Repositories that could not be exported are listed separately
+        assert snapshot.repositories == ["Repo"]
+        assert snapshot.failed_repositories == [{"name": "Failed", "archived": False}]
+
+        with pytest.raises(KeyError):
+            snapshot.GetRepository("Failed")
+
+    finally:
+        snapshot.Close()
+
+
+# ----------------------------------------------------------------------
+def test_Discard(tmp_path):
+    filename = tmp_path / "Snapshot.zip"
+
+    writer = SnapshotWriter(filename, _GITHUB_URL, "owner", True)
+    writer.Add({"name": "Repo"}, {})
+    writer.Close()
+
+    # An incomplete snapshot doesn't replace the existing snapshot
+    writer = SnapshotWriter(filename, _GITHUB_URL, "other_owner", True)
+    writer.Add({"name": "Other"}, {})
+    writer.Close(commit=False)
+
+    assert list(tmp_path.iterdir()) == [filename]
+
+    snapshot = Snapshot.Load(filename)
+
+    try:
+        assert snapshot.username == "owner"
+        assert snapshot.repositories == ["Repo"]
+    finally:
+        snapshot.Close()
+
+
+# ----------------------------------------------------------------------
+def test_DuplicateRepository(tmp_path):
+    writer = SnapshotWriter(tmp_path / "Snapshot.zip", _GITHUB_URL, "owner", True)
+
+    try:
+        writer.Add({"name": "Repo"}, {})
+
+        with pytest.raises(AssertionError):
+            writer.Add({"name": "Repo"}, {})
+
+    finally:
+        writer.Close(commit=False)
+
+
+# ----------------------------------------------------------------------
+def test_InvalidSnapshots(tmp_path):
+    with pytest.raises(Exception, match="is not a valid snapshot"):
+        Snapshot.Load(tmp_path / "Missing.zip")
+
+    filename = tmp_path / "Snapshot.zip"
+
+    filename.write_text("Not a zip file", encoding="utf-8")
+
+    with pytest.raises(Exception, match="is not a valid snapshot"):
+        Snapshot.Load(filename)
+
+    # No index
+    with zipfile.ZipFile(filename, "w") as zip_file:
+        zip_file.writestr("repositories/000000.json", "{}")
+
+    with pytest.raises(Exception, match="is not a valid snapshot"):
+        Snapshot.Load(filename)
+
+    # Unsupported version
+    with zipfile.ZipFile(filename, "w") as zip_file:
+        zip_file.writestr(Snapshot.INDEX_NAME, json.dumps({"format_version": Snapshot.FILE_FORMAT_VERSION + 1}))
+
+    with pytest.raises(Exception, match="is not a supported snapshot"):
+        Snapshot.Load(filename)
@@ -0,0 +1,238 @@
+# ----------------------------------------------------------------------
+# |
+# |  ValidationState_UnitTest.py
+# |
+# |  David Brownell <db@DavidBrownell.com>
+# |      2023-12-11 10:58:31
+# |
+# ----------------------------------------------------------------------
+# |
+# |  Copyright David Brownell 2023
+# |  Distributed under the Boost Software License, Version 1.0. See
+# |  accompanying file LICENSE_1_0.txt or copy at
+# |  http://www.boost.org/LICENSE_1_0.txt.
+# |
+# ----------------------------------------------------------------------
+"""Unit tests for ValidationState.py"""
+
+import sqlite3
+import sys
+
+from pathlib import Path
+from typing import Any, Optional
+
+from semantic_version import Version as SemVer
+
+from Common_Foundation.ContextlibEx import ExitStack
+from Common_Foundation import PathEx
+
+
+# ----------------------------------------------------------------------
+sys.path.insert(0, str(PathEx.EnsureDir(Path(__file__).parent.parent.parent)))
+with ExitStack(lambda: sys.path.pop(0)):
+    from GitHubConfigurationValidatorLib.Finding import Finding
+    from GitHubConfigurationValidatorLib.Plugin import Plugin
+    from GitHubConfigurationValidatorLib.ValidationState import ValidationState
+
+
+# ----------------------------------------------------------------------
+_GITHUB_URL                                 = "https://github.com"
+
+
+# ----------------------------------------------------------------------
+def _CreateRepositoryInfo(
+    name: str="Repo",
+    updated_at: Optional[str]="2023-12-01T00:00:00Z",
+    pushed_at: Optional[str]="2023-12-02T00:00:00Z",
+) -> dict[str, Any]:
+    return {
+        "name": name,
+        "updated_at": updated_at,
+        "pushed_at": pushed_at,
+    }
+
+
+# ----------------------------------------------------------------------
+_FINDINGS                                   = [
+    Finding("One", Plugin.MessageType.Error, "Error message"),
+    Finding("Two", Plugin.MessageType.Warning, "Warning message"),
+]
+
+
+# ----------------------------------------------------------------------
+def test_SetAndGet(tmp_path):
+    state = ValidationState(tmp_path / "State.db", _GITHUB_URL, "owner", "policy")
+
+    try:
+        repository_info = _CreateRepositoryInfo()
+
+        assert state.IsCurrent(repository_info) is False
+        assert state.Get(repository_info) is None
+
+        assert state.Set(repository_info, -1, "Output", _FINDINGS, ["Three"]) is True
+
+        assert state.IsCurrent(repository_info) is True
+        assert state.Get(repository_info) == ValidationState.Entry(-1, "Output", _FINDINGS, ["Three"])
+
+        # Results are replaced
+        assert state.Set(repository_info, 0, None, [], []) is True
+        assert state.Get(repository_info) == ValidationState.Entry(0, None, [], [])
+
+        assert (state.num_replayed, state.num_validated) == (2, 2)
+        assert state.GetStatisticsString() == "Validation state: 2 replayed, 2 validated.\n"
+
+    finally:
+        state.Close()
+
+
+# ----------------------------------------------------------------------
+def test_Markers(tmp_path):
+    state = ValidationState(tmp_path / "State.db", _GITHUB_URL, "owner", "policy")
+
+    try:
+        state.Set(_CreateRepositoryInfo(), 0, None, [], [])
+
+        # The repository has changed
+        assert state.Get(_CreateRepositoryInfo(pushed_at="2023-12-03T00:00:00Z")) is None
+        assert state.Get(_CreateRepositoryInfo(updated_at="2023-12-03T00:00:00Z")) is None
+
+        # Results without markers can't be replayed
+        repository_info = _CreateRepositoryInfo(pushed_at=None)
+
+        assert ValidationState.CreateMarkers(repository_info) is None
+        assert state.Set(repository_info, 0, None, [], []) is False
+        assert state.IsCurrent(repository_info) is False
+
+        assert state.num_validated == 2
+
+    finally:
+        state.Close()
+
+
+# ----------------------------------------------------------------------
+def test_Key(tmp_path):
+    filename = tmp_path / "State.db"
+    repository_info = _CreateRepositoryInfo()
+
+    state = ValidationState(filename, _GITHUB_URL, "owner", "policy")
+
+    try:
+        state.Set(repository_info, -1, "Output", [], [])
+    finally:
+        state.Close()
+
+    # Results are persisted
+    state = ValidationState(filename, _GITHUB_URL, "owner", "policy")
+
+    try:
+        assert state.IsCurrent(repository_info) is True
+        assert state.IsCurrent(_CreateRepositoryInfo("Other")) is False
+    finally:
+        state.Close()
+
+    # Results are not replayed for a different GitHub instance, owner, or policy
+    for github_url, owner, policy in [
+        ("https://github.example.com", "owner", "policy"),
+        (_GITHUB_URL, "other_owner", "policy"),
+        (_GITHUB_URL, "owner", "other_policy"),
+    ]:
+        state = ValidationState(filename, github_url, owner, policy)
+
+        try:
+            assert state.IsCurrent(repository_info) is False
+
+            # The same repository name for a different GitHub instance or owner is a different entry
+            state.Set(repository_info, 0, None, [], [])
+
+        finally:
+            state.Close()
+
+    state = ValidationState(filename, _GITHUB_URL, "owner", "policy")
+
+    try:
+        # Replaced by the results with a different policy
+        assert state.IsCurrent(repository_info) is False
+    finally:
+        state.Close()
+
+    for github_url, owner in [
+        ("https://github.example.com", "owner"),
+        (_GITHUB_URL, "other_owner"),
+    ]:
+        state = ValidationState(filename, github_url, owner, "policy")
+
+        try:
+            assert state.IsCurrent(repository_info) is True
+        finally:
+            state.Close()
+
+
+# ----------------------------------------------------------------------
+def test_Migration(tmp_path):
+    filename = tmp_path / "State.db"
+
+    # Stores created by earlier versions were keyed by repository name alone
+    connection = sqlite3.connect(filename)
+
+    connection.execute(
+        """
+        CREATE TABLE results (
+            repository TEXT PRIMARY KEY NOT NULL,
+            markers TEXT NOT NULL,
+            policy TEXT NOT NULL,
+            returncode INTEGER NOT NULL,
+            output TEXT
+        )
+        """,
+    )
+
+    repository_info = _CreateRepositoryInfo()
+
+    connection.execute(
+        "INSERT INTO results VALUES (?, ?, ?, ?, ?)",
+        ("Repo", ValidationState.CreateMarkers(repository_info), "policy", 0, None),
+    )
+
+    connection.commit()
+    connection.close()
+
+    state = ValidationState(filename, _GITHUB_URL, "owner", "policy")
+
+    try:
+        assert state.IsCurrent(repository_info) is False
+
+        assert state.Set(repository_info, -1, None, _FINDINGS, []) is True
+        assert state.Get(repository_info) == ValidationState.Entry(-1, None, _FINDINGS, [])
+
+    finally:
+        state.Close()
+
+
+# ----------------------------------------------------------------------
+class _Plugin(Plugin):
+    # ----------------------------------------------------------------------
+    def __init__(
+        self,
+        name: str,
+        value: Any,
+    ):
+        super(_Plugin, self).__init__(name, Plugin.ConfigurationType.Repository, SemVer("0.1.0"), "Description", "Resolution")
+
+        self.value                          = value
+
+    # ----------------------------------------------------------------------
+    def Validate(self, configuration):
+        return None
+
+
+# ----------------------------------------------------------------------
+def test_CreatePolicy():
+    policy = ValidationState.CreatePolicy([_Plugin("One", 1), _Plugin("Two", 2)], setting=True)
+
+    # Plugin order doesn't matter
+    assert policy == ValidationState.CreatePolicy([_Plugin("Two", 2), _Plugin("One", 1)], setting=True)
+
+    # Plugins, their arguments, and settings do
+    assert policy != ValidationState.CreatePolicy([_Plugin("One", 1)], setting=True)
+    assert policy != ValidationState.CreatePolicy([_Plugin("One", 1), _Plugin("Two", 3)], setting=True)
+    assert policy != ValidationState.CreatePolicy([_Plugin("One", 1), _Plugin("Two", 2)], setting=False)
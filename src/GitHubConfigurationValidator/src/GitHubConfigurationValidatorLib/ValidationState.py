@@ -0,0 +1,275 @@
+# ----------------------------------------------------------------------
+# |
+# |  ValidationState.py
+# |
+# |  David Brownell <db@DavidBrownell.com>
+# |      2023-11-27 08:41:16
+# |
+# ----------------------------------------------------------------------
+# |
+# |  Copyright David Brownell 2023
+# |  Distributed under the Boost Software License, Version 1.0. See
+# |  accompanying file LICENSE_1_0.txt or copy at
+# |  http://www.boost.org/LICENSE_1_0.txt.
+# |
+# ----------------------------------------------------------------------
+"""Contains the ValidationState object"""
+
+import hashlib
+import json
+import sqlite3
+import threading
+
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Optional
+
+from GitHubConfigurationValidatorLib.Finding import Finding
+from GitHubConfigurationValidatorLib.Plugin import Plugin
+
+
+# ----------------------------------------------------------------------
+class ValidationState(object):
+    """\
+    On-disk store of the results of previous validations.
+
+    Results are stored per GitHub instance, owner, and repository and are associated with the change
+    markers of the repository (as provided by GitHub when listing repositories) and the policy
+    (plugins and their arguments) used during validation; results can be replayed without accessing
+    GitHub when neither has changed.
+    """
+
+    # ----------------------------------------------------------------------
+    # |
+    # |  Public Types
+    # |
+    # ----------------------------------------------------------------------
+    MARKER_KEYS                             = ["updated_at", "pushed_at"]
+
+    # ----------------------------------------------------------------------
+    @dataclass(frozen=True)
+    class Entry(object):
+        """Results of a previous validation"""
+
+        returncode: int
+        output: Optional[str]               # None if there wasn't any output to display
+        findings: list[Finding]
+        skipped_plugin_names: list[str]     # Plugins that were not evaluated
+
+    # ----------------------------------------------------------------------
+    # |
+    # |  Public Methods
+    # |
+    # ----------------------------------------------------------------------
+    def __init__(
+        self,
+        filename: Path,
+        github_url: str,
+        owner: str,
+        policy: str,
+    ):
+        filename.parent.mkdir(parents=True, exist_ok=True)
+
+        connection = sqlite3.connect(
+            filename,
+            check_same_thread=False,
+            isolation_level=None,
+        )
+
+        # Stores created by earlier versions were keyed by repository name alone (and may not have
+        # findings or skipped plugins); their results are discarded and replaced as repositories are
+        # validated.
+        columns = [row[1] for row in connection.execute("PRAGMA table_info(results)")]
+        if columns and any(column not in columns for column in ["github_url", "findings", "skipped_plugins"]):
+            connection.execute("DROP TABLE results")
+
+        connection.execute(
+            """
+            CREATE TABLE IF NOT EXISTS results (
+                github_url TEXT NOT NULL,
+                owner TEXT NOT NULL,
+                repository TEXT NOT NULL,
+                markers TEXT NOT NULL,
+                policy TEXT NOT NULL,
+                returncode INTEGER NOT NULL,
+                output TEXT,
+                findings TEXT NOT NULL,
+                skipped_plugins TEXT NOT NULL,
+                PRIMARY KEY (github_url, owner, repository)
+            )
+            """,
+        )
+
+        self.filename                       = filename
+        self.github_url                     = github_url
+        self.owner                          = owner
+        self.policy                         = policy
+
+        self._connection                    = connection
+        self._lock                          = threading.Lock()
+
+        self._num_replayed                  = 0
+        self._num_validated                 = 0
+
+    # ----------------------------------------------------------------------
+    def Close(self) -> None:
+        with self._lock:
+            self._connection.close()
+
+    # ----------------------------------------------------------------------
+    @property
+    def num_replayed(self) -> int:
+        return self._num_replayed
+
+    @property
+    def num_validated(self) -> int:
+        return self._num_validated
+
+    # ----------------------------------------------------------------------
+    @staticmethod
+    def CreatePolicy(
+        plugins: list[Plugin],
+        **settings: Any,
+    ) -> str:
+        """\
+        Creates a value that uniquely identifies the plugins, their arguments, and any other settings
+        that impact the results of a validation.
+        """
+
+        # The values provided on the command line are stored as instance attributes of the plugin
+        plugin_values = [
+            {
+                "name": plugin.name,
+                "version": str(plugin.version_introduced),
+                "attributes": vars(plugin),
+            }
+            for plugin in sorted(plugins, key=lambda plugin: plugin.name)
+        ]
+
+        return hashlib.sha256(
+            json.dumps(
+                {
+                    "plugins": plugin_values,
+                    "settings": settings,
+                },
+                sort_keys=True,
+                default=str,
+            ).encode("utf-8"),
+        ).hexdigest()
+
+    # ----------------------------------------------------------------------
+    @classmethod
+    def CreateMarkers(
+        cls,
+        repository_info: dict[str, Any],
+    ) -> Optional[str]:
+        """Returns the change markers for the repository, or None if they are not available"""
+
+        markers: dict[str, Any] = {}
+
+        for key in cls.MARKER_KEYS:
+            value = repository_info.get(key, None)
+            if value is None:
+                return None
+
+            markers[key] = value
+
+        return json.dumps(markers, sort_keys=True)
+
+    # ----------------------------------------------------------------------
+    def IsCurrent(
+        self,
+        repository_info: dict[str, Any],
+    ) -> bool:
+        """Returns True if the results of a previous validation can be replayed"""
+
+        return self._GetImpl(repository_info) is not None
+
+    # ----------------------------------------------------------------------
+    def Get(
+        self,
+        repository_info: dict[str, Any],
+    ) -> Optional["ValidationState.Entry"]:
+        """Returns the results of a previous validation if the repository and policy haven't changed"""
+
+        entry = self._GetImpl(repository_info)
+
+        if entry is not None:
+            with self._lock:
+                self._num_replayed += 1
+
+        return entry
+
+    # ----------------------------------------------------------------------
+    def Set(
+        self,
+        repository_info: dict[str, Any],
+        returncode: int,
+        output: Optional[str],
+        findings: list[Finding],
+        skipped_plugin_names: list[str],
+    ) -> bool:
+        """Stores the results of a validation; returns True if the results were stored"""
+
+        markers = self.__class__.CreateMarkers(repository_info)
+
+        with self._lock:
+            self._num_validated += 1
+
+            if markers is None:
+                return False
+
+            self._connection.execute(
+                "INSERT OR REPLACE INTO results (github_url, owner, repository, markers, policy, returncode, output, findings, skipped_plugins) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (
+                    self.github_url,
+                    self.owner,
+                    repository_info["name"],
+                    markers,
+                    self.policy,
+                    returncode,
+                    output,
+                    json.dumps([finding.ToJson() for finding in findings]),
+                    json.dumps(skipped_plugin_names),
+                ),
+            )
+
+        return True
+
+    # ----------------------------------------------------------------------
+    def GetStatisticsString(self) -> str:
+        return "Validation state: {} replayed, {} validated.\n".format(
+            self._num_replayed,
+            self._num_validated,
+        )
+
+    # ----------------------------------------------------------------------
+    # |
+    # |  Private Methods
+    # |
+    # ----------------------------------------------------------------------
+    def _GetImpl(
+        self,
+        repository_info: dict[str, Any],
+    ) -> Optional["ValidationState.Entry"]:
+        markers = self.__class__.CreateMarkers(repository_info)
+        if markers is None:
+            return None
+
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT returncode, output, findings, skipped_plugins FROM results WHERE github_url = ? AND owner = ? AND repository = ? AND markers = ? AND policy = ?",
+                (self.github_url, self.owner, repository_info["name"], markers, self.policy),
+            ).fetchone()
+
+        if row is None:
+            return None
+
+        returncode, output, findings, skipped_plugin_names = row
+
+        return ValidationState.Entry(
+            returncode,
+            output,
+            [Finding.FromJson(finding) for finding in json.loads(findings)],
+            json.loads(skipped_plugin_names),
+        )
@@ -21,6 +21,7 @@ from semantic_version import Version as SemVer
 
 from GitHubConfigurationValidatorLib.Plugin import Plugin as PluginBase
 from GitHubConfigurationValidatorLib.Impl.PluginImpl import CreateEnablePlugin
+from GitHubConfigurationValidatorLib.RuleEngine import ConfigurationValue
 
 
 # ----------------------------------------------------------------------
@@ -33,7 +34,7 @@ Plugin = CreateEnablePlugin(
     "settings/branches",
     "Protect matching branches",
     "Do not allow bypassing the above settings",
-    lambda configuration: configuration["enforce_admins"]["enabled"],
+    ConfigurationValue(("enforce_admins", "enabled")),
     rationale=textwrap.dedent(
         """\
         The default behavior is to not allow administrators to bypass branch protection settings.
@@ -21,6 +21,7 @@ from semantic_version import Version as SemVer
 
 from GitHubConfigurationValidatorLib.Plugin import Plugin as PluginBase
 from GitHubConfigurationValidatorLib.Impl.PluginImpl import CreateEnablePlugin
+from GitHubConfigurationValidatorLib.RuleEngine import ConfigurationValue
 
 
 # ----------------------------------------------------------------------
@@ -33,7 +34,7 @@ Plugin = CreateEnablePlugin(
     "settings/branches",
     "Rules applied to everyone including administrators",
     "Allow deletions",
-    lambda configuration: configuration["allow_deletions"]["enabled"],
+    ConfigurationValue(("allow_deletions", "enabled")),
     rationale=textwrap.dedent(
         """\
         The default behavior is to not allow the deletion of the mainline branch.
@@ -21,6 +21,7 @@ from semantic_version import Version as SemVer
 
 from GitHubConfigurationValidatorLib.Plugin import Plugin as PluginBase
 from GitHubConfigurationValidatorLib.Impl.PluginImpl import CreateEnablePlugin
+from GitHubConfigurationValidatorLib.RuleEngine import ConfigurationValue
 
 
 # ----------------------------------------------------------------------
@@ -33,7 +34,7 @@ Plugin = CreateEnablePlugin(
     "settings/branches",
     "Rules applied to everyone including administrators",
     "Allow force pushes",
-    lambda configuration: configuration["allow_force_pushes"]["enabled"],
+    ConfigurationValue(("allow_force_pushes", "enabled")),
     rationale=textwrap.dedent(
         """\
         The default behavior is to not allow force pushes to the mainline branch.
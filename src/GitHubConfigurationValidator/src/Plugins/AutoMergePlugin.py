@@ -21,6 +21,7 @@ from semantic_version import Version as SemVer
 
 from GitHubConfigurationValidatorLib.Plugin import Plugin as PluginBase
 from GitHubConfigurationValidatorLib.Impl.PluginImpl import CreateEnablePlugin
+from GitHubConfigurationValidatorLib.RuleEngine import ConfigurationValue
 
 
 # ----------------------------------------------------------------------
@@ -33,7 +34,7 @@ Plugin = CreateEnablePlugin(
     "settings",
     "Pull Requests",
     "Allow auto-merge",
-    lambda configuration: configuration["allow_auto_merge"],
+    ConfigurationValue(("allow_auto_merge", )),
     rationale=textwrap.dedent(
         """\
         The default behavior is to enable the option to auto-merge once all the required status checks associated with a pull request have passed.
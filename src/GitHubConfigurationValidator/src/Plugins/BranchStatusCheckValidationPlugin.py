@@ -18,8 +18,8 @@
 import textwrap
 
 from datetime import datetime
-from dateutil import parser as datetime_parser
-from typing import Any, Callable, Iterator, Optional
+from functools import cache
+from typing import Any, Callable, Iterator, Optional, TYPE_CHECKING
 
 import typer
 
@@ -28,12 +28,13 @@ from semantic_version import Version as SemVer
 from Common_Foundation.Streams.DoneManager import DoneManager
 from Common_Foundation.Types import overridemethod
 
-from Common_FoundationEx.InflectEx import inflect
 from Common_FoundationEx.TyperEx import TypeDefinitionsType
 
-from GitHubConfigurationValidatorLib.GitHubSession import GitHubSession
 from GitHubConfigurationValidatorLib.Plugin import Plugin as PluginBase
 
+if TYPE_CHECKING:
+    from GitHubConfigurationValidatorLib.GitHubSession import GitHubSession  # pragma: no cover
+
 
 # ----------------------------------------------------------------------
 class Plugin(PluginBase):
@@ -101,6 +102,27 @@ class Plugin(PluginBase):
 
         self._no_branch_status_check_validation         = no_branch_status_check_validation
 
+    # ----------------------------------------------------------------------
+    @overridemethod
+    def GetRequiredConfigurationTypes(self) -> set[PluginBase.ConfigurationType]:
+        if self._no_branch_status_check_validation:
+            return set()
+
+        # The repository settings (for the default branch) and the branch protection settings are
+        # retrieved in CustomValidate.
+        return {
+            PluginBase.ConfigurationType.Repository,
+            PluginBase.ConfigurationType.BranchProtection,
+        }
+
+    # ----------------------------------------------------------------------
+    @overridemethod
+    def Prepare(self) -> None:
+        if self._no_branch_status_check_validation:
+            return
+
+        _ImportValidationModules()
+
     # ----------------------------------------------------------------------
     @overridemethod
     def Validate(
@@ -114,12 +136,14 @@ class Plugin(PluginBase):
     def CustomValidate(
         self,
         dm: DoneManager,
-        session: GitHubSession,
+        session: "GitHubSession",
         repository: str,
     ) -> PluginBase.ValidateResultType:
         if self._no_branch_status_check_validation:
             return None
 
+        datetime_parser, inflect = _ImportValidationModules()
+
         # Get the default branch
         default_branch: Optional[str] = None
 
@@ -243,9 +267,24 @@ class Plugin(PluginBase):
 
 # ----------------------------------------------------------------------
 # ----------------------------------------------------------------------
+# ----------------------------------------------------------------------
+# ----------------------------------------------------------------------
+@cache
+def _ImportValidationModules() -> tuple[Any, Any]:
+    """Returns the dateutil parser and inflect engine"""
+
+    # These modules are imported here (rather than when the plugin is loaded) as they are only needed
+    # when validating and inflect is slow to import. `Prepare` imports them before repositories are
+    # validated concurrently.
+    from dateutil import parser as datetime_parser
+    from Common_FoundationEx.InflectEx import inflect
+
+    return datetime_parser, inflect
+
+
 # ----------------------------------------------------------------------
 def _EnumItems(
-    session: GitHubSession,
+    session: "GitHubSession",
     url: str,
     postprocess_response_func: Optional[Callable[[dict[str, Any]], dict[str, Any]]]=None,
 ) -> Iterator[dict[str, Any]]:
@@ -20,7 +20,8 @@ import textwrap
 from semantic_version import Version as SemVer
 
 from GitHubConfigurationValidatorLib.Plugin import Plugin as PluginBase
-from GitHubConfigurationValidatorLib.Impl.PluginImpl import CreateValuePlugin, Result
+from GitHubConfigurationValidatorLib.Impl.PluginImpl import CreateValuePlugin
+from GitHubConfigurationValidatorLib.RuleEngine import ConfigurationValue
 
 
 # ----------------------------------------------------------------------
@@ -33,7 +34,7 @@ Plugin = CreateValuePlugin(
     "settings",
     "Default Branch",
     None,
-    lambda configuration: Result(configuration["default_branch"]),
+    ConfigurationValue(("default_branch", )),
     rationale=textwrap.dedent(
         """\
         The default behavior is not name the mainline/base/default branch "main".
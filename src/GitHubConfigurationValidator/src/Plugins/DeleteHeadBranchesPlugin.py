@@ -21,6 +21,7 @@ from semantic_version import Version as SemVer
 
 from GitHubConfigurationValidatorLib.Plugin import Plugin as PluginBase
 from GitHubConfigurationValidatorLib.Impl.PluginImpl import CreateEnablePlugin
+from GitHubConfigurationValidatorLib.RuleEngine import ConfigurationValue
 
 
 # ----------------------------------------------------------------------
@@ -33,7 +34,7 @@ Plugin = CreateEnablePlugin(
     "settings",
     "Pull Requests",
     "Automatically delete head branches",
-    lambda configuration: configuration["delete_branch_on_merge"],
+    ConfigurationValue(("delete_branch_on_merge", )),
     rationale=textwrap.dedent(
         """\
         The default behavior is to automatically delete head branches once they have been merged into the mainline branch.
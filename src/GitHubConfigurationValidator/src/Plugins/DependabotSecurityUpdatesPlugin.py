@@ -17,26 +17,11 @@
 
 import textwrap
 
-from typing import Any
-
 from semantic_version import Version as SemVer
 
 from GitHubConfigurationValidatorLib.Plugin import Plugin as PluginBase
 from GitHubConfigurationValidatorLib.Impl.PluginImpl import CreateEnablePlugin
-
-
-# ----------------------------------------------------------------------
-def _GetValue(
-    configuration: dict[str, Any],
-) -> PluginBase.ValidateResultType | bool:
-    security_and_analysis = configuration.get("security_and_analysis", None)
-    if security_and_analysis is None:
-        return (
-            PluginBase.MessageType.Warning,
-            "'security_and_analysis' was not found in the results; please provide a GitHub Personal Access Token (PAT).",
-        )
-
-    return security_and_analysis["dependabot_security_updates"]["status"] == "enabled"
+from GitHubConfigurationValidatorLib.RuleEngine import ConfigurationValue
 
 
 # ----------------------------------------------------------------------
@@ -49,7 +34,12 @@ Plugin = CreateEnablePlugin(
     "settings/security_analysis",
     "Dependabot",
     "Dependabot security updates",
-    _GetValue,
+    ConfigurationValue(
+        ("security_and_analysis", "dependabot_security_updates", "status"),
+        ConfigurationValue.Type.Enabled,
+        ConfigurationValue.MissingBehavior.Warning,
+        ConfigurationValue.SECURITY_AND_ANALYSIS_MISSING_MESSAGE,
+    ),
     rationale=textwrap.dedent(
         """\
         The default behavior is to enable Dependabot security updates.
@@ -17,23 +17,11 @@
 
 import textwrap
 
-from typing import Any
-
 from semantic_version import Version as SemVer
 
 from GitHubConfigurationValidatorLib.Plugin import Plugin as PluginBase
 from GitHubConfigurationValidatorLib.Impl.PluginImpl import CreateEnablePlugin
-
-
-# ----------------------------------------------------------------------
-def _GetValue(
-    configuration: dict[str, Any],
-) -> PluginBase.ValidateResultType:
-    settings = configuration.get("required_pull_request_reviews", None)
-    if settings is None:
-        return None
-
-    return settings["dismiss_stale_reviews"]
+from GitHubConfigurationValidatorLib.RuleEngine import ConfigurationValue
 
 
 # ----------------------------------------------------------------------
@@ -46,7 +34,10 @@ Plugin = CreateEnablePlugin(
     "settings/branches",
     "Protect matching branches",
     "Dismiss stale pull request approvals when new commits are pushed",
-    _GetValue,
+    ConfigurationValue(
+        ("required_pull_request_reviews", "dismiss_stale_reviews"),
+        missing_behavior=ConfigurationValue.MissingBehavior.Skip,
+    ),
     rationale=textwrap.dedent(
         """\
         The default behavior is to dismiss stale pull request approvals when new commits are pushed.
@@ -17,22 +17,11 @@
 
 import textwrap
 
-from typing import Any, Optional
-
 from semantic_version import Version as SemVer
 
 from GitHubConfigurationValidatorLib.Plugin import Plugin as PluginBase
-from GitHubConfigurationValidatorLib.Impl.PluginImpl import CreateValuePlugin, Result
-
-
-# ----------------------------------------------------------------------
-def _GetValue(
-    configuration: dict[str, Any],
-) -> PluginBase.ValidateResultType | Result[Optional[str]]:
-    if configuration["license"] is None:
-        return Result(None)
-
-    return Result(configuration["license"]["name"])
+from GitHubConfigurationValidatorLib.Impl.PluginImpl import CreateValuePlugin
+from GitHubConfigurationValidatorLib.RuleEngine import ConfigurationValue
 
 
 # ----------------------------------------------------------------------
@@ -45,7 +34,10 @@ Plugin = CreateValuePlugin(
     "settings",
     None,
     None,
-    _GetValue,
+    ConfigurationValue(
+        ("license", "name"),
+        missing_behavior=ConfigurationValue.MissingBehavior.NullIfNone,
+    ),
     rationale=textwrap.dedent(
         """\
         The default behavior is to use the MIT License.
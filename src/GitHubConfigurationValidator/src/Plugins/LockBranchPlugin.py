@@ -21,6 +21,7 @@ from semantic_version import Version as SemVer
 
 from GitHubConfigurationValidatorLib.Plugin import Plugin as PluginBase
 from GitHubConfigurationValidatorLib.Impl.PluginImpl import CreateEnablePlugin
+from GitHubConfigurationValidatorLib.RuleEngine import ConfigurationValue
 
 
 # ----------------------------------------------------------------------
@@ -33,7 +34,7 @@ Plugin = CreateEnablePlugin(
     "settings/branches",
     "Protect matching branches",
     "Lock branch",
-    lambda configuration: configuration["lock_branch"]["enabled"],
+    ConfigurationValue(("lock_branch", "enabled")),
     rationale=textwrap.dedent(
         """\
         The default behavior is to not lock the mainline branch.
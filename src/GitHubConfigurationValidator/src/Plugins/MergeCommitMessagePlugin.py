@@ -17,22 +17,11 @@
 
 import textwrap
 
-from typing import Any, Optional
-
 from semantic_version import Version as SemVer
 
 from GitHubConfigurationValidatorLib.Plugin import Plugin as PluginBase
-from GitHubConfigurationValidatorLib.Impl.PluginImpl import CreateValuePlugin, Result
-
-
-# ----------------------------------------------------------------------
-def _GetValue(
-    configuration: dict[str, Any],
-) -> PluginBase.ValidateResultType | Result[Optional[str]]:
-    if not configuration["allow_merge_commit"]:
-        return None
-
-    return Result(configuration["merge_commit_message"])
+from GitHubConfigurationValidatorLib.Impl.PluginImpl import CreateValuePlugin
+from GitHubConfigurationValidatorLib.RuleEngine import ConfigurationValue
 
 
 # ----------------------------------------------------------------------
@@ -45,7 +34,10 @@ Plugin = CreateValuePlugin(
     "settings",
     "Pull Requests",
     "Allow merge commits -> Default...",
-    _GetValue,
+    ConfigurationValue(
+        ("merge_commit_message", ),
+        condition_path=("allow_merge_commit", ),
+    ),
     rationale=textwrap.dedent(
         """\
         Available values:
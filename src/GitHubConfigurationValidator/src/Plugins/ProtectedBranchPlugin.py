@@ -21,6 +21,7 @@ from semantic_version import Version as SemVer
 
 from GitHubConfigurationValidatorLib.Plugin import Plugin as PluginBase
 from GitHubConfigurationValidatorLib.Impl.PluginImpl import CreateEnablePlugin
+from GitHubConfigurationValidatorLib.RuleEngine import ConfigurationValue
 
 
 # ----------------------------------------------------------------------
@@ -33,7 +34,7 @@ Plugin = CreateEnablePlugin(
     "settings/branches",
     "Branch protection rules",
     "protected",
-    lambda configuration: configuration["protected"],
+    ConfigurationValue(("protected", )),
     rationale=textwrap.dedent(
         """\
         The default behavior is to protect the mainline branch.
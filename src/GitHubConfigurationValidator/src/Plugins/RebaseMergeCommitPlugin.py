@@ -21,6 +21,7 @@ from semantic_version import Version as SemVer
 
 from GitHubConfigurationValidatorLib.Plugin import Plugin as PluginBase
 from GitHubConfigurationValidatorLib.Impl.PluginImpl import CreateEnablePlugin
+from GitHubConfigurationValidatorLib.RuleEngine import ConfigurationValue
 
 
 # ----------------------------------------------------------------------
@@ -33,7 +34,7 @@ Plugin = CreateEnablePlugin(
     "settings",
     "Pull Requests",
     "Allow rebase merging",
-    lambda configuration: configuration["allow_rebase_merge"],
+    ConfigurationValue(("allow_rebase_merge", )),
     rationale=textwrap.dedent(
         """\
         The default behavior is to not allow rebase merging.
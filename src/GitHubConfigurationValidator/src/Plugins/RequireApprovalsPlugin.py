@@ -17,23 +17,11 @@
 
 import textwrap
 
-from typing import Any, Optional
-
 from semantic_version import Version as SemVer
 
 from GitHubConfigurationValidatorLib.Plugin import Plugin as PluginBase
-from GitHubConfigurationValidatorLib.Impl.PluginImpl import CreateValuePlugin, Result
-
-
-# ----------------------------------------------------------------------
-def _GetValue(
-    configuration: dict[str, Any],
-) -> PluginBase.ValidateResultType | Result[Optional[int]]:
-    settings = configuration.get("required_pull_request_reviews", None)
-    if settings is None:
-        return Result(None)
-
-    return Result(settings["required_approving_review_count"])
+from GitHubConfigurationValidatorLib.Impl.PluginImpl import CreateValuePlugin
+from GitHubConfigurationValidatorLib.RuleEngine import ConfigurationValue
 
 
 # ----------------------------------------------------------------------
@@ -46,7 +34,10 @@ Plugin = CreateValuePlugin(
     "settings/branches",
     "Protected machine branches",
     "Require approvals",
-    _GetValue,
+    ConfigurationValue(
+        ("required_pull_request_reviews", "required_approving_review_count"),
+        missing_behavior=ConfigurationValue.MissingBehavior.Null,
+    ),
     rationale=textwrap.dedent(
         """\
         The default behavior is to require at least one approval.
@@ -21,6 +21,7 @@ from semantic_version import Version as SemVer
 
 from GitHubConfigurationValidatorLib.Plugin import Plugin as PluginBase
 from GitHubConfigurationValidatorLib.Impl.PluginImpl import CreateEnablePlugin
+from GitHubConfigurationValidatorLib.RuleEngine import ConfigurationValue
 
 
 # ----------------------------------------------------------------------
@@ -33,7 +34,7 @@ Plugin = CreateEnablePlugin(
     "settings/branches",
     "Protect matching branches",
     "Require conversation resolution before merging",
-    lambda configuration: configuration["required_conversation_resolution"]["enabled"],
+    ConfigurationValue(("required_conversation_resolution", "enabled")),
     rationale=textwrap.dedent(
         """\
         The default behavior is to require conversation resolution before merging a pull request.
@@ -17,23 +17,11 @@
 
 import textwrap
 
-from typing import Any
-
 from semantic_version import Version as SemVer
 
 from GitHubConfigurationValidatorLib.Plugin import Plugin as PluginBase
 from GitHubConfigurationValidatorLib.Impl.PluginImpl import CreateEnablePlugin
-
-
-# ----------------------------------------------------------------------
-def _GetValue(
-    configuration: dict[str, Any],
-) -> PluginBase.ValidateResultType | bool:
-    settings = configuration.get("required_pull_request_reviews", None)
-    if settings is None:
-        return None
-
-    return settings["require_last_push_approval"]
+from GitHubConfigurationValidatorLib.RuleEngine import ConfigurationValue
 
 
 # ----------------------------------------------------------------------
@@ -46,7 +34,10 @@ Plugin = CreateEnablePlugin(
     "settings/branches",
     "Protect matching branches",
     "Require approval of the most recent reviewable push",
-    _GetValue,
+    ConfigurationValue(
+        ("required_pull_request_reviews", "require_last_push_approval"),
+        missing_behavior=ConfigurationValue.MissingBehavior.Skip,
+    ),
     rationale=textwrap.dedent(
         """\
         The default behavior is to require approval of the most recent reviewable push by someone other than the author of the pull request.
@@ -23,6 +23,7 @@ from semantic_version import Version as SemVer
 
 from GitHubConfigurationValidatorLib.Plugin import Plugin as PluginBase
 from GitHubConfigurationValidatorLib.Impl.PluginImpl import CreateEnablePlugin
+from GitHubConfigurationValidatorLib.RuleEngine import ConfigurationValue
 
 from Plugins.RebaseMergeCommitPlugin import Plugin as RebaseMergeCommitPlugin
 from Plugins.SquashMergeCommitPlugin import Plugin as SquashMergeCommitPlugin
@@ -38,7 +39,7 @@ Plugin = CreateEnablePlugin(
     "settings/branches",
     "Protect matching branches",
     "Require linear history",
-    lambda configuration: configuration["required_linear_history"]["enabled"],
+    ConfigurationValue(("required_linear_history", "enabled")),
     rationale=textwrap.dedent(
         """\
         The default behavior is to not require a linear history as this option is disabled when rebase
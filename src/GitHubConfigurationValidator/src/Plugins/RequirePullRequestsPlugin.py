@@ -21,6 +21,7 @@ from semantic_version import Version as SemVer
 
 from GitHubConfigurationValidatorLib.Plugin import Plugin as PluginBase
 from GitHubConfigurationValidatorLib.Impl.PluginImpl import CreateEnablePlugin
+from GitHubConfigurationValidatorLib.RuleEngine import ConfigurationValue
 
 
 # ----------------------------------------------------------------------
@@ -33,7 +34,7 @@ Plugin = CreateEnablePlugin(
     "settings/branches",
     "Protect matching branches",
     "Require a pull request before merging",
-    lambda configuration: "required_pull_request_reviews" in configuration,
+    ConfigurationValue(("required_pull_request_reviews", ), ConfigurationValue.Type.Exists),
     rationale=textwrap.dedent(
         """\
         The default behavior is to require pull requests before merging.
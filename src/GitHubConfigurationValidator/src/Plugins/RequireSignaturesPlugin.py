@@ -21,6 +21,7 @@ from semantic_version import Version as SemVer
 
 from GitHubConfigurationValidatorLib.Plugin import Plugin as PluginBase
 from GitHubConfigurationValidatorLib.Impl.PluginImpl import CreateEnablePlugin
+from GitHubConfigurationValidatorLib.RuleEngine import ConfigurationValue
 
 
 # ----------------------------------------------------------------------
@@ -33,7 +34,7 @@ Plugin = CreateEnablePlugin(
     "settings/branches",
     "Protect matching branches",
     "Require signed commits",
-    lambda configuration: configuration["required_signatures"]["enabled"],
+    ConfigurationValue(("required_signatures", "enabled")),
     rationale=textwrap.dedent(
         """\
         The default behavior is to require signed commits. Note that this setting does not work with
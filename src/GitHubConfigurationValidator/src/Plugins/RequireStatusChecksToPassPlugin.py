@@ -21,6 +21,7 @@ from semantic_version import Version as SemVer
 
 from GitHubConfigurationValidatorLib.Plugin import Plugin as PluginBase
 from GitHubConfigurationValidatorLib.Impl.PluginImpl import CreateEnablePlugin
+from GitHubConfigurationValidatorLib.RuleEngine import ConfigurationValue
 
 
 # ----------------------------------------------------------------------
@@ -33,7 +34,7 @@ Plugin = CreateEnablePlugin(
     "settings/branches",
     "Protect matching branches",
     "Require status checks to pass before merging",
-    lambda configuration: configuration.get("required_status_checks", None) is not None,
+    ConfigurationValue(("required_status_checks", ), ConfigurationValue.Type.Exists),
     rationale=textwrap.dedent(
         """\
         The default behavior is to require status checks to pass before merging a pull request.
@@ -17,23 +17,11 @@
 
 import textwrap
 
-from typing import Any
-
 from semantic_version import Version as SemVer
 
 from GitHubConfigurationValidatorLib.Plugin import Plugin as PluginBase
 from GitHubConfigurationValidatorLib.Impl.PluginImpl import CreateEnablePlugin
-
-
-# ----------------------------------------------------------------------
-def _GetValue(
-    configuration: dict[str, Any],
-) -> PluginBase.ValidateResultType | bool:
-    settings = configuration.get("required_status_checks", None)
-    if settings is None:
-        return None
-
-    return settings["strict"]
+from GitHubConfigurationValidatorLib.RuleEngine import ConfigurationValue
 
 
 # ----------------------------------------------------------------------
@@ -46,7 +34,10 @@ Plugin = CreateEnablePlugin(
     "settings/branches",
     "Protect matching branches",
     "Require status checks to pass before merging -> Require branches to be up to date before merging",
-    _GetValue,
+    ConfigurationValue(
+        ("required_status_checks", "strict"),
+        missing_behavior=ConfigurationValue.MissingBehavior.Skip,
+    ),
     rationale=textwrap.dedent(
         """\
         The default behavior is to require branches to be up to date before merging. The terminology
@@ -19,24 +19,9 @@ import textwrap
 
 from semantic_version import Version as SemVer
 
-from typing import Any
-
 from GitHubConfigurationValidatorLib.Plugin import Plugin as PluginBase
 from GitHubConfigurationValidatorLib.Impl.PluginImpl import CreateEnablePlugin
-
-
-# ----------------------------------------------------------------------
-def _GetValue(
-    configuration: dict[str, Any],
-) -> PluginBase.ValidateResultType | bool:
-    security_and_analysis = configuration.get("security_and_analysis", None)
-    if security_and_analysis is None:
-        return (
-            PluginBase.MessageType.Warning,
-            "'security_and_analysis' was not found in the results; please provide a GitHub Personal Access Token (PAT).",
-        )
-
-    return security_and_analysis["secret_scanning_push_protection"]["status"] == "enabled"
+from GitHubConfigurationValidatorLib.RuleEngine import ConfigurationValue
 
 
 # ----------------------------------------------------------------------
@@ -49,7 +34,12 @@ Plugin = CreateEnablePlugin(
     "settings/security_analysis",
     "Secret scanning",
     "Push protection",
-    _GetValue,
+    ConfigurationValue(
+        ("security_and_analysis", "secret_scanning_push_protection", "status"),
+        ConfigurationValue.Type.Enabled,
+        ConfigurationValue.MissingBehavior.Warning,
+        ConfigurationValue.SECURITY_AND_ANALYSIS_MISSING_MESSAGE,
+    ),
     subject="Secret Scanning Push Protection",
     rationale=textwrap.dedent(
         """\
@@ -17,22 +17,11 @@
 
 import textwrap
 
-from typing import Any, Optional
-
 from semantic_version import Version as SemVer
 
 from GitHubConfigurationValidatorLib.Plugin import Plugin as PluginBase
-from GitHubConfigurationValidatorLib.Impl.PluginImpl import CreateValuePlugin, Result
-
-
-# ----------------------------------------------------------------------
-def _GetValue(
-    configuration: dict[str, Any],
-) -> PluginBase.ValidateResultType | Result[Optional[str]]:
-    if not configuration["allow_squash_merge"]:
-        return None
-
-    return Result(configuration["squash_merge_commit_message"])
+from GitHubConfigurationValidatorLib.Impl.PluginImpl import CreateValuePlugin
+from GitHubConfigurationValidatorLib.RuleEngine import ConfigurationValue
 
 
 # ----------------------------------------------------------------------
@@ -45,7 +34,10 @@ Plugin = CreateValuePlugin(
     "settings",
     "Pull Requests",
     "Allow squash merging -> Default...",
-    _GetValue,
+    ConfigurationValue(
+        ("squash_merge_commit_message", ),
+        condition_path=("allow_squash_merge", ),
+    ),
     rationale=textwrap.dedent(
         """\
         Available values:
@@ -21,6 +21,7 @@ from semantic_version import Version as SemVer
 
 from GitHubConfigurationValidatorLib.Plugin import Plugin as PluginBase
 from GitHubConfigurationValidatorLib.Impl.PluginImpl import CreateEnablePlugin
+from GitHubConfigurationValidatorLib.RuleEngine import ConfigurationValue
 
 
 # ----------------------------------------------------------------------
@@ -33,7 +34,7 @@ Plugin = CreateEnablePlugin(
     "settings",
     "Pull Requests",
     "Always suggest updating pull request branches",
-    lambda configuration: configuration["allow_update_branch"],
+    ConfigurationValue(("allow_update_branch", )),
     rationale=textwrap.dedent(
         """\
         The default behavior is to not suggest updating branches associated with pull requests within the pull request.
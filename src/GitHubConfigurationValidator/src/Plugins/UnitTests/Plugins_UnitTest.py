@@ -0,0 +1,512 @@
+# ----------------------------------------------------------------------
+# |
+# |  Plugins_UnitTest.py
+# |
+# |  David Brownell <db@DavidBrownell.com>
+# |      2023-12-04 08:21:17
+# |
+# ----------------------------------------------------------------------
+# |
+# |  Copyright David Brownell 2023
+# |  Distributed under the Boost Software License, Version 1.0. See
+# |  accompanying file LICENSE_1_0.txt or copy at
+# |  http://www.boost.org/LICENSE_1_0.txt.
+# |
+# ----------------------------------------------------------------------
+"""\
+Unit tests for the plugins that are evaluated by the RuleEngine.
+
+Each plugin is compared with the function that it used to implement validation before it was
+described by a ConfigurationValue.
+"""
+
+import copy
+import importlib.util
+import itertools
+import sys
+
+from pathlib import Path
+from typing import Any, Callable, Iterator, Optional
+from unittest import mock
+
+import pytest
+
+from Common_Foundation.ContextlibEx import ExitStack
+from Common_Foundation import PathEx
+
+
+# ----------------------------------------------------------------------
+sys.path.insert(0, str(PathEx.EnsureDir(Path(__file__).parent.parent.parent)))
+with ExitStack(lambda: sys.path.pop(0)):
+    from GitHubConfigurationValidatorLib.Impl import PluginImpl
+    from GitHubConfigurationValidatorLib.Impl.PluginImpl import Result
+    from GitHubConfigurationValidatorLib.Plugin import Plugin as PluginBase
+    from GitHubConfigurationValidatorLib.RuleEngine import ConfigurationValue, RuleEngine
+
+
+# ----------------------------------------------------------------------
+# |
+# |  Legacy Implementations
+# |
+# ----------------------------------------------------------------------
+def _GetSecurityAndAnalysisValue(
+    configuration: dict[str, Any],
+    name: str,
+) -> PluginBase.ValidateResultType | bool:
+    security_and_analysis = configuration.get("security_and_analysis", None)
+    if security_and_analysis is None:
+        return (
+            PluginBase.MessageType.Warning,
+            "'security_and_analysis' was not found in the results; please provide a GitHub Personal Access Token (PAT).",
+        )
+
+    return security_and_analysis[name]["status"] == "enabled"
+
+
+# ----------------------------------------------------------------------
+def _GetPullRequestReviewsValue(
+    configuration: dict[str, Any],
+    name: str,
+) -> PluginBase.ValidateResultType | bool:
+    settings = configuration.get("required_pull_request_reviews", None)
+    if settings is None:
+        return None
+
+    return settings[name]
+
+
+# ----------------------------------------------------------------------
+def _GetPullRequestReviewsResult(
+    configuration: dict[str, Any],
+    name: str,
+) -> PluginBase.ValidateResultType | Result[Optional[Any]]:
+    settings = configuration.get("required_pull_request_reviews", None)
+    if settings is None:
+        return Result(None)
+
+    return Result(settings[name])
+
+
+# ----------------------------------------------------------------------
+def _GetLicenseValue(
+    configuration: dict[str, Any],
+) -> PluginBase.ValidateResultType | Result[Optional[str]]:
+    if configuration["license"] is None:
+        return Result(None)
+
+    return Result(configuration["license"]["name"])
+
+
+# ----------------------------------------------------------------------
+def _GetMessageValue(
+    configuration: dict[str, Any],
+    allow_name: str,
+    message_name: str,
+) -> PluginBase.ValidateResultType | Result[Optional[str]]:
+    if not configuration[allow_name]:
+        return None
+
+    return Result(configuration[message_name])
+
+
+# ----------------------------------------------------------------------
+def _GetUpToDateBranchesValue(
+    configuration: dict[str, Any],
+) -> PluginBase.ValidateResultType | bool:
+    settings = configuration.get("required_status_checks", None)
+    if settings is None:
+        return None
+
+    return settings["strict"]
+
+
+# ----------------------------------------------------------------------
+# The functions used by each plugin before it was described by a ConfigurationValue
+_LEGACY_FUNCS: dict[str, Callable[[dict[str, Any]], Any]] = {
+    "AllowBypassSettings": lambda configuration: configuration["enforce_admins"]["enabled"],
+    "AllowDeletions": lambda configuration: configuration["allow_deletions"]["enabled"],
+    "AllowForcePushes": lambda configuration: configuration["allow_force_pushes"]["enabled"],
+    "AutoMerge": lambda configuration: configuration["allow_auto_merge"],
+    "DefaultBranch": lambda configuration: Result(configuration["default_branch"]),
+    "DeleteHeadBranches": lambda configuration: configuration["delete_branch_on_merge"],
+    "DependabotSecurityUpdates": lambda configuration: _GetSecurityAndAnalysisValue(configuration, "dependabot_security_updates"),
+    "DismissStalePullRequestApprovals": lambda configuration: _GetPullRequestReviewsValue(configuration, "dismiss_stale_reviews"),
+    "License": _GetLicenseValue,
+    "LockBranch": lambda configuration: configuration["lock_branch"]["enabled"],
+    "MergeCommit": lambda configuration: configuration["allow_merge_commit"],
+    "MergeCommitMessage": lambda configuration: _GetMessageValue(configuration, "allow_merge_commit", "merge_commit_message"),
+    "ProtectedBranch": lambda configuration: configuration["protected"],
+    "RebaseMergeCommit": lambda configuration: configuration["allow_rebase_merge"],
+    "RequireApprovals": lambda configuration: _GetPullRequestReviewsResult(configuration, "required_approving_review_count"),
+    "RequireCodeOwnerReviews": lambda configuration: _GetPullRequestReviewsResult(configuration, "require_code_owner_reviews"),
+    "RequireConversationResolution": lambda configuration: configuration["required_conversation_resolution"]["enabled"],
+    "RequireLastPushApprovals": lambda configuration: _GetPullRequestReviewsValue(configuration, "require_last_push_approval"),
+    "RequireLinearHistory": lambda configuration: configuration["required_linear_history"]["enabled"],
+    "RequirePullRequests": lambda configuration: "required_pull_request_reviews" in configuration,
+    "RequireSignatures": lambda configuration: configuration["required_signatures"]["enabled"],
+    "RequireStatusChecksToPass": lambda configuration: configuration.get("required_status_checks", None) is not None,
+    "RequireUpToDateBranches": _GetUpToDateBranchesValue,
+    "SecretScanning": lambda configuration: _GetSecurityAndAnalysisValue(configuration, "secret_scanning"),
+    "SecretScanningPushProtection": lambda configuration: _GetSecurityAndAnalysisValue(configuration, "secret_scanning_push_protection"),
+    "SquashCommitMerge": lambda configuration: configuration["allow_squash_merge"],
+    "SquashMergeCommitMessage": lambda configuration: _GetMessageValue(configuration, "allow_squash_merge", "squash_merge_commit_message"),
+    "SuggestUpdatingPullRequestBranches": lambda configuration: configuration["allow_update_branch"],
+    "SupportsDiscussions": lambda configuration: configuration["has_discussions"],
+    "SupportsIssues": lambda configuration: configuration["has_issues"],
+    "SupportsProjects": lambda configuration: configuration["has_projects"],
+    "SupportsWikis": lambda configuration: configuration["has_wiki"],
+    "TemplateRepository": lambda configuration: configuration["is_template"],
+    "WebCommitSignoff": lambda configuration: configuration["web_commit_signoff_required"],
+}
+
+
+# ----------------------------------------------------------------------
+# |
+# |  Configurations
+# |
+# ----------------------------------------------------------------------
+_CONFIGURATIONS: dict[PluginBase.ConfigurationType, dict[str, Any]] = {
+    PluginBase.ConfigurationType.Repository: {
+        "name": "Repo",
+        "default_branch": "main",
+        "allow_auto_merge": True,
+        "delete_branch_on_merge": True,
+        "allow_merge_commit": True,
+        "merge_commit_message": "PR_TITLE",
+        "allow_squash_merge": False,
+        "squash_merge_commit_message": "COMMIT_MESSAGES",
+        "allow_rebase_merge": False,
+        "allow_update_branch": True,
+        "has_discussions": False,
+        "has_issues": True,
+        "has_projects": True,
+        "has_wiki": True,
+        "is_template": False,
+        "web_commit_signoff_required": True,
+        "license": {
+            "name": "MIT License",
+        },
+        "security_and_analysis": {
+            "dependabot_security_updates": {"status": "enabled"},
+            "secret_scanning": {"status": "enabled"},
+            "secret_scanning_push_protection": {"status": "disabled"},
+        },
+    },
+    PluginBase.ConfigurationType.Branch: {
+        "name": "main",
+        "protected": True,
+    },
+    PluginBase.ConfigurationType.BranchProtection: {
+        "enforce_admins": {"enabled": True},
+        "allow_deletions": {"enabled": False},
+        "allow_force_pushes": {"enabled": False},
+        "lock_branch": {"enabled": False},
+        "required_conversation_resolution": {"enabled": True},
+        "required_linear_history": {"enabled": False},
+        "required_signatures": {"enabled": True},
+        "required_pull_request_reviews": {
+            "required_approving_review_count": 1,
+            "require_code_owner_reviews": False,
+            "dismiss_stale_reviews": True,
+            "require_last_push_approval": True,
+        },
+        "required_status_checks": {
+            "strict": True,
+            "checks": [{"context": "build"}],
+        },
+    },
+}
+
+
+# ----------------------------------------------------------------------
+# |
+# |  Tests
+# |
+# ----------------------------------------------------------------------
+def test_AllConvertedPluginsAreTested():
+    assert set(_LoadPlugins().keys()) == set(_LEGACY_FUNCS.keys())
+
+
+# ----------------------------------------------------------------------
+@pytest.mark.parametrize("plugin_name", sorted(_LEGACY_FUNCS.keys()))
+def test_Equivalence(plugin_name):
+    plugin_class, legacy_plugin_class = _LoadPlugins()[plugin_name]
+
+    num_configurations = 0
+
+    for kwargs in _EnumInstantiationKwargs(plugin_class):
+        plugin = plugin_class(**kwargs)
+        legacy_plugin = legacy_plugin_class(**kwargs)
+
+        rule = plugin.GetRule()
+        assert rule is not None
+        assert legacy_plugin.GetRule() is None
+
+        rule_engine = RuleEngine([plugin])
+
+        for configuration in _EnumConfigurations(plugin.configuration_type, rule.value, kwargs):
+            num_configurations += 1
+
+            expected = _Invoke(legacy_plugin.Validate, configuration)
+
+            # Legacy implementations indexed into None sub-objects (raising a TypeError, which
+            # wasn't handled); rules consistently treat None sub-objects as missing.
+            if isinstance(expected, TypeError):
+                expected = KeyError
+
+            # Legacy implementation treated a null value as an existing value
+            if (
+                plugin_name == "RequirePullRequests"
+                and "required_pull_request_reviews" in configuration
+                and configuration["required_pull_request_reviews"] is None
+            ):
+                expected = legacy_plugin.Validate(_SetValue(configuration, ("required_pull_request_reviews", ), "__missing__"))
+
+            actual = _Invoke(plugin.Validate, configuration)
+            engine_result = rule_engine.Evaluate(plugin.configuration_type, configuration)[plugin_name]
+            columns_result = rule_engine.EvaluateColumns(plugin.configuration_type, [configuration, None])[plugin_name]
+
+            assert columns_result[1] is None
+
+            for result in [actual, engine_result, columns_result[0]]:
+                if expected is KeyError:
+                    assert isinstance(result, KeyError), (configuration, result)
+                elif isinstance(expected, KeyError):
+                    assert isinstance(result, KeyError), (configuration, result)
+                    assert result.args == expected.args, (configuration, result)
+                else:
+                    assert result == expected, (configuration, result)
+
+    assert num_configurations > 0
+
+
+# ----------------------------------------------------------------------
+def test_SecurityAndAnalysisWarning():
+    plugin_class = _LoadPlugins()["SecretScanning"][0]
+    plugin = plugin_class(**next(_EnumInstantiationKwargs(plugin_class)))
+
+    assert plugin.Validate({}) == (
+        PluginBase.MessageType.Warning,
+        ConfigurationValue.SECURITY_AND_ANALYSIS_MISSING_MESSAGE,
+    )
+
+
+# ----------------------------------------------------------------------
+def test_BranchStatusCheckValidationPrepare():
+    filename = Path(__file__).parent.parent / "BranchStatusCheckValidationPlugin.py"
+
+    spec = importlib.util.spec_from_file_location("_UnitTest_{}".format(filename.stem), filename)
+    assert spec is not None
+    assert spec.loader is not None
+
+    mod = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(mod)
+
+    # Nothing is imported when validation is disabled
+    mod.Plugin(no_branch_status_check_validation=True).Prepare()
+    assert mod._ImportValidationModules.cache_info().currsize == 0
+
+    # The modules used during validation are imported once
+    plugin = mod.Plugin(no_branch_status_check_validation=False)
+
+    plugin.Prepare()
+    plugin.Prepare()
+
+    cache_info = mod._ImportValidationModules.cache_info()
+
+    assert cache_info.misses == 1
+    assert cache_info.hits == 1
+
+    datetime_parser, inflect = mod._ImportValidationModules()
+
+    assert datetime_parser.parse("2023-12-14T08:00:00Z").year == 2023
+    assert inflect.no("job", 2) == "2 jobs"
+
+
+# ----------------------------------------------------------------------
+# |
+# |  Private Functions
+# |
+# ----------------------------------------------------------------------
+_plugins: Optional[dict[str, tuple[type, type]]] = None
+
+def _LoadPlugins() -> dict[str, tuple[type, type]]:
+    """Returns the plugin class and a plugin class created with the legacy function for each converted plugin"""
+
+    global _plugins  # pylint: disable=global-statement
+
+    if _plugins is not None:
+        return _plugins
+
+    plugins: dict[str, tuple[type, type]] = {}
+
+    # Plugins may import other plugins
+    sys.path.insert(0, str(PathEx.EnsureDir(Path(__file__).parent.parent.parent)))
+    with ExitStack(lambda: sys.path.pop(0)):
+        for filename in sorted(Path(__file__).parent.parent.glob("*Plugin.py")):
+            _LoadPlugin(filename, plugins)
+
+    _plugins = plugins
+    return plugins
+
+
+# ----------------------------------------------------------------------
+def _LoadPlugin(
+    filename: Path,
+    plugins: dict[str, tuple[type, type]],
+) -> None:
+    captured: list[tuple[Callable, tuple, dict, type]] = []
+
+    # ----------------------------------------------------------------------
+    def CreateCapture(
+        create_func: Callable,
+    ) -> Callable:
+        def Impl(*args, **kwargs):
+            result = create_func(*args, **kwargs)
+
+            captured.append((create_func, args, kwargs, result))
+            return result
+
+        return Impl
+
+    # ----------------------------------------------------------------------
+
+    with (
+        mock.patch.object(PluginImpl, "CreateEnablePlugin", CreateCapture(PluginImpl.CreateEnablePlugin)),
+        mock.patch.object(PluginImpl, "CreateValuePlugin", CreateCapture(PluginImpl.CreateValuePlugin)),
+    ):
+        spec = importlib.util.spec_from_file_location("_UnitTest_{}".format(filename.stem), filename)
+        assert spec is not None
+        assert spec.loader is not None
+
+        mod = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(mod)
+
+    # Ignore the plugins created by plugins imported by this plugin
+    captured = [item for item in captured if item[3] is mod.Plugin]
+    if not captured:
+        return
+
+    assert len(captured) == 1, filename
+    create_func, args, kwargs, _ = captured[0]
+
+    # The 9th argument is `get_configuration_value_func`
+    assert isinstance(args[8], ConfigurationValue), filename
+
+    plugin_name = args[0]
+
+    plugins[plugin_name] = (
+        mod.Plugin,
+        create_func(*args[:8], _LEGACY_FUNCS[plugin_name], *args[9:], **kwargs),
+    )
+
+
+# ----------------------------------------------------------------------
+def _EnumInstantiationKwargs(
+    plugin_class: type,
+) -> Iterator[dict[str, Any]]:
+    parameters = plugin_class.GetInstantiationParameters()
+    assert len(parameters) == 1
+
+    parameter_name, (parameter_type, option_info) = next(iter(parameters.items()))
+
+    if parameter_type is bool:
+        values: list[Any] = [True, False]
+    elif isinstance(option_info.default, int):
+        values = [str(option_info.default), str(option_info.default + 1), "none"]
+    else:
+        values = [option_info.default, "Other", "none"]
+
+    for value in values:
+        yield {parameter_name: value}
+
+
+# ----------------------------------------------------------------------
+def _EnumConfigurations(
+    configuration_type: PluginBase.ConfigurationType,
+    configuration_value: ConfigurationValue,
+    kwargs: dict[str, Any],
+) -> Iterator[dict[str, Any]]:
+    base_configuration = _CONFIGURATIONS[configuration_type]
+
+    yield base_configuration
+    yield {}
+
+    # Values at the end of the path
+    if configuration_value.type == ConfigurationValue.Type.Enabled:
+        leaf_values: list[Any] = ["enabled", "disabled", None]
+    elif configuration_value.type == ConfigurationValue.Type.Exists:
+        leaf_values = [{}, {"value": True}, None]
+    else:
+        leaf_values = [True, False, None]
+
+        expected_value = next(iter(kwargs.values()))
+        if not isinstance(expected_value, bool):
+            leaf_values += [expected_value, "Other"]
+
+            if expected_value.isdigit():
+                leaf_values += [int(expected_value), int(expected_value) + 1]
+
+    paths = [configuration_value.path]
+
+    if configuration_value.condition_path is not None:
+        paths.append(configuration_value.condition_path)
+
+    condition_values: list[Any] = [None]
+
+    if configuration_value.condition_path is not None:
+        condition_values = [True, False, None, "__missing__"]
+
+    for leaf_value, condition_value in itertools.product(leaf_values, condition_values):
+        configuration = _SetValue(base_configuration, configuration_value.path, leaf_value)
+
+        if configuration_value.condition_path is not None:
+            configuration = _SetValue(configuration, configuration_value.condition_path, condition_value)
+
+        yield configuration
+
+    # Missing keys and None sub-objects
+    for path in paths:
+        for index in range(1, len(path) + 1):
+            yield _SetValue(base_configuration, path[:index], "__missing__")
+            yield _SetValue(base_configuration, path[:index], None)
+
+            if index != len(path):
+                yield _SetValue(base_configuration, path[:index], {})
+
+
+# ----------------------------------------------------------------------
+def _SetValue(
+    configuration: dict[str, Any],
+    path: tuple[str, ...],
+    value: Any,
+) -> dict[str, Any]:
+    """Returns a copy of the configuration with the value at the path replaced ("__missing__" removes the value)"""
+
+    configuration = copy.deepcopy(configuration)
+
+    node = configuration
+
+    for key in path[:-1]:
+        if not isinstance(node.get(key, None), dict):
+            return configuration
+
+        node = node[key]
+
+    if value == "__missing__":
+        node.pop(path[-1], None)
+    else:
+        node[path[-1]] = value
+
+    return configuration
+
+
+# ----------------------------------------------------------------------
+def _Invoke(
+    func: Callable[[dict[str, Any]], Any],
+    configuration: dict[str, Any],
+) -> Any:
+    try:
+        return func(configuration)
+    except (KeyError, TypeError) as ex:
+        return ex
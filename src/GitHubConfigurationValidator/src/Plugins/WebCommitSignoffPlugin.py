@@ -21,6 +21,7 @@ from semantic_version import Version as SemVer
 
 from GitHubConfigurationValidatorLib.Plugin import Plugin as PluginBase
 from GitHubConfigurationValidatorLib.Impl.PluginImpl import CreateEnablePlugin
+from GitHubConfigurationValidatorLib.RuleEngine import ConfigurationValue
 
 
 # ----------------------------------------------------------------------
@@ -33,7 +34,7 @@ Plugin = CreateEnablePlugin(
     "settings",
     "General",
     "Require contributors to sign off on web-based commits",
-    lambda configuration: configuration["web_commit_signoff_required"],
+    ConfigurationValue(("web_commit_signoff_required", )),
     rationale=textwrap.dedent(
         """\
         The default behavior is to require contributors to sign off on web-based commits.